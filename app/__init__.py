@@ -12,6 +12,7 @@ from app.dataBase import db
 from app.shared.infrastructure.persistence.models import *
 # Import the health check blueprint
 from app.apis.base_routes import health_bp
+from app.shared.utils.json_provider import FastJSONProvider
 
 def create_app(config_name: str = 'development') -> Flask:
     """
@@ -29,9 +30,17 @@ def create_app(config_name: str = 'development') -> Flask:
     config_class = get_config(config_name)
     app.config.from_object(config_class)
     
+    if app.config.get('JSON_PROVIDER', 'fast') == 'fast':
+        app.json = FastJSONProvider(app)
+    
     # Setup logging
     setup_logging(app)
     
+    # Settings read by container-built services
+    container.config.order_status_counters.from_value(app.config.get('ORDER_STATUS_COUNTERS', False))
+    container.config.idempotency_key_ttl.from_value(app.config.get('IDEMPOTENCY_KEY_TTL'))
+    container.config.product_cache_ttl.from_value(app.config.get('PRODUCT_CACHE_TTL'))
+    
     # Initialize extensions and resources
     init_resources(app)
     
@@ -75,6 +84,9 @@ def create_app(config_name: str = 'development') -> Flask:
         except Exception as e:
             app.logger.error(f"Database setup error: {e}")
             app.logger.info("Application will continue without database initialization")
+        
+        # Build in-memory read models once per worker
+        warm_up_read_models(app)
                     
     # Register blueprints
     register_blueprints(app)
@@ -83,6 +95,31 @@ def create_app(config_name: str = 'development') -> Flask:
     
     return app
 
+def warm_up_read_models(app: Flask) -> None:
+    """Build in-process read models so requests never wait on them."""
+    try:
+        # Orders placed before order_summaries existed would be missing from every order list
+        container.order_service().backfill_order_summaries()
+    except Exception as e:
+        db.session.rollback()
+        app.logger.warning(f"Order summary backfill failed (run manage.py backfill-order-summaries): {e}")
+    finally:
+        db.session.remove()
+    try:
+        container.product_service().rebuild_prefix_index()
+    except Exception as e:
+        db.session.rollback()
+        app.logger.warning(f"Product prefix index warm-up failed (will build on first use): {e}")
+    finally:
+        db.session.remove()
+    try:
+        container.product_service().warm_up_product_cache(app.config.get('PRODUCT_CACHE_WARMUP', 0))
+    except Exception as e:
+        db.session.rollback()
+        app.logger.warning(f"Product cache warm-up failed (will fill on first reads): {e}")
+    finally:
+        db.session.remove()
+
 def setup_logging(app: Flask) -> None:
     """Configure application logging."""
     if not app.debug and not app.testing:
@@ -9,7 +9,7 @@ from app.apis.base_routes import BaseRoute
 from flask_jwt_extended import jwt_required
 from app.apis.decorators.auth_decorator import require_admin
 from app.extensions import container
-from app.apis.auth.schemas import AdminRegistrationErrorResponseSchema, AdminRegistrationResponseSchema, AdminRegistrationSchema, LogInResponseSchema, LoginSchema, UserRegistrationSchema, UserResponseSchema
+from app.apis.auth.schemas import AdminRegistrationErrorResponseSchema, AdminRegistrationResponseSchema, AdminRegistrationSchema, LogInResponseSchema, LoginSchema, UserRegistrationSchema, UserResponseSchema, UserUpdateSchema
 from app.services.auth_service.application.commands import CreateUserCommand, CreateOrGetHealthCareCenterCommand, LoginCommand, RegisterUserCommand, UserUpdateCommand,RegisterUserCommand, UserUpdateCommand,AdminRegistrationCommand
 from app.services.auth_service.application.queries import AccessCodeValidationQuery
 from app.services.auth_service.infrastructure.persistence.models.user_model import UserModel
@@ -89,8 +89,9 @@ class UserUpdate(BaseRoute):
             abort(404, message="User not found")
         return APIResponse.success(data=user, message="User fetched successfully")
 
+    @auth_bp.arguments(UserUpdateSchema)
     @jwt_required()
-    def put(self, user_id, user_data):
+    def put(self, user_data, user_id):
         command = UserUpdateCommand(**user_data)
         user_updated = container.auth_service().update_user(user_id, command)
         return self._success_response(
@@ -1,5 +1,5 @@
 from .health_care import HealthCareCenterSchema, HealthCareCenterFilterSchema, HealthCareCenterResponseSchema, HealthCareCenterListResponseSchema
-from .user import UserSchema, UserRegistrationSchema, AdminRegistrationSchema
+from .user import UserSchema, UserRegistrationSchema, UserUpdateSchema, AdminRegistrationSchema
 from .auth import LoginSchema, AccessCodeGenerationSchema, AccessCodeFilterSchema
 from .responses import (
     AdminRegistrationResponseSchema,
@@ -18,6 +18,7 @@ __all__ = [
     'HealthCareCenterResponseSchema',
     'HealthCareCenterListResponseSchema',
     'UserSchema',
+    'UserUpdateSchema',
     'UserRegistrationSchema',
     'AdminRegistrationSchema',
     'LoginSchema',
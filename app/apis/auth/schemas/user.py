@@ -46,5 +46,11 @@ class UserRegistrationSchema(UserSchema):
     code = fields.Str(required=True, metadata={"description": "The user code"})
 #admin registration schema
 class AdminRegistrationSchema(UserBaseSchema):
-    initialization_key = fields.Str(required=True, metadata={"description": "Admin initialization key"}) 
+    initialization_key = fields.Str(required=True, metadata={"description": "Admin initialization key"})
 
+class UserUpdateSchema(Schema):
+    full_name = fields.Str(metadata={"description": "The user full name"})
+    email = fields.Email(metadata={"description": "The user email"})
+    phone = fields.Str(metadata={"description": "The user phone"})
+    health_care_center_id = fields.UUID(metadata={"description": "The user's health care center"})
+    is_active = fields.Bool(metadata={"description": "Whether the user is active"})
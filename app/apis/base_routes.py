@@ -1,10 +1,15 @@
-from typing import Any
+from typing import Any, Callable, Dict, Optional, Type
 from flask.views import MethodView
 from http import HTTPStatus
 from flask_smorest import abort
 from werkzeug.exceptions import UnprocessableEntity
+from werkzeug.http import http_date, quote_etag
+from werkzeug.wrappers import Response
+from marshmallow import Schema
+from app.apis.schema_projection import project
 from app.shared.domain.exceptions.common_errors import BaseAPIException
-from flask import Blueprint, jsonify
+from app.shared.utils.json_provider import FastJSONProvider
+from flask import Blueprint, jsonify, request
 from flask_smorest import Api
 from app.shared.utils.api_response import APIResponse
 from flask import current_app
@@ -42,6 +47,64 @@ class BaseRoute(MethodView):
         }
         return response, status_code
 
+    def _trusted_response(self, schema: Type[Schema], data=None, message="Success", status_code=HTTPStatus.OK):
+        """
+        Success response for DTOs that already carry the right value types.
+
+        Skips the marshmallow dump of the route's @response schema: the payload is
+        only projected onto the schema's keys and encoded by the fast JSON provider.
+        Falls back to the regular (marshmallow) path when TRUSTED_RESPONSES is off
+        or another JSON provider is installed.
+
+        Args:
+            schema: The response schema declared for the route
+            data: Trusted DTO (dict, pydantic model or plain object)
+            message: Response message
+            status_code: HTTP status
+        """
+        if not (current_app.config.get('TRUSTED_RESPONSES', True) and isinstance(current_app.json, FastJSONProvider)):
+            return self._success_response(data=data, message=message, status_code=status_code)
+        payload = project(schema, {"code": status_code, "message": message, "data": data})
+        response = current_app.json.response(payload)
+        response.status_code = status_code
+        return response
+
+    def _conditional_response(self, etag: str, last_modified: Optional[datetime.datetime],
+                              build: Callable[[], Any]) -> Any:
+        """
+        Answer a GET from its validators before doing the actual work.
+
+        Returns 304 Not Modified when the client's If-None-Match (or, without it,
+        If-Modified-Since) still matches; otherwise calls build() and attaches
+        ETag / Last-Modified to its response.
+        """
+        headers = self._validator_headers(etag, last_modified)
+        if self._is_not_modified(etag, last_modified):
+            return Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        response = build()
+        if isinstance(response, tuple):
+            return response + (headers,)
+        if isinstance(response, Response):
+            response.headers.update(headers)
+        return response
+
+    def _validator_headers(self, etag: str, last_modified: Optional[datetime.datetime]) -> Dict[str, str]:
+        headers = {"ETag": quote_etag(etag), "Cache-Control": "no-cache"}
+        if last_modified is not None:
+            headers["Last-Modified"] = http_date(last_modified)
+        return headers
+
+    def _is_not_modified(self, etag: str, last_modified: Optional[datetime.datetime]) -> bool:
+        if request.method not in ("GET", "HEAD"):
+            return False
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110, 13.2.2)
+        if request.if_none_match:
+            return request.if_none_match.contains_weak(etag)
+        if request.if_modified_since and last_modified is not None:
+            # HTTP dates have second resolution
+            return last_modified.replace(microsecond=0) <= request.if_modified_since
+        return False
+
     def _error_response(self, 
                        message: str = "Error occurred", 
                        status_code: HTTPStatus = HTTPStatus.BAD_REQUEST,
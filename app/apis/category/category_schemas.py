@@ -34,6 +34,7 @@ class CategoryFilterSchema(Schema):
     )
     page = fields.Int(dump_default=1, validate=validate.Range(min=1), metadata={"description": "Page number"})
     items_per_page = fields.Int(dump_default=20, validate=validate.Range(min=1), metadata={"description": "Items per page"})
+    cursor = fields.Str(metadata={"description": "Opaque cursor from a previous page's next_cursor; replaces page"})
 
 class CategoryResponseSchema(Schema):
     """Schema for category response"""
@@ -45,9 +46,10 @@ class CategoryPaginatedSchema(Schema):
     """Schema for paginated category response"""
     items = fields.List(fields.Nested(CategorySchema), metadata={"description": "List of categories"})
     total_items = fields.Int(metadata={"description": "Total number of categories"})
-    page = fields.Int(metadata={"description": "Current page number"})
+    page = fields.Int(allow_none=True, metadata={"description": "Current page number (null when paging by cursor)"})
     page_size = fields.Int(metadata={"description": "Items per page"})
     total_pages = fields.Int(metadata={"description": "Total number of pages"})
+    next_cursor = fields.Str(allow_none=True, metadata={"description": "Cursor of the next page, null on the last page"})
 
 class CategoryPaginatedResponseSchema(Schema):
     """Schema for category response"""
@@ -11,6 +11,8 @@ from app.services.category_service.application.queries.get_categories_by_filter
 from app.apis import category_bp
 from app.apis.base_routes import BaseRoute
 from app.apis.category.category_schemas import CategorySchema, CategoryResponseSchema, CategoryFilterSchema, CategoryPaginatedResponseSchema, DeleteCategoryResponseSchema
+from app.services.category_service.infrastructure.query_services.category_query_service import CATEGORY_LIST_NAMESPACE
+from app.shared.infrastructure.persistence.list_counts import filter_signature
 from typing import Tuple, Dict, Any
 
 @category_bp.route('/')
@@ -105,6 +107,15 @@ class CategoryListRoute(BaseRoute):
     @category_bp.arguments(CategoryFilterSchema, location="query")
     @category_bp.response(HTTPStatus.OK, CategoryPaginatedResponseSchema)
     def get(self, filter_args: Dict[str, Any]) -> Tuple[dict, int]:
+        etag, last_modified = container.resource_versions().collection_validators(
+            CATEGORY_LIST_NAMESPACE, filter_signature(filter_args),
+            marker=container.category_service().get_list_marker()
+        )
+        return self._conditional_response(
+            etag, last_modified, lambda: self._list_categories(filter_args)
+        )
+
+    def _list_categories(self, filter_args: Dict[str, Any]) -> Tuple[dict, int]:
         result = container.category_service().list_categories(
             GetCategoriesByFilterQuery(
                 **filter_args
@@ -0,0 +1,84 @@
+import hashlib
+from functools import wraps
+from http import HTTPStatus
+
+from flask import jsonify, make_response, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+
+from app.extensions import container
+from app.shared.infrastructure.idempotency import ClaimState
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+def idempotent(scope: str):
+    """
+    Make a write endpoint safe to retry with an Idempotency-Key header.
+
+    The first request with a key runs and its 2xx response is stored; a retry
+    with the same key and body gets that response back without running the
+    endpoint again. Keys are per endpoint (scope) and per authenticated user.
+    Requests without the header, or without a valid token, are not affected.
+
+    Must be the outermost decorator, so the stored response is the final one.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if not key:
+                return f(*args, **kwargs)
+            if len(key) > MAX_KEY_LENGTH:
+                return jsonify({
+                    "success": False,
+                    "message": f"{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters"
+                }), HTTPStatus.BAD_REQUEST
+            try:
+                verify_jwt_in_request()
+            except Exception:
+                # Let the endpoint's own authentication answer
+                return f(*args, **kwargs)
+
+            store = container.idempotency_store()
+            key_scope = f"{scope}:{get_jwt_identity()}"
+            claim = store.begin(key_scope, key, _fingerprint())
+            if claim.state == ClaimState.REPLAY:
+                response = make_response(claim.response.body, claim.response.status_code)
+                response.mimetype = "application/json"
+                response.headers[REPLAYED_HEADER] = "true"
+                return response
+            if claim.state == ClaimState.MISMATCH:
+                return jsonify({
+                    "success": False,
+                    "message": f"{IDEMPOTENCY_HEADER} was already used for a different request"
+                }), HTTPStatus.UNPROCESSABLE_ENTITY
+            if claim.state == ClaimState.IN_PROGRESS:
+                return jsonify({
+                    "success": False,
+                    "message": f"A request with this {IDEMPOTENCY_HEADER} is still being processed"
+                }), HTTPStatus.CONFLICT
+
+            try:
+                response = make_response(f(*args, **kwargs))
+            except Exception:
+                store.release(key_scope, key)
+                raise
+            # Failures are not stored, so the client can fix the cause and retry with the same key
+            if 200 <= response.status_code < 300:
+                store.complete(key_scope, key, response.status_code, response.get_data(as_text=True))
+            else:
+                store.release(key_scope, key)
+            return response
+        return decorated
+    return decorator
+
+
+def _fingerprint() -> str:
+    digest = hashlib.sha256()
+    for part in (request.method, request.path, request.query_string.decode("utf-8")):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(request.get_data())
+    return digest.hexdigest()
@@ -1,8 +1,10 @@
 from http import HTTPStatus
 from uuid import UUID
+from flask import Response, stream_with_context
 from app.apis import order_bp
 from app.apis.base_routes import BaseRoute
 from app.apis.decorators.auth_decorator import require_admin
+from app.apis.decorators.idempotency_decorator import idempotent
 from app.apis.order.schemas import (
     CreateOrderSchema, 
     OrderFilterSchema, 
@@ -10,15 +12,29 @@ from app.apis.order.schemas import (
     OrderResponseSchema, 
     UpdateOrderStatusSchema,
     BulkUpdateOrderSchema,
-    BulkUpdateOrderResponseSchema
+    BulkUpdateOrderResponseSchema,
+    BatchCreateOrderSchema,
+    BatchCreateOrderResponseSchema,
+    DailyOrderStatsQuerySchema,
+    DailyOrderStatsResponseSchema,
+    OrderStatusSummaryResponseSchema,
+    OrderExportQuerySchema,
+    OrderSearchQuerySchema
+)
+from app.services.order_service.application.commands import (
+    BatchCreateOrderCommand,
+    CancelOrderCommand,
+    CreateOrderCommand,
+    UpdateOrderCommand
 )
-from app.services.order_service.application.commands import CreateOrderCommand, UpdateOrderCommand, CancelOrderCommand
 from app.services.order_service.application.commands.bulk_update_order_command import (
     BulkUpdateOrderCommand, 
     BulkUpdateOrderItemCommand
 )
-from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO
+from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO, OrderFilterDTO
 from app.services.order_service.application.queries.order_filter_query import OrderFilterQuery
+from app.services.order_service.infrastructure.export.order_export import EXPORT_CONTENT_TYPES
+from app.services.order_service.infrastructure.query_services.order_query_service import ORDER_LIST_NAMESPACE
 from app.shared.domain.schema.common_errors import ErrorResponseSchema
 from app.shared.utils.api_response import APIResponse
 from app.extensions import container    
@@ -35,7 +51,77 @@ class OrderFilterRoutes(BaseRoute):
         # Get orders using the service
 
         result = container.order_service().get_orders(OrderFilterQuery(**data))        
-        return self._success_response(
+        return self._trusted_response(
+            OrderListResponseSchema,
+            message='Orders retrieved successfully',
+            data=result,
+            status_code=HTTPStatus.OK
+        )
+
+@order_bp.route('/orders/stats/daily')
+class DailyOrderStatsRoutes(BaseRoute):
+    @order_bp.doc(summary="Daily order statistics", description="Order count, revenue and items per day, read from the daily rollup")
+    @order_bp.arguments(DailyOrderStatsQuerySchema, location="query")
+    @order_bp.response(HTTPStatus.OK, DailyOrderStatsResponseSchema, description="Daily statistics")
+    @require_admin
+    def get(self, args):
+        stats = container.order_service().get_daily_order_stats(args['days'], args.get('status'))
+        return self._trusted_response(
+            DailyOrderStatsResponseSchema,
+            message='Daily order statistics retrieved successfully',
+            data=stats,
+            status_code=HTTPStatus.OK
+        )
+
+@order_bp.route('/orders/stats/status')
+class OrderStatusSummaryRoutes(BaseRoute):
+    @order_bp.doc(summary="Order status summary", description="Number of orders in each status")
+    @order_bp.response(HTTPStatus.OK, OrderStatusSummaryResponseSchema, description="Orders per status")
+    @require_admin
+    def get(self):
+        summary = container.order_service().get_order_status_summary()
+        return self._trusted_response(
+            OrderStatusSummaryResponseSchema,
+            message='Order status summary retrieved successfully',
+            data=summary,
+            status_code=HTTPStatus.OK
+        )
+
+@order_bp.route('/orders/export')
+class OrderExportRoutes(BaseRoute):
+    @order_bp.doc(summary="Export orders", description="Every order matching the filter as CSV or NDJSON, "
+                                                       "streamed from a server-side cursor and optionally gzip-compressed")
+    @order_bp.arguments(OrderExportQuerySchema, location="query")
+    @order_bp.response(HTTPStatus.OK)
+    @require_admin
+    def get(self, args):
+        fmt = args.pop('format')
+        compress = args.pop('compress')
+        include_items = args.pop('include_items')
+        yield_per = args.pop('yield_per')
+        blocks = container.order_service().export_orders(
+            OrderFilterDTO(**args), fmt=fmt, compress=compress, include_items=include_items, yield_per=yield_per
+        )
+        filename = f"orders.{fmt}{'.gz' if compress else ''}"
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+        # The request context (and its session) stays open until the last block is sent
+        return Response(stream_with_context(blocks), mimetype=EXPORT_CONTENT_TYPES[fmt], headers=headers)
+
+@order_bp.route('/orders/search')
+class OrderSearchRoutes(BaseRoute):
+    @order_bp.doc(summary="Search orders", description="Orders whose id or user id starts with a short id, "
+                                                       "or whose notes contain every word, live or archived, newest first and paged by cursor")
+    @order_bp.arguments(OrderSearchQuerySchema, location="query")
+    @order_bp.response(HTTPStatus.OK, OrderListResponseSchema, description="Matching orders")
+    @require_admin
+    def get(self, args):
+        result = container.order_service().search_orders(
+            args['q'], status=args.get('status'), per_page=args['per_page'], cursor=args.get('cursor')
+        )
+        return self._trusted_response(
+            OrderListResponseSchema,
             message='Orders retrieved successfully',
             data=result,
             status_code=HTTPStatus.OK
@@ -43,6 +129,7 @@ class OrderFilterRoutes(BaseRoute):
 
 @order_bp.route('/orders/bulk')
 class OrderBulkUpdateRoutes(BaseRoute):
+    @idempotent("orders:bulk-update")
     @require_admin
     @order_bp.doc(summary="Bulk update orders", description="Update multiple orders in a single request")
     @order_bp.arguments(BulkUpdateOrderSchema)
@@ -110,8 +197,71 @@ class OrderBulkUpdateRoutes(BaseRoute):
             status_code=HTTPStatus.OK
         )
 
+@order_bp.route('/orders/batch')
+class OrderBatchCreateRoutes(BaseRoute):
+    @idempotent("orders:batch-create")
+    @order_bp.doc(summary="Create orders in batch", description="Create several orders of the current user in one transaction")
+    @order_bp.arguments(BatchCreateOrderSchema)
+    @order_bp.response(HTTPStatus.OK, BatchCreateOrderResponseSchema, description="Batch creation results")
+    @order_bp.response(HTTPStatus.BAD_REQUEST, ErrorResponseSchema, description="Invalid request data")
+    @jwt_required()
+    def post(self, data):
+        """
+        Create a batch of orders.
+
+        Stock is reserved for the whole batch at once. With all_or_nothing (the default)
+        no order is created unless all of them can be; otherwise the orders that fit the
+        stock are created. Returns the result of each order by its position.
+        """
+        user_id = UUID(get_jwt_identity())
+        command = BatchCreateOrderCommand(
+            orders=[
+                CreateOrderCommand(
+                    user_id=user_id,
+                    items=[CreateOrderItemDTO(**item) for item in order['items']],
+                    notes=order.get('notes')
+                ) for order in data['orders']
+            ],
+            all_or_nothing=data['all_or_nothing']
+        )
+
+        result = container.order_service().create_batch_orders(command)
+
+        if result.total_failed == 0:
+            message = f"All {result.total_successful} orders created successfully"
+        elif result.total_successful == 0:
+            message = f"Failed to create all {result.total_failed} orders"
+        else:
+            message = (
+                f"Batch creation completed: {result.total_successful} created, "
+                f"{result.total_failed} failed out of {result.total_attempted} orders"
+            )
+
+        return self._success_response(
+            message=message,
+            data={
+                'total_attempted': result.total_attempted,
+                'total_successful': result.total_successful,
+                'total_failed': result.total_failed,
+                'success_rate': result.success_rate,
+                'results': [
+                    {
+                        'index': item.index,
+                        'success': item.success,
+                        'order_id': str(item.order_id) if item.order_id else None,
+                        'total_amount': float(item.total_amount) if item.total_amount is not None else None,
+                        'error_message': item.error_message,
+                        'error_code': item.error_code,
+                        'errors': item.errors
+                    } for item in result.results
+                ]
+            },
+            status_code=HTTPStatus.OK
+        )
+
 @order_bp.route('/order')
 class OrderRoutes(BaseRoute):
+    @idempotent("orders:create")
     @order_bp.doc(summary="Create an order", description="Create an order")   
     @order_bp.arguments(CreateOrderSchema)
     @order_bp.response(HTTPStatus.NOT_FOUND, ErrorResponseSchema) #Inventory not found
@@ -182,7 +332,20 @@ class OrderDetailRoutes(BaseRoute):
     # @order_bp.response(HTTPStatus.NOT_FOUND, ErrorResponseSchema)
     @jwt_required()
     def get(self, order_id):
-        order = container.order_service().get_order(order_id)
+        order_service = container.order_service()
+        updated_at = order_service.get_order_updated_at(order_id)
+        if updated_at is None:
+            return self._get_order(order_service, order_id)
+
+        etag, last_modified = container.resource_versions().resource_validators(
+            ORDER_LIST_NAMESPACE, order_id, updated_at
+        )
+        return self._conditional_response(
+            etag, last_modified, lambda: self._get_order(order_service, order_id)
+        )
+
+    def _get_order(self, order_service, order_id):
+        order = order_service.get_order(order_id)
         if not order:
             return self._error_response(
                 message='Order not found',
@@ -253,7 +416,8 @@ class UserOrdersRoutes(BaseRoute):
         # Get user's orders
         orders = container.order_service().get_user_orders(user_id)
         
-        return self._success_response(
+        return self._trusted_response(
+            OrderListResponseSchema,
             message='User orders retrieved successfully',
             data=orders,
             status_code=HTTPStatus.OK
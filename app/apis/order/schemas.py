@@ -1,6 +1,10 @@
 from marshmallow import Schema, fields, validate
 
+from app.services.order_service.application.commands.batch_create_order_command import MAX_BATCH_CREATE
+from app.services.order_service.application.commands.bulk_update_order_command import MAX_BULK_UPDATE
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.export.order_export import EXPORT_FORMATS
+from app.shared.infrastructure.persistence.list_counts import COUNT_MODES
 
 class OrderItemSchema(Schema):
     id = fields.Str(dump_only=True)
@@ -34,6 +38,9 @@ class OrderFilterSchema(Schema):
     max_amount = fields.Float(required=False, description="Filter by maximum amount")
     page = fields.Integer(required=False, missing=1, description="Page number")
     per_page = fields.Integer(required=False, missing=10, description="Items per page")
+    cursor = fields.String(required=False, allow_none=True, description="Opaque cursor from a previous page's next_cursor; replaces page")
+    count_mode = fields.String(required=False, validate=validate.OneOf(COUNT_MODES), description="How to compute the total: exact, cached, estimate (unfiltered lists) or none")
+    archived = fields.Boolean(required=False, load_default=False, description="List archived orders instead of live ones")
 
 class CreateOrderSchema(Schema):
     items = fields.List(fields.Nested(OrderItemSchema), required=True, validate=validate.Length(min=1))
@@ -55,8 +62,8 @@ class BulkUpdateOrderSchema(Schema):
     updates = fields.List(
         fields.Nested(BulkUpdateOrderItemSchema), 
         required=True, 
-        validate=validate.Length(min=1, max=100),
-        description="List of order updates (max 100)"
+        validate=validate.Length(min=1, max=MAX_BULK_UPDATE),
+        description=f"List of order updates (max {MAX_BULK_UPDATE})"
     )
     
 # Bulk Update Response Schemas
@@ -81,11 +88,46 @@ class BulkUpdateOrderResultSchema(Schema):
         description="Detailed results for each order"
     )
 
+# Batch Create Schemas
+class BatchCreateOrderSchema(Schema):
+    """Schema for batch order creation request"""
+    orders = fields.List(
+        fields.Nested(CreateOrderSchema),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_BATCH_CREATE),
+        description=f"Orders to create (max {MAX_BATCH_CREATE})"
+    )
+    all_or_nothing = fields.Bool(required=False, load_default=True, description="Create every order or none; when false, create the orders whose stock can be reserved")
+
+class BatchCreateOrderItemResultSchema(Schema):
+    """Schema for the result of one order of a batch"""
+    index = fields.Int(required=True, description="Position of the order in the request")
+    success = fields.Bool(required=True, description="Whether the order was created")
+    order_id = fields.UUID(allow_none=True, description="ID of the created order")
+    total_amount = fields.Float(allow_none=True, description="Total amount of the created order")
+    error_message = fields.Str(allow_none=True, description="Error message if creation failed")
+    error_code = fields.Str(allow_none=True, description="Error code if creation failed")
+    errors = fields.Dict(allow_none=True, description="Error details, such as the products short of stock")
+
+class BatchCreateOrderResultSchema(Schema):
+    """Schema for batch creation response data"""
+    total_attempted = fields.Int(required=True, description="Number of orders in the request")
+    total_successful = fields.Int(required=True, description="Number of created orders")
+    total_failed = fields.Int(required=True, description="Number of orders not created")
+    success_rate = fields.Float(dump_only=True, description="Success rate percentage")
+    results = fields.List(
+        fields.Nested(BatchCreateOrderItemResultSchema),
+        required=True,
+        description="Result of each order, in request order"
+    )
+
 class PaginationSchema(Schema):
-    page = fields.Int(description="Current page number")
+    page = fields.Int(allow_none=True, description="Current page number (null when paging by cursor)")
     per_page = fields.Int(description="Items per page")
-    pages = fields.Int(description="Total pages")
-    total = fields.Int(description="Total items")
+    pages = fields.Int(allow_none=True, description="Total pages (null when count_mode=none)")
+    total = fields.Int(allow_none=True, description="Total items (null when count_mode=none)")
+    total_estimated = fields.Bool(description="Whether total comes from planner statistics")
+    next_cursor = fields.Str(allow_none=True, description="Cursor of the next page, null on the last page")
 
 class OrderListSchema(Schema):
     orders = fields.Nested(OrderSchema,many=True)
@@ -107,4 +149,49 @@ class BulkUpdateOrderResponseSchema(Schema):
     message = fields.Str(description="Response message")
     data = fields.Nested(BulkUpdateOrderResultSchema, description="Bulk update results")
 
+class BatchCreateOrderResponseSchema(Schema):
+    """Schema for batch creation API response"""
+    code = fields.Int(description="Response code")
+    message = fields.Str(description="Response message")
+    data = fields.Nested(BatchCreateOrderResultSchema, description="Batch creation results")
+
+class DailyOrderStatsQuerySchema(Schema):
+    days = fields.Integer(required=False, load_default=30, validate=validate.Range(min=1, max=366), description="Days before today to include (today included)")
+    status = fields.Enum(enum=OrderStatus, by_value=True, required=False, description="Only count orders currently in this status")
+
+class DailyOrderStatsSchema(Schema):
+    date = fields.Str(description="UTC day (YYYY-MM-DD)")
+    order_count = fields.Int(description="Orders created that day")
+    total_revenue = fields.Float(description="Sum of their total amounts")
+    item_count = fields.Int(description="Order lines")
+    unit_count = fields.Int(description="Ordered units")
 
+class DailyOrderStatsResponseSchema(Schema):
+    code = fields.Int(description="Response code")
+    message = fields.Str(description="Response message")
+    data = fields.List(fields.Nested(DailyOrderStatsSchema), description="One entry per day, oldest first")
+
+class OrderStatusSummaryResponseSchema(Schema):
+    code = fields.Int(description="Response code")
+    message = fields.Str(description="Response message")
+    data = fields.Dict(keys=fields.Str(), values=fields.Int(), description="Number of orders per status")
+
+class OrderSearchQuerySchema(Schema):
+    """Query parameters of an order search"""
+    q = fields.Str(required=True, validate=validate.Length(min=1, max=200), description="Short order or user id prefix (at least 4 hex digits, '#' and '-' allowed) or words of the notes")
+    status = fields.String(required=False, validate=validate.OneOf([status.value for status in OrderStatus]), description="Filter by order status")
+    per_page = fields.Int(load_default=10, validate=validate.Range(min=1, max=100), description="Items per page")
+    cursor = fields.String(required=False, allow_none=True, description="Opaque cursor from a previous page's next_cursor")
+
+class OrderExportQuerySchema(Schema):
+    """Query parameters of a streamed order export"""
+    user_id = fields.UUID(required=False, description="Filter by user ID")
+    status = fields.String(required=False, validate=validate.OneOf([status.value for status in OrderStatus]), description="Filter by order status")
+    start_date = fields.DateTime(required=False, description="Filter by start date")
+    end_date = fields.DateTime(required=False, description="Filter by end date")
+    min_amount = fields.Float(required=False, description="Filter by minimum amount")
+    max_amount = fields.Float(required=False, description="Filter by maximum amount")
+    format = fields.Str(load_default="csv", validate=validate.OneOf(EXPORT_FORMATS), description="Export format")
+    compress = fields.Bool(load_default=False, description="Gzip the response body")
+    include_items = fields.Bool(load_default=False, description="Add line items (nested in NDJSON, one CSV row per item)")
+    yield_per = fields.Int(load_default=1000, validate=validate.Range(min=100, max=10000), description="Orders fetched from the database cursor at a time")
@@ -1,6 +1,9 @@
 from marshmallow import Schema, fields, validate
 from datetime import datetime
 from app.services.product_service.domain.enums.product_status import ProductStatus
+from app.shared.infrastructure.persistence.list_counts import COUNT_MODES
+from app.services.product_service.infrastructure.catalog.catalog_import import IMPORT_FORMATS, IMPORT_MODES
+from app.services.product_service.infrastructure.catalog.catalog_export import EXPORT_FORMATS
 
 
 
@@ -33,6 +36,7 @@ class ProductSchema(Schema):
     id = fields.UUID(dump_only=True, metadata={"description": "The product ID"})
     product_fields=fields.Nested(ProductFieldsSchema)
     inventory_fields=fields.Nested(InventoryFieldsSchema)
+    category_name = fields.Str(dump_only=True, allow_none=True, metadata={"description": "Name of the product's category"})
 
 class ProductItemSchema(Schema):
     """Schema for flattened product item in list responses"""
@@ -59,9 +63,9 @@ class ProductFilterSchema(Schema):
     min_stock = fields.Int(metadata={"description": "Filter by minimum stock level"})
     has_stock = fields.Bool(metadata={"description": "Filter by stock availability"})
     sort_by = fields.Str(
-        validate=validate.OneOf(["name", "created_at", "brand"]),
+        validate=validate.OneOf(["name", "price", "stock", "created_at", "brand"]),
         dump_default="name",
-        metadata={"description": "Field to sort by"}
+        metadata={"description": "Field to sort by (price and stock leave out products without inventory)"}
     )
     sort_direction = fields.Str(
         validate=validate.OneOf(["asc", "desc"]),
@@ -70,6 +74,11 @@ class ProductFilterSchema(Schema):
     )
     page = fields.Int(dump_default=1, metadata={"description": "Page number"})
     items_per_page = fields.Int(dump_default=20, metadata={"description": "Items per page"})
+    cursor = fields.Str(metadata={"description": "Opaque cursor from a previous page's next_cursor; replaces page"})
+    count_mode = fields.Str(
+        validate=validate.OneOf(COUNT_MODES),
+        metadata={"description": "How to compute the total: exact, cached, estimate (unfiltered lists) or none"}
+    )
     # Additional fields for advanced filtering
     min_price = fields.Float(metadata={"description": "Minimum price filter"})
     max_price = fields.Float(metadata={"description": "Maximum price filter"})
@@ -88,10 +97,15 @@ class ProductSearchSchema(Schema):
     in_stock_only = fields.Bool(dump_default=False, metadata={"description": "Show only products in stock"})
     page = fields.Int(dump_default=1, metadata={"description": "Page number"})
     page_size = fields.Int(dump_default=20, metadata={"description": "Items per page"})
+    cursor = fields.Str(metadata={"description": "Opaque cursor from a previous page's next_cursor; replaces page (not available with a search term)"})
+    facets = fields.Bool(load_default=False, metadata={"description": "Also return category, brand, dosage form and in-stock counts of the filtered set"})
+    count_mode = fields.Str(
+        validate=validate.OneOf(COUNT_MODES),
+        metadata={"description": "How to compute the total: exact, cached, estimate (unfiltered lists) or none"}
+    )
     sort_by = fields.Str(
-        validate=validate.OneOf(["name", "price", "created_at", "brand"]),
-        dump_default="name",
-        metadata={"description": "Field to sort by"}
+        validate=validate.OneOf(["relevance", "name", "price", "stock", "created_at", "brand"]),
+        metadata={"description": "Field to sort by; defaults to relevance with a search term and name otherwise"}
     )
     sort_direction = fields.Str(
         validate=validate.OneOf(["asc", "desc"]),
@@ -99,6 +113,23 @@ class ProductSearchSchema(Schema):
         metadata={"description": "Sort direction"}
     )
 
+class ProductAutocompleteSchema(Schema):
+    """Schema for product autocomplete queries"""
+    q = fields.Str(required=True, validate=validate.Length(min=1, max=100), metadata={"description": "Prefix typed by the user"})
+    limit = fields.Int(load_default=10, validate=validate.Range(min=1, max=20), metadata={"description": "Maximum number of suggestions"})
+
+class ProductSuggestionSchema(Schema):
+    """Schema for a single autocomplete suggestion"""
+    id = fields.Str(metadata={"description": "The product ID"})
+    name = fields.Str(metadata={"description": "Product name"})
+    brand = fields.Str(allow_none=True, metadata={"description": "Product brand"})
+
+class ProductAutocompleteResponseSchema(Schema):
+    """Schema for product autocomplete response"""
+    code = fields.Int()
+    message = fields.Str()
+    data = fields.List(fields.Nested(ProductSuggestionSchema))
+
 class BulkProductSchema(Schema):
     """Schema for bulk product operations"""
     products = fields.List(
@@ -108,6 +139,37 @@ class BulkProductSchema(Schema):
         metadata={"description": "List of products to create"}
     )
 
+class ProductImportQuerySchema(Schema):
+    """Query parameters of a streamed catalog import"""
+    format = fields.Str(validate=validate.OneOf(IMPORT_FORMATS), metadata={"description": "Upload format; defaults from Content-Type"})
+    mode = fields.Str(load_default="partial", validate=validate.OneOf(IMPORT_MODES), metadata={"description": "partial commits valid rows, atomic commits only a fully valid upload"})
+    chunk_size = fields.Int(load_default=1000, validate=validate.Range(min=1, max=10000), metadata={"description": "Rows per multi-row insert"})
+
+class ProductImportErrorSchema(Schema):
+    row = fields.Int(metadata={"description": "1-based row number in the upload"})
+    error = fields.Str()
+
+class ProductImportReportSchema(Schema):
+    mode = fields.Str()
+    total_rows = fields.Int()
+    imported = fields.Int()
+    failed = fields.Int()
+    committed = fields.Bool()
+    errors = fields.List(fields.Nested(ProductImportErrorSchema))
+    errors_truncated = fields.Bool()
+
+class ProductImportResponseSchema(Schema):
+    code = fields.Int()
+    message = fields.Str()
+    data = fields.Nested(ProductImportReportSchema)
+
+class ProductExportQuerySchema(Schema):
+    """Query parameters of a streamed catalog export"""
+    format = fields.Str(load_default="csv", validate=validate.OneOf(EXPORT_FORMATS), metadata={"description": "Export format"})
+    compress = fields.Bool(load_default=False, metadata={"description": "Gzip the response body"})
+    status = fields.Enum(ProductStatus, metadata={"description": "Only export products with this status"})
+    yield_per = fields.Int(load_default=1000, validate=validate.Range(min=100, max=10000), metadata={"description": "Rows fetched from the database cursor at a time"})
+
 class ProductResponseSchema(Schema):
     """Schema for product response"""
     code = fields.Int()
@@ -115,13 +177,28 @@ class ProductResponseSchema(Schema):
     data = fields.Nested(ProductSchema)
     
     
+class ProductFacetValueSchema(Schema):
+    value = fields.Raw(allow_none=True, metadata={"description": "Facet value (null for products without one)"})
+    label = fields.Str(allow_none=True, metadata={"description": "Display name (categories only)"})
+    count = fields.Int()
+
+class ProductFacetsSchema(Schema):
+    """Counts of the filtered products per facet value, largest first"""
+    category = fields.List(fields.Nested(ProductFacetValueSchema))
+    brand = fields.List(fields.Nested(ProductFacetValueSchema))
+    dosage_form = fields.List(fields.Nested(ProductFacetValueSchema))
+    in_stock = fields.List(fields.Nested(ProductFacetValueSchema))
+
 class ProductPaginatedSchema(Schema):
     """Schema for paginated product response"""
     items = fields.List(fields.Nested(ProductItemSchema), metadata={"description": "List of products"})
-    total = fields.Int(metadata={"description": "Total number of products"})
-    page = fields.Int(metadata={"description": "Current page number"})
+    total = fields.Int(attribute="total_items", allow_none=True, metadata={"description": "Total number of products (null when count_mode=none)"})
+    total_estimated = fields.Bool(metadata={"description": "Whether total comes from planner statistics"})
+    page = fields.Int(allow_none=True, metadata={"description": "Current page number (null when paging by cursor)"})
     page_size = fields.Int(metadata={"description": "Items per page"})
-    total_pages = fields.Int(metadata={"description": "Total number of pages"})
+    total_pages = fields.Int(allow_none=True, metadata={"description": "Total number of pages (null when count_mode=none)"})
+    next_cursor = fields.Str(allow_none=True, metadata={"description": "Cursor of the next page, null on the last page"})
+    facets = fields.Nested(ProductFacetsSchema, metadata={"description": "Facet counts, when requested with facets=true"})
 
 class ProductPaginatedResponseSchema(Schema):
     """Schema for product response"""
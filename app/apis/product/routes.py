@@ -1,6 +1,8 @@
 from http import HTTPStatus
 from uuid import UUID
 
+from flask import Response, request, stream_with_context
+
 from app import container
 from app.apis.decorators.auth_decorator import require_admin
 from app.services.product_service.application.commands.create_product_command import CreateProductCommand
@@ -11,7 +13,11 @@ from app.services.product_service.application.queries.get_products_by_filter imp
 # from app.api.decorators.error_handler import handle_exceptions
 from app.apis import product_bp
 from app.apis.base_routes import BaseRoute
-from app.apis.product.product_shemas import ProductSchema, ProductResponseSchema, ProductFilterSchema, ProductPaginatedResponseSchema, ProductSearchSchema, BulkProductSchema
+from app.apis.product.product_shemas import ProductSchema, ProductResponseSchema, ProductFilterSchema, ProductPaginatedResponseSchema, ProductSearchSchema, BulkProductSchema, ProductAutocompleteSchema, ProductAutocompleteResponseSchema, ProductImportQuerySchema, ProductImportResponseSchema, ProductExportQuerySchema
+from app.services.product_service.infrastructure.catalog.catalog_export import EXPORT_CONTENT_TYPES
+from app.services.product_service.infrastructure.query_services.product_query_service import PRODUCT_LIST_NAMESPACE
+from app.shared.infrastructure.persistence.list_counts import filter_signature
+from app.shared.utils.cursor_pagination import InvalidCursorError
 from typing import Tuple, Dict, Any
 
 @product_bp.route('/')
@@ -51,7 +57,20 @@ class ProductRoute(BaseRoute):
     @product_bp.doc(description="Get product details")
     @product_bp.response(HTTPStatus.OK, ProductResponseSchema)
     def get(self, product_id: UUID):
-        result = container.product_service().get_product(
+        product_service = container.product_service()
+        updated_at = product_service.get_product_updated_at(product_id)
+        if updated_at is None:
+            return self._get_product(product_service, product_id)
+
+        etag, last_modified = container.resource_versions().resource_validators(
+            PRODUCT_LIST_NAMESPACE, product_id, updated_at
+        )
+        return self._conditional_response(
+            etag, last_modified, lambda: self._get_product(product_service, product_id)
+        )
+
+    def _get_product(self, product_service, product_id: UUID):
+        result = product_service.get_product(
             GetProductByIdQuery(id=product_id)
             )
         
@@ -61,7 +80,8 @@ class ProductRoute(BaseRoute):
                 status_code=HTTPStatus.NOT_FOUND
             )
             
-        return self._success_response(
+        return self._trusted_response(
+            ProductResponseSchema,
             data=result,
             message="Product retrieved successfully",
             status_code=HTTPStatus.OK
@@ -125,15 +145,22 @@ class ProductListRoute(BaseRoute):
     def get(self, filter_args: Dict[str, Any]) -> Tuple[dict, int]:
         """List products with filtering and pagination"""
         try:
-            result = container.product_service().list_products(
-                GetProductsByFilterQuery(**filter_args)
+            # Decided from the write-event version and a cheap database marker, before the list query runs
+            etag, last_modified = container.resource_versions().collection_validators(
+                PRODUCT_LIST_NAMESPACE, filter_signature(filter_args),
+                marker=container.product_service().get_list_marker()
             )
-
-            return self._success_response(
-                data=result,
-                message="Products retrieved successfully",
-                status_code=HTTPStatus.OK
+            return self._conditional_response(
+                etag, last_modified, lambda: self._trusted_response(
+                    ProductPaginatedResponseSchema,
+                    data=container.product_service().list_products(GetProductsByFilterQuery(**filter_args)),
+                    message="Products retrieved successfully",
+                    status_code=HTTPStatus.OK
+                )
             )
+        except InvalidCursorError:
+            # Reported as 400 by BaseRoute.dispatch_request
+            raise
         except Exception as e:
             return self._error_response(
                 message=f"Failed to retrieve products: {str(e)}",
@@ -159,17 +186,49 @@ class ProductSearchRoute(BaseRoute):
                 filters=search_args
             )
             
-            return self._success_response(
+            return self._trusted_response(
+                ProductPaginatedResponseSchema,
                 data=result,
                 message="Product search completed successfully",
                 status_code=HTTPStatus.OK
             )
+        except InvalidCursorError:
+            # Reported as 400 by BaseRoute.dispatch_request
+            raise
         except Exception as e:
             return self._error_response(
                 message=f"Search failed: {str(e)}",
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR
             )
 
+@product_bp.route('/autocomplete')
+class ProductAutocompleteRoute(BaseRoute):
+    """
+    Product name and brand suggestions for the search box
+    """
+    
+    @product_bp.doc(description="Suggest products by name or brand prefix from the in-memory index")
+    @product_bp.arguments(ProductAutocompleteSchema, location="query")
+    @product_bp.response(HTTPStatus.OK, ProductAutocompleteResponseSchema)
+    def get(self, query_args: Dict[str, Any]) -> Tuple[dict, int]:
+        """Get the top product suggestions for a prefix"""
+        try:
+            result = container.product_service().autocomplete_products(
+                prefix=query_args['q'],
+                limit=query_args.get('limit', 10)
+            )
+            
+            return self._success_response(
+                data=result,
+                message="Product suggestions retrieved successfully",
+                status_code=HTTPStatus.OK
+            )
+        except Exception as e:
+            return self._error_response(
+                message=f"Autocomplete failed: {str(e)}",
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR
+            )
+
 @product_bp.route('/bulk')
 class ProductBulkRoute(BaseRoute):
     """
@@ -197,6 +256,56 @@ class ProductBulkRoute(BaseRoute):
                 status_code=HTTPStatus.BAD_REQUEST
             )
 
+@product_bp.route('/import')
+class ProductImportRoute(BaseRoute):
+    """
+    Streamed bulk import of a supplier catalog
+    """
+    @require_admin
+    @product_bp.doc(description="Import products with inventory from an NDJSON or CSV request body (or a multipart 'file'), "
+                                "validated and inserted set-based in one transaction")
+    @product_bp.arguments(ProductImportQuerySchema, location="query")
+    @product_bp.response(HTTPStatus.OK, ProductImportResponseSchema)
+    def post(self, import_args: Dict[str, Any]) -> Tuple[dict, int]:
+        """Import products in bulk"""
+        upload = request.files.get('file')
+        stream = upload.stream if upload else request.stream
+        content_type = (upload.mimetype if upload else request.mimetype) or ""
+        fmt = import_args.get('format') or ("csv" if "csv" in content_type else "ndjson")
+
+        report = container.product_service().import_products(
+            stream, fmt=fmt, mode=import_args['mode'], chunk_size=import_args['chunk_size']
+        )
+        return self._success_response(
+            data=report,
+            message=f"Imported {report['imported']} of {report['total_rows']} products",
+            status_code=HTTPStatus.OK
+        )
+
+@product_bp.route('/export')
+class ProductExportRoute(BaseRoute):
+    """
+    Streamed export of the whole catalog
+    """
+    @require_admin
+    @product_bp.doc(description="Export products with inventory and category name as CSV or NDJSON, "
+                                "streamed from a server-side cursor and optionally gzip-compressed")
+    @product_bp.arguments(ProductExportQuerySchema, location="query")
+    @product_bp.response(HTTPStatus.OK)
+    def get(self, export_args: Dict[str, Any]) -> Response:
+        """Export the product catalog"""
+        fmt = export_args['format']
+        compress = export_args['compress']
+        blocks = container.product_service().export_products(
+            fmt=fmt, compress=compress, status=export_args.get('status'), yield_per=export_args['yield_per']
+        )
+        filename = f"products.{fmt}{'.gz' if compress else ''}"
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+        # The request context (and its session) stays open until the last block is sent
+        return Response(stream_with_context(blocks), mimetype=EXPORT_CONTENT_TYPES[fmt], headers=headers)
+
 @product_bp.route('/categories/<uuid:category_id>')
 class ProductByCategoryRoute(BaseRoute):
     """
@@ -221,6 +330,9 @@ class ProductByCategoryRoute(BaseRoute):
                 message=f"Products retrieved for category {category_id}",
                 status_code=HTTPStatus.OK
             )
+        except InvalidCursorError:
+            # Reported as 400 by BaseRoute.dispatch_request
+            raise
         except Exception as e:
             return self._error_response(
                 message=f"Failed to retrieve category products: {str(e)}",
@@ -308,3 +420,20 @@ class ProductStockStatusRoute(BaseRoute):
                 message=f"Failed to retrieve stock status: {str(e)}",
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR
             )
+
+@product_bp.route('/cache-stats')
+class ProductCacheStatsRoute(BaseRoute):
+    """
+    Metrics of the in-process product DTO cache
+    """
+    
+    @require_admin
+    @product_bp.doc(description="Get hit, miss and eviction counters of this worker's product cache")
+    @product_bp.response(HTTPStatus.OK)
+    def get(self) -> Tuple[dict, int]:
+        """Get product cache metrics"""
+        return self._success_response(
+            data=container.product_service().get_product_cache_stats(),
+            message="Product cache statistics retrieved successfully",
+            status_code=HTTPStatus.OK
+        )
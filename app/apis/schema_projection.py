@@ -0,0 +1,82 @@
+"""
+Fast projection of trusted DTOs onto response schemas.
+
+marshmallow's dump() converts and validates every field of every item. When a
+query service already returns values of the right types, responses only need
+the schema's *shape*: which keys to keep, under which names, and how nested
+schemas apply. project() does just that from a plan compiled once per schema
+class and leaves value encoding to the JSON provider.
+"""
+
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Tuple, Type
+
+from marshmallow import Schema, fields
+
+_MISSING = object()
+
+# Plain fields as (output key, attribute) and nested ones as (output key, attribute, schema class, many)
+_Plan = Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str, Type[Schema], bool], ...]]
+
+
+def _nested_schema(field: fields.Field) -> Tuple[Optional[Type[Schema]], bool]:
+    """Schema class behind a Nested or List(Nested) field, and whether it holds many items"""
+    if isinstance(field, fields.List) and isinstance(field.inner, fields.Nested):
+        nested, _ = _nested_schema(field.inner)
+        return nested, True
+    if isinstance(field, fields.Nested):
+        nested = field.nested
+        if isinstance(nested, Schema):
+            return type(nested), bool(field.many or nested.many)
+        if isinstance(nested, type) and issubclass(nested, Schema):
+            return nested, bool(field.many)
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def _plan(schema_class: Type[Schema]) -> _Plan:
+    plain, nested_fields = [], []
+    for name, field in schema_class().dump_fields.items():
+        nested, many = _nested_schema(field)
+        if nested is None:
+            plain.append((field.data_key or name, field.attribute or name))
+        else:
+            nested_fields.append((field.data_key or name, field.attribute or name, nested, many))
+    return tuple(plain), tuple(nested_fields)
+
+
+def project(schema_class: Type[Schema], obj: Any) -> Any:
+    """
+    Reduce a DTO (dict, pydantic model, dataclass or plain object) to a schema's keys.
+
+    Keys missing from the DTO are left out, like marshmallow does. Values are
+    not converted: UUIDs, enums and datetimes are left to the JSON provider.
+
+    Args:
+        schema_class: Response schema declaring the output shape
+        obj: Trusted DTO
+
+    Returns:
+        Dict ready for JSON encoding (None stays None)
+    """
+    if obj is None:
+        return None
+    plain, nested_fields = _plan(schema_class)
+    if isinstance(obj, Mapping):
+        result = {key: obj[attribute] for key, attribute in plain if attribute in obj}
+        get = obj.get
+    else:
+        result = {}
+        for key, attribute in plain:
+            value = getattr(obj, attribute, _MISSING)
+            if value is not _MISSING:
+                result[key] = value
+        get = lambda attribute, default: getattr(obj, attribute, default)
+    for key, attribute, nested, many in nested_fields:
+        value = get(attribute, _MISSING)
+        if value is _MISSING:
+            continue
+        if value is not None:
+            value = [project(nested, item) for item in value] if many else project(nested, value)
+        result[key] = value
+    return result
@@ -41,6 +41,22 @@ class Config:
         # Security Configuration
     ADMIN_INITIALIZATION_KEY = os.getenv('ADMIN_INITIALIZATION_KEY', 'admin-init-key-change-this')
     BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+    
+    # Read model warm-up
+    PRODUCT_CACHE_WARMUP = int(os.getenv('PRODUCT_CACHE_WARMUP', 200))
+    # Seconds a cached product DTO is served before it is reloaded (bounds staleness across workers)
+    PRODUCT_CACHE_TTL = float(os.getenv('PRODUCT_CACHE_TTL', 30))
+    
+    # Maintain order_status_counts on every order write and read status totals from it
+    ORDER_STATUS_COUNTERS = os.getenv('ORDER_STATUS_COUNTERS', 'false').lower() == 'true'
+    
+    # How long responses of requests sent with an Idempotency-Key are replayed
+    IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', 24 * 60 * 60))
+    
+    # Response serialization: "fast" (UUID/Decimal/datetime/enum aware, orjson when installed) or "default"
+    JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'fast')
+    # Let hot endpoints skip marshmallow re-serialization of trusted DTOs (needs the fast provider)
+    TRUSTED_RESPONSES = os.getenv('TRUSTED_RESPONSES', 'true').lower() == 'true'
 
     
 class DevelopmentConfig(Config):
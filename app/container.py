@@ -3,11 +3,22 @@ from dependency_injector import containers, providers
 from app.services.category_service.service import CategoryService
 from app.services.delivery_service.service import DeliveryService
 from app.services.order_service.service import OrderService
+from app.services.order_service.infrastructure.cache.consumer_name_cache import ConsumerNameCache
+from app.services.order_service.infrastructure.projections.order_summary_projection import OrderSummaryProjection
 from app.shared.acl.unified_acl import UnifiedACL
 from app.shared.application.events.event_bus import EventBus
 from app.dataBase import Database
 from app.services.inventory_service.service import InventoryService
 from app.services.product_service.service import ProductService
+from app.services.product_service.infrastructure.search.product_prefix_index import ProductPrefixIndex
+from app.services.product_service.infrastructure.cache.product_dto_cache import ProductDtoCache
+from app.services.product_service.infrastructure.search.product_facets import PRODUCT_FACET_NAMESPACE
+from app.services.product_service.infrastructure.query_services.product_query_service import PRODUCT_LIST_NAMESPACE, PRODUCT_LIST_WRITE_EVENTS
+from app.services.order_service.infrastructure.query_services.order_query_service import ORDER_LIST_NAMESPACE, ORDER_LIST_WRITE_EVENTS, ORDER_NAME_EVENTS
+from app.services.category_service.infrastructure.query_services.category_query_service import CATEGORY_LIST_NAMESPACE, CATEGORY_WRITE_EVENTS
+from app.shared.infrastructure.persistence.list_counts import ListCountCache
+from app.shared.infrastructure.resource_versions import ResourceVersions
+from app.shared.infrastructure.idempotency import IdempotencyStore
 from app.services.auth_service.service import AuthService
 from app.shared.domain.enums.enums import ServiceType
 
@@ -21,8 +32,37 @@ class Container(containers.DeclarativeContainer):
     # Core dependencies
     db = providers.Singleton(Database)
     event_bus = providers.Singleton(EventBus)
+    # Process-wide read models, kept in sync through the event bus
+    product_prefix_index = providers.Singleton(ProductPrefixIndex, event_bus=event_bus)
+    product_dto_cache = providers.Singleton(ProductDtoCache, event_bus=event_bus, ttl_seconds=config.product_cache_ttl)
+    consumer_name_cache = providers.Singleton(ConsumerNameCache, event_bus=event_bus)
+    order_summary_projection = providers.Singleton(OrderSummaryProjection, db=db, event_bus=event_bus)
+    list_count_cache = providers.Singleton(
+        ListCountCache,
+        event_bus=event_bus,
+        invalidation={
+            PRODUCT_LIST_NAMESPACE: PRODUCT_LIST_WRITE_EVENTS,
+            # Facets carry category names
+            PRODUCT_FACET_NAMESPACE: PRODUCT_LIST_WRITE_EVENTS + CATEGORY_WRITE_EVENTS,
+            ORDER_LIST_NAMESPACE: ORDER_LIST_WRITE_EVENTS,
+        }
+    )
+    # Product list items carry their category name, so category writes bump products too,
+    # and order list items carry consumer, center and product names
+    resource_versions = providers.Singleton(
+        ResourceVersions,
+        event_bus=event_bus,
+        tracking={
+            PRODUCT_LIST_NAMESPACE: PRODUCT_LIST_WRITE_EVENTS + CATEGORY_WRITE_EVENTS,
+            CATEGORY_LIST_NAMESPACE: CATEGORY_WRITE_EVENTS,
+            ORDER_LIST_NAMESPACE: ORDER_LIST_WRITE_EVENTS + ORDER_NAME_EVENTS,
+        }
+    )
    
     
+    # Responses of Idempotency-Key requests, in memory over a table shared by all workers
+    idempotency_store = providers.Singleton(IdempotencyStore, db=db, ttl_seconds=config.idempotency_key_ttl)
+   
     # # Services
     inventory_service = providers.Factory(
         InventoryService,
@@ -36,7 +76,10 @@ class Container(containers.DeclarativeContainer):
         ProductService,
         db=db,
         event_bus=event_bus,
-        acl=unified_acl
+        acl=unified_acl,
+        prefix_index=product_prefix_index,
+        count_cache=list_count_cache,
+        dto_cache=product_dto_cache
     )
     auth_service = providers.Factory(
         AuthService,
@@ -54,7 +97,11 @@ class Container(containers.DeclarativeContainer):
         OrderService,
         db=db,
         event_bus=event_bus,
-        acl=unified_acl
+        acl=unified_acl,
+        count_cache=list_count_cache,
+        status_counters=config.order_status_counters.as_(bool),
+        name_cache=consumer_name_cache,
+        summary_projection=order_summary_projection
     )
     delivery_service = providers.Singleton(
         DeliveryService,
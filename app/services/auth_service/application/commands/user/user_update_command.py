@@ -1,6 +1,12 @@
 from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
 
 
 @dataclass
-class UserUpdateCommand :
-    user_id: str
\ No newline at end of file
+class UserUpdateCommand:
+    full_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    health_care_center_id: Optional[UUID] = None
+    is_active: Optional[bool] = None
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
 from app.services.auth_service.application.commands.health_care_center.update_center_command import UpdateHealthCareCenterCommand
 from app.services.auth_service.domain.exceptions.health_care_center_errors import HealthCareCenterNotFoundError, DuplicateHealthCareCenterError
 from app.services.auth_service.infrastructure.persistence.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from app.shared.contracts.auth.auth_events import HealthCareCenterUpdatedEvent
 
 @dataclass
 class UpdateHealthCareCenterOutputDto:
@@ -54,6 +56,13 @@ class UpdateHealthCareCenterUseCase:
         # Save changes
         result = self._uow.health_care_center.update(updated_center)
         self._uow.commit()
+
+        # Read models holding the center's name refresh it from this event
+        self._uow.publish(HealthCareCenterUpdatedEvent(
+            id=str(result.id),
+            name=result.name,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
         
         # Return output DTO
         return UpdateHealthCareCenterOutputDto(
@@ -1,4 +1,5 @@
 from app.services.auth_service.application.commands import AssignUserToCenterCommand
+from app.services.auth_service.application.use_cases.user.update_user import publish_user_updated
 from app.services.auth_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.services.auth_service.domain.exceptions.auth_errors import UserNotFoundError
 from app.services.auth_service.domain.exceptions.health_care_center_errors import CenterNotFoundError
@@ -18,8 +19,9 @@ class AssignUserToCenterUseCase:
         if not center:
             raise CenterNotFoundError(f"Health care center with ID {command.center_id} not found")
 
-        user.health_care_center_id=center.id
+        updated_user = user.update(health_care_center_id=center.id)
+        self.uow.user.update(updated_user)
+        self.uow.commit()
 
-        self.uow.user.update(user)     
-
-       
\ No newline at end of file
+        publish_user_updated(self.uow, updated_user, user)
+        return updated_user
@@ -1,83 +1,76 @@
-from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime, timezone
 from uuid import UUID
 
-from ....domain.entities.user_entity import UserEntity
-from ....domain.value_objects.email import Email
-from ....domain.interfaces.unit_of_work import UnitOfWork
+from app.services.auth_service.application.commands.user.user_update_command import UserUpdateCommand
+from app.services.auth_service.domain.entities.user_entity import UserEntity
+from app.services.auth_service.domain.exceptions.auth_errors import UserAlreadyExistsError, UserNotFoundError
+from app.services.auth_service.domain.exceptions.health_care_center_errors import CenterNotFoundError
+from app.services.auth_service.domain.interfaces.unit_of_work import UnitOfWork
+from app.services.auth_service.domain.value_objects.email import Email
+from app.shared.contracts.auth.auth_events import UserUpdatedEvent
+
+
+def publish_user_updated(uow: UnitOfWork, user: UserEntity, previous: UserEntity) -> None:
+    """
+    Publish UserUpdatedEvent after a committed change of the user's name or center.
+
+    Read models holding the consumer's name and center (order summaries, the
+    consumer name cache) refresh them from this event.
+    """
+    if user.full_name == previous.full_name and user.health_care_center_id == previous.health_care_center_id:
+        return
+    center = uow.health_care_center.get_by_id(user.health_care_center_id) if user.health_care_center_id else None
+    uow.publish(UserUpdatedEvent(
+        id=str(user.id),
+        full_name=user.full_name,
+        health_care_center_id=str(user.health_care_center_id) if user.health_care_center_id else None,
+        health_care_center_name=center.name if center else None,
+        timestamp=datetime.now(timezone.utc).isoformat()
+    ))
 
-@dataclass
-class UpdateUserCommand:
-    id: UUID
-    name: Optional[str] = None
-    email: Optional[str] = None
-    role: Optional[str] = None
-    health_care_center_id: Optional[UUID] = None
-    is_active: Optional[bool] = None
 
 class UpdateUserUseCase:
     def __init__(self, uow: UnitOfWork):
         self._uow = uow
 
-    async def execute(self, command: UpdateUserCommand) -> UserEntity:
+    def execute(self, user_id: UUID, command: UserUpdateCommand) -> UserEntity:
         """
         Update an existing user.
-        
+
         Args:
-            command: The command containing updated user details
-            
+            user_id: ID of the user to update
+            command: The fields to change; None leaves a field as it is
+
         Returns:
             The updated user entity
-            
+
         Raises:
-            ValueError: If user not found
-            ValueError: If email already exists
-            ValueError: If validation fails
+            UserNotFoundError: If the user does not exist
+            UserAlreadyExistsError: If the new email belongs to another user
+            CenterNotFoundError: If the health care center does not exist
         """
-        async with self._uow:
-            # Get existing user
-            existing_user = await self._uow.users.get_by_id(command.id)
-            if not existing_user:
-                raise ValueError(f"User with id {command.id} not found")
-
-            # If email is being updated, check uniqueness and validate format
-            email = None
-            if command.email and command.email != str(existing_user.email):
-                # Check uniqueness
-                user_with_email = await self._uow.users.get_by_email(command.email)
-                if user_with_email:
-                    raise ValueError(f"Email {command.email} already exists")
-                # Create and validate email value object
-                email = Email(command.email)
+        existing_user = self._uow.user.get_by_id(user_id)
+        if not existing_user:
+            raise UserNotFoundError(f"User with ID {user_id} not found")
 
-            # If health care center is being updated, verify it exists
-            if command.health_care_center_id:
-                center = await self._uow.health_care_centers.get_by_id(
-                    command.health_care_center_id
-                )
-                if not center:
-                    raise ValueError(
-                        f"Health care center with id {command.health_care_center_id} not found"
-                    )
-                if not center.is_active:
-                    raise ValueError(
-                        f"Health care center with id {command.health_care_center_id} is not active"
-                    )
+        changes = {}
+        if command.email and command.email != existing_user.email.address:
+            if self._uow.user.get_by_email(command.email):
+                raise UserAlreadyExistsError(f"Email {command.email} already exists")
+            changes['email'] = Email(command.email)
 
-            # Create updated entity
-            updated_user = existing_user.update_profile(
-                name=command.name,
-                email=email,
-                role=command.role,
-                health_care_center_id=command.health_care_center_id
-            )
+        if command.health_care_center_id:
+            if not self._uow.health_care_center.get_by_id(command.health_care_center_id):
+                raise CenterNotFoundError(f"Health care center with ID {command.health_care_center_id} not found")
+            changes['health_care_center_id'] = command.health_care_center_id
 
-            # If deactivation is requested
-            if command.is_active is False and existing_user.is_active:
-                updated_user = updated_user.deactivate()
+        for field in ('full_name', 'phone', 'is_active'):
+            if getattr(command, field) is not None:
+                changes[field] = getattr(command, field)
 
-            # Save changes
-            result = await self._uow.users.update(updated_user)
-            await self._uow.commit()
+        updated_user = existing_user.update(**changes)
+        self._uow.user.update(updated_user)
+        self._uow.commit()
 
-            return result
+        publish_user_updated(self._uow, updated_user, existing_user)
+        return updated_user
@@ -28,6 +28,14 @@ class HealthCareCenterRepository:
         ).first()
         return self._to_entity(model) if model else None
 
+    def get_by_ids(self, center_ids: List[UUID]) -> List[HealthCareCenterEntity]:
+        if not center_ids:
+            return []
+        models = self._session.query(HealthCareCenterModel).filter(
+            HealthCareCenterModel.id.in_(set(center_ids))
+        ).all()
+        return [self._to_entity(model) for model in models]
+
     def get_by_email(self, email: str) -> Optional[HealthCareCenterEntity]:
         model = self._session.query(HealthCareCenterModel).filter(
             HealthCareCenterModel.email == email
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from app.services.auth_service.domain.entities import UserEntity
 from app.services.auth_service.domain.value_objects import Email,Password
@@ -12,6 +12,12 @@ class UserRepository:
         user = self._session.query(UserModel).filter_by(id=user_id).first()
         return self._to_entity(user) if user else None
 
+    def get_by_ids(self, user_ids: List[UUID]) -> List[UserEntity]:
+        if not user_ids:
+            return []
+        users = self._session.query(UserModel).filter(UserModel.id.in_(set(user_ids))).all()
+        return [self._to_entity(user) for user in users]
+
     def get_by_username(self, username: str) -> Optional[UserEntity]:
         user = self._session.query(UserModel).filter_by(username=username).first()
         return self._to_entity(user) if user else None
@@ -48,7 +54,11 @@ class UserRepository:
         ).first()        
         return True if user else False
     def update(self,user:UserEntity):
-        user_model=UserModel.query.filter_by(id=user.id).first()
+        user_model=self._session.query(UserModel).filter_by(id=user.id).first()
+        user_model.email=user.email.address if isinstance(user.email, Email) else user.email
+        user_model.full_name=user.full_name
+        user_model.phone=user.phone
+        user_model.is_active=user.is_active
         user_model.health_care_center_id=user.health_care_center_id
         self._session.flush()
 
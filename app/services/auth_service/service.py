@@ -1,4 +1,4 @@
-from app.services.auth_service.application.commands import LoginCommand,RegisterUserCommand,AdminRegistrationCommand,GenerateAccessCodeCommand
+from app.services.auth_service.application.commands import LoginCommand,RegisterUserCommand,AdminRegistrationCommand,GenerateAccessCodeCommand,UserUpdateCommand,AssignUserToCenterCommand
 from app.services.auth_service.application.commands.health_care_center import create_center_command
 from app.services.auth_service.application.commands.health_care_center.update_center_command import UpdateHealthCareCenterCommand
 from app.services.auth_service.application.commands.health_care_center.delete_center_command import DeleteHealthCareCenterCommand
@@ -10,6 +10,8 @@ from app.services.auth_service.application.queries.access_code.list_access_codes
 from app.services.auth_service.application.use_cases.user.login_user import UserLoginUseCase
 from app.services.auth_service.application.use_cases.token.refresh_token import RefreshTokenUseCase
 from app.services.auth_service.application.use_cases.user.register_user import RegisterUserUseCase
+from app.services.auth_service.application.use_cases.user.update_user import UpdateUserUseCase
+from app.services.auth_service.application.use_cases.user.assign_user_to_center import AssignUserToCenterUseCase
 from app.services.auth_service.application.use_cases.access_code.generate_code import GenerateAccessCodeUseCase
 from app.services.auth_service.application.use_cases.access_code.validate_code import ValidateAccessCodeUseCase
 from app.services.auth_service.application.use_cases.access_code.delete_code import DeleteAccessCodeUseCase
@@ -28,6 +30,7 @@ from app.shared.application.events.event_bus import EventBus
 from app.dataBase import Database
 from app.shared.infrastructure.db_error_handler import DatabaseErrorHandler
 from typing import Dict, Any
+from uuid import UUID
 
 class AuthService:
     def __init__(self,db:Database,event_bus:EventBus):
@@ -53,6 +56,8 @@ class AuthService:
             self._user_login_use_case = UserLoginUseCase(self._uow, self._auth_query_service)
             self._refresh_token_use_case= RefreshTokenUseCase(self._uow, self._auth_query_service)
             self._register_user_use_case = RegisterUserUseCase(self._uow, self._access_code_query_service)
+            self._update_user_use_case = UpdateUserUseCase(self._uow)
+            self._assign_user_to_center_use_case = AssignUserToCenterUseCase(self._uow)
             
             # Access code related use cases
             self._generate_access_code_use_case = GenerateAccessCodeUseCase(self._uow)
@@ -131,6 +136,20 @@ class AuthService:
     def register(self, command: RegisterUserCommand):
         return self._register_user_use_case.execute(command)
         
+    def update_user(self, user_id: UUID, command: UserUpdateCommand) -> Dict[str, Any]:
+        try:
+            return self._user_payload(self._update_user_use_case.execute(user_id, command))
+        except Exception as e:
+            self._uow.rollback()
+            raise e
+
+    def assign_user_to_center(self, command: AssignUserToCenterCommand) -> Dict[str, Any]:
+        try:
+            return self._user_payload(self._assign_user_to_center_use_case.execute(command))
+        except Exception as e:
+            self._uow.rollback()
+            raise e
+
     def list_centers_by_filter(self, query: ListCentersByFilterQuery):
         return self._health_query_service.list_centers_by_filter(query)
         
@@ -187,16 +206,7 @@ class AuthService:
             if not center:
                 return None
                 
-            return {
-                'id': str(center.id),
-                'name': center.name,
-                'address': center.address,
-                'phone': center.phone,
-                'email': center.email,
-                'latitude': center.latitude,
-                'longitude': center.longitude,
-                'is_active': center.is_active
-            }
+            return self._center_payload(center)
             
         except Exception as e:
             return None
@@ -222,16 +232,7 @@ class AuthService:
             if not center:
                 return None
                 
-            return {
-                'id': str(center.id),
-                'name': center.name,
-                'address': center.address,
-                'phone': center.phone,
-                'email': center.email,
-                'latitude': center.latitude,
-                'longitude': center.longitude,
-                'is_active': center.is_active
-            }
+            return self._center_payload(center)
             
         except Exception as e:
             return None
@@ -257,22 +258,66 @@ class AuthService:
             if not user:
                 return None
                 
-            return {
-                'id': str(user.id),
-                'username': user.username,
-                'email': user.email,
-                'full_name': user.full_name,
-                'phone': user.phone,
-                'is_admin': user.is_admin,
-                'is_active': user.is_active,
-                'health_care_center_id': str(user.health_care_center_id) if user.health_care_center_id else None,
-                'created_at': user.created_at.isoformat() if user.created_at else None,
-                'updated_at': user.updated_at.isoformat() if user.updated_at else None
-            }
+            return self._user_payload(user)
             
         except Exception as e:
             return None
 
+    def get_users_by_ids(self, request: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several users with one query.
+        This method is called by other services via ACL.
+
+        Args:
+            request: Request containing user_ids
+
+        Returns:
+            Dictionary mapping user ID to user information, for the users that exist
+        """
+        user_ids = [UUID(str(user_id)) for user_id in request.get('user_ids') or []]
+        return {str(user.id): self._user_payload(user) for user in self._uow.user.get_by_ids(user_ids)}
+
+    def get_health_care_centers_by_ids(self, request: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several health care centers with one query.
+        This method is called by other services via ACL.
+
+        Args:
+            request: Request containing center_ids
 
+        Returns:
+            Dictionary mapping center ID to health care center information, for the centers that exist
+        """
+        center_ids = [UUID(str(center_id)) for center_id in request.get('center_ids') or []]
+        return {
+            str(center.id): self._center_payload(center)
+            for center in self._uow.health_care_center.get_by_ids(center_ids)
+        }
 
+    @staticmethod
+    def _user_payload(user) -> Dict[str, Any]:
+        return {
+            'id': str(user.id),
+            'username': user.username,
+            'email': user.email,
+            'full_name': user.full_name,
+            'phone': user.phone,
+            'is_admin': user.is_admin,
+            'is_active': user.is_active,
+            'health_care_center_id': str(user.health_care_center_id) if user.health_care_center_id else None,
+            'created_at': user.created_at.isoformat() if user.created_at else None,
+            'updated_at': user.updated_at.isoformat() if user.updated_at else None
+        }
 
+    @staticmethod
+    def _center_payload(center) -> Dict[str, Any]:
+        return {
+            'id': str(center.id),
+            'name': center.name,
+            'address': center.address,
+            'phone': center.phone,
+            'email': center.email,
+            'latitude': center.latitude,
+            'longitude': center.longitude,
+            'is_active': center.is_active
+        }
@@ -36,6 +36,7 @@ class CategoryResponseDto(BaseModel):
 class CategoryListDto(BaseModel):
     items: List[CategoryResponseDto]
     total_items: int
-    page: int
+    page: Optional[int]
     page_size: int
-    total_pages: int 
\ No newline at end of file
+    total_pages: int
+    next_cursor: Optional[str] = None 
\ No newline at end of file
@@ -10,4 +10,5 @@ class GetCategoriesByFilterQuery(BaseModel):
     sort_by: str = "name"
     sort_direction: str = "asc"
     page: int = 1
-    items_per_page: int = 20 
\ No newline at end of file
+    items_per_page: int = 20
+    cursor: Optional[str] = None 
\ No newline at end of file
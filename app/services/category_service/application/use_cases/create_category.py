@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID
 import logging
 from typing import Dict, Any
@@ -9,6 +9,7 @@ from app.services.category_service.application.commands.create_category_command
 from app.services.category_service.domain.entities.category_entity import CategoryEntity
 from app.services.category_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.services.category_service.application.dtos.category_dto import CategoryFieldsDto
+from app.shared.contracts.category.category_events import CategoryCreatedEvent
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -33,6 +34,13 @@ class CreateCategoryUseCase:
             
         # Commit the transaction
         self._uow.commit()
+        
+        # Notify read models once the category is visible to other sessions
+        self._uow.publish(CategoryCreatedEvent(
+            id=str(category_entity.id),
+            name=category_entity.name,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
             
         # Prepare response
         response = self._create_category_response_dto(category_entity)
@@ -1,10 +1,12 @@
 import logging
+from datetime import datetime, timezone
 from uuid import UUID
 
 from pydantic import BaseModel
 
 from app.services.category_service.application.commands.delete_category_command import DeleteCategoryCommand
 from app.services.category_service.domain.interfaces.unit_of_work import UnitOfWork
+from app.shared.contracts.category.category_events import CategoryDeletedEvent
 from app.shared.domain.exceptions.common_errors import ResourceNotFoundError
 
 # Configure logger
@@ -37,6 +39,12 @@ class DeleteCategoryUseCase:
         # Commit the transaction
         self._uow.commit()
         
+        # Notify read models that the category is gone
+        self._uow.publish(CategoryDeletedEvent(
+            id=str(command.id),
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
+        
         # Prepare response
         response = DeleteCategoryResponseDTO(
             id=command.id,
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 from uuid import UUID
 
@@ -8,6 +8,7 @@ from app.services.category_service.application.commands.update_category_command
 from app.services.category_service.domain.entities.category_entity import CategoryEntity
 from app.services.category_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.services.category_service.application.dtos.category_dto import CategoryFieldsDto
+from app.shared.contracts.category.category_events import CategoryUpdatedEvent
 from app.shared.domain.exceptions.common_errors import ResourceNotFoundError
 
 # Configure logger
@@ -40,6 +41,13 @@ class UpdateCategoryUseCase:
         # Commit the transaction
         self._uow.commit()
         
+        # Notify read models of the committed change
+        self._uow.publish(CategoryUpdatedEvent(
+            id=str(updated_category.id),
+            name=updated_category.name,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
+        
         # Prepare response
         response = self._create_update_response_dto(updated_category)
         
@@ -1,11 +1,17 @@
 from uuid import uuid4
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
 from datetime import datetime
 from app.dataBase import db
 from app.shared.database_types import UUID
 
 class Category(db.Model):
     __tablename__ = 'categories'
+    __table_args__ = (
+        # Backs the (name, id) keyset pagination of the category list
+        Index('ix_categories_name_id', 'name', 'id'),
+        # max(updated_at) of the category list marker
+        Index('ix_categories_updated_at', 'updated_at'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     name = Column(String(100), nullable=False)
@@ -1,16 +1,28 @@
 import logging
+import math
 from typing import Optional, List, Dict, Any
 from uuid import UUID
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.services.category_service.application.dtos.category_dto import CategoryResponseDto, CategoryListDto, CategoryResponseFieldsDto
 from app.services.category_service.application.queries.get_category_by_id import GetCategoryByIdQuery
 from app.services.category_service.application.queries.get_categories_by_filter import GetCategoriesByFilterQuery
 from app.services.category_service.domain.interfaces.unit_of_work import UnitOfWork
+from app.services.category_service.infrastructure.persistence.models.category import Category
+from app.shared.contracts.category.category_events import CategoryCreatedEvent, CategoryDeletedEvent, CategoryUpdatedEvent
+from app.shared.utils.cursor_pagination import decode_cursor, encode_cursor, keyset_condition
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Cursor kind for the category listing ordered by (name, id)
+CATEGORY_CURSOR = "categories:name"
+
+# Version namespace of the category listing and the writes that change it
+CATEGORY_LIST_NAMESPACE = "categories"
+CATEGORY_WRITE_EVENTS = (CategoryCreatedEvent, CategoryUpdatedEvent, CategoryDeletedEvent)
+
 class CategoryQueryService:
     """
     Service for querying categories.
@@ -56,17 +68,92 @@ class CategoryQueryService:
         
         return response
     
+    def get_list_marker(self) -> tuple:
+        """
+        Row count and newest write time of the categories, in one round trip.
+
+        Folded into the list ETag so a write made on another worker changes it too.
+        """
+        return tuple(self._session.execute(
+            select(func.count(), func.max(Category.updated_at)).select_from(Category)
+        ).one())
+    
     def list(self, query: GetCategoriesByFilterQuery) -> CategoryListDto:
         """
         List categories with optional filtering and pagination.
         
+        Filtering, sorting and paging happen in SQL. Pages are addressed either by
+        page number or, when query.cursor is set, by seeking past the (name, id)
+        key of the previous page's last row.
+        
         Args:
             query: Query containing filter and pagination parameters
             
         Returns:
             Category list DTO with pagination information
         """
-        from app.services.category_service.application.use_cases.list_categories import ListCategoriesUseCase
+        logger.info(f"Listing categories with filters: {query.model_dump()}")
+        
+        sql_query = self._apply_filters(self._session.query(Category), query)
+        total_items = sql_query.count()
+        total_pages = math.ceil(total_items / query.items_per_page) if total_items > 0 else 1
+        
+        descending = query.sort_direction.lower() == 'desc'
+        sort_columns = (Category.name, Category.id)
+        if descending:
+            sql_query = sql_query.order_by(Category.name.desc(), Category.id.desc())
+        else:
+            sql_query = sql_query.order_by(Category.name, Category.id)
+        
+        if query.cursor:
+            sql_query = sql_query.filter(
+                keyset_condition(sort_columns, decode_cursor(query.cursor, CATEGORY_CURSOR), descending)
+            )
+            page = None
+        else:
+            page = query.page
+            sql_query = sql_query.offset((query.page - 1) * query.items_per_page)
         
-        list_use_case = ListCategoriesUseCase(self._uow)
-        return list_use_case.execute(query) 
\ No newline at end of file
+        # Read one extra row to know whether another page follows
+        categories = sql_query.limit(query.items_per_page + 1).all()
+        has_more = len(categories) > query.items_per_page
+        categories = categories[:query.items_per_page]
+        next_cursor = (
+            encode_cursor(CATEGORY_CURSOR, (categories[-1].name, categories[-1].id))
+            if has_more else None
+        )
+        
+        response = CategoryListDto(
+            items=[self._to_response_dto(category) for category in categories],
+            total_items=total_items,
+            page=page,
+            page_size=query.items_per_page,
+            total_pages=total_pages,
+            next_cursor=next_cursor
+        )
+        
+        logger.info(f"Found {total_items} categories")
+        return response
+    
+    def _apply_filters(self, sql_query, query: GetCategoriesByFilterQuery):
+        """Apply name, parent and active filters to a category query"""
+        if query.name:
+            sql_query = sql_query.filter(Category.name.ilike(f"%{query.name}%"))
+        if query.parent_id:
+            sql_query = sql_query.filter(Category.parent_id == query.parent_id)
+        if query.is_active is not None:
+            sql_query = sql_query.filter(Category.is_active == query.is_active)
+        return sql_query
+    
+    def _to_response_dto(self, category: Category) -> CategoryResponseDto:
+        """Convert a category model to its response DTO"""
+        return CategoryResponseDto(
+            id=category.id,
+            category_fields=CategoryResponseFieldsDto(
+                name=category.name,
+                description=category.description,
+                parent_id=category.parent_id,
+                image_url=category.image_url,
+                is_active=category.is_active
+            )
+        )
@@ -93,6 +93,10 @@ class CategoryService:
             logger.error(f"Error getting category: {str(e)}")
             raise
     
+    def get_list_marker(self) -> tuple:
+        """Row count and newest write time of the categories, for conditional GET validators"""
+        return self._query_service.get_list_marker()
+    
     def list_categories(self, query: GetCategoriesByFilterQuery):        
         logger.info(f"Listing categories")
         try:
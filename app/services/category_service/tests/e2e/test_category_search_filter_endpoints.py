@@ -169,4 +169,57 @@ class TestCategorySearchFilterEndpoints:
         
         # Test invalid items_per_page
         response = client.get("/api/categories/list?items_per_page=0")
-        assert response.status_code == 422 
\ No newline at end of file
+        assert response.status_code == 422 
+    def test_category_cursor_pagination(self, client, admin_headers, valid_category_data):
+        """Test walking the category list with next_cursor"""
+        created_names = ["Cursor A", "Cursor B", "Cursor B", "Cursor C", "Cursor D"]
+        for name in created_names:
+            category_data = json.loads(json.dumps(valid_category_data))
+            category_data['category_fields']['name'] = name
+            create_response = client.post("/api/categories/",
+                                        data=json.dumps(category_data),
+                                        content_type='application/json',
+                                        headers=admin_headers)
+            assert create_response.status_code == 201
+
+        names = []
+        ids = []
+        response = client.get("/api/categories/list?name=Cursor&items_per_page=2")
+        while True:
+            assert response.status_code == 200
+            page = response.get_json()['data']
+            names.extend(item['category_fields']['name'] for item in page['items'])
+            ids.extend(item['id'] for item in page['items'])
+            if not page['next_cursor']:
+                break
+            assert page['total_items'] == len(created_names)
+            response = client.get(f"/api/categories/list?name=Cursor&items_per_page=2&cursor={page['next_cursor']}")
+
+        assert names == sorted(created_names)
+        assert len(set(ids)) == len(created_names)
+
+    def test_category_invalid_cursor(self, client):
+        """Test that a malformed cursor is rejected"""
+        response = client.get("/api/categories/list?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_category_list_conditional_get(self, client, admin_headers, valid_category_data):
+        """Test that the list answers 304 until a category is written"""
+        first = client.get("/api/categories/list?items_per_page=5")
+        etag = first.headers['ETag']
+        assert first.status_code == 200
+
+        response = client.get("/api/categories/list?items_per_page=5", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        category_data = json.loads(json.dumps(valid_category_data))
+        category_data['category_fields']['name'] = "Conditional Category"
+        create_response = client.post("/api/categories/",
+                                    data=json.dumps(category_data),
+                                    content_type='application/json',
+                                    headers=admin_headers)
+        assert create_response.status_code == 201
+
+        response = client.get("/api/categories/list?items_per_page=5", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
@@ -67,6 +67,7 @@ class ProcessingOrderDto:
     items_count: int
     notes: Optional[str] = None
     created_at: Optional[datetime] = None
+    health_care_center_id: Optional[UUID] = None
 
 
 @dataclass
@@ -80,6 +81,14 @@ class PrioritizedOrderDto:
     priority: str  # 'HIGH' for SHIPPED, 'NORMAL' for PROCESSING
     notes: Optional[str] = None
     created_at: Optional[datetime] = None
+    health_care_center_id: Optional[UUID] = None
+
+
+@dataclass
+class PrioritizedOrdersDto:
+    """Prioritized orders returned for a request, and the number of orders waiting whatever its limit"""
+    orders: List[PrioritizedOrderDto]
+    total_count: int
 
 
 @dataclass
@@ -7,7 +7,8 @@ from app.services.delivery_service.application.dtos.delivery_dto import (
     DeliveryRoutesResponseDto,
     DeliveryRouteDto,
     DeliveryLocationDto,
-    DeliveryOrderDto
+    DeliveryOrderDto,
+    PrioritizedOrdersDto
 )
 from app.services.delivery_service.application.queries.get_delivery_routes_query import GetDeliveryRoutesQuery
 from app.services.delivery_service.domain.entities.delivery_route_entity import (
@@ -27,8 +28,8 @@ class GetDeliveryRoutesUseCase:
     Use case for getting delivery routes from processing orders.
     
     This use case handles:
-    1. Getting all orders with PROCESSING status from Order Service
-    2. Getting health care center information for each order from Auth Service
+    1. Getting the prioritized orders from Order Service, limited there
+    2. Getting the health care centers of all orders from Auth Service in one call
     3. Grouping orders by location (health care center)
     4. Creating delivery routes with GPS coordinates
     5. Returning optimized delivery route information
@@ -44,14 +45,15 @@ class GetDeliveryRoutesUseCase:
         try:
             with self._uow:
                 # Step 1: Get prioritized orders from Order Service (SHIPPED first, then PROCESSING)
-                prioritized_orders = self._get_prioritized_orders()
+                prioritized = self._get_prioritized_orders(query)
+                prioritized_orders = prioritized.orders
                 logger.info(f"Found {len(prioritized_orders)} prioritized orders (SHIPPED first, then PROCESSING)")
                 
                 if not prioritized_orders:
                     return DeliveryRoutesResponseDto(
                         routes=[],
                         total_routes=0,
-                        processing_orders_count=0,
+                        processing_orders_count=prioritized.total_count,
                         total_estimated_deliveries=0
                     )
                 
@@ -70,7 +72,7 @@ class GetDeliveryRoutesUseCase:
                     delivery_routes = delivery_routes[:query.limit]
                 
                 # Step 5: Create response
-                response = self._create_response(delivery_routes, len(prioritized_orders))
+                response = self._create_response(delivery_routes, prioritized.total_count)
                 
                 logger.info(f"Generated {len(delivery_routes)} delivery routes")
                 return response
@@ -79,28 +81,34 @@ class GetDeliveryRoutesUseCase:
             logger.error(f"Error generating delivery routes: {str(e)}", exc_info=True)
             raise
     
-    def _get_prioritized_orders(self) -> List:
-        """Get prioritized orders for delivery (SHIPPED first, then PROCESSING)"""
-        return self._uow.order_service_port.get_prioritized_orders_for_delivery()
+    def _get_prioritized_orders(self, query: GetDeliveryRoutesQuery) -> PrioritizedOrdersDto:
+        """Get prioritized orders for delivery (SHIPPED first, then PROCESSING), for the first limit routes"""
+        return self._uow.order_service_port.get_prioritized_orders_for_delivery(
+            limit=query.limit,
+            group_by_location=query.group_by_location
+        )
     
     def _enrich_orders_with_location(self, orders) -> List[Dict]:
         """Enrich orders with health care center location information"""
         enriched_orders = []
         
+        try:
+            centers = self._uow.auth_service_port.get_health_care_centers_by_ids(list({
+                order.health_care_center_id for order in orders if order.health_care_center_id
+            }))
+        except Exception as e:
+            logger.warning(f"Failed to get health care centers for {len(orders)} orders: {str(e)}")
+            return enriched_orders
+        
         for order in orders:
-            try:
-                # Get health care center for this user
-                health_care_center = self._uow.auth_service_port.get_user_health_care_center(order.user_id)
-                
-                if health_care_center:
-                    enriched_orders.append({
-                        'order': order,
-                        'location': health_care_center
-                    })
-                else:
-                    logger.warning(f"No health care center found for user {order.user_id} in order {order.order_id}")
-            except Exception as e:
-                logger.warning(f"Failed to get health care center for order {order.order_id}: {str(e)}")
+            health_care_center = centers.get(order.health_care_center_id)
+            if health_care_center:
+                enriched_orders.append({
+                    'order': order,
+                    'location': health_care_center
+                })
+            else:
+                logger.warning(f"No health care center found for user {order.user_id} in order {order.order_id}")
         
         return enriched_orders
     
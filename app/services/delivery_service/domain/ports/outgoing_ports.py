@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from app.services.delivery_service.application.dtos.delivery_dto import ProcessingOrderDto, PrioritizedOrderDto, HealthCareCenterDto
+from app.services.delivery_service.application.dtos.delivery_dto import ProcessingOrderDto, PrioritizedOrdersDto, HealthCareCenterDto
 
 
 class OrderServicePort(ABC):
@@ -14,7 +14,8 @@ class OrderServicePort(ABC):
         pass
     
     @abstractmethod
-    def get_prioritized_orders_for_delivery(self) -> List[PrioritizedOrderDto]:
+    def get_prioritized_orders_for_delivery(self, limit: Optional[int] = None, group_by_location: bool = False,
+                                            health_care_center_id: Optional[UUID] = None) -> PrioritizedOrdersDto:
         """Get prioritized orders for delivery (SHIPPED first, then PROCESSING)"""
         pass
 
@@ -30,4 +31,9 @@ class AuthServicePort(ABC):
     @abstractmethod
     def get_health_care_center_by_id(self, center_id: UUID) -> Optional[HealthCareCenterDto]:
         """Get health care center by ID"""
+        pass
+
+    @abstractmethod
+    def get_health_care_centers_by_ids(self, center_ids: List[UUID]) -> Dict[UUID, HealthCareCenterDto]:
+        """Get several health care centers with one call; missing centers are left out"""
         pass 
\ No newline at end of file
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass
+class GetPrioritizedOrdersRequest:
+    """Request to get orders prioritized for delivery (SHIPPED first, then PROCESSING)"""
+    limit: Optional[int] = None
+    group_by_location: bool = False
+    health_care_center_id: Optional[UUID] = None
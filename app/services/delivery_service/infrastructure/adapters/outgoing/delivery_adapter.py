@@ -1,8 +1,14 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from app.services.delivery_service.application.dtos.delivery_dto import ProcessingOrderDto, PrioritizedOrderDto, HealthCareCenterDto
+from app.services.delivery_service.application.dtos.delivery_dto import (
+    ProcessingOrderDto,
+    PrioritizedOrderDto,
+    PrioritizedOrdersDto,
+    HealthCareCenterDto
+)
 from app.services.delivery_service.domain.ports.outgoing_ports import OrderServicePort, AuthServicePort
+from app.services.delivery_service.domain.requests.get_prioritized_orders_request import GetPrioritizedOrdersRequest
 from app.services.delivery_service.domain.requests.get_processing_orders_request import GetProcessingOrdersRequest
 from app.services.delivery_service.domain.requests.get_health_care_center_request import (
     GetHealthCareCenterRequest,
@@ -41,17 +47,22 @@ class DeliveryOrderServiceAdapter(OrderServicePort):
                 user_id=UUID(order_data['user_id']),
                 status=order_data['status'],
                 total_amount=float(order_data['total_amount']),
-                items_count=len(order_data.get('items', [])),
+                items_count=order_data.get('items_count', 0),
                 notes=order_data.get('notes'),
-                created_at=order_data.get('created_at')
+                created_at=order_data.get('created_at'),
+                health_care_center_id=_optional_uuid(order_data.get('health_care_center_id'))
             ))
         
         return orders
 
-    def get_prioritized_orders_for_delivery(self) -> List[PrioritizedOrderDto]:
+    def get_prioritized_orders_for_delivery(self, limit: Optional[int] = None, group_by_location: bool = False,
+                                            health_care_center_id: Optional[UUID] = None) -> PrioritizedOrdersDto:
         """Get prioritized orders for delivery (SHIPPED first, then PROCESSING) from Order Service"""
-        # Create a request object (can be empty as the logic is in the service)
-        request = GetProcessingOrdersRequest()  # Reusing this for now, could create specific request
+        request = GetPrioritizedOrdersRequest(
+            limit=limit,
+            group_by_location=group_by_location,
+            health_care_center_id=health_care_center_id
+        )
         
         result = self._acl.execute_service_operation(
             ServiceContext(
@@ -62,7 +73,7 @@ class DeliveryOrderServiceAdapter(OrderServicePort):
         )
         
         if not result.success:
-            return []
+            return PrioritizedOrdersDto(orders=[], total_count=0)
             
         # Transform the response to PrioritizedOrderDto list
         orders = []
@@ -72,13 +83,14 @@ class DeliveryOrderServiceAdapter(OrderServicePort):
                 user_id=UUID(order_data['user_id']),
                 status=order_data['status'],
                 total_amount=float(order_data['total_amount']),
-                items_count=len(order_data.get('items', [])),
+                items_count=order_data.get('items_count', 0),
                 priority=order_data.get('priority', 'NORMAL'),
                 notes=order_data.get('notes'),
-                created_at=order_data.get('created_at')
+                created_at=order_data.get('created_at'),
+                health_care_center_id=_optional_uuid(order_data.get('health_care_center_id'))
             ))
         
-        return orders
+        return PrioritizedOrdersDto(orders=orders, total_count=result.data.get('total_count', len(orders)))
 
 
 class DeliveryAuthServiceAdapter(AuthServicePort):
@@ -102,18 +114,25 @@ class DeliveryAuthServiceAdapter(AuthServicePort):
         if not result.success or not result.data:
             return None
             
-        center_data = result.data
-        return HealthCareCenterDto(
-            id=UUID(center_data['id']),
-            name=center_data['name'],
-            address=center_data['address'],
-            phone=center_data['phone'],
-            email=center_data['email'],
-            latitude=float(center_data['latitude']),
-            longitude=float(center_data['longitude']),
-            is_active=center_data.get('is_active', True)
+        return _center_dto(result.data)
+
+    def get_health_care_centers_by_ids(self, center_ids: List[UUID]) -> Dict[UUID, HealthCareCenterDto]:
+        """Get several health care centers from Auth Service with one call"""
+        if not center_ids:
+            return {}
+        result = self._acl.execute_service_operation(
+            ServiceContext(
+                service_type=ServiceType.AUTH,
+                operation="GET_HEALTH_CARE_CENTERS_BY_IDS",
+                data={"center_ids": [str(center_id) for center_id in center_ids]}
+            )
         )
 
+        if not result.success or not result.data:
+            return {}
+
+        return {UUID(center_id): _center_dto(center_data) for center_id, center_data in result.data.items()}
+
     def get_health_care_center_by_id(self, center_id: UUID) -> Optional[HealthCareCenterDto]:
         """Get health care center by ID from Auth Service"""
         request = GetHealthCareCenterRequest(center_id=center_id)
@@ -129,14 +148,21 @@ class DeliveryAuthServiceAdapter(AuthServicePort):
         if not result.success or not result.data:
             return None
             
-        center_data = result.data
-        return HealthCareCenterDto(
-            id=UUID(center_data['id']),
-            name=center_data['name'],
-            address=center_data['address'],
-            phone=center_data['phone'],
-            email=center_data['email'],
-            latitude=float(center_data['latitude']),
-            longitude=float(center_data['longitude']),
-            is_active=center_data.get('is_active', True)
-        ) 
\ No newline at end of file
+        return _center_dto(result.data)
+
+
+def _optional_uuid(value: Optional[str]) -> Optional[UUID]:
+    return UUID(value) if value else None
+
+
+def _center_dto(center_data: Dict[str, Any]) -> HealthCareCenterDto:
+    return HealthCareCenterDto(
+        id=UUID(center_data['id']),
+        name=center_data['name'],
+        address=center_data['address'],
+        phone=center_data['phone'],
+        email=center_data['email'],
+        latitude=float(center_data['latitude']),
+        longitude=float(center_data['longitude']),
+        is_active=center_data.get('is_active', True)
+    )
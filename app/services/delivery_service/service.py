@@ -48,20 +48,31 @@ class DeliveryService:
         
         logger.info("Delivery service resources initialized")
     
-    def get_gps_coordinates_for_orders(self) -> Dict[str, Any]:
+    def get_gps_coordinates_for_orders(self, limit: int = None, group_by_location: bool = False,
+                                       health_care_center_id: str = None) -> Dict[str, Any]:
         """
         Get GPS coordinates for prioritized orders.
         Prioritizes SHIPPED orders first, then PROCESSING orders if no SHIPPED orders exist.
         
+        Args:
+            limit: Maximum number of orders, or with group_by_location of health care centers
+            group_by_location: Whether limit counts health care centers
+            health_care_center_id: Only the orders going to this health care center
+            
         Returns:
             Dictionary containing GPS coordinates and order information
         """
         logger.info("Getting GPS coordinates for prioritized orders (SHIPPED first, then PROCESSING)")
         
         try:
-            # Step 1: Get prioritized orders (SHIPPED first, then PROCESSING)
-            prioritized_orders = self._uow.order_service_port.get_prioritized_orders_for_delivery()
-            logger.info(f"Found {len(prioritized_orders)} prioritized orders (SHIPPED first, then PROCESSING)")
+            # Step 1: Get prioritized orders (SHIPPED first, then PROCESSING), limited by the order service
+            prioritized = self._uow.order_service_port.get_prioritized_orders_for_delivery(
+                limit=limit,
+                group_by_location=group_by_location,
+                health_care_center_id=UUID(health_care_center_id) if health_care_center_id else None
+            )
+            prioritized_orders = prioritized.orders
+            logger.info(f"Found {len(prioritized_orders)} of {prioritized.total_count} prioritized orders (SHIPPED first, then PROCESSING)")
             
             if not prioritized_orders:
                 return {
@@ -69,17 +80,20 @@ class DeliveryService:
                     "message": "No prioritized orders found",
                     "orders_with_gps": [],
                     "total_orders": 0,
+                    "waiting_orders": prioritized.total_count,
                     "orders_with_coordinates": 0
                 }
             
-            # Step 2: Get GPS coordinates for each order
+            # Step 2: Get the health care centers of all orders with one call
+            centers = self._uow.auth_service_port.get_health_care_centers_by_ids(list({
+                order.health_care_center_id for order in prioritized_orders if order.health_care_center_id
+            }))
             orders_with_gps = []
             successful_coordinates = 0
             
             for order in prioritized_orders:
                 try:
-                    # Get health care center for this user
-                    health_care_center = self._uow.auth_service_port.get_user_health_care_center(order.user_id)
+                    health_care_center = centers.get(order.health_care_center_id)
                     
                     order_info = {
                         "order_id": str(order.order_id),
@@ -125,6 +139,7 @@ class DeliveryService:
                 "message": f"Retrieved GPS coordinates for {successful_coordinates}/{len(prioritized_orders)} orders",
                 "orders_with_gps": orders_with_gps,
                 "total_orders": len(prioritized_orders),
+                "waiting_orders": prioritized.total_count,
                 "orders_with_coordinates": successful_coordinates,
                 "orders_without_coordinates": len(prioritized_orders) - successful_coordinates
             }
@@ -139,6 +154,7 @@ class DeliveryService:
                 "error": str(e),
                 "orders_with_gps": [],
                 "total_orders": 0,
+                "waiting_orders": 0,
                 "orders_with_coordinates": 0
             }
     
@@ -160,8 +176,8 @@ class DeliveryService:
         logger.info(f"Getting delivery routes with GPS coordinates (limit={limit})")
         
         try:
-            # Get GPS coordinates data
-            gps_data = self.get_gps_coordinates_for_orders()
+            # Get GPS coordinates data, for the first limit routes only
+            gps_data = self.get_gps_coordinates_for_orders(limit=limit, group_by_location=group_by_location)
             
             if not gps_data["success"]:
                 return {
@@ -272,7 +288,7 @@ class DeliveryService:
                 "routes": routes,
                 "summary": {
                     "total_routes": len(routes),
-                    "processing_orders_count": gps_data["total_orders"],
+                    "processing_orders_count": gps_data["waiting_orders"],
                     "total_estimated_deliveries": total_estimated_deliveries
                 }
             }
@@ -304,8 +320,8 @@ class DeliveryService:
         logger.info(f"Getting delivery route for health care center: {health_care_center_id}")
         
         try:
-            # Get all orders with GPS coordinates
-            all_orders = self.get_gps_coordinates_for_orders()
+            # Get the orders going to this health care center, with GPS coordinates
+            all_orders = self.get_gps_coordinates_for_orders(health_care_center_id=health_care_center_id)
             
             if not all_orders["success"]:
                 return all_orders
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class StockReservedEvent():
+    """Stock of an order was taken out of inventory when the order was placed"""
+    order_id: str
+    items: list[dict]
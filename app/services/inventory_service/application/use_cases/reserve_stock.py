@@ -0,0 +1,47 @@
+from typing import Dict
+from uuid import UUID
+
+from app.services.inventory_service.application.use_cases.stock_check import StockCheckUseCase
+from app.services.inventory_service.domain.interfaces.unit_of_work import UnitOfWork
+from app.shared.contracts.inventory.stock_check import (
+    StockCheckItemContract,
+    StockCheckRequestContract,
+    StockReservationResponseContract
+)
+
+
+class ReserveStockUseCase:
+    """
+    Reserve the stock of a whole order at once.
+
+    Quantities are summed per product and taken out of stock with one conditional
+    UPDATE. Nothing is committed here: the caller owns the transaction and rolls it
+    back when the reservation fails, so a partial reservation never sticks.
+    """
+
+    def __init__(self, uow: UnitOfWork, stock_check_use_case: StockCheckUseCase):
+        self._uow = uow
+        self._stock_check_use_case = stock_check_use_case
+
+    def execute(self, request: StockCheckRequestContract) -> StockReservationResponseContract:
+        quantities: Dict[UUID, int] = {}
+        for item in request.items:
+            quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+
+        reserved = self._uow.inventory_repository.reserve(quantities)
+        if len(reserved) == len(quantities):
+            return StockReservationResponseContract(success=True, reserved_product_ids=reserved)
+
+        # Only the products left untouched still show their real stock
+        reserved_ids = set(reserved)
+        missing = [product_id for product_id in quantities if product_id not in reserved_ids]
+        shortfall = StockCheckRequestContract(consumer_id=request.consumer_id, items=[
+            StockCheckItemContract(product_id=product_id, quantity=quantities[product_id])
+            for product_id in missing
+        ])
+        return StockReservationResponseContract(
+            success=False,
+            reserved_product_ids=reserved,
+            available_quantities=self._uow.inventory_repository.reservable(missing),
+            stock_check=self._stock_check_use_case.execute(shortfall)
+        )
@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 from app.shared.contracts.inventory.stock_check import (
     StockCheckRequestContract,
-    StockCheckResponseContract
+    StockCheckResponseContract,
+    StockReservationResponseContract
 )
 
 class StockCheckPort(ABC):
     """Primary/Incoming port for stock checking"""
     @abstractmethod
     def stock_check(self, request: StockCheckRequestContract) -> StockCheckResponseContract:
-        pass 
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def reserve_stock(self, request: StockCheckRequestContract) -> StockReservationResponseContract:
+        pass
@@ -8,7 +8,8 @@ from app.shared.contracts.inventory.enums import StockStatusContract
 from app.shared.contracts.inventory.stock_check import (
     StockCheckRequestContract,
     StockCheckResponseContract,
-    StockCheckItemContract
+    StockCheckItemContract,
+    StockReservationResponseContract
 )
 from app.services.inventory_service.domain.enums.stock_status import StockStatus
 
@@ -16,11 +17,15 @@ from app.services.inventory_service.domain.enums.stock_status import StockStatus
 
 class StockCheckAdapter(StockCheckPort):
     """Incoming adapter for Inventory Service"""
-    def __init__(self, stock_check_use_case):
+    def __init__(self, stock_check_use_case, reserve_stock_use_case=None):
         self._use_case = stock_check_use_case
+        self._reserve_use_case = reserve_stock_use_case
 
     def stock_check(self, request: StockCheckRequestContract) -> StockCheckResponseContract:      
         
         # Execute use case
         result = self._use_case.execute(request)
-        return result
\ No newline at end of file
+        return result
+
+    def reserve_stock(self, request: StockCheckRequestContract) -> StockReservationResponseContract:
+        return self._reserve_use_case.execute(request)
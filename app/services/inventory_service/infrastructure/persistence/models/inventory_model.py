@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 import uuid
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, Float, String, Text
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Float, String, Text
 from sqlalchemy.orm import relationship
 from app.shared.database_types import UUID
 from app.dataBase import db
@@ -14,10 +14,23 @@ class InventoryModel(db.Model):
     price = Column(Float)
     max_stock = Column(Integer)
     min_stock = Column(Integer)
-    last_updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    last_updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
     expiry_date = Column(DateTime(timezone=True))
     supplier_id = Column(UUID(as_uuid=True), nullable=True)
     
+    __table_args__ = (
+        # Join from products to their inventory row
+        Index('ix_inventory_product_id', 'product_id'),
+        # max(last_updated_at) of the product list marker
+        Index('ix_inventory_last_updated_at', 'last_updated_at'),
+        # Back product sort_by=price / sort_by=stock and the min_price / max_price range filters
+        Index('ix_inventory_price_product_id', 'price', 'product_id'),
+        Index('ix_inventory_quantity_product_id', 'quantity', 'product_id'),
+        # Price ordering and ranges restricted to in_stock_only
+        Index('ix_inventory_in_stock_price', 'price', 'product_id',
+              postgresql_where=quantity > 0, sqlite_where=quantity > 0),
+    )
+
     # New fields for enhanced inventory tracking
     # batch_number = Column(String(50), nullable=True)
     # lot_number = Column(String(50), nullable=True)
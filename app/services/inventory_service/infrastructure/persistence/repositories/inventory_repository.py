@@ -1,5 +1,6 @@
+from sqlalchemy import case, or_, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 from datetime import datetime, timedelta, timezone
 
@@ -34,6 +35,50 @@ class InventoryRepository(SQLAlchemyRepository):
         model = self._session.query(InventoryModel).filter(InventoryModel.product_id == product_id).first()
         return self._to_entity(model) if model else None
     
+    def reserve(self, quantities: Dict[UUID, int]) -> List[UUID]:
+        """
+        Take the requested quantities out of stock with one conditional UPDATE.
+
+        Only products with enough stock that has not expired are reserved; the
+        others are left as they are. Runs in the caller's transaction, which has
+        to be rolled back unless every product was reserved.
+
+        Returns:
+            IDs of the reserved products
+        """
+        if not quantities:
+            return []
+        requested = case(*[
+            (InventoryModel.product_id == product_id, quantity) for product_id, quantity in quantities.items()
+        ])
+        return list(self._session.execute(
+            update(InventoryModel)
+            .where(
+                InventoryModel.product_id.in_(list(quantities)),
+                InventoryModel.quantity >= requested,
+                self._not_expired()
+            )
+            .values(quantity=InventoryModel.quantity - requested)
+            .returning(InventoryModel.product_id)
+            .execution_options(synchronize_session=False)
+        ).scalars())
+
+    def reservable(self, product_ids: List[UUID]) -> Dict[UUID, int]:
+        """Quantity reserve() could take of each product; products without usable stock are left out"""
+        if not product_ids:
+            return {}
+        return dict(self._session.query(InventoryModel.product_id, InventoryModel.quantity).filter(
+            InventoryModel.product_id.in_(list(product_ids)),
+            self._not_expired()
+        ).all())
+
+    @staticmethod
+    def _not_expired():
+        # Stock expiring today is no longer available (see InventoryEntity)
+        tomorrow = datetime.combine(datetime.now(timezone.utc).date() + timedelta(days=1),
+                                    datetime.min.time(), timezone.utc)
+        return or_(InventoryModel.expiry_date.is_(None), InventoryModel.expiry_date >= tomorrow)
+
     def get_all(self) -> List[InventoryEntity]:
         """Get all inventory items"""
         models = self._session.query(InventoryModel).all()
@@ -5,11 +5,13 @@ from app.services.order_service.application.commands.bulk_update_order_command i
     BulkUpdateOrderCommand,
     BulkUpdateOrderItemCommand
 )
+from app.services.order_service.application.commands.batch_create_order_command import BatchCreateOrderCommand
 
 __all__ = [
     "CreateOrderCommand",
     "UpdateOrderCommand",
     "CancelOrderCommand",
     "BulkUpdateOrderCommand",
-    "BulkUpdateOrderItemCommand"
+    "BulkUpdateOrderItemCommand",
+    "BatchCreateOrderCommand"
 ]
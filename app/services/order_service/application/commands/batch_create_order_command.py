@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import List
+
+from app.services.order_service.application.commands.create_order_command import CreateOrderCommand
+
+# Largest number of orders a single batch may create
+MAX_BATCH_CREATE = 500
+
+@dataclass
+class BatchCreateOrderCommand:
+    """Command for creating several orders at once"""
+    orders: List[CreateOrderCommand]
+    # Create every order or none; otherwise create the ones whose stock can be reserved
+    all_or_nothing: bool = True
+
+    def __post_init__(self):
+        if not self.orders:
+            raise ValueError("At least one order is required")
+
+        if len(self.orders) > MAX_BATCH_CREATE:
+            raise ValueError(f"Maximum {MAX_BATCH_CREATE} orders can be created in a single batch")
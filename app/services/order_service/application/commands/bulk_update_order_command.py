@@ -4,6 +4,9 @@ from uuid import UUID
 
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
 
+# Largest number of orders a single bulk update may target
+MAX_BULK_UPDATE = 5000
+
 @dataclass
 class BulkUpdateOrderItemCommand:
     """Command for updating a single order in a bulk operation"""
@@ -21,5 +24,5 @@ class BulkUpdateOrderCommand:
         if not self.updates:
             raise ValueError("At least one order update is required")
         
-        if len(self.updates) > 100:  # Prevent too large bulk operations
-            raise ValueError("Maximum 100 orders can be updated in a single bulk operation") 
\ No newline at end of file
+        if len(self.updates) > MAX_BULK_UPDATE:  # Prevent too large bulk operations
+            raise ValueError(f"Maximum {MAX_BULK_UPDATE} orders can be updated in a single bulk operation") 
\ No newline at end of file
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+@dataclass
+class BatchCreateOrderItemResult:
+    """Result for a single order of a batch, by its position in the request"""
+    index: int
+    success: bool
+    order_id: Optional[UUID] = None
+    total_amount: Optional[Decimal] = None
+    error_message: Optional[str] = None
+    error_code: Optional[str] = None
+    errors: Optional[Dict[str, Any]] = None
+
+@dataclass
+class BatchCreateOrderResponse:
+    """Response for a batch order creation"""
+    total_attempted: int
+    total_successful: int
+    total_failed: int
+    results: List[BatchCreateOrderItemResult]
+
+    @property
+    def success_rate(self) -> float:
+        """Calculate success rate percentage"""
+        if self.total_attempted == 0:
+            return 0.0
+        return (self.total_successful / self.total_attempted) * 100
+
+    def get_created_orders(self) -> List[UUID]:
+        """Get list of created order IDs, in request order"""
+        return [result.order_id for result in self.results if result.success]
+
+    def get_errors_summary(self) -> Dict[str, int]:
+        """Get summary of error types"""
+        error_counts = {}
+        for result in self.results:
+            if not result.success and result.error_code:
+                error_counts[result.error_code] = error_counts.get(result.error_code, 0) + 1
+        return error_counts
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
@@ -59,12 +59,36 @@ class OrderSummaryDTO:
     consumer_name: Optional[str] = None
     health_center_name: Optional[str] = None
 
+
+@dataclass
+class DeliveryOrderDTO:
+    """An order waiting for delivery, with the health care center it goes to"""
+    order_id: UUID
+    consumer_id: UUID
+    status: str
+    total_amount: Decimal
+    items_count: int
+    created_at: datetime
+    health_center_id: Optional[UUID] = None
+    consumer_name: Optional[str] = None
+    health_center_name: Optional[str] = None
+
+@dataclass
+class OrderDisplayNames:
+    """Names denormalized into order summaries; names the other services did not return are left out"""
+    # User ID to user name, health center name and health center ID
+    consumers: Dict[UUID, Tuple[str, Optional[str], Optional[UUID]]]
+    # Product ID to product name
+    products: Dict[UUID, str]
+
 @dataclass
 class OrderFilterPaginationDTO:
-    page: int
+    page: Optional[int]
     per_page: int
-    pages:int
-    total:int
+    pages: Optional[int]
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+    total_estimated: bool = False
 
 
 
@@ -84,4 +108,7 @@ class OrderFilterDTO:
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     min_amount: Optional[Decimal] = None
-    max_amount: Optional[Decimal] = None 
\ No newline at end of file
+    max_amount: Optional[Decimal] = None
+    cursor: Optional[str] = None
+    count_mode: str = "exact"
+    archived: bool = False 
\ No newline at end of file
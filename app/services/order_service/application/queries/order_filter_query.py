@@ -12,4 +12,7 @@ class OrderFilterQuery:
     min_amount: Optional[float] = None
     max_amount: Optional[float] = None
     page: int = 1
-    per_page: int = 10
\ No newline at end of file
+    per_page: int = 10
+    cursor: Optional[str] = None
+    count_mode: str = "exact"
+    archived: bool = False
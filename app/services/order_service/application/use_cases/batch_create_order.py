@@ -0,0 +1,222 @@
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+
+from app.services.inventory_service.application.events.stock_reserved_event import StockReservedEvent
+from app.services.order_service.application.commands.batch_create_order_command import BatchCreateOrderCommand
+from app.services.order_service.application.commands.create_order_command import CreateOrderCommand
+from app.services.order_service.application.dtos.batch_create_dto import (
+    BatchCreateOrderItemResult,
+    BatchCreateOrderResponse
+)
+from app.services.order_service.domain.entities.order import OrderEntity
+from app.services.order_service.domain.entities.order_item import OrderItem
+from app.services.order_service.domain.exceptions.order_errors import OrderValidationError
+from app.services.order_service.domain.interfaces.unit_of_work import UnitOfWork
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.shared.contracts.inventory.stock_check import (
+    StockCheckItemContract,
+    StockCheckRequestContract,
+    StockReservationResponseContract
+)
+from app.shared.contracts.order.order_events import OrderPlacedEvent
+
+logger = logging.getLogger(__name__)
+
+# Reservations tried in best-effort mode before giving up on stock that keeps changing
+MAX_RESERVE_ATTEMPTS = 3
+
+class BatchCreateOrderUseCase:
+    """Use case for creating several orders in one transaction"""
+
+    def __init__(self, uow: UnitOfWork, query_service: OrderQueryService):
+        self._uow = uow
+        self._query_service = query_service
+
+    def execute(self, command: BatchCreateOrderCommand) -> BatchCreateOrderResponse:
+        """
+        Create a batch of orders set-based.
+
+        The demand of all orders is summed per product and reserved with one
+        conditional UPDATE, then every order and item is written with one
+        multi-row INSERT per table (summaries included) and a single commit.
+        Display names are looked up once for the whole batch. With all_or_nothing a
+        failing order fails the whole batch. Otherwise orders that do not fit the
+        remaining stock are dropped, in request order, and the rest is reserved
+        again. Each order gets its own result.
+        """
+        logger.info(f"Creating batch of {len(command.orders)} orders")
+
+        failures: Dict[int, BatchCreateOrderItemResult] = {}
+        pending: Dict[int, OrderEntity] = {}
+        for index, order_command in enumerate(command.orders):
+            try:
+                pending[index] = self._build_order(order_command)
+            except OrderValidationError as e:
+                failures[index] = self._failure(index, str(e), "VALIDATION_ERROR")
+
+        names = self._query_service.get_display_names(
+            [order.user_id for order in pending.values()],
+            [item.product_id for order in pending.values() for item in order.items]
+        )
+        try:
+            if failures and command.all_or_nothing:
+                pending = {}
+            else:
+                pending = self._reserve(pending, failures, command.all_or_nothing)
+            self._uow.order_repository.add_many(list(pending.values()))
+            self._uow.order_summary_repository.add_many(list(pending.values()), names)
+            self._uow.commit()
+        except Exception as e:
+            logger.error(f"Unexpected error creating order batch: {str(e)}")
+            self._uow.rollback()
+            for index in pending:
+                failures[index] = self._failure(index, f"Unexpected error: {str(e)}", "INTERNAL_ERROR")
+            pending = {}
+
+        if failures and command.all_or_nothing:
+            for index in range(len(command.orders)):
+                failures.setdefault(index, self._failure(
+                    index, "Not created because another order of the batch failed", "BATCH_ABORTED"
+                ))
+            pending = {}
+
+        self._publish(pending.values())
+        results = [
+            failures[index] if index in failures else BatchCreateOrderItemResult(
+                index=index,
+                success=True,
+                order_id=pending[index].id,
+                total_amount=pending[index].total_amount
+            )
+            for index in range(len(command.orders))
+        ]
+
+        response = BatchCreateOrderResponse(
+            total_attempted=len(command.orders),
+            total_successful=len(pending),
+            total_failed=len(failures),
+            results=results
+        )
+        logger.info(
+            f"Batch creation completed: {response.total_successful} created, "
+            f"{response.total_failed} failed out of {response.total_attempted} orders"
+        )
+        return response
+
+    def _reserve(self, pending: Dict[int, OrderEntity], failures: Dict[int, BatchCreateOrderItemResult],
+                 all_or_nothing: bool) -> Dict[int, OrderEntity]:
+        """
+        Reserve the summed demand of the pending orders in the current transaction.
+
+        Orders left without stock are moved to failures. On return the stock of
+        every order still pending is reserved.
+        """
+        for _ in range(MAX_RESERVE_ATTEMPTS):
+            if not pending:
+                return pending
+            reservation = self._uow.order_adapter_service.reserve_stock(self._stock_request(pending.values()))
+            if reservation.success:
+                return pending
+
+            # Give back what was reserved before retrying with fewer orders
+            self._uow.rollback()
+            fitting = {} if all_or_nothing else self._fitting_orders(pending, reservation)
+            for index, order in pending.items():
+                short = self._short_products(order, reservation)
+                # Without a short product an order only fails along with the rest of an all-or-nothing batch
+                if index not in fitting and short:
+                    failures[index] = self._failure(
+                        index, "Stock is not available for some items", "INSUFFICIENT_STOCK",
+                        {"product_ids": [str(product_id) for product_id in short]}
+                    )
+            pending = fitting
+
+        # Stock kept changing between attempts
+        for index in pending:
+            failures[index] = self._failure(index, "Stock changed while the batch was reserved", "INSUFFICIENT_STOCK")
+        return {}
+
+    @staticmethod
+    def _fitting_orders(pending: Dict[int, OrderEntity],
+                        reservation: StockReservationResponseContract) -> Dict[int, OrderEntity]:
+        """Orders that fit the stock left of the unreserved products, taken in request order"""
+        reserved = set(reservation.reserved_product_ids)
+        remaining = dict(reservation.available_quantities)
+        fitting = {}
+        for index, order in pending.items():
+            demand = {
+                product_id: quantity
+                for product_id, quantity in BatchCreateOrderUseCase._demand([order]).items()
+                if product_id not in reserved
+            }
+            if all(remaining.get(product_id, 0) >= quantity for product_id, quantity in demand.items()):
+                for product_id, quantity in demand.items():
+                    remaining[product_id] -= quantity
+                fitting[index] = order
+        return fitting
+
+    @staticmethod
+    def _short_products(order: OrderEntity, reservation: StockReservationResponseContract) -> List[UUID]:
+        reserved: Set[UUID] = set(reservation.reserved_product_ids)
+        return [product_id for product_id in BatchCreateOrderUseCase._demand([order]) if product_id not in reserved]
+
+    @staticmethod
+    def _demand(orders) -> Dict[UUID, int]:
+        """Quantity ordered of each product, summed over the orders"""
+        demand: Dict[UUID, int] = {}
+        for order in orders:
+            for item in order.items:
+                demand[item.product_id] = demand.get(item.product_id, 0) + item.quantity
+        return demand
+
+    def _stock_request(self, orders) -> StockCheckRequestContract:
+        return StockCheckRequestContract(items=[
+            StockCheckItemContract(product_id=product_id, quantity=quantity)
+            for product_id, quantity in self._demand(orders).items()
+        ])
+
+    @staticmethod
+    def _build_order(command: CreateOrderCommand) -> OrderEntity:
+        if not command.items:
+            raise OrderValidationError("Order must contain at least one item")
+        items = [
+            OrderItem.create(product_id=item.product_id, quantity=item.quantity, price=item.price)
+            for item in command.items
+        ]
+        return OrderEntity(
+            user_id=command.user_id,
+            items=items,
+            status=OrderStatus.PENDING,
+            total_amount=sum(item.quantity * item.price.amount for item in items),
+            notes=command.notes
+        )
+
+    @staticmethod
+    def _failure(index: int, message: str, code: str,
+                 errors: Optional[Dict] = None) -> BatchCreateOrderItemResult:
+        return BatchCreateOrderItemResult(
+            index=index, success=False, error_message=message, error_code=code, errors=errors
+        )
+
+    def _publish(self, orders) -> None:
+        """Same events as a single order creation, once the batch is committed"""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        for order in orders:
+            self._uow.publish(StockReservedEvent(
+                order_id=str(order.id),
+                items=[{
+                    'product_id': str(item.product_id),
+                    'quantity': item.quantity
+                } for item in order.items]
+            ))
+            self._uow.publish(OrderPlacedEvent(
+                id=str(order.id),
+                user_id=str(order.user_id) if order.user_id else None,
+                status=order.status.value,
+                total_amount=str(order.total_amount),
+                created_at=order.created_at.isoformat(),
+                timestamp=timestamp
+            ))
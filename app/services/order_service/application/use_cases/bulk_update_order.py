@@ -1,136 +1,145 @@
 import logging
-from typing import List
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
 from uuid import UUID
 
 from app.services.order_service.application.commands.bulk_update_order_command import (
-    BulkUpdateOrderCommand, 
+    BulkUpdateOrderCommand,
     BulkUpdateOrderItemCommand
 )
-from app.services.order_service.application.commands.update_order_command import UpdateOrderCommand
 from app.services.order_service.application.dtos.bulk_update_dto import (
     BulkUpdateOrderResponse,
     BulkUpdateOrderItemResult
 )
-from app.services.order_service.application.events.order_updated_event import OrderUpdatedEvent
-from app.services.order_service.application.use_cases.update_order import UpdateOrderUseCase
-from app.services.order_service.domain.exceptions.order_errors import (
-    OrderNotFoundError,
-    OrderValidationError,
-    InvalidOrderStatusTransition
-)
 from app.services.order_service.domain.interfaces.unit_of_work import UnitOfWork
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
 from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.shared.contracts.order.order_events import OrderStatusChangedEvent
 
 logger = logging.getLogger(__name__)
 
 class BulkUpdateOrderUseCase:
     """Use case for bulk updating multiple orders"""
-    
+
     def __init__(self, uow: UnitOfWork, query_service: OrderQueryService):
         self._uow = uow
         self._query_service = query_service
-        self._update_order_use_case = UpdateOrderUseCase(uow, query_service)
-    
+
     def execute(self, command: BulkUpdateOrderCommand) -> BulkUpdateOrderResponse:
         """
         Execute bulk update operation.
-        
-        Uses individual order updates with partial success handling.
-        Each order update is attempted independently, allowing some to succeed
-        while others fail.
+
+        Set-based with partial success handling: the targeted orders' statuses are
+        loaded with one query and every transition is checked in memory. The valid
+        ones are applied with one UPDATE per (old status, new status) group and a
+        single commit. Each order still gets its own result.
         """
         logger.info(f"Starting bulk update for {len(command.updates)} orders")
-        
-        results = []
-        successful_count = 0
-        failed_count = 0
-        
-        for update_item in command.updates:
-            result = self._update_single_order(update_item)
-            results.append(result)
-            
-            if result.success:
-                successful_count += 1
-            else:
-                failed_count += 1
-        
+
+        statuses = self._uow.order_repository.get_statuses([item.order_id for item in command.updates])
+        results, original_statuses = self._check_transitions(command.updates, statuses)
+
+        # Net transition per order, so an order updated twice in one request moves once
+        groups: Dict[Tuple[OrderStatus, OrderStatus], List[UUID]] = {}
+        for order_id, original_status in original_statuses.items():
+            if statuses[order_id] != original_status:
+                groups.setdefault((original_status, statuses[order_id]), []).append(order_id)
+
+        failures: Dict[UUID, Tuple[str, str]] = {}
+        try:
+            for (old_status, new_status), order_ids in groups.items():
+                moved = set(self._uow.order_repository.update_statuses(order_ids, old_status, new_status))
+                for order_id in set(order_ids) - moved:
+                    failures[order_id] = ("Order status changed during the bulk update", "CONCURRENT_UPDATE")
+            self._uow.commit()
+        except Exception as e:
+            logger.error(f"Unexpected error applying bulk update: {str(e)}")
+            self._uow.rollback()
+            failures = {order_id: (f"Unexpected error: {str(e)}", "INTERNAL_ERROR") for order_id in original_statuses}
+        if failures:
+            self._fail_orders(results, failures)
+
+        timestamp = datetime.now(timezone.utc).isoformat()
+        for result in results:
+            if result.success and result.old_status != result.new_status:
+                self._uow.publish(OrderStatusChangedEvent(
+                    id=str(result.order_id),
+                    old_status=result.old_status.value,
+                    new_status=result.new_status.value,
+                    timestamp=timestamp
+                ))
+
+        successful_count = sum(1 for result in results if result.success)
+        failed_count = len(results) - successful_count
         response = BulkUpdateOrderResponse(
             total_attempted=len(command.updates),
             total_successful=successful_count,
             total_failed=failed_count,
             results=results
         )
-        
+
         logger.info(
             f"Bulk update completed: {successful_count} successful, "
             f"{failed_count} failed out of {len(command.updates)} orders"
         )
-        
+
         return response
-    
-    def _update_single_order(self, update_item: BulkUpdateOrderItemCommand) -> BulkUpdateOrderItemResult:
-        """Update a single order and return the result"""
-        try:
-            logger.debug(f"Updating order {update_item.order_id}")
-            
-            # Get current order to track old status
-            order = self._uow.order_repository.get(update_item.order_id)
-            if not order:
-                return BulkUpdateOrderItemResult(
+
+    def _check_transitions(
+        self,
+        updates: List[BulkUpdateOrderItemCommand],
+        statuses: Dict[UUID, OrderStatus]
+    ) -> Tuple[List[BulkUpdateOrderItemResult], Dict[UUID, OrderStatus]]:
+        """
+        Validate every update against the loaded statuses, in request order.
+
+        statuses is advanced in place to each order's status after its valid updates.
+
+        Returns:
+            One result per update, and the status each accepted order had before the request
+        """
+        results = []
+        original_statuses: Dict[UUID, OrderStatus] = {}
+        for update_item in updates:
+            current_status = statuses.get(update_item.order_id)
+            if current_status is None:
+                results.append(BulkUpdateOrderItemResult(
                     order_id=update_item.order_id,
                     success=False,
                     error_message=f"Order {update_item.order_id} not found",
                     error_code="ORDER_NOT_FOUND"
-                )
-            
-            old_status = order.status
-            
-            # Create update command
-            update_command = UpdateOrderCommand(
-                id=update_item.order_id,
-                status=update_item.status,
-                notes=update_item.notes
-            )
-            
-            # Execute update using existing use case
-            result = self._update_order_use_case.execute(update_command)
-            
-            return BulkUpdateOrderItemResult(
-                order_id=update_item.order_id,
-                success=True,
-                old_status=old_status,
-                new_status=result.new_status
-            )
-            
-        except OrderNotFoundError:
-            return BulkUpdateOrderItemResult(
-                order_id=update_item.order_id,
-                success=False,
-                error_message=f"Order {update_item.order_id} not found",
-                error_code="ORDER_NOT_FOUND"
-            )
-            
-        except InvalidOrderStatusTransition as e:
-            return BulkUpdateOrderItemResult(
-                order_id=update_item.order_id,
-                success=False,
-                error_message=str(e),
-                error_code="INVALID_STATUS_TRANSITION"
-            )
-            
-        except OrderValidationError as e:
-            return BulkUpdateOrderItemResult(
-                order_id=update_item.order_id,
-                success=False,
-                error_message=str(e),
-                error_code="VALIDATION_ERROR"
-            )
-            
-        except Exception as e:
-            logger.error(f"Unexpected error updating order {update_item.order_id}: {str(e)}")
-            return BulkUpdateOrderItemResult(
-                order_id=update_item.order_id,
-                success=False,
-                error_message=f"Unexpected error: {str(e)}",
-                error_code="INTERNAL_ERROR"
-            ) 
\ No newline at end of file
+                ))
+            elif update_item.status is None:
+                results.append(BulkUpdateOrderItemResult(
+                    order_id=update_item.order_id,
+                    success=False,
+                    error_message="A new status is required",
+                    error_code="VALIDATION_ERROR"
+                ))
+            elif not OrderStatus.can_transition(current_status, update_item.status):
+                results.append(BulkUpdateOrderItemResult(
+                    order_id=update_item.order_id,
+                    success=False,
+                    error_message=f"Cannot transition from {current_status.value} to {update_item.status.value}",
+                    error_code="INVALID_STATUS_TRANSITION"
+                ))
+            else:
+                original_statuses.setdefault(update_item.order_id, current_status)
+                statuses[update_item.order_id] = update_item.status
+                results.append(BulkUpdateOrderItemResult(
+                    order_id=update_item.order_id,
+                    success=True,
+                    old_status=current_status,
+                    new_status=update_item.status
+                ))
+        return results, original_statuses
+
+    @staticmethod
+    def _fail_orders(results: List[BulkUpdateOrderItemResult], failures: Dict[UUID, Tuple[str, str]]) -> None:
+        """Turn the successful results of orders that could not be written into failures"""
+        for result in results:
+            if result.success and result.order_id in failures:
+                result.error_message, result.error_code = failures[result.order_id]
+                result.success = False
+                result.old_status = None
+                result.new_status = None
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from app.services.order_service.application.commands.cancel_order_command import CancelOrderCommand
 from app.services.order_service.application.dtos.order_dto import OrderDTO
 from app.services.order_service.domain.entities.order import OrderEntity
@@ -8,6 +10,7 @@ from app.services.order_service.domain.exceptions.order_errors import (
 )
 from app.services.order_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.shared.contracts.order.order_events import OrderStatusChangedEvent
 
 class CancelOrderUseCase:
     def __init__(self, uow: UnitOfWork, query_service: OrderQueryService):
@@ -34,6 +37,7 @@ class CancelOrderUseCase:
                     )
 
                 # Cancel order and update notes
+                old_status = order.status
                 order.cancel()
                 if command.reason:
                     order.notes = f"Cancelled: {command.reason}"
@@ -41,6 +45,12 @@ class CancelOrderUseCase:
                 # Save changes
                 cancelled_order = self._uow.order_repository.update(order)
                 self._uow.commit()
+                self._uow.publish(OrderStatusChangedEvent(
+                    id=str(command.order_id),
+                    old_status=old_status.value,
+                    new_status=cancelled_order.status.value,
+                    timestamp=datetime.now(timezone.utc).isoformat()
+                ))
                 
                 # Get updated order from query service for DTO creation
                 order_model = self._query_service.get_order_by_id(command.order_id)
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 
 from pydantic import BaseModel
-from app.services.inventory_service.application.events.stock_release_requested_event import StockReleaseRequestedEvent
+from app.services.inventory_service.application.events.stock_reserved_event import StockReservedEvent
 from app.services.order_service.application.commands import CreateOrderCommand
-from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO, CreateOrderResponse
+from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO, CreateOrderResponse, OrderDisplayNames
 from app.services.order_service.application.events import OrderCreatedEvent
 from app.services.order_service.domain.entities.order import OrderEntity
 from app.services.order_service.domain.entities.order_item import OrderItem
@@ -16,6 +16,7 @@ from app.services.order_service.domain.value_objects.order_status import OrderSt
 from app.services.order_service.domain.value_objects.money import Money
 from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
 from app.shared.contracts.inventory.stock_check import StockCheckItemContract, StockCheckRequestContract
+from app.shared.contracts.order.order_events import OrderPlacedEvent
 from decimal import Decimal
 
 @dataclass
@@ -43,66 +44,59 @@ class CreateOrderUseCase:
         self.order_qr = order_qr
 
     def execute(self, command: CreateOrderCommand) -> CreateOrderResponse:
-        # Validate input data
-        # self._validate_order_command(command)
-        
-        # If user_id is provided, check if user is eligible to place orders
-        # if command.user_id:
-        #     self._check_user_eligibility(command.user_id)
-        
-            # Check stock availability before creating order
-        self._check_stock_level(command)
-            
-            # Create order items and calculate total
+        """
+        Place an order in one transaction.
+
+        The stock of every item is reserved set-based by the inventory service and
+        the order and its items are inserted in the same transaction, committed
+        once, along with its summary for order listings. A shortfall rolls the
+        whole transaction back. Display names are looked up before the
+        transaction starts, the consumer's from the query service's name cache.
+        """
+        # Create order items and calculate total
         order_items = self._order_item_list(command)
         total_amount = self._calculate_total_amount(order_items)
-        
-            # Create the order in PENDING status
-        order = self._create_order(command, order_items, total_amount)
-        
-        # Track if stock release event was published to avoid duplicates
-        stock_release_published = False
-        
+        names = self.order_qr.get_display_names([command.user_id], [item.product_id for item in order_items])
+
         try:
-                # Publish stock release event
-            self.uow.publish(StockReleaseRequestedEvent(
-                order_id=str(order.id),  # Convert UUID to string
-                items=[{
-                    'product_id': str(item.product_id),
-                    'quantity': item.quantity
-                } for item in command.items]
-            ))
-            stock_release_published = True
-                
-            # Publish order created event
-            # self.uow.publish(OrderCreatedEvent(
-            #     order_id=str(order.id)          
-            # ))
-                
-            # Commit transaction
+            self._reserve_stock(command)
+
+            # Create the order in PENDING status
+            order = self._create_order(command, order_items, total_amount)
+            self.uow.order_summary_repository.add_many([order], names)
             self.uow.commit()
-            
-                # Run post-creation workflows in a separate process/thread
-            # self._trigger_post_creation_workflows(order)
-                
-                # Create DTO for response
-            order_dto = self._create_order_dto(order)
-            return order_dto
-                
+        except (OrderCreationError, OrderValidationError):
+            self.uow.rollback()
+            raise
         except Exception as e:
-                # Rollback transaction in case of error
+            # Rollback transaction in case of error
             self.uow.rollback()
-            
-            # Log the error with context
-            error_msg = f"Failed to create order: {str(e)}"
-            if stock_release_published:
-                error_msg += " (Note: Stock release event was published before failure)"
-                
-            # Re-raise the exception for higher-level handling
             raise OrderCreationError(
-                message=error_msg,
+                message=f"Failed to create order: {str(e)}",
                 status_code=500
             )
+
+        # Notify caches and read models once the order and its stock are visible to other sessions
+        self.uow.publish(StockReservedEvent(
+            order_id=str(order.id),
+            items=[{
+                'product_id': str(item.product_id),
+                'quantity': item.quantity
+            } for item in command.items]
+        ))
+        self.uow.publish(OrderPlacedEvent(
+            id=str(order.id),
+            user_id=str(order.user_id) if order.user_id else None,
+            status=order.status.value,
+            total_amount=str(order.total_amount),
+            created_at=order.created_at.isoformat() if order.created_at else None,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
+
+        # Run post-creation workflows in a separate process/thread
+        # self._trigger_post_creation_workflows(order)
+
+        return self._create_order_dto(order, names)
     
     def _validate_order_command(self, command: CreateOrderCommand) -> None:
         """Validate order command data"""
@@ -129,7 +123,7 @@ class CreateOrderUseCase:
     
     def _create_order(self, command: CreateOrderCommand, order_items: List[OrderItem], total_amount: Decimal):
         """Create order entity and add to repository"""
-        # Create order in PENDING status - will be updated based on stock release result
+        # Create order in PENDING status, its stock is already reserved
         order = self.uow.order_repository.add(OrderEntity(
             user_id=command.user_id,
             total_amount=total_amount,
@@ -141,7 +135,7 @@ class CreateOrderUseCase:
 
         return order
         
-    def _create_order_dto(self, order: OrderEntity):
+    def _create_order_dto(self, order: OrderEntity, names: OrderDisplayNames):
         """Create DTO from order entity"""
 
         order_items = [OrderItemDTO(
@@ -150,34 +144,9 @@ class CreateOrderUseCase:
             price=float(item.price.amount)
             ) for item in order.items]
         
-        # Fetch consumer name and health center name from auth service
-        consumer_name = None
-        health_center_name = None
-        if order.user_id:
-            try:
-                user_info = self.uow.order_adapter_service.get_user_by_id(order.user_id)
-                if user_info:
-                    consumer_name = user_info.get('full_name')
-                    
-                    # Fetch health center name if user has health_care_center_id
-                    health_care_center_id = user_info.get('health_care_center_id')
-                    if health_care_center_id:
-                        try:
-                            from uuid import UUID
-                            center_info = self.uow.order_adapter_service.get_health_care_center_by_id(UUID(health_care_center_id))
-                            if center_info:
-                                health_center_name = center_info.get('name')
-                        except Exception as e:
-                            # Log error but don't fail the order creation
-                            import logging
-                            logger = logging.getLogger(__name__)
-                            logger.warning(f"Failed to fetch health center info for {health_care_center_id}: {str(e)}")
-                            
-            except Exception as e:
-                # Log error but don't fail the order creation
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"Failed to fetch user name for {order.user_id}: {str(e)}")
+        consumer_name, health_center_name, _ = names.consumers.get(order.user_id, (None, None, None))
+        if order.user_id and not consumer_name:
+            consumer_name = self.order_qr.get_consumer_names(order.user_id)[0]
         
         return CreateOrderDto(
             order_id=order.id,
@@ -197,24 +166,24 @@ class CreateOrderUseCase:
         total= sum(item.quantity * item.price.amount for item in order_items)
         return total
         
-    def _check_stock_level(self, command: CreateOrderCommand):
-        """Check if stock is available for all items"""
-        adapter_service = self.uow.order_adapter_service
-        
-        stock_check_result = adapter_service.stock_check(
-            StockCheckRequestContract(items=[
-                StockCheckItemContract(
-                    product_id=item.product_id,
-                    quantity=item.quantity
-                ) for item in command.items
-            ])
+    def _reserve_stock(self, command: CreateOrderCommand):
+        """Reserve the stock of all items in the current transaction, or fail with the stock check of the shortfall"""
+        reservation = self.uow.order_adapter_service.reserve_stock(
+            StockCheckRequestContract(
+                consumer_id=command.user_id,
+                items=[
+                    StockCheckItemContract(
+                        product_id=item.product_id,
+                        quantity=item.quantity
+                    ) for item in command.items
+                ]
+            )
         )
-        is_legit = stock_check_result.is_legit()
         
-        if not is_legit:
+        if not reservation.success:
             raise OrderCreationError(
                 message="Stock is not available for some items",
-                errors=stock_check_result.model_dump()
+                errors=reservation.stock_check.model_dump() if reservation.stock_check else {}
             )
         
     def _order_item_list(self, command: CreateOrderCommand):
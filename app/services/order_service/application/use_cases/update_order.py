@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -14,6 +14,7 @@ from app.services.order_service.domain.exceptions.order_errors import (
 from app.services.order_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
 from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.shared.contracts.order.order_events import OrderStatusChangedEvent
 class UpdateOrderDto(BaseModel):
     order_id: UUID
     new_status: OrderStatus
@@ -43,6 +44,14 @@ class UpdateOrderUseCase:
         # Commit transaction
         self._uow.commit() 
 
+        if updated_order.status != old_status:
+            self._uow.publish(OrderStatusChangedEvent(
+                id=str(updated_order.id),
+                old_status=old_status.value,
+                new_status=updated_order.status.value,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            ))
+
         return UpdateOrderDto(
             order_id=updated_order.id, 
             new_status=updated_order.status,
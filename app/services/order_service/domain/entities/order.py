@@ -28,6 +28,10 @@ class OrderEntity:
         # self.total_amount = self.calculate_total()
         self._validate()
 
+    def __hash__(self) -> int:
+        # Orders are identified by their id; repositories keep the orders they load in a set
+        return hash(self.id)
+
     def _validate(self) -> None:
         if not self.items:
             raise OrderValidationError("Order must have at least one item")
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 
 from app.services.order_service.domain.entities.order import OrderEntity
@@ -12,6 +12,11 @@ class OrderRepository(ABC):
         """Add a new order"""
         pass
 
+    @abstractmethod
+    def add_many(self, orders: Sequence[OrderEntity]) -> List[OrderEntity]:
+        """Add several new orders at once"""
+        pass
+
     @abstractmethod
     def get(self, order_id: UUID) -> Optional[OrderEntity]:
         """Get an order by ID"""
@@ -22,6 +27,17 @@ class OrderRepository(ABC):
         """Update an existing order"""
         pass
 
+    @abstractmethod
+    def get_statuses(self, order_ids: Sequence[UUID]) -> Dict[UUID, OrderStatus]:
+        """Get the current status of several orders at once"""
+        pass
+
+    @abstractmethod
+    def update_statuses(self, order_ids: Sequence[UUID], old_status: OrderStatus,
+                        new_status: OrderStatus) -> List[UUID]:
+        """Move orders still in old_status to new_status; returns the IDs moved"""
+        pass
+
     @abstractmethod
     def delete(self, order_id: UUID) -> None:
         """Delete an order"""
@@ -5,7 +5,8 @@ from dataclasses import dataclass, field
 from app.services.order_service.domain.enums.stock_status import OrderStockStatus
 from app.shared.contracts.inventory.stock_check import (
     StockCheckRequestContract,
-    StockCheckResponseContract
+    StockCheckResponseContract,
+    StockReservationResponseContract
 )
 
 # @dataclass
@@ -29,6 +30,10 @@ class InventoryServicePort(ABC):
     @abstractmethod
     def stock_check(self, request: StockCheckRequestContract) -> StockCheckResponseContract:
         pass
+
+    @abstractmethod
+    def reserve_stock(self, request: StockCheckRequestContract) -> StockReservationResponseContract:
+        pass
    
 
 
@@ -21,6 +21,9 @@ class OrderAdapterService:
 
     def stock_check(self, request: StockCheckRequestContract):
         return self._stock_check_adapter.stock_check(request)
+
+    def reserve_stock(self, request: StockCheckRequestContract):
+        return self._stock_check_adapter.reserve_stock(request)
     
     def get_product_by_id(self, product_id):
         return self._product_adapter.get_product_by_id(product_id)
@@ -37,8 +40,11 @@ class OrderAdapterService:
     def get_users_by_ids(self, user_ids: List[UUID]) -> Dict[UUID, Dict]:
         return self._auth_adapter.get_users_by_ids(user_ids)
 
+    def get_health_care_centers_by_ids(self, center_ids: List[UUID]) -> Dict[UUID, Dict]:
+        return self._auth_adapter.get_health_care_centers_by_ids(center_ids)
+
     def get_product_name(self, product_id):
         return self._product_adapter.get_product_name(product_id)
 
     def get_products_names(self, product_ids):
-        return self._product_adapter.get_products_names(product_ids)
\ No newline at end of file
+        return self._product_adapter.get_product_names(product_ids)
\ No newline at end of file
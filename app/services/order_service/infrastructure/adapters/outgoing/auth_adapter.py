@@ -77,7 +77,7 @@ class AuthServiceAdapter:
 
     def get_users_by_ids(self, user_ids: List[UUID]) -> Dict[UUID, Dict[str, Any]]:
         """
-        Get multiple users by their IDs from the auth service.
+        Get multiple users by their IDs with a single auth service call.
         
         Args:
             user_ids: List of user UUIDs to fetch
@@ -85,17 +85,54 @@ class AuthServiceAdapter:
         Returns:
             Dictionary mapping user_id to user information
         """
-        users = {}
+        if not user_ids:
+            return {}
+        try:
+            result = self._acl.execute_service_operation(
+                ServiceContext(
+                    service_type=ServiceType.AUTH,
+                    operation="GET_USERS_BY_IDS",
+                    data={"user_ids": [str(user_id) for user_id in user_ids]}
+                )
+            )
+            if not result.success or not result.data:
+                return {}
+            return {UUID(user_id): user for user_id, user in result.data.items()}
+                
+        except Exception as e:
+            # Log the error but don't raise to avoid breaking order queries
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to fetch users from auth service: {str(e)}")
+            return {}
+
+    def get_health_care_centers_by_ids(self, center_ids: List[UUID]) -> Dict[UUID, Dict[str, Any]]:
+        """
+        Get multiple health care centers by their IDs with a single auth service call.
         
-        for user_id in user_ids:
-            try:
-                user = self.get_user_by_id(user_id)
-                if user:
-                    users[user_id] = user
-            except Exception as e:
-                # Log error but continue with other users
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"Failed to fetch user {user_id}: {str(e)}")
+        Args:
+            center_ids: List of health care center UUIDs to fetch
+            
+        Returns:
+            Dictionary mapping center_id to health care center information
+        """
+        if not center_ids:
+            return {}
+        try:
+            result = self._acl.execute_service_operation(
+                ServiceContext(
+                    service_type=ServiceType.AUTH,
+                    operation="GET_HEALTH_CARE_CENTERS_BY_IDS",
+                    data={"center_ids": [str(center_id) for center_id in center_ids]}
+                )
+            )
+            if not result.success or not result.data:
+                return {}
+            return {UUID(center_id): center for center_id, center in result.data.items()}
                 
-        return users
\ No newline at end of file
+        except Exception as e:
+            # Log the error but don't raise to avoid breaking order queries
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to fetch health care centers from auth service: {str(e)}")
+            return {}
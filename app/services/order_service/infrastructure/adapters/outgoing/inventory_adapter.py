@@ -3,7 +3,8 @@ from app.services.order_service.domain.ports.outgoing_ports import InventoryServ
 from app.shared.contracts.inventory.stock_check import (
     StockCheckRequestContract,
     StockCheckItemContract,
-    StockCheckResponseContract
+    StockCheckResponseContract,
+    StockReservationResponseContract
 )
 from app.services.order_service.domain.enums.stock_status import OrderStockStatus
 
@@ -12,26 +13,42 @@ class InventoryServiceAdapter(InventoryServicePort):
         self._acl = acl
 
     def stock_check(self, request: StockCheckRequestContract) -> StockCheckResponseContract : 
-        dict_data = request.model_dump()
-        
         result = self._acl.execute_service_operation(
             ServiceContext(
                 service_type=ServiceType.INVENTORY,
                 operation="STOCK_CHECK",
-                data={
-                    "consumer_id": dict_data.get("consumer_id"),
-                    "items": [
-                        {
-                            "product_id": item.get("product_id"),
-                            "quantity": item.get("quantity")
-                        } for item in dict_data.get("items")
-                    ]
-                }
+                data=self._stock_request_data(request)
             )
         )
         
             
         return result.data
+
+    def reserve_stock(self, request: StockCheckRequestContract) -> StockReservationResponseContract:
+        """Reserve the stock of an order in the current transaction, all products or none"""
+        result = self._acl.execute_service_operation(
+            ServiceContext(
+                service_type=ServiceType.INVENTORY,
+                operation="RESERVE_STOCK",
+                data=self._stock_request_data(request)
+            )
+        )
+        if not result.success:
+            raise RuntimeError(f"Stock reservation failed: {result.error}")
+        return result.data
+
+    @staticmethod
+    def _stock_request_data(request: StockCheckRequestContract) -> dict:
+        dict_data = request.model_dump()
+        return {
+            "consumer_id": dict_data.get("consumer_id"),
+            "items": [
+                {
+                    "product_id": item.get("product_id"),
+                    "quantity": item.get("quantity")
+                } for item in dict_data.get("items")
+            ]
+        }
     # def check_inventory(self, order_data: Dict[str, Any]) -> ServiceResponse:
     #     """Check inventory availability for order"""
     #     translated_data = self.translate_request(
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 
 from app.shared.acl.unified_acl import UnifiedACL, ServiceContext
@@ -61,4 +61,35 @@ class ProductServiceAdapter:
             if product:
                 products[product_id] = product
                 
-        return products 
\ No newline at end of file
+        return products
+
+    def get_product_names(self, product_ids: List[UUID]) -> Dict[UUID, str]:
+        """
+        Get the names of several products with a single product service call.
+        
+        Args:
+            product_ids: List of product UUIDs to look up
+            
+        Returns:
+            Dictionary mapping product_id to name, for the products that exist
+        """
+        if not product_ids:
+            return {}
+        try:
+            result = self._acl.execute_service_operation(
+                ServiceContext(
+                    service_type=ServiceType.PRODUCT,
+                    operation="GET_PRODUCT_NAMES",
+                    data={"product_ids": [str(product_id) for product_id in product_ids]}
+                )
+            )
+            if not result.success or not result.data:
+                return {}
+            return {UUID(product_id): name for product_id, name in result.data.items()}
+                
+        except Exception as e:
+            # Log the error but don't raise to avoid breaking order queries
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to fetch product names from product service: {str(e)}")
+            return {}
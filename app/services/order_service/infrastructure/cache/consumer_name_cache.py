@@ -0,0 +1,76 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from app.shared.application.events.event_bus import EventBus
+from app.shared.contracts.auth.auth_events import HealthCareCenterUpdatedEvent, UserUpdatedEvent
+
+# A consumer's user name, health center name and health center id (both None when the user has no center)
+ConsumerNames = Tuple[str, Optional[str], Optional[UUID]]
+
+
+class ConsumerNameCache:
+    """
+    In-process LRU cache of consumer display names, keyed by user id.
+
+    Entries are evicted when the auth service reports a user or health center
+    update, and expire after ttl_seconds in any case, for updates made by
+    another worker.
+    """
+
+    def __init__(self, event_bus: Optional[EventBus] = None, max_entries: int = 10000, ttl_seconds: float = 300.0):
+        self._entries: "OrderedDict[UUID, Tuple[ConsumerNames, float]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if event_bus:
+            event_bus.subscribe(UserUpdatedEvent, lambda event: self.invalidate_user(event.id))
+            event_bus.subscribe(HealthCareCenterUpdatedEvent, lambda event: self.invalidate_center(event.id))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, user_ids: Iterable[UUID]) -> Dict[UUID, ConsumerNames]:
+        """Cached names of the given users; missing or expired users are left out"""
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for user_id in user_ids:
+                entry = self._entries.get(user_id)
+                if entry is None or entry[1] < now:
+                    self._entries.pop(user_id, None)
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                found[user_id] = entry[0]
+        return found
+
+    def put(self, user_id: UUID, user_name: str, health_center_name: Optional[str] = None,
+            health_center_id: Optional[UUID] = None) -> None:
+        with self._lock:
+            self._entries[user_id] = (
+                (user_name, health_center_name, health_center_id), time.monotonic() + self._ttl_seconds
+            )
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: Any) -> None:
+        with self._lock:
+            self._entries.pop(UUID(str(user_id)), None)
+
+    def invalidate_center(self, center_id: Any) -> None:
+        """Drop every user of a health center"""
+        center_id = UUID(str(center_id))
+        with self._lock:
+            for user_id in [user_id for user_id, (names, _) in self._entries.items() if names[2] == center_id]:
+                del self._entries[user_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
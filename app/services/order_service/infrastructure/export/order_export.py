@@ -0,0 +1,179 @@
+"""
+Streaming export of orders.
+
+Every order matching the filter, live or archived, is read with one query on a
+server-side cursor (yield_per), oldest first. Each partition of the cursor is enriched as a whole —
+one lookup for its line items, one for product names and one for user and
+health center names — then encoded and handed to the response in blocks, so
+memory use depends on yield_per and not on the number of exported orders.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.services.order_service.infrastructure.persistence.repositories.order_archive_repository import (
+    all_order_items,
+    all_orders
+)
+from app.shared.infrastructure.streaming_export import BLOCK_SIZE, csv_blocks, gzip_blocks, ndjson_blocks
+
+EXPORT_FORMATS = ("csv", "ndjson")
+EXPORT_CONTENT_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+DEFAULT_YIELD_PER = 1000
+
+ORDER_FIELDS = (
+    "id", "user_id", "consumer_name", "health_center_name", "status", "total_amount",
+    "items_count", "unit_count", "notes", "created_at", "updated_at"
+)
+# CSV columns of a line item; with items, CSV has one row per line item
+ITEM_FIELDS = ("item_id", "product_id", "product_name", "quantity", "price")
+
+# Product IDs to names
+ProductNames = Callable[[List[UUID]], Dict[UUID, str]]
+# User IDs to user names, and to health center names for users that have one
+ConsumerNames = Callable[[List[UUID]], Tuple[Dict[UUID, str], Dict[UUID, str]]]
+
+# Live and archived orders, so ranges older than the archive cutoff still export;
+# filter conditions are written against EXPORTED_ORDERS.c
+EXPORTED_ORDERS = all_orders('id', 'user_id', 'status', 'total_amount', 'notes', 'created_at', 'updated_at')
+EXPORTED_ITEMS = all_order_items('id', 'order_id', 'product_id', 'quantity', 'price')
+
+
+def order_partitions(session: Session, conditions: Sequence[Any] = (),
+                     yield_per: int = DEFAULT_YIELD_PER) -> Iterator[Sequence[Any]]:
+    """
+    Stream the matching orders with a server-side cursor, yield_per rows at a time.
+
+    Args:
+        session: Database session
+        conditions: Filter criteria on EXPORTED_ORDERS.c
+        yield_per: Rows fetched from the cursor at a time
+
+    Yields:
+        Partitions of plain rows (id, user_id, status, total_amount, notes,
+        created_at, updated_at, items_count, unit_count), oldest first
+    """
+    orders = EXPORTED_ORDERS.c
+    items = (
+        select(
+            EXPORTED_ITEMS.c.order_id.label('order_id'),
+            func.count().label('items_count'),
+            func.sum(EXPORTED_ITEMS.c.quantity).label('unit_count')
+        )
+        .group_by(EXPORTED_ITEMS.c.order_id)
+        .subquery('order_item_totals')
+    )
+    statement = (
+        select(
+            orders.id, orders.user_id, orders.status, orders.total_amount,
+            orders.notes, orders.created_at, orders.updated_at,
+            func.coalesce(items.c.items_count, 0), func.coalesce(items.c.unit_count, 0)
+        )
+        .outerjoin(items, items.c.order_id == orders.id)
+        .where(*conditions)
+        .order_by(orders.created_at, orders.id)
+    )
+    result = session.execute(statement.execution_options(yield_per=yield_per))
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
+
+
+def _items_by_order(session: Session, order_ids: List[UUID]) -> Dict[UUID, List[Sequence[Any]]]:
+    """Line items (id, order_id, product_id, quantity, price) of a partition, in one query"""
+    item = EXPORTED_ITEMS.c
+    rows = session.execute(
+        select(item.id, item.order_id, item.product_id, item.quantity, item.price)
+        .where(item.order_id.in_(order_ids))
+        .order_by(item.order_id, item.id)
+    ).all()
+    items: Dict[UUID, List[Sequence[Any]]] = {}
+    for row in rows:
+        items.setdefault(row[1], []).append(row)
+    return items
+
+
+def order_records(session: Session, partitions: Iterable[Sequence[Any]], product_names: ProductNames,
+                  consumer_names: ConsumerNames, include_items: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Enrich the cursor partitions with names (and line items), one partition at a time.
+
+    Yields:
+        One dict per order with ORDER_FIELDS, plus "items" when include_items is set
+    """
+    for partition in partitions:
+        user_names, center_names = consumer_names([row[1] for row in partition])
+        items = _items_by_order(session, [row[0] for row in partition]) if include_items else {}
+        names = product_names([item[2] for order_items in items.values() for item in order_items])
+        for order_id, user_id, status, total_amount, notes, created_at, updated_at, items_count, unit_count in partition:
+            record = {
+                "id": order_id,
+                "user_id": user_id,
+                "consumer_name": user_names.get(user_id),
+                "health_center_name": center_names.get(user_id),
+                "status": status,
+                "total_amount": total_amount,
+                "items_count": items_count,
+                "unit_count": unit_count,
+                "notes": notes,
+                "created_at": created_at,
+                "updated_at": updated_at,
+            }
+            if include_items:
+                record["items"] = [
+                    {
+                        "item_id": item_id,
+                        "product_id": product_id,
+                        "product_name": names.get(product_id),
+                        "quantity": quantity,
+                        "price": price,
+                    }
+                    for item_id, _, product_id, quantity, price in items.get(order_id, [])
+                ]
+            yield record
+
+
+def _csv_rows(records: Iterable[Dict[str, Any]], include_items: bool) -> Iterator[List[Any]]:
+    for record in records:
+        order = [record[name] for name in ORDER_FIELDS]
+        if not include_items:
+            yield order
+            continue
+        # Orders without items still get their row
+        for item in record["items"] or [{}]:
+            yield order + [item.get(name) for name in ITEM_FIELDS]
+
+
+def export_orders(session: Session, product_names: ProductNames, consumer_names: ConsumerNames,
+                  conditions: Sequence[Any] = (), fmt: str = "csv", compress: bool = False,
+                  include_items: bool = False, yield_per: int = DEFAULT_YIELD_PER) -> Iterator[bytes]:
+    """
+    Build the byte stream of an order export.
+
+    Args:
+        session: Database session, kept open while the stream is consumed
+        product_names: Resolves a partition's product names
+        consumer_names: Resolves a partition's user and health center names
+        conditions: Filter criteria on EXPORTED_ORDERS.c
+        fmt: "csv" or "ndjson"
+        compress: Gzip the stream
+        include_items: Add line items (nested in NDJSON, one CSV row per item)
+        yield_per: Orders fetched from the cursor, and enriched, at a time
+
+    Returns:
+        Iterator of encoded (and optionally compressed) blocks
+    """
+    records = order_records(session, order_partitions(session, conditions, yield_per),
+                            product_names, consumer_names, include_items)
+    if fmt == "csv":
+        header = ORDER_FIELDS + ITEM_FIELDS if include_items else ORDER_FIELDS
+        text_blocks = csv_blocks(header, _csv_rows(records, include_items), BLOCK_SIZE)
+    else:
+        text_blocks = ndjson_blocks(records, BLOCK_SIZE)
+    blocks = (text.encode("utf-8") for text in text_blocks)
+    return gzip_blocks(blocks) if compress else blocks
@@ -1,6 +1,15 @@
 from .order import OrderModel, OrderItemModel
+from .order_archive import ArchivedOrderModel, ArchivedOrderItemModel
+from .order_daily_stats import OrderDailyStatsModel
+from .order_status_count import OrderStatusCountModel
+from .order_summary import OrderSummaryModel
 
 __all__ = [
     'OrderModel',
-    'OrderItemModel'
-]
\ No newline at end of file
+    'OrderItemModel',
+    'ArchivedOrderModel',
+    'ArchivedOrderItemModel',
+    'OrderDailyStatsModel',
+    'OrderStatusCountModel',
+    'OrderSummaryModel'
+]
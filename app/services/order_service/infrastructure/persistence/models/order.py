@@ -1,6 +1,6 @@
 from datetime import datetime
 import uuid
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, Numeric, String, Table
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String, Table
 from sqlalchemy.orm import relationship
 
 from app.dataBase import db
@@ -10,14 +10,21 @@ from datetime import UTC
 
 class OrderModel(db.Model):
     __tablename__ = 'orders'
+    __table_args__ = (
+        # Backs the (created_at, id) keyset pagination of order lists
+        Index('ix_orders_created_at_id', 'created_at', 'id'),
+        # Per-user history and user / status filtered listings, newest first
+        Index('ix_orders_user_id_created_at', 'user_id', 'created_at'),
+        Index('ix_orders_status_created_at', 'status', 'created_at'),
+    )
 
     id = Column(UUID(as_uuid=True),default=uuid.uuid4, primary_key=True)
     user_id = Column(UUID(as_uuid=True), nullable=True)
     status = Column(Enum(OrderStatus), nullable=False, default=OrderStatus.PENDING)
     total_amount = Column(Numeric(10, 2), nullable=False)
     notes = Column(String)
-    created_at = Column(DateTime(timezone=True  ), nullable=False, default=datetime.now(UTC))
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.now(UTC))
+    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
     completed_at = Column(DateTime(timezone=True))
 
     # Relationships
@@ -38,6 +45,11 @@ class OrderModel(db.Model):
 
 class OrderItemModel(db.Model):
     __tablename__ = 'order_items'
+    __table_args__ = (
+        Index('ix_order_items_order_id', 'order_id'),
+        # Order summaries to refresh when a product is renamed
+        Index('ix_order_items_product_id', 'product_id'),
+    )
 
     id = Column(UUID(as_uuid=True),default=uuid.uuid4, primary_key=True)
     order_id = Column(UUID(as_uuid=True), ForeignKey('orders.id'), nullable=False)
@@ -45,8 +57,8 @@ class OrderItemModel(db.Model):
     # name = Column(String, nullable=False)
     quantity = Column(Integer, nullable=False)
     price = Column(Numeric(10, 2), nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.now(UTC))
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=datetime.now(UTC))
+    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
 
     # Relationships
     order = relationship("OrderModel", back_populates="items") 
\ No newline at end of file
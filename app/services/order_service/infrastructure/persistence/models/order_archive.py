@@ -0,0 +1,67 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.orm import relationship
+
+from app.dataBase import db
+from app.shared.database_types import UUID
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+
+
+class ArchivedOrderModel(db.Model):
+    """
+    Orders moved out of the hot orders table by the archival job.
+
+    Same columns (and attribute names) as OrderModel, so mappers and query
+    services read archived orders like live ones.
+    """
+    __tablename__ = 'orders_archive'
+    __table_args__ = (
+        Index('ix_orders_archive_created_at_id', 'created_at', 'id'),
+        Index('ix_orders_archive_user_id_created_at', 'user_id', 'created_at'),
+        Index('ix_orders_archive_status_created_at', 'status', 'created_at'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+    status = Column(Enum(OrderStatus), nullable=False)
+    total_amount = Column(Numeric(10, 2), nullable=False)
+    notes = Column(String)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    completed_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
+
+    items = relationship("ArchivedOrderItemModel", back_populates="order", cascade="all, delete-orphan")
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'status': self.status,
+            'total_amount': self.total_amount,
+            'notes': self.notes,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'completed_at': self.completed_at,
+            'archived_at': self.archived_at
+        }
+
+
+class ArchivedOrderItemModel(db.Model):
+    """Line items of archived orders, same columns as OrderItemModel"""
+    __tablename__ = 'order_items_archive'
+    __table_args__ = (
+        Index('ix_order_items_archive_order_id', 'order_id'),
+        Index('ix_order_items_archive_product_id', 'product_id'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    order_id = Column(UUID(as_uuid=True), ForeignKey('orders_archive.id'), nullable=False)
+    product_id = Column(UUID(as_uuid=True), nullable=False)
+    quantity = Column(Integer, nullable=False)
+    price = Column(Numeric(10, 2), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+    order = relationship("ArchivedOrderModel", back_populates="items")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Date, Enum, Integer, Numeric
+
+from app.dataBase import db
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+
+
+class OrderDailyStatsModel(db.Model):
+    """
+    Order totals per UTC creation day and current status.
+
+    Kept in step with the orders table by the order repository, in the same
+    transaction as the order write. Rebuilt from the orders by the
+    backfill-order-stats command.
+    """
+    __tablename__ = 'order_daily_stats'
+
+    day = Column(Date, primary_key=True)
+    status = Column(Enum(OrderStatus), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    revenue = Column(Numeric(14, 2), nullable=False, default=0)
+    # Order lines and ordered units
+    item_count = Column(Integer, nullable=False, default=0)
+    unit_count = Column(Integer, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            'day': self.day,
+            'status': self.status,
+            'order_count': self.order_count,
+            'revenue': self.revenue,
+            'item_count': self.item_count,
+            'unit_count': self.unit_count
+        }
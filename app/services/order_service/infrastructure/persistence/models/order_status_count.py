@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Enum, Integer
+
+from app.dataBase import db
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+
+
+class OrderStatusCountModel(db.Model):
+    """
+    Number of orders currently in each status.
+
+    Maintained by the order repository in the same transaction as the order
+    write when ORDER_STATUS_COUNTERS is enabled. Rebuilt from the orders by
+    the backfill-order-stats command.
+    """
+    __tablename__ = 'order_status_counts'
+
+    status = Column(Enum(OrderStatus), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+
+    def to_dict(self):
+        return {
+            'status': self.status,
+            'order_count': self.order_count
+        }
@@ -0,0 +1,39 @@
+from sqlalchemy import JSON, Boolean, Column, DateTime, Enum, Index, Integer, Numeric, String
+
+from app.dataBase import db
+from app.shared.database_types import UUID
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+
+
+class OrderSummaryModel(db.Model):
+    """
+    Read model of order listings: one row per live or archived order.
+
+    Holds everything a list entry shows, the consumer, health center and
+    product names included, so a page is read with one query and no calls to
+    other services. The id is the order's id, and the filtered columns keep
+    OrderModel's attribute names so listings apply the same criteria.
+
+    items is a JSON list of {id, product_id, name, quantity, price}; names
+    unknown when the row was written are null and shown as defaults.
+    """
+    __tablename__ = 'order_summaries'
+    __table_args__ = (
+        Index('ix_order_summaries_archived_created_at_id', 'archived', 'created_at', 'id'),
+        Index('ix_order_summaries_user_id_created_at', 'user_id', 'created_at'),
+        Index('ix_order_summaries_status_created_at', 'status', 'created_at'),
+        # Rows to refresh when a health center is renamed
+        Index('ix_order_summaries_health_center_id', 'health_center_id'),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+    status = Column(Enum(OrderStatus), nullable=False)
+    total_amount = Column(Numeric(10, 2), nullable=False)
+    items_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    archived = Column(Boolean, nullable=False, default=False)
+    consumer_name = Column(String)
+    health_center_id = Column(UUID(as_uuid=True), nullable=True)
+    health_center_name = Column(String)
+    items = Column(JSON, nullable=False, default=list)
@@ -0,0 +1,92 @@
+from datetime import UTC, datetime
+from typing import Iterable, List
+from uuid import UUID
+
+from sqlalchemy import DateTime, Select, delete, insert, literal, select, union_all, update
+from sqlalchemy.orm import Session
+
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_archive import (
+    ArchivedOrderItemModel,
+    ArchivedOrderModel
+)
+from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+
+# Only orders that can no longer change are archived
+ARCHIVABLE_STATUSES = (OrderStatus.COMPLETED, OrderStatus.CANCELLED, OrderStatus.FAILED)
+
+_ORDER_COLUMNS = ('id', 'user_id', 'status', 'total_amount', 'notes', 'created_at', 'updated_at', 'completed_at')
+_ITEM_COLUMNS = ('id', 'order_id', 'product_id', 'quantity', 'price', 'created_at', 'updated_at')
+
+
+def all_orders(*columns: str):
+    """Live and archived orders as one selectable with the given OrderModel columns"""
+    return union_all(
+        select(*[getattr(OrderModel, name) for name in columns]),
+        select(*[getattr(ArchivedOrderModel, name) for name in columns])
+    ).subquery('all_orders')
+
+
+def all_order_items(*columns: str):
+    """Live and archived order items as one selectable with the given OrderItemModel columns"""
+    return union_all(
+        select(*[getattr(OrderItemModel, name) for name in columns]),
+        select(*[getattr(ArchivedOrderItemModel, name) for name in columns])
+    ).subquery('all_order_items')
+
+
+class OrderArchiveRepository:
+    """
+    Moves finished orders older than a cutoff from the hot tables into the archive tables.
+
+    Each batch copies the orders and their items with INSERT ... SELECT, deletes
+    them from the hot tables and flags their summaries as archived, so a batch
+    costs five statements whatever its size. The daily rollup and the status
+    counters keep counting archived orders.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def archive_batch(self, cutoff: datetime, batch_size: int = 1000,
+                      statuses: Iterable[OrderStatus] = ARCHIVABLE_STATUSES) -> int:
+        """
+        Move up to batch_size of the oldest archivable orders created before cutoff.
+
+        Returns:
+            Number of orders moved; 0 once nothing is left to archive
+        """
+        order_ids = self._session.execute(
+            select(OrderModel.id)
+            .where(OrderModel.created_at < cutoff, OrderModel.status.in_(list(statuses)))
+            .order_by(OrderModel.created_at, OrderModel.id)
+            .limit(batch_size)
+        ).scalars().all()
+        if order_ids:
+            self._move(order_ids)
+        return len(order_ids)
+
+    def _move(self, order_ids: List[UUID]) -> None:
+        now = literal(datetime.now(UTC), DateTime(timezone=True))
+        self._session.execute(insert(ArchivedOrderModel).from_select(
+            [*_ORDER_COLUMNS, 'archived_at'],
+            self._copy(OrderModel, _ORDER_COLUMNS, OrderModel.id.in_(order_ids)).add_columns(now)
+        ))
+        self._session.execute(insert(ArchivedOrderItemModel).from_select(
+            list(_ITEM_COLUMNS),
+            self._copy(OrderItemModel, _ITEM_COLUMNS, OrderItemModel.order_id.in_(order_ids))
+        ))
+        self._session.execute(delete(OrderItemModel).where(OrderItemModel.order_id.in_(order_ids)))
+        self._session.execute(delete(OrderModel).where(OrderModel.id.in_(order_ids)))
+        self._session.execute(
+            update(OrderSummaryModel)
+            .where(OrderSummaryModel.id.in_(order_ids))
+            .values(archived=True)
+            .execution_options(synchronize_session=False)
+        )
+        self._session.flush()
+
+    @staticmethod
+    def _copy(model, columns, condition) -> Select:
+        return select(*[getattr(model, name) for name in columns]).where(condition)
@@ -0,0 +1,199 @@
+from datetime import UTC, date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Date, Table, cast, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_daily_stats import OrderDailyStatsModel
+from app.services.order_service.infrastructure.persistence.repositories.order_archive_repository import (
+    all_order_items,
+    all_orders
+)
+
+# Counters of a rollup row, in the order deltas are passed around
+_COUNTERS = ('order_count', 'revenue', 'item_count', 'unit_count')
+
+
+def order_day(created_at: Optional[datetime]) -> date:
+    """UTC day an order is counted under; naive timestamps are taken as UTC"""
+    if created_at is None:
+        return datetime.now(UTC).date()
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(UTC)
+    return created_at.date()
+
+
+def increment_counters(session: Session, table: Table, key: Dict[str, Any], deltas: Dict[str, Any]) -> None:
+    """
+    Add deltas to the counter columns of the row with the given primary key, creating it if needed.
+
+    A single INSERT ... ON CONFLICT DO UPDATE on PostgreSQL and SQLite, so concurrent
+    writers never read the row first.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect in ('postgresql', 'sqlite'):
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+        statement = upsert(table).values(**key, **deltas)
+        session.execute(statement.on_conflict_do_update(
+            index_elements=[table.c[name] for name in key],
+            set_={name: table.c[name] + statement.excluded[name] for name in deltas}
+        ))
+        return
+
+    # Databases without an upsert: update the row, insert it when it is not there yet
+    result = session.execute(
+        update(table)
+        .where(*[table.c[name] == value for name, value in key.items()])
+        .values({name: table.c[name] + delta for name, delta in deltas.items()})
+    )
+    if result.rowcount == 0:
+        session.execute(insert(table).values(**key, **deltas))
+
+
+class OrderDailyStatsRepository:
+    """
+    Incremental maintenance of the order_daily_stats rollup.
+
+    Every order write adds its delta to the (day, status) row it belongs to
+    with increment_counters(), so the rollup stays exact under concurrent writers.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def record_order(self, created_at: Optional[datetime], status: OrderStatus, total_amount: Decimal,
+                     item_count: int, unit_count: int) -> None:
+        """Count a new order"""
+        self._add(order_day(created_at), status, 1, total_amount, item_count, unit_count)
+
+    def record_orders(self, orders: Iterable[Tuple[Optional[datetime], OrderStatus, Decimal, int, int]]) -> None:
+        """Count new orders, given as record_order() arguments, with one increment per (day, status)"""
+        totals: Dict[Tuple[date, OrderStatus], List] = {}
+        for created_at, status, total_amount, item_count, unit_count in orders:
+            row = totals.setdefault((order_day(created_at), status), [0, Decimal('0'), 0, 0])
+            for position, delta in enumerate((1, total_amount, item_count, unit_count)):
+                row[position] += delta
+        for (day, status), deltas in totals.items():
+            self._add(day, status, *deltas)
+
+    def remove_order(self, created_at: Optional[datetime], status: OrderStatus, total_amount: Decimal,
+                     item_count: int, unit_count: int) -> None:
+        """Stop counting a deleted order"""
+        self._add(order_day(created_at), status, -1, -total_amount, -item_count, -unit_count)
+
+    def move_order(self, created_at: Optional[datetime], old_status: OrderStatus, new_status: OrderStatus,
+                   total_amount: Decimal, item_count: int, unit_count: int) -> None:
+        """Move an order from its old status row to its new one"""
+        if old_status == new_status:
+            return
+        day = order_day(created_at)
+        self._add(day, old_status, -1, -total_amount, -item_count, -unit_count)
+        self._add(day, new_status, 1, total_amount, item_count, unit_count)
+
+    def rebuild(self, start_day: Optional[date] = None, end_day: Optional[date] = None) -> int:
+        """
+        Recompute the rollup rows of a day range from the live and archived orders.
+
+        Run it with order writes paused, or re-run it for the days written meanwhile.
+
+        Args:
+            start_day: First day to rebuild, the first order's day when omitted
+            end_day: Last day to rebuild, inclusive; the last order's day when omitted
+
+        Returns:
+            Number of rollup rows written
+        """
+        orders = all_orders('id', 'status', 'total_amount', 'created_at')
+        day = self._day_expression(orders.c.created_at)
+        items = self._item_totals(include_archived=True)
+        grouped = (
+            select(
+                day.label('day'),
+                orders.c.status.label('status'),
+                func.count(orders.c.id).label('order_count'),
+                func.coalesce(func.sum(orders.c.total_amount), 0).label('revenue'),
+                func.coalesce(func.sum(items.c.item_count), 0).label('item_count'),
+                func.coalesce(func.sum(items.c.unit_count), 0).label('unit_count')
+            )
+            .select_from(orders)
+            .outerjoin(items, items.c.order_id == orders.c.id)
+            .group_by(day, orders.c.status)
+        )
+        clear = delete(OrderDailyStatsModel)
+        if start_day is not None:
+            grouped = grouped.where(orders.c.created_at >= datetime.combine(start_day, time.min, UTC))
+            clear = clear.where(OrderDailyStatsModel.day >= start_day)
+        if end_day is not None:
+            grouped = grouped.where(orders.c.created_at < datetime.combine(end_day + timedelta(days=1), time.min, UTC))
+            clear = clear.where(OrderDailyStatsModel.day <= end_day)
+
+        self._session.execute(clear)
+        result = self._session.execute(
+            insert(OrderDailyStatsModel).from_select(['day', 'status', *_COUNTERS], grouped)
+        )
+        self._session.flush()
+        return result.rowcount
+
+    def move_orders(self, order_ids: Sequence[UUID], old_status: OrderStatus, new_status: OrderStatus) -> None:
+        """
+        Move a set of orders from their old status rows to their new ones.
+
+        The orders' totals are read with one query grouped by day, so the number of
+        statements depends on the days the orders span, not on how many orders move.
+        """
+        if old_status == new_status or not order_ids:
+            return
+        day = self._day_expression(OrderModel.created_at)
+        items = self._item_totals(order_ids)
+        rows = self._session.execute(
+            select(
+                day,
+                func.count(OrderModel.id),
+                func.coalesce(func.sum(OrderModel.total_amount), 0),
+                func.coalesce(func.sum(items.c.item_count), 0),
+                func.coalesce(func.sum(items.c.unit_count), 0)
+            )
+            .select_from(OrderModel)
+            .outerjoin(items, items.c.order_id == OrderModel.id)
+            .where(OrderModel.id.in_(order_ids))
+            .group_by(day)
+        ).all()
+        for order_date, order_count, revenue, item_count, unit_count in rows:
+            if isinstance(order_date, str):
+                order_date = date.fromisoformat(order_date)
+            self._add(order_date, old_status, -order_count, -revenue, -item_count, -unit_count)
+            self._add(order_date, new_status, order_count, revenue, item_count, unit_count)
+
+    def _add(self, day: date, status: OrderStatus, *deltas) -> None:
+        increment_counters(self._session, OrderDailyStatsModel.__table__,
+                           {'day': day, 'status': status}, dict(zip(_COUNTERS, deltas)))
+
+    @staticmethod
+    def _item_totals(order_ids: Optional[Sequence[UUID]] = None, include_archived: bool = False):
+        """Number of lines and units per order, optionally for some orders only or archived ones too"""
+        source = all_order_items('order_id', 'quantity') if include_archived else OrderItemModel.__table__
+        items = (
+            select(
+                source.c.order_id.label('order_id'),
+                func.count().label('item_count'),
+                func.sum(source.c.quantity).label('unit_count')
+            )
+            .group_by(source.c.order_id)
+        )
+        if order_ids is not None:
+            items = items.where(source.c.order_id.in_(order_ids))
+        return items.subquery('order_item_totals')
+
+    def _day_expression(self, created_at):
+        """UTC creation day of an order, as computed by order_day()"""
+        if self._session.get_bind().dialect.name == 'postgresql':
+            return cast(func.timezone('UTC', created_at), Date)
+        # SQLite stores the timestamps as UTC text
+        return func.date(created_at)
@@ -1,8 +1,9 @@
-from datetime import datetime
-from typing import List, Optional, Set
+from collections import Counter
+from datetime import UTC, datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 from uuid import UUID, uuid4
 
-from sqlalchemy import or_
+from sqlalchemy import insert, or_, update
 from sqlalchemy.orm import Session
 
 from app.services.order_service.domain.entities.order import OrderEntity
@@ -10,12 +11,28 @@ from app.services.order_service.domain.interfaces.order_repository import OrderR
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
 from app.services.order_service.infrastructure.persistence.mappers.order_mapper import OrderMapper
 from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.repositories.order_daily_stats_repository import OrderDailyStatsRepository
+from app.services.order_service.infrastructure.persistence.repositories.order_status_count_repository import OrderStatusCountRepository
+from app.services.order_service.infrastructure.persistence.repositories.order_summary_repository import OrderSummaryRepository
+from app.services.order_service.infrastructure.search.order_search_backend import get_order_search_backend, id_prefix_range
+
+# Orders per IN list of the set-based status methods
+ID_CHUNK_SIZE = 1000
+
+
+def _chunks(ids: List[UUID]) -> Iterator[List[UUID]]:
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        yield ids[start:start + ID_CHUNK_SIZE]
+
 
 class SQLAlchemyOrderRepository(OrderRepository):
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, status_counters: bool = False):
         self._session = session
         self._mapper = OrderMapper()
         self._seen: Set[OrderEntity] = set()
+        self._daily_stats = OrderDailyStatsRepository(session)
+        self._status_counts = OrderStatusCountRepository(session) if status_counters else None
+        self._summaries = OrderSummaryRepository(session)
     
     def get_all(self):
         orders_model= self._session.query(OrderModel).all()
@@ -41,10 +58,53 @@ class SQLAlchemyOrderRepository(OrderRepository):
         
         self._session.add(order_model)
         self._session.flush()
+        self._daily_stats.record_order(
+            order_model.created_at, order_model.status, order_model.total_amount,
+            *self._item_totals(order_model)
+        )
+        if self._status_counts:
+            self._status_counts.add(order_model.status)
        
         order = self._mapper.to_entity(order_model)
         return order
 
+    def add_many(self, orders: Sequence[OrderEntity]) -> List[OrderEntity]:
+        """
+        Insert new orders and their items with one multi-row INSERT per table.
+
+        The rows take the entities' ids and timestamps, so the entities are
+        returned as written without reading anything back.
+        """
+        if not orders:
+            return []
+        self._session.execute(insert(OrderModel), [{
+            'id': order.id,
+            'user_id': order.user_id,
+            'status': order.status,
+            'total_amount': order.total_amount,
+            'notes': order.notes,
+            'created_at': order.created_at,
+            'updated_at': order.created_at
+        } for order in orders])
+        self._session.execute(insert(OrderItemModel), [{
+            'id': item.id,
+            'order_id': order.id,
+            'product_id': item.product_id,
+            'quantity': item.quantity,
+            'price': item.price.amount,
+            'created_at': order.created_at,
+            'updated_at': order.created_at
+        } for order in orders for item in order.items])
+        self._daily_stats.record_orders(
+            (order.created_at, order.status, order.total_amount,
+             len(order.items), sum(item.quantity for item in order.items))
+            for order in orders
+        )
+        if self._status_counts:
+            for status, count in Counter(order.status for order in orders).items():
+                self._status_counts.add(status, count)
+        return list(orders)
+
     def get(self, order_id: UUID) -> Optional[OrderEntity]:
         order_model = self._session.query(OrderModel).filter(
             OrderModel.id == order_id
@@ -67,17 +127,76 @@ class SQLAlchemyOrderRepository(OrderRepository):
             raise ValueError(f"Order {order.id} not found")
             
         # updated_model = self._mapper.to_model(order)
+        old_status = order_model.status
         order_model.status = order.status
+        if order.status != old_status:
+            self._daily_stats.move_order(
+                order_model.created_at, old_status, order.status, order_model.total_amount,
+                *self._item_totals(order_model)
+            )
+            if self._status_counts:
+                self._status_counts.move(old_status, order.status)
+            self._summaries.set_status([order.id], order.status)
         # for key, value in updated_model.__dict__.items():
         #     if not key.startswith('_'):
         #         setattr(order_model, key, value)
         self._session.flush()
         return self._mapper.to_entity(order_model)
 
+    def get_statuses(self, order_ids: Sequence[UUID]) -> Dict[UUID, OrderStatus]:
+        """Current status of the existing orders among order_ids"""
+        statuses = {}
+        for chunk in _chunks(list(dict.fromkeys(order_ids))):
+            statuses.update(self._session.query(OrderModel.id, OrderModel.status).filter(OrderModel.id.in_(chunk)).all())
+        return statuses
+
+    def update_statuses(self, order_ids: Sequence[UUID], old_status: OrderStatus,
+                        new_status: OrderStatus) -> List[UUID]:
+        """
+        Move the orders still in old_status to new_status with one UPDATE per chunk of ids.
+
+        Orders whose status changed in the meantime are left alone, so callers can
+        check the returned ids against the ones they asked for.
+
+        Returns:
+            IDs of the orders that were moved
+        """
+        now = datetime.now(UTC)
+        values = {OrderModel.status: new_status, OrderModel.updated_at: now}
+        if new_status == OrderStatus.COMPLETED:
+            values[OrderModel.completed_at] = now
+        moved = []
+        for chunk in _chunks(list(order_ids)):
+            moved_chunk = self._session.execute(
+                update(OrderModel)
+                .where(OrderModel.id.in_(chunk), OrderModel.status == old_status)
+                .values(values)
+                .returning(OrderModel.id)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+            self._summaries.set_status(moved_chunk, new_status)
+            moved.extend(moved_chunk)
+        self._daily_stats.move_orders(moved, old_status, new_status)
+        if self._status_counts and moved:
+            self._status_counts.add(old_status, -len(moved))
+            self._status_counts.add(new_status, len(moved))
+        return moved
+
     def delete(self, order_id: UUID) -> None:
+        order_model = self._session.query(OrderModel).filter(
+            OrderModel.id == order_id
+        ).first()
+        if order_model:
+            self._daily_stats.remove_order(
+                order_model.created_at, order_model.status, order_model.total_amount,
+                *self._item_totals(order_model)
+            )
+            if self._status_counts:
+                self._status_counts.add(order_model.status, -1)
         self._session.query(OrderModel).filter(
             OrderModel.id == order_id
         ).delete()
+        self._summaries.delete(order_id)
         self._session.flush()
 
     def get_by_user(
@@ -126,13 +245,17 @@ class SQLAlchemyOrderRepository(OrderRepository):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> List[OrderEntity]:
-        db_query = self._session.query(OrderModel).filter(
-            or_(
-                OrderModel.id.ilike(f"%{query}%"),
-                OrderModel.user_id.ilike(f"%{query}%"),
-                OrderModel.notes.ilike(f"%{query}%")
-            )
-        )
+        # Id and user id prefixes seek their indexes, notes go through the full-text index
+        conditions = []
+        bounds = id_prefix_range(query)
+        if bounds:
+            conditions += [OrderModel.id.between(*bounds), OrderModel.user_id.between(*bounds)]
+        notes = get_order_search_backend(self._session).notes_matching(query)
+        if notes is not None:
+            conditions.append(OrderModel.id.in_(notes))
+        if not conditions:
+            return []
+        db_query = self._session.query(OrderModel).filter(or_(*conditions))
 
         if status:
             db_query = db_query.filter(OrderModel.status == status)
@@ -151,4 +274,9 @@ class SQLAlchemyOrderRepository(OrderRepository):
             self._session.query(OrderModel).filter(
                 OrderModel.id == order_id
             ).exists()
-        ).scalar()
\ No newline at end of file
+        ).scalar()
+
+    @staticmethod
+    def _item_totals(order_model: OrderModel) -> Tuple[int, int]:
+        """Number of order lines and of ordered units"""
+        return len(order_model.items), sum(item.quantity for item in order_model.items)
@@ -0,0 +1,50 @@
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order_status_count import OrderStatusCountModel
+from app.services.order_service.infrastructure.persistence.repositories.order_archive_repository import all_orders
+from app.services.order_service.infrastructure.persistence.repositories.order_daily_stats_repository import increment_counters
+
+
+class OrderStatusCountRepository:
+    """
+    Incremental maintenance of the order_status_counts table.
+
+    One row per status: writes that change many orders at once contend on it,
+    which is why the counters are opt-in (ORDER_STATUS_COUNTERS).
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def add(self, status: OrderStatus, delta: int = 1) -> None:
+        """Count orders entering (or, with a negative delta, leaving) a status"""
+        increment_counters(self._session, OrderStatusCountModel.__table__,
+                           {'status': status}, {'order_count': delta})
+
+    def move(self, old_status: OrderStatus, new_status: OrderStatus) -> None:
+        """Move one order between statuses"""
+        if old_status == new_status:
+            return
+        self.add(old_status, -1)
+        self.add(new_status, 1)
+
+    def rebuild(self) -> int:
+        """
+        Recompute all counters from the live and archived orders with one grouped count.
+
+        Returns:
+            Number of counter rows written
+        """
+        orders = all_orders('id', 'status')
+        grouped = (
+            select(orders.c.status, func.count(orders.c.id))
+            .group_by(orders.c.status)
+        )
+        self._session.execute(delete(OrderStatusCountModel))
+        result = self._session.execute(
+            insert(OrderStatusCountModel).from_select(['status', 'order_count'], grouped)
+        )
+        self._session.flush()
+        return result.rowcount
@@ -0,0 +1,158 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session, selectinload
+
+from app.services.order_service.application.dtos.order_dto import OrderDisplayNames
+from app.services.order_service.domain.entities.order import OrderEntity
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_archive import ArchivedOrderModel
+from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+from app.services.order_service.infrastructure.persistence.repositories.order_archive_repository import all_order_items
+
+# Summaries read and rewritten at a time when a product is renamed
+RENAME_CHUNK_SIZE = 1000
+
+# An order line as stored in a summary: id, product id, quantity and unit price
+_Line = Tuple[UUID, UUID, int, Decimal]
+
+
+class OrderSummaryRepository:
+    """
+    Writes the order_summaries read model.
+
+    Summaries are inserted in the transaction that creates their orders and
+    follow their status and deletion in the transactions that change those
+    (archival flags them in OrderArchiveRepository). Display names are the ones known when the order was placed, and are
+    rewritten set-based by the rename methods when a user, health center or
+    product changes.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def add_many(self, orders: Sequence[OrderEntity], names: OrderDisplayNames) -> None:
+        """Insert the summaries of new orders with one multi-row INSERT"""
+        if not orders:
+            return
+        self._session.execute(insert(OrderSummaryModel), [
+            self._row(order.id, order.user_id, order.status, order.total_amount, order.created_at, [
+                (item.id, item.product_id, item.quantity, item.price.amount) for item in order.items
+            ], names)
+            for order in orders
+        ])
+
+    def add_models(self, orders: Sequence[Any], names: OrderDisplayNames, archived: bool = False) -> None:
+        """Insert the summaries of orders read from the live or the archive tables"""
+        if not orders:
+            return
+        self._session.execute(insert(OrderSummaryModel), [
+            self._row(order.id, order.user_id, order.status, order.total_amount, order.created_at, [
+                (item.id, item.product_id, item.quantity, item.price) for item in order.items
+            ], names, archived)
+            for order in orders
+        ])
+
+    def missing(self, limit: int, archived: bool = False) -> List[Any]:
+        """Oldest live (or archived) orders without a summary, with their items"""
+        model = ArchivedOrderModel if archived else OrderModel
+        summarized = select(OrderSummaryModel.id).where(OrderSummaryModel.id == model.id).exists()
+        return self._session.query(model).options(
+            selectinload(model.items)
+        ).filter(~summarized).order_by(model.created_at, model.id).limit(limit).all()
+
+    def set_status(self, order_ids: Sequence[UUID], status: OrderStatus) -> None:
+        if order_ids:
+            self._session.execute(
+                update(OrderSummaryModel)
+                .where(OrderSummaryModel.id.in_(list(order_ids)))
+                .values(status=status)
+                .execution_options(synchronize_session=False)
+            )
+
+    def delete(self, order_id: UUID) -> None:
+        self._session.execute(delete(OrderSummaryModel).where(OrderSummaryModel.id == order_id))
+
+    def rename_consumer(self, user_id: UUID, name: str, health_center_id: Optional[UUID],
+                        health_center_name: Optional[str]) -> int:
+        """Set the consumer and health center names of a user's orders; returns the rows updated"""
+        return self._session.execute(
+            update(OrderSummaryModel)
+            .where(OrderSummaryModel.user_id == user_id)
+            .values(consumer_name=name, health_center_id=health_center_id, health_center_name=health_center_name)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    def rename_health_center(self, health_center_id: UUID, name: str) -> int:
+        """Set the health center name of the orders of a center's users; returns the rows updated"""
+        return self._session.execute(
+            update(OrderSummaryModel)
+            .where(OrderSummaryModel.health_center_id == health_center_id)
+            .values(health_center_name=name)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    def rename_product(self, product_id: UUID, name: str) -> int:
+        """
+        Set the name of a product in the items of every summary holding it.
+
+        The summaries are found through the product_id index of the live and
+        archived item tables, read RENAME_CHUNK_SIZE at a time in id order and
+        written back with one executemany UPDATE per chunk. Summaries already
+        showing the name are left alone.
+
+        Returns:
+            Number of summaries updated
+        """
+        product_key = str(product_id)
+        lines = all_order_items('order_id', 'product_id')
+        holding = select(lines.c.order_id).where(lines.c.product_id == product_id)
+        renamed = 0
+        last_id = None
+        while True:
+            query = select(OrderSummaryModel.id, OrderSummaryModel.items).where(OrderSummaryModel.id.in_(holding))
+            if last_id is not None:
+                query = query.where(OrderSummaryModel.id > last_id)
+            rows = self._session.execute(query.order_by(OrderSummaryModel.id).limit(RENAME_CHUNK_SIZE)).all()
+            changed = [
+                {'id': order_id, 'items': [
+                    dict(item, name=name) if item['product_id'] == product_key else item for item in items
+                ]}
+                for order_id, items in rows
+                if any(item['product_id'] == product_key and item.get('name') != name for item in items)
+            ]
+            if changed:
+                self._session.execute(update(OrderSummaryModel), changed)
+                renamed += len(changed)
+            if len(rows) < RENAME_CHUNK_SIZE:
+                return renamed
+            last_id = rows[-1][0]
+
+    @staticmethod
+    def _row(order_id: UUID, user_id: Optional[UUID], status: OrderStatus, total_amount: Decimal,
+             created_at: datetime, lines: List[_Line], names: OrderDisplayNames,
+             archived: bool = False) -> Dict[str, Any]:
+        consumer_name, health_center_name, health_center_id = names.consumers.get(user_id, (None, None, None))
+        return {
+            'id': order_id,
+            'user_id': user_id,
+            'status': status,
+            'total_amount': total_amount,
+            'items_count': len(lines),
+            'created_at': created_at,
+            'archived': archived,
+            'consumer_name': consumer_name,
+            'health_center_id': health_center_id,
+            'health_center_name': health_center_name,
+            'items': [{
+                'id': str(item_id),
+                'product_id': str(product_id),
+                'name': names.products.get(product_id),
+                'quantity': quantity,
+                'price': str(price)
+            } for item_id, product_id, quantity, price in lines]
+        }
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import Session
+
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_archive import (
+    ArchivedOrderItemModel,
+    ArchivedOrderModel
+)
+from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+
+# An updated_at this close to the stuck created_at was written by the same
+# import-time default rather than by a later update
+DEFAULT_SLACK = timedelta(seconds=1)
+
+
+class OrderTimestampRepository:
+    """
+    Repairs order timestamps written by the former import-time column defaults.
+
+    created_at/updated_at used to default to a datetime evaluated once when the
+    models were imported, so every order a worker created shares that worker's
+    start time. Such values are found as a created_at shared by several orders.
+    The real creation time is lost. The stuck value is a lower bound and every
+    later stamp of the order an upper bound: updated_at (its last write) and
+    completed_at both prove the order existed by then. created_at is capped
+    at the earliest of them, the tightest bound left, and written to the
+    order, its items and its summary. Orders with no later stamp are left
+    unchanged.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def repair(self, min_shared: int = 2, dry_run: bool = False,
+               chunk_size: int = 1000) -> Tuple[int, int]:
+        """
+        Repair the live and archived orders and their items.
+
+        Returns:
+            Number of orders repaired, and number of affected orders left unchanged
+        """
+        repaired = unresolved = 0
+        for model, item_model in ((OrderModel, OrderItemModel), (ArchivedOrderModel, ArchivedOrderItemModel)):
+            fixes, missing = self._fixes(model, min_shared)
+            if fixes and not dry_run:
+                self._apply(model, item_model, fixes, chunk_size)
+            repaired += len(fixes)
+            unresolved += missing
+        return repaired, unresolved
+
+    def _fixes(self, model, min_shared: int) -> Tuple[List[dict], int]:
+        """New (created_at, updated_at) of every order whose created_at is shared"""
+        shared = (
+            select(model.created_at)
+            .group_by(model.created_at)
+            .having(func.count() >= min_shared)
+        )
+        rows = self._session.execute(
+            select(model.id, model.created_at, model.updated_at, model.completed_at)
+            .where(model.created_at.in_(shared))
+        ).all()
+
+        fixes, missing = [], 0
+        for order_id, created_at, updated_at, completed_at in rows:
+            created = self._earliest_evidence(created_at, updated_at, completed_at)
+            if created is None:
+                missing += 1
+                continue
+            fixes.append({
+                'b_id': order_id,
+                'b_created_at': created,
+                'b_updated_at': max(updated_at, created)
+            })
+        return fixes, missing
+
+    @staticmethod
+    def _earliest_evidence(created_at: datetime, updated_at: datetime,
+                           completed_at: Optional[datetime]) -> Optional[datetime]:
+        """Earliest later stamp of the order: the latest its creation can have been"""
+        stamps = [stamp for stamp in (updated_at, completed_at)
+                  if stamp is not None and stamp - created_at > DEFAULT_SLACK]
+        return min(stamps) if stamps else None
+
+    def _apply(self, model, item_model, fixes: List[dict], chunk_size: int) -> None:
+        orders = model.__table__
+        items = item_model.__table__
+        update_orders = (
+            update(orders)
+            .where(orders.c.id == bindparam('b_id'))
+            .values(created_at=bindparam('b_created_at'), updated_at=bindparam('b_updated_at'))
+        )
+        # Items are written with their order and never updated
+        update_items = (
+            update(items)
+            .where(items.c.order_id == bindparam('b_id'))
+            .values(created_at=bindparam('b_created_at'), updated_at=bindparam('b_created_at'))
+        )
+        # Summaries list by created_at, and exist for live and archived orders alike
+        summaries = OrderSummaryModel.__table__
+        update_summaries = (
+            update(summaries)
+            .where(summaries.c.id == bindparam('b_id'))
+            .values(created_at=bindparam('b_created_at'))
+        )
+        connection = self._session.connection()
+        for start in range(0, len(fixes), chunk_size):
+            chunk = fixes[start:start + chunk_size]
+            connection.execute(update_orders, chunk)
+            connection.execute(update_items, chunk)
+            connection.execute(update_summaries, chunk)
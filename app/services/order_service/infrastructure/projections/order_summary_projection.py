@@ -0,0 +1,115 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.dataBase import Database
+from app.services.order_service.application.dtos.order_dto import OrderDisplayNames
+from app.services.order_service.infrastructure.persistence.repositories.order_summary_repository import OrderSummaryRepository
+from app.shared.application.events.event_bus import EventBus
+from app.shared.contracts.auth.auth_events import HealthCareCenterUpdatedEvent, UserUpdatedEvent
+from app.shared.contracts.product.product_events import ProductUpdatedEvent
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Resolves the display names of the given user and product ids
+NameResolver = Callable[[List[UUID], List[UUID]], OrderDisplayNames]
+
+
+class OrderSummaryProjection:
+    """
+    Keeps the names held by order_summaries in step with the services owning them.
+
+    Subscribes to user, health center and product updates and rewrites the
+    affected summaries set-based, each event in a session and transaction of
+    its own, so a handler never commits or discards the publisher's pending
+    work whether the event is published before or after its commit. Product
+    updates that leave the name as this process last applied it are skipped,
+    so price or stock edits do not rewrite a popular product's summaries.
+    """
+
+    def __init__(self, db: Database, event_bus: Optional[EventBus] = None, max_products: int = 10000):
+        self._db = db
+        self._product_names: "OrderedDict[UUID, str]" = OrderedDict()
+        self._max_products = max_products
+        self._lock = threading.Lock()
+        if event_bus:
+            event_bus.subscribe(UserUpdatedEvent, self.handle_user_updated)
+            event_bus.subscribe(HealthCareCenterUpdatedEvent, self.handle_health_care_center_updated)
+            event_bus.subscribe(ProductUpdatedEvent, self.handle_product_updated)
+
+    def handle_user_updated(self, event: UserUpdatedEvent) -> None:
+        center_id = UUID(event.health_care_center_id) if event.health_care_center_id else None
+        self._apply(event, lambda summaries: summaries.rename_consumer(
+            UUID(event.id), event.full_name, center_id, event.health_care_center_name
+        ))
+
+    def handle_health_care_center_updated(self, event: HealthCareCenterUpdatedEvent) -> None:
+        self._apply(event, lambda summaries: summaries.rename_health_center(UUID(event.id), event.name))
+
+    def handle_product_updated(self, event: ProductUpdatedEvent) -> None:
+        product_id = UUID(event.id)
+        with self._lock:
+            if self._product_names.get(product_id) == event.name:
+                self._product_names.move_to_end(product_id)
+                return
+        if self._apply(event, lambda summaries: summaries.rename_product(product_id, event.name)):
+            with self._lock:
+                self._product_names[product_id] = event.name
+                self._product_names.move_to_end(product_id)
+                while len(self._product_names) > self._max_products:
+                    self._product_names.popitem(last=False)
+
+    def backfill(self, resolve_names: NameResolver, batch_size: int = 1000) -> int:
+        """
+        Write the summaries missing for live and archived orders, such as orders
+        placed before the read model existed.
+
+        Works oldest first in batches of batch_size orders, each with one name
+        lookup per service, one multi-row INSERT and its own commit.
+
+        Returns:
+            Number of summaries written
+        """
+        session = self._db.get_session()
+        summaries = OrderSummaryRepository(session)
+        written = 0
+        try:
+            for archived in (False, True):
+                while True:
+                    orders = summaries.missing(batch_size, archived)
+                    if not orders:
+                        break
+                    names = resolve_names(
+                        [order.user_id for order in orders],
+                        [item.product_id for order in orders for item in order.items]
+                    )
+                    summaries.add_models(orders, names, archived)
+                    session.commit()
+                    written += len(orders)
+                    if len(orders) < batch_size:
+                        break
+        except Exception:
+            session.rollback()
+            raise
+        return written
+
+    def _apply(self, event, rename: Callable[[OrderSummaryRepository], int]) -> bool:
+        """
+        Run a rename in a dedicated session rather than the request's scoped one;
+        failures are logged, not raised into the publisher
+        """
+        with Session(bind=self._db.db.engine) as session:
+            try:
+                updated = rename(OrderSummaryRepository(session))
+                session.commit()
+                logger.info(f"Refreshed {updated} order summaries after {type(event).__name__} {event.id}")
+                return True
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Failed to refresh order summaries after {type(event).__name__} {event.id}: {str(e)}")
+                return False
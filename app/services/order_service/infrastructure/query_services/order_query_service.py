@@ -1,12 +1,15 @@
-from datetime import datetime, timedelta
-from typing import List, Optional, Tuple, Dict, Any
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import List, Optional, Tuple, Dict, Any, Iterator
 from uuid import UUID
 
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import and_, or_, desc, func, select, union
 from sqlalchemy.orm import Session, joinedload
 # from functools import lru_cache
 
 from app.services.order_service.application.dtos.order_dto import (
+    DeliveryOrderDTO,
+    OrderDisplayNames,
     OrderDTO,
     OrderFilterPaginationDTO,
     OrderFilterResponseDTO,
@@ -15,233 +18,217 @@ from app.services.order_service.application.dtos.order_dto import (
     OrderFilterDTO
 )
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.cache.consumer_name_cache import ConsumerNameCache, ConsumerNames
+from app.services.order_service.infrastructure.export import order_export
 from app.services.order_service.infrastructure.persistence.mappers.order_mapper import OrderMapper
 from app.services.order_service.infrastructure.persistence.models.order import OrderModel, OrderItemModel
+from app.services.order_service.infrastructure.persistence.models.order_archive import ArchivedOrderModel
+from app.services.order_service.infrastructure.persistence.models.order_daily_stats import OrderDailyStatsModel
+from app.services.order_service.infrastructure.persistence.models.order_status_count import OrderStatusCountModel
+from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+from app.services.order_service.infrastructure.persistence.repositories.order_archive_repository import all_order_items, all_orders
+from app.services.order_service.infrastructure.search.order_search_backend import get_order_search_backend, id_prefix_range
 from app.shared.acl.unified_acl import UnifiedACL
+from app.shared.contracts.auth.auth_events import HealthCareCenterUpdatedEvent, UserUpdatedEvent
+from app.shared.contracts.order.order_events import OrderPlacedEvent, OrdersArchivedEvent, OrderStatusChangedEvent
+from app.shared.contracts.product.product_events import ProductUpdatedEvent
+from app.shared.infrastructure.persistence.list_counts import CountMode, ListCountCache, fetch_page, filter_signature
+from app.shared.utils.cursor_pagination import decode_cursor, encode_cursor, keyset_condition
+
+# Cursor kind for order listings ordered by (created_at, id) descending
+ORDER_CURSOR = "orders:created_at"
+# Cursor kind for order search results, in the same order
+ORDER_SEARCH_CURSOR = "orders:search"
+
+# Count cache namespace of order listings and the writes that change their totals
+ORDER_LIST_NAMESPACE = "orders"
+ORDER_LIST_WRITE_EVENTS = (OrderPlacedEvent, OrderStatusChangedEvent, OrdersArchivedEvent)
+# Renames that change the names shown by order listings, but not their totals
+ORDER_NAME_EVENTS = (UserUpdatedEvent, HealthCareCenterUpdatedEvent, ProductUpdatedEvent)
+
+# Filter fields that do not change which orders are counted
+ORDER_PAGING_FIELDS = ("page", "per_page", "cursor", "count_mode")
 
 class OrderQueryService:
-    def __init__(self, session: Session, acl: UnifiedACL = None):
+    def __init__(self, session: Session, acl: UnifiedACL = None, count_cache: Optional[ListCountCache] = None,
+                 status_counters: bool = False, name_cache: Optional[ConsumerNameCache] = None):
         self._session = session
         self._mapper = OrderMapper()
         self._acl = acl
+        self._count_cache = count_cache
+        self._status_counters = status_counters
+        self._name_cache = name_cache
         # self._cache = {}  # Simple in-memory cache
         # self._cache_ttl = 300  # 5 minutes in seconds
 
-    def _get_product_name(self, product_id: UUID) -> str:
-        """
-        Get product name from product service via ACL.
-        Falls back to a default name if product service is unavailable.
-        """
-        if not self._acl:
-            return f"Product {str(product_id).split('-')[0]}"
-            
-        try:
-            from app.services.order_service.infrastructure.adapters.outgoing.product_adapter import ProductServiceAdapter
-            product_adapter = ProductServiceAdapter(self._acl)
-            product = product_adapter.get_product_by_id(product_id)
-            
-            if product and 'name' in product:
-                return product['name']
-            else:
-                return f"Product {str(product_id).split('-')[0]}"
-                
-        except Exception as e:
-            # Log the error but don't break the order query
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to fetch product name for {product_id}: {str(e)}")
-            return f"Product {str(product_id).split('-')[0]}"
+    @staticmethod
+    def _default_product_name(product_id: UUID) -> str:
+        return f"Product {str(product_id).split('-')[0]}"
+
+    @staticmethod
+    def _default_user_name(user_id: UUID) -> str:
+        return f"User {str(user_id).split('-')[0]}"
+
+    def _lookup_product_names(self, product_ids: List[UUID]) -> Dict[UUID, str]:
+        """Names of the given products from product service via ACL, in a single lookup; unknown products are left out"""
+        product_ids = set(product_ids)
+        if not self._acl or not product_ids:
+            return {}
+        from app.services.order_service.infrastructure.adapters.outgoing.product_adapter import ProductServiceAdapter
+        return {
+            product_id: name
+            for product_id, name in ProductServiceAdapter(self._acl).get_product_names(list(product_ids)).items()
+            if name
+        }
 
     def _get_product_names_batch(self, product_ids: List[UUID]) -> Dict[UUID, str]:
         """
-        Get product names in batch for better performance.
+        Get product names from product service via ACL, in a single lookup.
         Falls back to default names if product service is unavailable.
         """
-        product_names = {}
-        
-        if not self._acl or not product_ids:
-            # Return default names if ACL is not available or no product IDs
-            return {pid: f"Product {str(pid).split('-')[0]}" for pid in product_ids}
-            
-        try:
-            from app.services.order_service.infrastructure.adapters.outgoing.product_adapter import ProductServiceAdapter
-            product_adapter = ProductServiceAdapter(self._acl)
-            
-            for product_id in product_ids:
-                try:
-                    product = product_adapter.get_product_by_id(product_id)
-                    if product and 'name' in product:
-                        product_names[product_id] = product['name']
-                    else:
-                        product_names[product_id] = f"Product {str(product_id).split('-')[0]}"
-                except Exception:
-                    product_names[product_id] = f"Product {str(product_id).split('-')[0]}"
-            
-        except Exception as e:
-            # Log the error but don't break the order query
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to fetch product names in batch: {str(e)}")
-            # Return default names
-            product_names = {pid: f"Product {str(pid).split('-')[0]}" for pid in product_ids}
-            
-        return product_names
+        product_names = self._lookup_product_names(product_ids)
+        return {
+            product_id: product_names.get(product_id) or self._default_product_name(product_id)
+            for product_id in set(product_ids)
+        }
 
-    def _get_user_name(self, user_id: UUID) -> str:
+    def _lookup_consumers(self, user_ids: List[UUID]) -> Dict[UUID, ConsumerNames]:
         """
-        Get user name from auth service via ACL.
-        Falls back to a default name if auth service is unavailable.
+        Get user names and health centers from the name cache, or else from auth service via ACL.
+        Uncached users are looked up once and their health centers once, whatever the number of users.
+
+        Returns:
+            User ID to user name, health center name and health center ID, for the users auth service returned
         """
-        if not self._acl or not user_id:
-            return f"User {str(user_id).split('-')[0]}" if user_id else "Unknown User"
-            
-        try:
-            from app.services.order_service.infrastructure.adapters.outgoing.auth_adapter import AuthServiceAdapter
-            auth_adapter = AuthServiceAdapter(self._acl)
-            user = auth_adapter.get_user_by_id(user_id)
-            
-            if user and 'full_name' in user:
-                return user['full_name']
-            else:
-                return f"User {str(user_id).split('-')[0]}"
-                
-        except Exception as e:
-            # Log the error but don't break the order query
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to fetch user name for {user_id}: {str(e)}")
-            return f"User {str(user_id).split('-')[0]}"
+        user_ids = {user_id for user_id in user_ids if user_id}
+        consumers = self._name_cache.get_many(user_ids) if self._name_cache is not None else {}
+        user_ids -= consumers.keys()
+        if not self._acl or not user_ids:
+            return consumers
+
+        from app.services.order_service.infrastructure.adapters.outgoing.auth_adapter import AuthServiceAdapter
+        auth_adapter = AuthServiceAdapter(self._acl)
+        users = auth_adapter.get_users_by_ids(list(user_ids))
+        center_ids = {
+            UUID(user['health_care_center_id'])
+            for user in users.values() if user.get('health_care_center_id')
+        }
+        centers = auth_adapter.get_health_care_centers_by_ids(list(center_ids))
 
-    def _get_user_names_batch(self, user_ids: List[UUID]) -> Dict[UUID, str]:
+        for user_id, user in users.items():
+            center_id = UUID(user['health_care_center_id']) if user.get('health_care_center_id') else None
+            center = centers.get(center_id) if center_id else None
+            consumers[user_id] = (
+                user.get('full_name') or self._default_user_name(user_id),
+                center.get('name') if center else None,
+                center_id
+            )
+            # Users whose health center the auth service did not return stay uncached
+            if self._name_cache is not None and (not center_id or center):
+                self._name_cache.put(user_id, *consumers[user_id])
+        return consumers
+
+    def _get_consumer_names_batch(self, user_ids: List[UUID]) -> Tuple[Dict[UUID, str], Dict[UUID, str]]:
         """
-        Get user names in batch for better performance.
-        Falls back to default names if auth service is unavailable.
+        Get user names and health center names, from the name cache or auth service.
+        Falls back to default user names (and no health center) if auth service is unavailable.
+
+        Returns:
+            User ID to user name, and user ID to health center name for users that have one
         """
-        user_names = {}
-        
-        if not self._acl or not user_ids:
-            # Return default names if ACL is not available or no user IDs
-            return {uid: f"User {str(uid).split('-')[0]}" for uid in user_ids}
-            
-        try:
-            from app.services.order_service.infrastructure.adapters.outgoing.auth_adapter import AuthServiceAdapter
-            auth_adapter = AuthServiceAdapter(self._acl)
-            
-            for user_id in user_ids:
-                try:
-                    user = auth_adapter.get_user_by_id(user_id)
-                    if user and 'full_name' in user:
-                        user_names[user_id] = user['full_name']
-                    else:
-                        user_names[user_id] = f"User {str(user_id).split('-')[0]}"
-                except Exception:
-                    user_names[user_id] = f"User {str(user_id).split('-')[0]}"
-                    
-        except Exception as e:
-            # Log the error but don't break the order query
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to fetch user names in batch: {str(e)}")
-            # Return default names
-            user_names = {uid: f"User {str(uid).split('-')[0]}" for uid in user_ids}
-            
-        return user_names
+        consumers = self._lookup_consumers(user_ids)
+        user_names = {
+            user_id: consumers[user_id][0] if user_id in consumers else self._default_user_name(user_id)
+            for user_id in user_ids if user_id
+        }
+        health_center_names = {user_id: names[1] for user_id, names in consumers.items() if names[1]}
+        return user_names, health_center_names
 
-    def _get_health_center_name(self, user_id: UUID) -> str:
-        """Get health center name for a user"""
-        if not user_id or not self._acl:
-            return None
-            
-        try:
-            from app.services.order_service.infrastructure.adapters.outgoing.auth_adapter import AuthServiceAdapter
-            auth_adapter = AuthServiceAdapter(self._acl)
-            
-            # First get the user to find their health_care_center_id
-            user = auth_adapter.get_user_by_id(user_id)
-            if not user or not user.get('health_care_center_id'):
-                return None
-                
-            # Then get the health center details
-            health_care_center_id = user.get('health_care_center_id')
-            center = auth_adapter.get_health_care_center_by_id(UUID(health_care_center_id))
-            if center and center.get('name'):
-                return center['name']
-            else:
-                return None
-                
-        except Exception as e:
-            # Log error but don't fail the query
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Error fetching health center for user {user_id}: {str(e)}")
-            return None
+    def get_display_names(self, user_ids: List[UUID], product_ids: List[UUID]) -> OrderDisplayNames:
+        """Names to store in the summaries of new orders, with one lookup for products, users and centers each"""
+        return OrderDisplayNames(
+            consumers=self._lookup_consumers(user_ids),
+            products=self._lookup_product_names(product_ids)
+        )
 
-    def _get_health_center_names_batch(self, user_ids: List[UUID]) -> Dict[UUID, str]:
-        """Get health center names for multiple users in a single batch operation"""
-        if not user_ids or not self._acl:
-            return {}
-            
-        health_center_names = {}
-        
-        try:
-            from app.services.order_service.infrastructure.adapters.outgoing.auth_adapter import AuthServiceAdapter
-            auth_adapter = AuthServiceAdapter(self._acl)
-            
-            # Get all users by IDs first to get their health_care_center_ids
-            users_data = {}
-            for user_id in user_ids:
-                try:
-                    user = auth_adapter.get_user_by_id(user_id)
-                    if user:
-                        users_data[user_id] = user
-                except Exception as e:
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"Error fetching user {user_id}: {str(e)}")
-                    continue
-            
-            # Get unique health center IDs
-            center_ids = set()
-            for user_data in users_data.values():
-                if user_data.get('health_care_center_id'):
-                    center_ids.add(UUID(user_data['health_care_center_id']))
-            
-            # Fetch health center details for all unique center IDs
-            centers_data = {}
-            for center_id in center_ids:
-                try:
-                    center = auth_adapter.get_health_care_center_by_id(center_id)
-                    if center:
-                        centers_data[center_id] = center
-                except Exception as e:
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"Error fetching health center {center_id}: {str(e)}")
-                    continue
-            
-            # Map user IDs to health center names
-            for user_id, user_data in users_data.items():
-                if user_data.get('health_care_center_id'):
-                    center_id = UUID(user_data['health_care_center_id'])
-                    center_data = centers_data.get(center_id)
-                    if center_data and center_data.get('name'):
-                        health_center_names[user_id] = center_data['name']
-                        
-        except Exception as e:
-            # If batch operation fails, return empty dict
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Error in batch health center fetch: {str(e)}")
-            
-        return health_center_names
+    def get_consumer_names(self, user_id: Optional[UUID]) -> Tuple[Optional[str], Optional[str]]:
+        """User name and health center name of one consumer, from the name cache when possible"""
+        if not user_id:
+            return None, None
+        user_names, health_center_names = self._get_consumer_names_batch([user_id])
+        return user_names.get(user_id), health_center_names.get(user_id)
+
+    def _to_summary_dtos(self, orders: List[OrderModel]) -> List[OrderSummaryDTO]:
+        """
+        Convert a page of orders without a summary (not backfilled yet) to summary DTOs.
+        Product, user and health center names are resolved for the whole page at once
+        and attached in memory, so the number of lookups does not grow with the page.
+        """
+        product_names = self._get_product_names_batch(
+            [item.product_id for order in orders for item in order.items or []]
+        )
+        user_names, health_center_names = self._get_consumer_names_batch(
+            [order.user_id for order in orders]
+        )
+
+        return [OrderSummaryDTO(
+            order_id=order.id,
+            consumer_id=order.user_id,
+            status=order.status,
+            total_amount=order.total_amount,
+            items_count=len(order.items) if order.items else 0,
+            created_at=order.created_at,
+            items=[{
+                'id': item.id,
+                'product_id': item.product_id,
+                'name': product_names[item.product_id],
+                'quantity': item.quantity,
+                'price': item.price,
+                'total_price': item.quantity*item.price
+            } for item in order.items],
+            consumer_name=user_names.get(order.user_id) if order.user_id else None,
+            health_center_name=health_center_names.get(order.user_id) if order.user_id else None
+        ) for order in orders]
+
+    def _summary_dtos(self, summaries: List[OrderSummaryModel]) -> List[OrderSummaryDTO]:
+        """Convert order summaries to DTOs as stored; names unknown when they were written get defaults"""
+        return [OrderSummaryDTO(
+            order_id=summary.id,
+            consumer_id=summary.user_id,
+            status=summary.status,
+            total_amount=summary.total_amount,
+            items_count=summary.items_count,
+            created_at=summary.created_at,
+            items=[self._summary_item(item) for item in summary.items],
+            consumer_name=(
+                summary.consumer_name or self._default_user_name(summary.user_id)
+            ) if summary.user_id else None,
+            health_center_name=summary.health_center_name
+        ) for summary in summaries]
+
+    def _summary_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        product_id = UUID(item['product_id'])
+        price = Decimal(item['price'])
+        return {
+            'id': UUID(item['id']),
+            'product_id': product_id,
+            'name': item.get('name') or self._default_product_name(product_id),
+            'quantity': item['quantity'],
+            'price': price,
+            'total_price': item['quantity'] * price
+        }
 
     def get_order_by_id(self, order_id: UUID) -> Optional[OrderModel]:
-        """Get order details by ID with eager loading of items"""
+        """Get order details by ID with eager loading of items, from the archive if it was archived"""
         try:
             order = self._session.query(OrderModel).options(
                 joinedload(OrderModel.items)  # Eager load items
             ).filter(
                 OrderModel.id == order_id
+            ).first() or self._session.query(ArchivedOrderModel).options(
+                joinedload(ArchivedOrderModel.items)
+            ).filter(
+                ArchivedOrderModel.id == order_id
             ).first()
             
             if order:
@@ -292,6 +279,14 @@ class OrderQueryService:
             logger.error(f"Database error fetching order {order_id}: {str(e)}")
             return None
 
+    def get_order_updated_at(self, order_id: UUID) -> Optional[datetime]:
+        """Read only the updated_at of an order, for conditional GET validators"""
+        row = (
+            self._session.query(OrderModel.updated_at).filter(OrderModel.id == order_id).first()
+            or self._session.query(ArchivedOrderModel.updated_at).filter(ArchivedOrderModel.id == order_id).first()
+        )
+        return row[0] if row else None
+
     def get_orders_by_user_id(self, user_id: UUID, page: int = 1, per_page: int = 10) -> List[OrderModel]:
         """Get all orders for a specific user ordered by creation date (newest first)"""
         # cache_key = f"user_orders_{user_id}_{page}_{per_page}"
@@ -299,45 +294,15 @@ class OrderQueryService:
         
         # if cached_result:
         #     return cached_result
-        orders = self._session.query(OrderModel).options(
-            joinedload(OrderModel.items)
-        ).filter(
-            OrderModel.user_id == user_id
+        orders = self._session.query(OrderSummaryModel).filter(
+            OrderSummaryModel.user_id == user_id,
+            OrderSummaryModel.archived.is_(False)
         ).order_by(
-            desc(OrderModel.created_at)
+            desc(OrderSummaryModel.created_at)
         ).offset((page - 1) * per_page).limit(per_page).all()
         
-        # Get user name for this specific user
-        user_name = self._get_user_name(user_id)
-        health_center_name = self._get_health_center_name(user_id)
-        
-        # Convert to DTOs with user name and health center name
-        result = []
-        for order in orders:
-            # Get all product IDs from the order items
-            product_ids = [item.product_id for item in order.items] if order.items else []
-            
-            # Fetch product names in batch for better performance
-            product_names = self._get_product_names_batch(product_ids)
-                
-            result.append(OrderSummaryDTO(
-                order_id=order.id,
-                consumer_id=order.user_id,
-                status=order.status,
-                total_amount=order.total_amount,
-                items_count=len(order.items) if order.items else 0,
-                created_at=order.created_at,
-                items=[{
-                    'id': item.id,
-                    'product_id': item.product_id,
-                    'name': product_names.get(item.product_id, f"Product {str(item.product_id).split('-')[0]}"),  # Use actual product name
-                    'quantity': item.quantity,
-                    'price': item.price,
-                    'total_price': item.quantity*item.price
-                } for item in order.items],
-                consumer_name=user_name,
-                health_center_name=health_center_name
-            ))
+        # Summaries already hold every name
+        result = self._summary_dtos(orders)
         
         # self._add_to_cache(cache_key, orders)
         return OrderFilterResponseDTO(
@@ -350,6 +315,24 @@ class OrderQueryService:
             )
         )
 
+    @staticmethod
+    def _filter_conditions(filter_dto: OrderFilterDTO, model=OrderModel) -> List[Any]:
+        """SQL criteria for the filter fields of an order listing or export, on live or archived orders"""
+        conditions = []
+        if filter_dto.user_id:
+            conditions.append(model.user_id == filter_dto.user_id)
+        if filter_dto.status:
+            conditions.append(model.status == OrderStatus(filter_dto.status))
+        if filter_dto.start_date:
+            conditions.append(model.created_at >= filter_dto.start_date)
+        if filter_dto.end_date:
+            conditions.append(model.created_at <= filter_dto.end_date)
+        if filter_dto.min_amount:
+            conditions.append(model.total_amount >= filter_dto.min_amount)
+        if filter_dto.max_amount:
+            conditions.append(model.total_amount <= filter_dto.max_amount)
+        return conditions
+
     def get_orders_by_filter(
         self,
         filter_dto: Optional[OrderFilterDTO] = None,
@@ -365,84 +348,94 @@ class OrderQueryService:
         # if cached_result:
         #     return cached_result
         
-        # Build base query
-        query = self._session.query(OrderModel).options(
-            joinedload(OrderModel.items)
-        ).order_by(desc(OrderModel.created_at))
+        # Build base query on the summaries, which hold live and archived orders with their names
+        archived = bool(getattr(filter_dto, 'archived', False))
+        model = OrderSummaryModel
+        query = self._session.query(model).filter(model.archived.is_(archived))
 
         # Apply filters
-        if filter_dto.user_id:
-            query = query.filter(OrderModel.user_id == filter_dto.user_id)
-        if filter_dto.status:
-            query = query.filter(OrderModel.status == OrderStatus(filter_dto.status))
-        if filter_dto.start_date:
-            query = query.filter(OrderModel.created_at >= filter_dto.start_date)
-        if filter_dto.end_date:
-            query = query.filter(OrderModel.created_at <= filter_dto.end_date)
-        if filter_dto.min_amount:
-            query = query.filter(OrderModel.total_amount >= filter_dto.min_amount)
-        if filter_dto.max_amount:
-            query = query.filter(OrderModel.total_amount <= filter_dto.max_amount)
-
-        # Get total count for pagination info
-        total = query.count()
-        pages = (total + filter_dto.per_page - 1) // filter_dto.per_page
-
-        # Apply pagination
-        orders = query.order_by(desc(OrderModel.created_at)) \
-            .offset((filter_dto.page - 1) * filter_dto.per_page) \
-            .limit(filter_dto.per_page) \
-            .all()
-
-        # Get all unique user IDs for batch processing
-        user_ids = list(set([order.user_id for order in orders if order.user_id]))
-        user_names = self._get_user_names_batch(user_ids)
-        health_center_names = self._get_health_center_names_batch(user_ids)
-
-        # Convert to DTOs with batch-fetched user names and health center names
-        result = []
-        for order in orders:
-            # Get all product IDs from the order items
-            product_ids = [item.product_id for item in order.items] if order.items else []
-            
-            # Fetch product names in batch for better performance
-            product_names = self._get_product_names_batch(product_ids)
-            
-            # Get consumer name and health center name from batch-fetched data
-            consumer_name = user_names.get(order.user_id) if order.user_id else None
-            health_center_name = health_center_names.get(order.user_id) if order.user_id else None
-                
-            result.append(OrderSummaryDTO(
-                order_id=order.id,
-                consumer_id=order.user_id,
-                status=order.status,
-                total_amount=order.total_amount,
-                items_count=len(order.items) if order.items else 0,
-                created_at=order.created_at,
-                items=[{
-                    'id': item.id,
-                    'product_id': item.product_id,
-                    'name': product_names.get(item.product_id, f"Product {str(item.product_id).split('-')[0]}"),  # Use actual product name
-                    'quantity': item.quantity,
-                    'price': item.price,
-                    'total_price': item.quantity*item.price
-                } for item in order.items],
-                consumer_name=consumer_name,
-                health_center_name=health_center_name
+        query = query.filter(*self._filter_conditions(filter_dto, model))
+
+        # Apply pagination, newest first with the id as tie-breaker. A cursor seeks
+        # past the (created_at, id) key of the previous page instead of using OFFSET.
+        ordered = query.order_by(desc(model.created_at), desc(model.id))
+        cursor = getattr(filter_dto, 'cursor', None)
+        if cursor:
+            ordered = ordered.filter(keyset_condition(
+                (model.created_at, model.id),
+                decode_cursor(cursor, ORDER_CURSOR),
+                descending=True
             ))
+            page = None
+        else:
+            page = filter_dto.page
+            ordered = ordered.offset((filter_dto.page - 1) * filter_dto.per_page)
+
+        # Read one extra order to know whether another page follows, and the
+        # total with the requested count strategy
+        filters = {k: v for k, v in vars(filter_dto).items() if k not in ORDER_PAGING_FIELDS}
+        orders, total, total_estimated = fetch_page(
+            query, ordered, filter_dto.per_page + 1,
+            CountMode.parse(getattr(filter_dto, 'count_mode', None)),
+            cache=self._count_cache,
+            namespace=ORDER_LIST_NAMESPACE,
+            signature=filter_signature(filters),
+            # Estimated from the order table holding the same orders
+            table_name=(ArchivedOrderModel if archived else OrderModel).__tablename__,
+            unfiltered=not any(filters.values()),
+            first_page=not cursor
+        )
+        has_more = len(orders) > filter_dto.per_page
+        orders = orders[:filter_dto.per_page]
+        next_cursor = (
+            encode_cursor(ORDER_CURSOR, (orders[-1].created_at, orders[-1].id))
+            if has_more else None
+        )
+        pages = (total + filter_dto.per_page - 1) // filter_dto.per_page if total is not None else None
+
+        # Summaries already hold every name
+        result = self._summary_dtos(orders)
 
         # self._add_to_cache(cache_key, result)
         return OrderFilterResponseDTO(
             orders=result,
             pagination=OrderFilterPaginationDTO(
                 total=total,
-                page=filter_dto.page,
+                page=page,
                 pages=pages,
                 per_page=filter_dto.per_page,
+                next_cursor=next_cursor,
+                total_estimated=total_estimated,
             )
         )
 
+    def export_orders(self, filter_dto: OrderFilterDTO, fmt: str = "csv", compress: bool = False,
+                      include_items: bool = False, yield_per: int = order_export.DEFAULT_YIELD_PER) -> Iterator[bytes]:
+        """
+        Stream every order matching the filter (paging fields are ignored).
+
+        Live and archived orders are both exported, so a date range older than the
+        archive cutoff is not empty; archived=True keeps only the archived ones.
+        Orders are read on a server-side cursor and their names resolved once
+        per cursor partition, so the session must stay open until the stream is consumed.
+        """
+        orders = order_export.EXPORTED_ORDERS.c
+        conditions = self._filter_conditions(filter_dto, orders)
+        if getattr(filter_dto, 'archived', False):
+            conditions.append(orders.id.in_(select(ArchivedOrderModel.id)))
+        return order_export.export_orders(
+            self._session,
+            product_names=self._get_product_names_batch,
+            consumer_names=self._get_consumer_names_batch,
+            conditions=conditions,
+            fmt=fmt,
+            compress=compress,
+            include_items=include_items,
+            yield_per=yield_per
+        )
+
     # @lru_cache(maxsize=128)
+
     def get_user_order_stats(self, user_id: UUID) -> dict:
         """Get order statistics for a user (cached with LRU cache for better performance)"""
         stats = self._session.query(
@@ -469,6 +462,63 @@ class OrderQueryService:
             'status_counts': status_counts
         }
 
+    def get_order_status_summary(self) -> Dict[str, int]:
+        """
+        Number of orders per status, every status included.
+
+        Reads the maintained status counters when they are enabled, otherwise
+        counts the live and archived orders with one grouped query.
+        """
+        if self._status_counters:
+            query = self._session.query(OrderStatusCountModel.status, OrderStatusCountModel.order_count)
+        else:
+            orders = all_orders('id', 'status')
+            query = self._session.query(orders.c.status, func.count(orders.c.id)).group_by(orders.c.status)
+        counts = dict(query.all())
+        return {status.value: int(counts.get(status) or 0) for status in OrderStatus}
+
+    def get_daily_order_stats(self, days: int = 30, status: Optional[OrderStatus] = None) -> List[Dict[str, Any]]:
+        """
+        Order count, revenue and items per UTC day from the daily rollup.
+
+        Reads one grouped row per day instead of the orders themselves.
+
+        Args:
+            days: Number of days before today to include, today included as well
+            status: Only count orders currently in this status
+
+        Returns:
+            One entry per day, oldest first, days without orders included
+        """
+        today = datetime.now(UTC).date()
+        start_day = today - timedelta(days=days)
+        query = self._session.query(
+            OrderDailyStatsModel.day,
+            func.sum(OrderDailyStatsModel.order_count),
+            func.sum(OrderDailyStatsModel.revenue),
+            func.sum(OrderDailyStatsModel.item_count),
+            func.sum(OrderDailyStatsModel.unit_count)
+        ).filter(
+            OrderDailyStatsModel.day >= start_day,
+            OrderDailyStatsModel.day <= today
+        )
+        if status is not None:
+            query = query.filter(OrderDailyStatsModel.status == status)
+        totals = {row[0]: row[1:] for row in query.group_by(OrderDailyStatsModel.day)}
+
+        daily_stats = []
+        for offset in range(days + 1):
+            day = start_day + timedelta(days=offset)
+            order_count, revenue, item_count, unit_count = totals.get(day, (0, 0, 0, 0))
+            daily_stats.append({
+                "date": day.isoformat(),
+                "order_count": int(order_count or 0),
+                "total_revenue": float(revenue or 0),
+                "item_count": int(item_count or 0),
+                "unit_count": int(unit_count or 0)
+            })
+        return daily_stats
+
     def get_order_history(
         self,
         user_id: UUID,
@@ -481,49 +531,101 @@ class OrderQueryService:
         # if cached_result:
         #     return cached_result
             
-        orders = self._session.query(OrderModel).options(
-            joinedload(OrderModel.items)
-        ).filter(
-            OrderModel.user_id == user_id
+        orders = self._session.query(OrderSummaryModel).filter(
+            OrderSummaryModel.user_id == user_id,
+            OrderSummaryModel.archived.is_(False)
         ).order_by(
-            desc(OrderModel.created_at)
+            desc(OrderSummaryModel.created_at)
         ).limit(limit).all()
 
-        # Get user name for this specific user
-        user_name = self._get_user_name(user_id)
-        health_center_name = self._get_health_center_name(user_id)
-        
-        # Convert to DTOs with user name and health center name
-        result = []
-        for order in orders:
-            # Get all product IDs from the order items
-            product_ids = [item.product_id for item in order.items] if order.items else []
-            
-            # Fetch product names in batch for better performance
-            product_names = self._get_product_names_batch(product_ids)
-                
-            result.append(OrderSummaryDTO(
-                order_id=order.id,
-                consumer_id=order.user_id,
-                status=order.status,
-                total_amount=order.total_amount,
-                items_count=len(order.items) if order.items else 0,
-                created_at=order.created_at,
-                items=[{
-                    'id': item.id,
-                    'product_id': item.product_id,
-                    'name': product_names.get(item.product_id, f"Product {str(item.product_id).split('-')[0]}"),  # Use actual product name
-                    'quantity': item.quantity,
-                    'price': item.price,
-                    'total_price': item.quantity*item.price
-                } for item in order.items],
-                consumer_name=user_name,
-                health_center_name=health_center_name
-            ))
+        # Summaries already hold every name
+        result = self._summary_dtos(orders)
 
         # self._add_to_cache(cache_key, result)
         return result
 
+    def get_product_sales(self, limit: Optional[int] = None) -> List[Tuple[UUID, int]]:
+        """
+        Units ordered per product, best sellers first, in one grouped query on live and archived order items.
+
+        Args:
+            limit: Keep only this many products, all when None
+
+        Returns:
+            (product id, units ordered) pairs
+        """
+        items = all_order_items('product_id', 'quantity')
+        units = func.sum(items.c.quantity)
+        query = (
+            select(items.c.product_id, units)
+            .group_by(items.c.product_id)
+            .order_by(units.desc(), items.c.product_id)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return [(product_id, int(total or 0)) for product_id, total in self._session.execute(query).all()]
+
+    def get_delivery_orders(
+        self,
+        limit: Optional[int] = None,
+        by_center: bool = False,
+        health_center_id: Optional[UUID] = None,
+        status: Optional[OrderStatus] = None
+    ) -> Tuple[List[DeliveryOrderDTO], int]:
+        """
+        Orders waiting for delivery, newest first: the SHIPPED ones, or the
+        PROCESSING ones when no order is SHIPPED (or the orders in status).
+
+        One statement on the summaries, which hold the item count and the
+        health center of every order. limit caps the orders, or with by_center
+        the health centers whose orders are returned, in the order their newest
+        order comes.
+
+        Returns:
+            The orders and the number of orders waiting, whatever the limit
+        """
+        model = OrderSummaryModel
+        if status is not None:
+            waiting = model.status == status
+        else:
+            shipped = select(model.id).where(model.status == OrderStatus.SHIPPED).exists()
+            waiting = or_(
+                model.status == OrderStatus.SHIPPED,
+                and_(model.status == OrderStatus.PROCESSING, ~shipped)
+            )
+        total = select(func.count()).select_from(model).where(waiting).scalar_subquery()
+        query = select(
+            model.id, model.user_id, model.status, model.total_amount, model.items_count, model.created_at,
+            model.health_center_id, model.consumer_name, model.health_center_name, total
+        ).where(waiting)
+        if health_center_id is not None:
+            query = query.where(model.health_center_id == health_center_id)
+        if limit and by_center:
+            centers = select(model.health_center_id).where(
+                waiting, model.health_center_id.is_not(None)
+            ).group_by(model.health_center_id).order_by(desc(func.max(model.created_at))).limit(limit)
+            query = query.where(model.health_center_id.in_(centers))
+        elif limit:
+            query = query.limit(limit)
+        rows = self._session.execute(query.order_by(desc(model.created_at), desc(model.id))).all()
+
+        orders = [DeliveryOrderDTO(
+            order_id=row.id,
+            consumer_id=row.user_id,
+            status=row.status.value,
+            total_amount=row.total_amount,
+            items_count=row.items_count,
+            created_at=row.created_at,
+            health_center_id=row.health_center_id,
+            consumer_name=row.consumer_name or (self._default_user_name(row.user_id) if row.user_id else None),
+            health_center_name=row.health_center_name
+        ) for row in rows]
+        if rows:
+            return orders, rows[0][-1]
+        # Nothing returned, but orders of other centers may be waiting
+        filtered = bool(limit and by_center) or health_center_id is not None
+        return orders, self._session.execute(select(total)).scalar() if filtered else 0
+
     def _to_dto(self, model: OrderModel) -> OrderDTO:
         """Convert OrderModel to OrderDTO"""
         if not model:
@@ -531,15 +633,16 @@ class OrderQueryService:
             
         entity = self._mapper.to_entity(model)
         
-        # Get all product IDs from the order items
-        product_ids = [item.product_id for item in entity.items]
-        
-        # Fetch product names in batch for better performance
-        product_names = self._get_product_names_batch(product_ids)
-        
-        # Fetch consumer name and health center name
-        consumer_name = self._get_user_name(entity.user_id) if entity.user_id else None
-        health_center_name = self._get_health_center_name(entity.user_id) if entity.user_id else None
+        # Names come from the order's summary; orders without one are looked up through the ACL
+        summary = self._session.get(OrderSummaryModel, entity.id)
+        if summary is not None:
+            product_names = {UUID(item['product_id']): item.get('name') for item in summary.items}
+            consumer_name, health_center_name = summary.consumer_name, summary.health_center_name
+        else:
+            names = self.get_display_names([entity.user_id], [item.product_id for item in entity.items])
+            product_names = names.products
+            consumer_name, health_center_name, _ = names.consumers.get(entity.user_id, (None, None, None))
+        consumer_name = (consumer_name or self._default_user_name(entity.user_id)) if entity.user_id else None
         
         return OrderDTO(
             order_id=entity.id,
@@ -549,7 +652,7 @@ class OrderQueryService:
             items=[{
                 'id': str(item.id) if item.id else None,
                 'product_id': str(item.product_id),
-                'name': product_names.get(item.product_id, f"Product {str(item.product_id).split('-')[0]}"),  # Use actual product name
+                'name': product_names.get(item.product_id) or self._default_product_name(item.product_id),
                 'quantity': item.quantity,
                 'price': float(item.price.amount),
                 'total_price': float(item.total_price.amount)
@@ -567,35 +670,10 @@ class OrderQueryService:
         """Convert OrderModel to OrderSummaryDTO"""
         if not model:
             return None
-        
-        # Get all product IDs from the order items
-        product_ids = [item.product_id for item in model.items] if model.items else []
-        
-        # Fetch product names in batch for better performance
-        product_names = self._get_product_names_batch(product_ids)
-        
-        # Fetch consumer name and health center name
-        consumer_name = self._get_user_name(model.user_id) if model.user_id else None
-        health_center_name = self._get_health_center_name(model.user_id) if model.user_id else None
-            
-        return OrderSummaryDTO(
-            order_id=model.id,
-            consumer_id=model.user_id,
-            status=model.status,
-            total_amount=model.total_amount,
-            items_count=len(model.items) if model.items else 0,
-            created_at=model.created_at,
-            items=[{
-                'id': item.id,
-                'product_id': item.product_id,
-                'name': product_names.get(item.product_id, f"Product {str(item.product_id).split('-')[0]}"),  # Use actual product name
-                'quantity': item.quantity,
-                'price': item.price,
-                'total_price': item.quantity*item.price
-            } for item in model.items],
-            consumer_name=consumer_name,
-            health_center_name=health_center_name
-        )
+        summary = self._session.get(OrderSummaryModel, model.id)
+        if summary is not None:
+            return self._summary_dtos([summary])[0]
+        return self._to_summary_dtos([model])[0]
         
     def _get_from_cache(self, key: str) -> Any:
         """Get value from cache if it exists and is not expired"""
@@ -635,35 +713,72 @@ class OrderQueryService:
         else:
             self._cache.clear()
     
-    # def search_orders(
-    #     self,
-    #     query: str,
-    #     status: Optional[OrderStatus] = None,
-    #     page: int = 1,
-    #     per_page: int = 10
-    # ) -> List[OrderSummaryDTO]:
-    #     """Search orders by ID, user ID, or notes with pagination"""
-    #     # We don't cache search results as they're likely to change frequently
-        
-    #     db_query = self._session.query(OrderModel).options(
-    #         joinedload(OrderModel.items)
-    #     ).filter(
-    #         or_(
-    #             OrderModel.id.ilike(f"%{query}%"),
-    #             OrderModel.user_id.ilike(f"%{query}%"),
-    #             OrderModel.notes.ilike(f"%{query}%")
-    #         )
-    #     )
-
-    #     if status:
-    #         db_query = db_query.filter(OrderModel.status == status)
-
-    #     orders = db_query.order_by(desc(OrderModel.created_at))\
-    #             .offset((page - 1) * per_page)\
-    #             .limit(per_page)\
-    #             .all()
-                
-    #     return [self._to_summary_dto(order) for order in orders]
+    def search_orders(
+        self,
+        term: str,
+        status: Optional[OrderStatus] = None,
+        per_page: int = 10,
+        cursor: Optional[str] = None
+    ) -> OrderFilterResponseDTO:
+        """
+        Search orders by short id or user id prefix, or by the words of their notes.
+
+        Id prefixes are range seeks on the summaries' id and user id indexes and
+        notes go through the dialect's full-text index, so no search scans the
+        orders. Matches come newest first, paged by cursor, without a total.
+        """
+        # We don't cache search results as they're likely to change frequently
+        model = OrderSummaryModel
+        matching = self._search_matches(term)
+        if matching is None:
+            return OrderFilterResponseDTO(
+                orders=[],
+                pagination=OrderFilterPaginationDTO(total=0, page=None, pages=0, per_page=per_page)
+            )
+
+        query = select(model).where(model.id.in_(matching))
+        if status:
+            query = query.where(model.status == status)
+        if cursor:
+            query = query.where(keyset_condition(
+                (model.created_at, model.id),
+                decode_cursor(cursor, ORDER_SEARCH_CURSOR),
+                descending=True
+            ))
+        # Read one extra order to know whether another page follows
+        orders = self._session.execute(
+            query.order_by(desc(model.created_at), desc(model.id)).limit(per_page + 1)
+        ).scalars().all()
+        has_more = len(orders) > per_page
+        orders = orders[:per_page]
+        return OrderFilterResponseDTO(
+            orders=self._summary_dtos(orders),
+            pagination=OrderFilterPaginationDTO(
+                total=None,
+                page=None,
+                pages=None,
+                per_page=per_page,
+                next_cursor=(
+                    encode_cursor(ORDER_SEARCH_CURSOR, (orders[-1].created_at, orders[-1].id))
+                    if has_more else None
+                )
+            )
+        )
+
+    def _search_matches(self, term: str) -> Optional[Any]:
+        """Union of the ids of the orders matching a search term, None when nothing can match"""
+        model = OrderSummaryModel
+        selects = []
+        bounds = id_prefix_range(term)
+        if bounds:
+            selects.append(select(model.id).where(model.id.between(*bounds)))
+            selects.append(select(model.id).where(model.user_id.between(*bounds)))
+        notes = get_order_search_backend(self._session).notes_matching(term)
+        if notes is not None:
+            selects.append(notes)
+        if not selects:
+            return None
+        return union(*selects) if len(selects) > 1 else selects[0]
         
 
             
@@ -0,0 +1,252 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Column, MetaData, String, Table, event, func, literal_column, select, text, union_all
+from sqlalchemy.orm import Session
+
+from app.services.order_service.infrastructure.persistence.models.order import OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_archive import ArchivedOrderModel
+from app.shared.infrastructure.search.search_backends import SearchBackendRegistry, tokenize_search_term
+
+# Shortest hex prefix searched as an order or user id; shorter terms only match notes
+MIN_ID_PREFIX = 4
+
+_ID_PREFIX_PATTERN = re.compile(r"#?([0-9a-f-]+)")
+
+# Order tables whose notes are searchable; archived orders stay findable by notes as by id
+SEARCHED_TABLES = (OrderModel.__table__, ArchivedOrderModel.__table__)
+
+
+def id_prefix_range(term: Optional[str]) -> Optional[Tuple[UUID, UUID]]:
+    """
+    Lowest and highest UUID starting with a short id such as "3f2a9c1e" or "#3f2a-9c1e".
+
+    UUIDs order like their hex digits on both PostgreSQL and SQLite, so a prefix
+    is a range seek on the id (or user id) index. None when the term is not a
+    hex prefix of at least MIN_ID_PREFIX digits.
+    """
+    match = _ID_PREFIX_PATTERN.fullmatch((term or "").strip().lower())
+    if not match:
+        return None
+    digits = match.group(1).replace("-", "")
+    if not MIN_ID_PREFIX <= len(digits) <= 32:
+        return None
+    return UUID(digits.ljust(32, "0")), UUID(digits.ljust(32, "f"))
+
+
+class OrderSearchBackend(ABC):
+    """
+    Full-text search over order notes.
+
+    A backend owns the search structures of one database dialect and selects
+    the ids of the live and archived orders whose notes match a term. Its
+    index follows order writes and archival by itself (generated columns or
+    triggers), so repositories do not maintain it.
+    """
+    name = "base"
+
+    @abstractmethod
+    def install(self, connection, tables: Sequence[Table] = SEARCHED_TABLES) -> None:
+        """
+        Create the search structures of the given order tables if they do not exist yet.
+
+        Args:
+            connection: SQLAlchemy connection used to issue DDL
+            tables: Order tables to index (the live and archive tables by default)
+        """
+        pass
+
+    @abstractmethod
+    def _notes_matching(self, table: Table, tokens: List[str]) -> Any:
+        """Select the ids, labelled "id", of the orders of one table whose notes match every token"""
+        pass
+
+    def notes_matching(self, term: str) -> Optional[Any]:
+        """
+        Select the ids of the orders whose notes match every word of the term, as prefixes.
+
+        Live and archived orders are both searched, like the id prefixes.
+
+        Args:
+            term: Raw search term
+
+        Returns:
+            A SELECT of order ids, or None when the term has no words
+        """
+        tokens = tokenize_search_term(term)
+        if not tokens:
+            return None
+        matches = union_all(*[self._notes_matching(table, tokens) for table in SEARCHED_TABLES]).subquery()
+        return select(matches.c.id)
+
+    def rebuild(self, session: Session) -> int:
+        """
+        Rebuild the whole index from the orders and archive tables.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Number of live and archived orders with notes
+        """
+        self.install(session.connection())
+        return self._noted_orders(session)
+
+    @staticmethod
+    def _noted_orders(session: Session) -> int:
+        return sum(
+            session.execute(
+                select(func.count()).select_from(table).where(table.c.notes.is_not(None), table.c.notes != "")
+            ).scalar()
+            for table in SEARCHED_TABLES
+        )
+
+
+class LikeSearchBackend(OrderSearchBackend):
+    """Fallback backend using ILIKE on the notes of every token (no index)"""
+    name = "like"
+
+    def install(self, connection, tables: Sequence[Table] = SEARCHED_TABLES) -> None:
+        pass
+
+    def _notes_matching(self, table: Table, tokens: List[str]) -> Any:
+        return select(table.c.id.label("id")).where(*[table.c.notes.ilike(f"%{token}%") for token in tokens])
+
+
+class PostgresSearchBackend(OrderSearchBackend):
+    """
+    PostgreSQL backend using a generated tsvector column over the notes and a GIN index, on each order table.
+
+    The columns are maintained by PostgreSQL itself, and archival carries the
+    notes over to the archive table's column.
+    """
+    name = "postgresql"
+    config = "simple"
+    vector_column = "notes_vector"
+
+    def install(self, connection, tables: Sequence[Table] = SEARCHED_TABLES) -> None:
+        for table in tables:
+            connection.execute(text(
+                f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {self.vector_column} tsvector "
+                f"GENERATED ALWAYS AS (to_tsvector('{self.config}', coalesce(notes, ''))) STORED"
+            ))
+            connection.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table.name}_{self.vector_column} "
+                f"ON {table.name} USING GIN ({self.vector_column})"
+            ))
+
+    def _notes_matching(self, table: Table, tokens: List[str]) -> Any:
+        ts_query = func.to_tsquery(self.config, " & ".join(f"{token}:*" for token in tokens))
+        return select(table.c.id.label("id")).where(
+            literal_column(f"{table.name}.{self.vector_column}").op("@@")(ts_query)
+        )
+
+
+class SqliteFtsSearchBackend(OrderSearchBackend):
+    """
+    SQLite backend using, for each order table, an FTS5 table of its orders with notes kept in sync by triggers.
+
+    Orders without notes are left out of the FTS tables, so inserting,
+    archiving or deleting them does not touch them. Archival moves a noted
+    order from the live FTS table to the archive's through the same triggers.
+    """
+    name = "sqlite_fts5"
+
+    # Declared on their own metadata so db.create_all() does not try to create them
+    _fts_metadata = MetaData()
+
+    _has_notes = "{row}.notes IS NOT NULL AND {row}.notes <> ''"
+    _triggers = {
+        "insert": (
+            "AFTER INSERT ON {table} WHEN " + _has_notes.format(row="new") + " BEGIN "
+            "INSERT INTO {fts} (order_id, notes) VALUES (new.id, new.notes); END"
+        ),
+        "delete": (
+            "AFTER DELETE ON {table} WHEN " + _has_notes.format(row="old") + " BEGIN "
+            "DELETE FROM {fts} WHERE order_id = old.id; END"
+        ),
+        "update": (
+            "AFTER UPDATE OF notes ON {table} BEGIN "
+            "DELETE FROM {fts} WHERE order_id = old.id; "
+            "INSERT INTO {fts} (order_id, notes) "
+            "SELECT new.id, new.notes WHERE " + _has_notes.format(row="new") + "; END"
+        ),
+    }
+
+    @staticmethod
+    def fts_table_name(table: Table) -> str:
+        """Name of the FTS table indexing an order table, such as orders_notes_fts"""
+        return f"{table.name}_notes_fts"
+
+    @classmethod
+    def fts_table(cls, table: Table) -> Table:
+        """The FTS table indexing an order table, for use in queries"""
+        name = cls.fts_table_name(table)
+        if name not in cls._fts_metadata.tables:
+            Table(name, cls._fts_metadata, Column("order_id", String(36)), Column("notes", String))
+        return cls._fts_metadata.tables[name]
+
+    def install(self, connection, tables: Sequence[Table] = SEARCHED_TABLES) -> None:
+        for table in tables:
+            fts = self.fts_table_name(table)
+            connection.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} "
+                f"USING fts5(order_id UNINDEXED, notes, tokenize='unicode61')"
+            ))
+            for action, body in self._triggers.items():
+                connection.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {fts}_{action} " + body.format(table=table.name, fts=fts)
+                ))
+
+    def _notes_matching(self, table: Table, tokens: List[str]) -> Any:
+        fts = self.fts_table(table)
+        # Every token must match, as a prefix
+        match_expression = " ".join(f'"{token}"*' for token in tokens)
+        return select(fts.c.order_id.label("id")).where(literal_column(fts.name).op("MATCH")(match_expression))
+
+    def rebuild(self, session: Session) -> int:
+        self.install(session.connection())
+        for table in SEARCHED_TABLES:
+            fts = self.fts_table_name(table)
+            session.execute(text(f"DELETE FROM {fts}"))
+            session.execute(text(
+                f"INSERT INTO {fts} (order_id, notes) "
+                f"SELECT id, notes FROM {table.name} WHERE notes IS NOT NULL AND notes <> ''"
+            ))
+        return self._noted_orders(session)
+
+
+_backends: SearchBackendRegistry[OrderSearchBackend] = SearchBackendRegistry(
+    "order", postgresql=PostgresSearchBackend, sqlite_fts5=SqliteFtsSearchBackend, fallback=LikeSearchBackend
+)
+
+
+def get_order_search_backend(bind) -> OrderSearchBackend:
+    """
+    Get the order search backend for the database behind a session, engine or connection.
+
+    Args:
+        bind: SQLAlchemy session, engine or connection
+
+    Returns:
+        The search backend for the bind's dialect (cached per dialect)
+    """
+    return _backends.get(bind)
+
+
+def _install_search_structures(target, connection, **kw):
+    """Create the search structures of an order table whenever it is created"""
+    get_order_search_backend(connection).install(connection, [target])
+
+
+def _drop_search_structures(target, connection, **kw):
+    """Drop an order table's SQLite FTS table together with it (its triggers go with the table)"""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {SqliteFtsSearchBackend.fts_table_name(target)}"))
+
+
+for _table in SEARCHED_TABLES:
+    event.listen(_table, "after_create", _install_search_structures)
+    event.listen(_table, "before_drop", _drop_search_structures)
@@ -4,24 +4,42 @@ from sqlalchemy.orm import Session
 
 from app.services.order_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.services.order_service.infrastructure.adapters.order_adpter_service import OrderAdapterService
+from app.services.order_service.infrastructure.persistence.repositories.order_archive_repository import OrderArchiveRepository
 from app.services.order_service.infrastructure.persistence.repositories.order_repository import SQLAlchemyOrderRepository
+from app.services.order_service.infrastructure.persistence.repositories.order_summary_repository import OrderSummaryRepository
 from app.shared.acl.unified_acl import UnifiedACL
 from app.shared.application.events.event_bus import EventBus
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
-    def __init__(self, session: Session, event_bus: EventBus = None, order_adapter_service: OrderAdapterService = None):
+    def __init__(self, session: Session, event_bus: EventBus = None, order_adapter_service: OrderAdapterService = None,
+                 status_counters: bool = False):
         self.db_session = session
         self.event_bus = event_bus
         self.order_adapter_service = order_adapter_service
+        self.status_counters = status_counters
         self._order_repository = None
+        self._order_archive_repository = None
+        self._order_summary_repository = None
         self._batch = None
         
     @property
     def order_repository(self):
         if self._order_repository is None:
-            self._order_repository = SQLAlchemyOrderRepository(self.db_session)
+            self._order_repository = SQLAlchemyOrderRepository(self.db_session, self.status_counters)
         return self._order_repository
 
+    @property
+    def order_archive_repository(self):
+        if self._order_archive_repository is None:
+            self._order_archive_repository = OrderArchiveRepository(self.db_session)
+        return self._order_archive_repository
+
+    @property
+    def order_summary_repository(self):
+        if self._order_summary_repository is None:
+            self._order_summary_repository = OrderSummaryRepository(self.db_session)
+        return self._order_summary_repository
+
     def commit(self):
         self.db_session.commit()
 
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import List, Optional, Tuple, Dict, Any
+from datetime import UTC, datetime, timedelta
+from typing import List, Optional, Tuple, Dict, Any, Iterator
 from uuid import UUID
 import logging
 
@@ -10,6 +10,7 @@ from app.services.order_service.application.commands.cancel_order_command import
 from app.services.order_service.application.commands.create_order_command import CreateOrderCommand
 from app.services.order_service.application.commands.update_order_command import UpdateOrderCommand
 from app.services.order_service.application.commands.bulk_update_order_command import BulkUpdateOrderCommand
+from app.services.order_service.application.commands.batch_create_order_command import BatchCreateOrderCommand
 from app.services.order_service.application.dtos.order_dto import (
     CreateOrderResponse,
     OrderDTO,
@@ -19,6 +20,7 @@ from app.services.order_service.application.dtos.order_dto import (
     OrderFilterResponseDTO
 )
 from app.services.order_service.application.dtos.bulk_update_dto import BulkUpdateOrderResponse
+from app.services.order_service.application.dtos.batch_create_dto import BatchCreateOrderResponse
 from app.services.order_service.application.event_handlers.order_event_handlers import OrderEventHandler
 from app.services.order_service.application.events.order_updated_event import OrderUpdatedEvent
 from app.services.order_service.application.events.stock_release_processed_event import StockReleaseProcessedEvent
@@ -27,6 +29,7 @@ from app.services.order_service.application.use_cases.cancel_order import Cancel
 from app.services.order_service.application.use_cases.create_order import CreateOrderUseCase
 from app.services.order_service.application.use_cases.update_order import UpdateOrderUseCase
 from app.services.order_service.application.use_cases.bulk_update_order import BulkUpdateOrderUseCase
+from app.services.order_service.application.use_cases.batch_create_order import BatchCreateOrderUseCase
 from app.services.order_service.domain.exceptions.order_errors import (
     InvalidOrderStatusTransition,
     OrderNotFoundError,
@@ -35,33 +38,49 @@ from app.services.order_service.domain.exceptions.order_errors import (
     OrderCancellationError
 )
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.cache.consumer_name_cache import ConsumerNameCache
+from app.services.order_service.infrastructure.export.order_export import DEFAULT_YIELD_PER, EXPORT_FORMATS
 from app.services.order_service.infrastructure.persistence.mappers.order_mapper import OrderMapper
+from app.services.order_service.infrastructure.projections.order_summary_projection import OrderSummaryProjection
 from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
 from app.services.order_service.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 from app.services.order_service.infrastructure.adapters.order_adpter_service import OrderAdapterService
 from app.shared.acl.unified_acl import UnifiedACL
 from app.shared.application.events.event_bus import EventBus
+from app.shared.contracts.order.order_events import OrdersArchivedEvent
+from app.shared.infrastructure.persistence.list_counts import ListCountCache
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 class OrderService:
-    def __init__(self, db: Database, event_bus: EventBus, acl: UnifiedACL):
+    def __init__(self, db: Database, event_bus: EventBus, acl: UnifiedACL,
+                 count_cache: Optional[ListCountCache] = None, status_counters: bool = False,
+                 name_cache: Optional[ConsumerNameCache] = None,
+                 summary_projection: Optional[OrderSummaryProjection] = None):
         self._db_session = db.get_session()
         self._acl = acl
         self._event_bus = event_bus
+        self._count_cache = count_cache
+        self._status_counters = status_counters
+        self._name_cache = name_cache
+        # Without the container's projection, summaries can be backfilled but do not follow renames
+        self._summary_projection = summary_projection or OrderSummaryProjection(db)
         self._init_resources()
         self._register_event_handlers()
         logger.info("Order service initialized")
 
     def _init_resources(self):
         self._order_adapter_service = OrderAdapterService(self._acl)
-        self._uow = SQLAlchemyUnitOfWork(self._db_session, self._event_bus, self._order_adapter_service)
-        self._query_service = OrderQueryService(self._db_session, self._acl)
+        self._uow = SQLAlchemyUnitOfWork(self._db_session, self._event_bus, self._order_adapter_service,
+                                         self._status_counters)
+        self._query_service = OrderQueryService(self._db_session, self._acl, self._count_cache,
+                                                self._status_counters, self._name_cache)
         self._create_order_use_case = CreateOrderUseCase(self._uow, self._query_service)
         self._update_order_use_case = UpdateOrderUseCase(self._uow, self._query_service)
         self._cancel_order_use_case = CancelOrderUseCase(self._uow, self._query_service)
         self._bulk_update_order_use_case = BulkUpdateOrderUseCase(self._uow, self._query_service)
+        self._batch_create_order_use_case = BatchCreateOrderUseCase(self._uow, self._query_service)
         self._mapper = OrderMapper()
         self._event_handler = OrderEventHandler(self._uow)
         
@@ -97,28 +116,13 @@ class OrderService:
             self._uow.rollback()
             raise OrderCreationError(message=f"Failed to create order: {str(e)}", status_code=500)
     
-    def create_batch_orders(self, commands: List[CreateOrderCommand]) -> List[Dict]:
-        """Create multiple orders in a batch operation"""
-        logger.info(f"Creating batch of {len(commands)} orders")
-        results = []
-        
-        for command in commands:
-            try:
-                result = self.create_order(command)
-                results.append({
-                    "status": "success", 
-                    "order_id": str(result.order.order_id),
-                    "message": f"Order created successfully"
-                })
-            except Exception as e:
-                logger.error(f"Failed to create order in batch: {str(e)}")
-                results.append({
-                    "status": "error", 
-                    "user_id": str(command.user_id) if command.user_id else None,
-                    "error": str(e)
-                })
-                
-        return results
+    def create_batch_orders(self, command: BatchCreateOrderCommand) -> BatchCreateOrderResponse:
+        """Create multiple orders in one transaction, with one result per order"""
+        logger.info(f"Creating batch of {len(command.orders)} orders")
+        response = self._batch_create_order_use_case.execute(command)
+        if response.total_failed > 0:
+            logger.warning(f"Batch order creation errors: {response.get_errors_summary()}")
+        return response
     
     def update_order_status(self, command: UpdateOrderCommand) :
         """Update order status"""
@@ -206,6 +210,10 @@ class OrderService:
             self._uow.rollback()
             raise OrderValidationError(f"Failed to cancel order: {str(e)}")
     # @lru_cache(maxsize=100)  # Cache frequently accessed orders
+    def get_order_updated_at(self, order_id: UUID) -> Optional[datetime]:
+        """Last update time of an order without loading it, None if it does not exist"""
+        return self._query_service.get_order_updated_at(order_id)
+
     def get_order(self, order_id: UUID) -> Optional[dict]:
         """Get order by ID"""
         try:
@@ -287,102 +295,44 @@ class OrderService:
     def get_order_status_summary(self) -> Dict[str, int]:
         """Get a summary count of orders by status"""
         try:
-            result = {}
-            for status in OrderStatus:
-                filter_dto = OrderFilterDTO(status=status.value)
-                response = self._query_service.get_orders_by_filter(filter_dto)
-                result[status.value] = response.pagination.total
-            return result
+            return self._query_service.get_order_status_summary()
         except Exception as e:
             logger.error(f"Error getting order status summary: {str(e)}")
             raise e
             
-    def get_daily_order_stats(self, days: int = 30) -> List[Dict]:
-        """Get daily order statistics for the last N days"""
+    def get_daily_order_stats(self, days: int = 30, status: Optional[OrderStatus] = None) -> List[Dict]:
+        """Get daily order statistics for the last N days from the daily rollup"""
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            
-            daily_stats = []
-            current_date = start_date
-            
-            while current_date <= end_date:
-                next_date = current_date + timedelta(days=1)
-                
-                # Create filter for this day
-                filter_dto = OrderFilterDTO(
-                    start_date=current_date,
-                    end_date=next_date,
-                    page=1,
-                    per_page=1000
-                )
-                
-                # Get orders for this day
-                response = self._query_service.get_orders_by_filter(filter_dto)
-                orders = response.orders
-                total = response.pagination.total
-                
-                # Calculate total revenue
-                total_revenue = sum(order.total_amount for order in orders) if orders else 0
-                
-                # Add stats for this day
-                daily_stats.append({
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "order_count": total,
-                    "total_revenue": float(total_revenue)
-                })
-                
-                # Move to next day
-                current_date = next_date
-                
-            return daily_stats
+            return self._query_service.get_daily_order_stats(days, status)
         except Exception as e:
             logger.error(f"Error generating daily order stats: {str(e)}")
             raise e
-    
-    def export_orders(self, filter_dto: OrderFilterDTO, format: str = "json") -> Dict:
-        """Export orders based on filter criteria"""
-        try:
-            response = self._query_service.get_orders_by_filter(filter_dto)
-            orders = response.orders
-            total = response.pagination.total
-            
-            if format.lower() == "csv":
-                # Prepare CSV format
-                result = {
-                    "format": "csv",
-                    "total_records": total,
-                    "headers": ["Order ID", "User ID", "Status", "Total Amount", "Items Count", "Created At"],
-                    "data": [
-                        [
-                            str(order.order_id),
-                            str(order.consumer_id),
-                            order.status,
-                            str(order.total_amount),
-                            str(order.items_count),
-                            order.created_at.isoformat()
-                        ] for order in orders
-                    ]
-                }
-            else:
-                # Default JSON format
-                result = {
-                    "format": "json",
-                    "total_records": total,
-                    "data": [{
-                        'id': str(order.order_id),
-                        'user_id': str(order.consumer_id),
-                        'status': order.status,
-                        'total_amount': float(order.total_amount),
-                        'items_count': order.items_count,
-                        'created_at': order.created_at.isoformat()
-                    } for order in orders]
-                }
-                
-            return result
-        except Exception as e:
-            logger.error(f"Error exporting orders: {str(e)}")
-            raise e
+
+    def export_orders(self, filter_dto: OrderFilterDTO, fmt: str = "csv", compress: bool = False,
+                      include_items: bool = False, yield_per: int = DEFAULT_YIELD_PER) -> Iterator[bytes]:
+        """
+        Stream every order matching the filter, not just one page.
+
+        Orders come from a server-side cursor and are enriched (names, line items)
+        one cursor partition at a time, so memory stays flat whatever the range.
+        The session must stay open until the stream is consumed.
+
+        Args:
+            filter_dto: Order filter; paging fields are ignored
+            fmt: "csv" or "ndjson"
+            compress: Gzip the stream
+            include_items: Add line items (nested in NDJSON, one CSV row per item)
+            yield_per: Orders fetched from the cursor at a time
+
+        Returns:
+            Iterator of encoded blocks
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise OrderValidationError(f"Unsupported export format: {fmt}")
+        logger.info(f"Exporting orders as {fmt}{' (gzip)' if compress else ''}")
+        return self._query_service.export_orders(
+            filter_dto, fmt=fmt, compress=compress, include_items=include_items, yield_per=yield_per
+        )
             
     def duplicate_order(self, order_id: UUID, user_id: UUID = None) -> CreateOrderResponse:
         """Create a duplicate of an existing order"""
@@ -416,50 +366,75 @@ class OrderService:
                 raise e
             raise OrderCreationError(message=f"Failed to duplicate order: {str(e)}")
     
-    def archive_orders(self, days: int = 90) -> int:
-        """Archive orders older than specified days"""
+    def backfill_order_summaries(self, batch_size: int = 1000) -> int:
+        """
+        Write the order_summaries rows missing for live and archived orders.
+
+        Orders placed before the read model existed have no summary and do not
+        show in listings until this has run; every worker runs it on start-up.
+        Names are resolved once per batch. A batch that another worker wrote
+        first fails on its primary keys and is rolled back.
+
+        Returns:
+            Number of summaries written
+        """
+        logger.info("Backfilling order summaries")
+        written = self._summary_projection.backfill(self._query_service.get_display_names, batch_size)
+        logger.info(f"Backfilled {written} order summaries")
+        return written
+
+    def archive_orders(self, days: int = 90, batch_size: int = 1000, max_batches: Optional[int] = None) -> int:
+        """
+        Move finished orders older than the given number of days to the archive tables.
+
+        Works in batches of batch_size orders, each moved with a handful of set-based
+        statements and committed on its own, so locks and transactions stay short.
+        Archived orders are still returned by get_order and by listings with archived=True.
+
+        Args:
+            days: Age in days past which completed, cancelled and failed orders are archived
+            batch_size: Orders moved per transaction
+            max_batches: Stop after this many batches (all remaining orders when omitted)
+
+        Returns:
+            Number of orders archived
+        """
+        cutoff = datetime.now(UTC) - timedelta(days=days)
+        archived_count = 0
+        batches = 0
         try:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            
-            # Get orders older than cutoff date
-            filter_dto = OrderFilterDTO(
-                end_date=cutoff_date,
-                per_page=1000  # Process in chunks
-            )
-            
-            response = self._query_service.get_orders_by_filter(filter_dto)
-            orders = response.orders
-            archived_count = 0
-            
-            # For each order, mark as archived
-            for order in orders:
-                try:
-                    # In a real implementation, you would move these to an archive table
-                    # or set an "archived" flag. This is just an example.
-                    command = UpdateOrderCommand(
-                        id=order.order_id,
-                        status=OrderStatus.ARCHIVED if hasattr(OrderStatus, "ARCHIVED") else OrderStatus.COMPLETED,
-                        notes=f"Archived automatically on {datetime.now().isoformat()}"
-                    )
-                    self.update_order_status(command)
-                    archived_count += 1
-                except Exception as e:
-                    logger.error(f"Error archiving order {order.order_id}: {str(e)}")
-                    continue
-                    
-            logger.info(f"Archived {archived_count} orders older than {days} days")
-            return archived_count
+            while max_batches is None or batches < max_batches:
+                moved = self._uow.order_archive_repository.archive_batch(cutoff, batch_size)
+                if not moved:
+                    break
+                self._uow.commit()
+                self._uow.publish(OrdersArchivedEvent(
+                    count=moved,
+                    cutoff=cutoff.isoformat(),
+                    timestamp=datetime.now(UTC).isoformat()
+                ))
+                archived_count += moved
+                batches += 1
+                if moved < batch_size:
+                    break
         except Exception as e:
+            self._uow.rollback()
             logger.error(f"Error archiving old orders: {str(e)}")
             raise e
-    # def search_orders(self, query: str, status: Optional[str] = None, page: int = 1, per_page: int = 10) -> List[OrderSummaryDTO]:
-    #     """Search orders with pagination"""
-    #     try:
-    #         order_status = OrderStatus(status) if status else None
-    #         return self._query_service.search_orders(query, order_status, page, per_page)
-    #     except Exception as e:
-    #         logger.error(f"Error searching orders: {str(e)}")
-    #         raise e
+
+        logger.info(f"Archived {archived_count} orders older than {days} days in {batches} batches")
+        return archived_count
+
+    def search_orders(self, query: str, status: Optional[str] = None, per_page: int = 10,
+                      cursor: Optional[str] = None) -> OrderFilterResponseDTO:
+        """Search orders by short id or user id prefix, or by notes, newest first and paged by cursor"""
+        try:
+            order_status = OrderStatus(status) if status else None
+            return self._query_service.search_orders(query, order_status, per_page, cursor)
+        except Exception as e:
+            logger.error(f"Error searching orders: {str(e)}")
+            raise e
+
     # def health_check(self) -> Dict[str, Any]:
     #     """Check the health of the order service and its dependencies"""
     #     health = {
@@ -499,54 +474,26 @@ class OrderService:
         This method is called by the delivery service via ACL.
         
         Args:
-            request: Optional request parameters (not used currently)
+            request: Optional request parameters: limit caps the orders returned
             
         Returns:
             Dictionary containing processing orders information
         """
         logger.info("Getting orders with PROCESSING status for delivery service")
+        request = request or {}
         
         try:
-            from app.services.order_service.application.dtos.order_dto import OrderFilterDTO
-            from app.services.order_service.domain.value_objects.order_status import OrderStatus
-            
-            # Create filter for PROCESSING orders
-            filter_dto = OrderFilterDTO(
-                status="PROCESSING",
-                page=1,
-                per_page=100  # Get all processing orders
+            orders, total = self._query_service.get_delivery_orders(
+                limit=request.get('limit'), status=OrderStatus.PROCESSING
             )
-            
-            # Get orders using existing method
-            result = self.get_orders(filter_dto)
-            
-            # Transform the response for delivery service
-            processing_orders = []
-            for order_summary in result.orders:  # result is OrderFilterResponseDTO with orders attribute
-                # Get full order details
-                order_details = self.get_order(order_summary.order_id)
-                if order_details and order_details.get('status') == 'PROCESSING':
-                    # Calculate items count from order details
-                    items_count = len(order_details.get('items', []))
-                    
-                    processing_orders.append({
-                        'id': str(order_summary.order_id),
-                        'user_id': str(order_summary.consumer_id),
-                        'consumer_name': order_summary.consumer_name,  # Added consumer name
-                        'health_center_name': order_summary.health_center_name,  # Added health center name
-                        'status': order_summary.status,
-                        'total_amount': float(order_summary.total_amount),
-                        'items': order_details.get('items', []),
-                        'notes': getattr(order_summary, 'notes', None),
-                        'created_at': order_summary.created_at
-                    })
+            processing_orders = [self._delivery_payload(order) for order in orders]
             
             response = {
                 'orders': processing_orders,
-                'total_count': len(processing_orders)
+                'total_count': total
             }
             
-            logger.info(f"Found {len(processing_orders)} orders with PROCESSING status")
+            logger.info(f"Found {total} orders with PROCESSING status")
             return response
             
         except Exception as e:
@@ -562,77 +509,40 @@ class OrderService:
         Get orders prioritized for delivery: SHIPPED orders first, then PROCESSING orders if no SHIPPED orders exist.
         This method is called by the delivery service via ACL.
         
+        Orders come from one query with their item count and health care center,
+        so delivery can look the centers up in one call.
+        
         Args:
-            request: Request parameters (optional)
+            request: Optional request parameters: limit caps the orders returned, or
+                with group_by_location the health care centers they go to, and
+                health_care_center_id keeps the orders of one center
             
         Returns:
             Dictionary containing prioritized orders for delivery
         """
         logger.info("Getting prioritized orders for delivery service (SHIPPED first, then PROCESSING)")
+        request = request or {}
         
         try:
-            from app.services.order_service.application.dtos.order_dto import OrderFilterDTO
-            from app.services.order_service.domain.value_objects.order_status import OrderStatus
-            
-            prioritized_orders = []
-            
-            # First, try to get SHIPPED orders
-            shipped_filter = OrderFilterDTO(
-                status="SHIPPED",
-                page=1,
-                per_page=100
+            center_id = request.get('health_care_center_id')
+            orders, total = self._query_service.get_delivery_orders(
+                limit=request.get('limit'),
+                by_center=bool(request.get('group_by_location')),
+                health_center_id=UUID(str(center_id)) if center_id else None
             )
-            
-            shipped_result = self.get_orders(shipped_filter)
-            
-            if shipped_result.orders:
-                # We have SHIPPED orders, use them
-                logger.info(f"Found {len(shipped_result.orders)} SHIPPED orders")
-                for order_summary in shipped_result.orders:
-                    order_details = self.get_order(order_summary.order_id)
-                    if order_details and order_details.get('status') == 'SHIPPED':
-                        prioritized_orders.append({
-                            'id': str(order_summary.order_id),
-                            'user_id': str(order_summary.consumer_id),
-                            'status': order_summary.status,
-                            'total_amount': float(order_summary.total_amount),
-                            'items': order_details.get('items', []),
-                            'notes': getattr(order_summary, 'notes', None),
-                            'created_at': order_summary.created_at,
-                            'priority': 'HIGH'  # Mark SHIPPED orders as high priority
-                        })
-            else:
-                # No SHIPPED orders, get PROCESSING orders
-                logger.info("No SHIPPED orders found, getting PROCESSING orders")
-                processing_filter = OrderFilterDTO(
-                    status="PROCESSING",
-                    page=1,
-                    per_page=100
-                )
-                
-                processing_result = self.get_orders(processing_filter)
-                
-                for order_summary in processing_result.orders:
-                    order_details = self.get_order(order_summary.order_id)
-                    if order_details and order_details.get('status') == 'PROCESSING':
-                        prioritized_orders.append({
-                            'id': str(order_summary.order_id),
-                            'user_id': str(order_summary.consumer_id),
-                            'status': order_summary.status,
-                            'total_amount': float(order_summary.total_amount),
-                            'items': order_details.get('items', []),
-                            'notes': getattr(order_summary, 'notes', None),
-                            'created_at': order_summary.created_at,
-                            'priority': 'NORMAL'  # Mark PROCESSING orders as normal priority
-                        })
+            # Mark SHIPPED orders as high priority
+            prioritized_orders = [
+                self._delivery_payload(order, priority='HIGH' if order.status == OrderStatus.SHIPPED.value else 'NORMAL')
+                for order in orders
+            ]
             
             response = {
                 'orders': prioritized_orders,
-                'total_count': len(prioritized_orders),
+                'total_count': total,
                 'priority_logic': 'SHIPPED_FIRST_THEN_PROCESSING'
             }
             
-            logger.info(f"Returning {len(prioritized_orders)} prioritized orders for delivery")
+            logger.info(f"Returning {len(prioritized_orders)} of {total} prioritized orders for delivery")
             return response
             
         except Exception as e:
@@ -643,4 +553,38 @@ class OrderService:
                 'error': str(e),
                 'priority_logic': 'SHIPPED_FIRST_THEN_PROCESSING'
             }
+
+    def get_product_sales(self, request: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Get the units ordered per product, best sellers first.
+        This method is called by the product service via ACL.
+        
+        Args:
+            request: Optional request parameters: limit keeps the best selling products only
+            
+        Returns:
+            Dictionary containing the products as {product_id, units} entries
+        """
+        request = request or {}
+        sales = self._query_service.get_product_sales(limit=request.get('limit'))
+        return {
+            'products': [{'product_id': str(product_id), 'units': units} for product_id, units in sales]
+        }
+
+    @staticmethod
+    def _delivery_payload(order, priority: Optional[str] = None) -> Dict[str, Any]:
+        payload = {
+            'id': str(order.order_id),
+            'user_id': str(order.consumer_id),
+            'consumer_name': order.consumer_name,
+            'health_care_center_id': str(order.health_center_id) if order.health_center_id else None,
+            'health_center_name': order.health_center_name,
+            'status': order.status,
+            'total_amount': float(order.total_amount),
+            'items_count': order.items_count,
+            'created_at': order.created_at
+        }
+        if priority:
+            payload['priority'] = priority
+        return payload
      
@@ -0,0 +1,80 @@
+"""
+Fixtures shared by the order service integration tests.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.auth_service.infrastructure.persistence.models.health_care_center_model import HealthCareCenterModel
+from app.services.auth_service.infrastructure.persistence.models.user_model import UserModel
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.shared.domain.enums.enums import ServiceType
+
+
+@pytest.fixture
+def order_query_service(db_session, acl, product_service, auth_service):
+    """Order query service resolving names through the ACL, like the container wires it"""
+    acl.register_service(ServiceType.PRODUCT, lambda: product_service)
+    acl.register_service(ServiceType.AUTH, lambda: auth_service)
+    return OrderQueryService(db_session, acl)
+
+
+@pytest.fixture
+def add_center_users(db_session):
+    """Add health care centers "Center NN" with one user "<label> NN" each, and return the users"""
+    def add(count, label):
+        users = []
+        for i in range(count):
+            center = HealthCareCenterModel(
+                id=uuid4(), name=f"Center {i:02d}", address="Street", phone=f"+2000000{i:02d}",
+                email=f"center{i}@example.com", latitude=10.0 + i, longitude=20.0 + i, is_active=True
+            )
+            user = UserModel(
+                id=uuid4(), username=f"{label.lower()}{i}", email=f"{label.lower()}{i}@example.com",
+                password="hashed", full_name=f"{label} {i:02d}", phone=f"+1000000{i:02d}", is_admin=False,
+                is_active=True, health_care_center_id=center.id
+            )
+            db_session.add_all([center, user])
+            users.append(user)
+        db_session.commit()
+        return users
+    return add
+
+
+@pytest.fixture
+def seed_orders(db_session, add_center_users):
+    """
+    Add one order per new user and center, each with its own "Product NN-j" lines.
+
+    Line j has quantity j + 1 at 10.00. Orders come oldest first by index, or
+    newest first with newest_first; status_of maps an index to its status.
+    """
+    def seed(count=12, items_per_order=2, label="Orderer", newest_first=False, status_of=None):
+        now = datetime.now(timezone.utc)
+        created = []
+        for i, user in enumerate(add_center_users(count, label)):
+            products = [
+                ProductModel(id=uuid4(), name=f"Product {i:02d}-{j}", description="Description", brand="Brand")
+                for j in range(items_per_order)
+            ]
+            created_at = now - timedelta(minutes=i if newest_first else count - i)
+            order = OrderModel(
+                id=uuid4(), user_id=user.id, total_amount=Decimal("30.00"),
+                status=status_of(i) if status_of else OrderStatus.PENDING,
+                created_at=created_at, updated_at=created_at,
+                items=[
+                    OrderItemModel(id=uuid4(), product_id=product.id, quantity=j + 1, price=Decimal("10.00"),
+                                   created_at=created_at, updated_at=created_at)
+                    for j, product in enumerate(products)
+                ]
+            )
+            db_session.add_all([*products, order])
+            created.append(order)
+        db_session.commit()
+        return created
+    return seed
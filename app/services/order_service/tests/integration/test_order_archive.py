@@ -0,0 +1,146 @@
+"""
+Integration tests for the batched order archival and reads of archived orders.
+"""
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.order_service.application.dtos.order_dto import OrderFilterDTO
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_archive import (
+    ArchivedOrderItemModel,
+    ArchivedOrderModel
+)
+from app.services.order_service.infrastructure.persistence.models.order_daily_stats import OrderDailyStatsModel
+from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+from app.services.order_service.infrastructure.persistence.repositories.order_daily_stats_repository import (
+    OrderDailyStatsRepository
+)
+from app.services.order_service.infrastructure.projections.order_summary_projection import OrderSummaryProjection
+from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.services.order_service.service import OrderService
+from app.shared.contracts.order.order_events import OrdersArchivedEvent
+
+
+@pytest.fixture
+def order_service(app, database, event_bus, acl):
+    return OrderService(database, event_bus, acl)
+
+
+@pytest.fixture
+def orders(db_session, database):
+    """IDs of old finished orders, an old pending one and a recent completed one"""
+    now = datetime.now(timezone.utc)
+    created = {}
+
+    def add(key, age_days, status):
+        created_at = now - timedelta(days=age_days)
+        order = OrderModel(
+            id=uuid4(), user_id=uuid4(), status=status, total_amount=Decimal("12.00"),
+            created_at=created_at, updated_at=created_at,
+            items=[OrderItemModel(id=uuid4(), product_id=uuid4(), quantity=3, price=Decimal("4.00"),
+                                  created_at=created_at, updated_at=created_at)]
+        )
+        db_session.add(order)
+        created[key] = order.id
+
+    for i in range(5):
+        add(f"old_{i}", 200 + i, OrderStatus.COMPLETED if i % 2 else OrderStatus.CANCELLED)
+    add("old_pending", 150, OrderStatus.PENDING)
+    add("recent", 10, OrderStatus.COMPLETED)
+    db_session.commit()
+    OrderDailyStatsRepository(db_session).rebuild()
+    db_session.commit()
+    OrderSummaryProjection(database).backfill(OrderQueryService(db_session).get_display_names)
+    return created
+
+
+def test_finished_old_orders_move_in_batches(db_session, order_service, event_bus, orders):
+    published = []
+    event_bus.subscribe(OrdersArchivedEvent, published.append)
+
+    assert order_service.archive_orders(days=90, batch_size=2) == 5
+
+    assert [event.count for event in published] == [2, 2, 1]
+    live = {order.id for order in db_session.query(OrderModel).all()}
+    assert live == {orders["old_pending"], orders["recent"]}
+    assert db_session.query(ArchivedOrderModel).count() == 5
+    assert db_session.query(ArchivedOrderItemModel).count() == 5
+    assert db_session.query(OrderItemModel).count() == 2
+    assert db_session.query(OrderSummaryModel).filter(OrderSummaryModel.archived.is_(True)).count() == 5
+    assert order_service.archive_orders(days=90) == 0
+
+
+def test_max_batches_bounds_a_run(order_service, orders):
+    assert order_service.archive_orders(days=90, batch_size=2, max_batches=1) == 2
+    assert order_service.archive_orders(days=90, batch_size=2) == 3
+
+
+def test_archived_orders_stay_readable(db_session, order_service, orders):
+    order_service.archive_orders(days=90)
+    query_service = order_service._query_service
+
+    archived = query_service.get_order_by_id(orders["old_1"])
+    assert isinstance(archived, ArchivedOrderModel)
+    assert [item.quantity for item in archived.items] == [3]
+    assert query_service.get_order_updated_at(orders["old_1"]) is not None
+
+    live_page = query_service.get_orders_by_filter(OrderFilterDTO(per_page=10))
+    archived_page = query_service.get_orders_by_filter(OrderFilterDTO(per_page=10, archived=True))
+    cancelled = query_service.get_orders_by_filter(
+        OrderFilterDTO(per_page=10, archived=True, status=OrderStatus.CANCELLED.value)
+    )
+    assert live_page.pagination.total == 2
+    assert archived_page.pagination.total == 5
+    assert [summary.items_count for summary in archived_page.orders] == [1] * 5
+    assert cancelled.pagination.total == 3
+
+
+
+def test_exports_cover_archived_orders(order_service, orders):
+    """A range older than the archive cutoff still exports, with its line items"""
+    order_service.archive_orders(days=90)
+    query_service = order_service._query_service
+    now = datetime.now(timezone.utc)
+
+    def exported(filter_dto):
+        body = b"".join(query_service.export_orders(filter_dto, include_items=True)).decode("utf-8")
+        return list(csv.DictReader(io.StringIO(body)))
+
+    old_range = exported(OrderFilterDTO(start_date=now - timedelta(days=365), end_date=now - timedelta(days=180)))
+    assert [row["id"] for row in old_range] == [str(orders[f"old_{i}"]) for i in reversed(range(5))]
+    assert {row["quantity"] for row in old_range} == {"3"}
+    assert len(exported(OrderFilterDTO())) == 7
+    assert len(exported(OrderFilterDTO(archived=True))) == 5
+
+
+def test_product_sales_count_archived_orders(order_service, orders):
+    order_service.archive_orders(days=90)
+
+    sales = order_service._query_service.get_product_sales()
+    assert len(sales) == 7
+    assert {units for _, units in sales} == {3}
+
+def test_stats_keep_counting_archived_orders(db_session, order_service, orders):
+    def rollup():
+        return {
+            (row.day, row.status): (row.order_count, Decimal(row.revenue), row.item_count, row.unit_count)
+            for row in db_session.query(OrderDailyStatsModel).all() if row.order_count
+        }
+
+    before = rollup()
+    summary = order_service.get_order_status_summary()
+    order_service.archive_orders(days=90)
+
+    assert rollup() == before
+    OrderDailyStatsRepository(db_session).rebuild()
+    db_session.commit()
+    assert rollup() == before
+    assert order_service.get_order_status_summary() == summary == {
+        "PENDING": 1, "PROCESSING": 0, "SHIPPED": 0, "COMPLETED": 3, "CANCELLED": 3, "FAILED": 0
+    }
@@ -0,0 +1,102 @@
+"""
+Integration tests for set-based batch order creation.
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.order_service.application.commands import BatchCreateOrderCommand, CreateOrderCommand
+from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_daily_stats import OrderDailyStatsModel
+from app.services.order_service.service import OrderService
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.shared.domain.enums.enums import ServiceType
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def order_service(app, database, event_bus, acl, inventory_service):
+    acl.register_service(ServiceType.INVENTORY, lambda: inventory_service)
+    return OrderService(database, event_bus, acl)
+
+
+@pytest.fixture
+def stock(db_session):
+    """Products a to e with 10 units each"""
+    expiry = datetime.combine(date.today(), time.min, timezone.utc) + timedelta(days=365)
+    product_ids = {}
+    for key in "abcde":
+        product_id = uuid4()
+        db_session.add(ProductModel(id=product_id, name=f"Product {key}", description="Test"))
+        db_session.add(InventoryModel(
+            id=uuid4(), product_id=product_id, quantity=10, price=5.0, max_stock=100, min_stock=1,
+            expiry_date=expiry
+        ))
+        product_ids[key] = product_id
+    db_session.commit()
+    return product_ids
+
+
+def _batch(stock, carts, all_or_nothing=True):
+    user_id = uuid4()
+    return BatchCreateOrderCommand(all_or_nothing=all_or_nothing, orders=[
+        CreateOrderCommand(user_id=user_id, items=[
+            CreateOrderItemDTO(product_id=stock[key], quantity=quantity, price=Decimal("5.00"))
+            for key, quantity in cart
+        ]) for cart in carts
+    ])
+
+
+def _quantities(db_session, stock):
+    db_session.expire_all()
+    rows = dict(db_session.query(InventoryModel.product_id, InventoryModel.quantity).all())
+    return {key: rows[product_id] for key, product_id in stock.items()}
+
+
+def test_batch_is_created_in_constant_statements(db_session, order_service, stock):
+    with count_queries() as small:
+        small_batch = order_service.create_batch_orders(_batch(stock, [[("a", 1)], [("b", 1)]]))
+    with count_queries() as large:
+        large_batch = order_service.create_batch_orders(
+            _batch(stock, [[(key, 1), ("e", 1)] for key in "abcd"] * 2 + [[("e", 1)]] * 2)
+        )
+
+    assert small_batch.total_successful == 2
+    assert large_batch.total_successful == 10
+    assert len(small) == len(large)
+    assert _quantities(db_session, stock) == {"a": 7, "b": 7, "c": 8, "d": 8, "e": 0}
+    assert db_session.query(OrderModel).count() == 12
+    assert db_session.query(OrderItemModel).count() == 20
+    assert db_session.query(OrderDailyStatsModel.order_count).scalar() == 12
+    assert [result.order_id for result in large_batch.results] == large_batch.get_created_orders()
+
+
+def test_all_or_nothing_batch_rolls_back_on_a_shortfall(db_session, order_service, stock):
+    response = order_service.create_batch_orders(_batch(stock, [[("a", 6)], [("b", 1)], [("a", 6)]]))
+
+    assert response.total_successful == 0
+    assert [result.error_code for result in response.results] == [
+        "INSUFFICIENT_STOCK", "BATCH_ABORTED", "INSUFFICIENT_STOCK"
+    ]
+    assert response.results[0].errors == {"product_ids": [str(stock["a"])]}
+    assert _quantities(db_session, stock)["a"] == _quantities(db_session, stock)["b"] == 10
+    assert db_session.query(OrderModel).count() == 0
+
+
+def test_best_effort_batch_creates_the_orders_that_fit(db_session, order_service, stock):
+    response = order_service.create_batch_orders(_batch(
+        stock, [[("a", 6)], [("a", 6), ("b", 1)], [("b", 2)], [("a", 4)], []], all_or_nothing=False
+    ))
+
+    assert [result.success for result in response.results] == [True, False, True, True, False]
+    assert [result.error_code for result in response.results if not result.success] == [
+        "INSUFFICIENT_STOCK", "VALIDATION_ERROR"
+    ]
+    assert response.results[0].total_amount == Decimal("30.00")
+    assert _quantities(db_session, stock)["a"] == 0
+    assert _quantities(db_session, stock)["b"] == 8
+    assert {order.id for order in db_session.query(OrderModel).all()} == set(response.get_created_orders())
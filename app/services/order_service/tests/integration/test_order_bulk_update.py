@@ -0,0 +1,109 @@
+"""
+Integration tests for the set-based bulk order status update.
+"""
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.order_service.application.commands.bulk_update_order_command import (
+    BulkUpdateOrderCommand,
+    BulkUpdateOrderItemCommand
+)
+from app.services.order_service.application.use_cases.bulk_update_order import BulkUpdateOrderUseCase
+from app.services.order_service.domain.entities.order import OrderEntity
+from app.services.order_service.domain.entities.order_item import OrderItem
+from app.services.order_service.domain.value_objects.money import Money
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_daily_stats import OrderDailyStatsModel
+from app.services.order_service.infrastructure.persistence.models.order_status_count import OrderStatusCountModel
+from app.services.order_service.infrastructure.persistence.repositories.order_daily_stats_repository import (
+    OrderDailyStatsRepository
+)
+from app.services.order_service.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from app.shared.contracts.order.order_events import OrderStatusChangedEvent
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def uow(app, db_session, event_bus):
+    return SQLAlchemyUnitOfWork(db_session, event_bus, status_counters=True)
+
+
+@pytest.fixture
+def orders(db_session, uow):
+    """Thirty pending orders and ten processing ones"""
+    created = []
+    for i in range(40):
+        order = uow.order_repository.add(OrderEntity(
+            user_id=uuid4(),
+            items=[OrderItem(product_id=uuid4(), quantity=2, price=Money(Decimal("5.00")))],
+            total_amount=Decimal("10.00")
+        ))
+        if i >= 30:
+            order.update_status(OrderStatus.PROCESSING)
+            uow.order_repository.update(order)
+        created.append(order)
+    db_session.commit()
+    return created
+
+
+def _bulk_update(uow, orders, status):
+    command = BulkUpdateOrderCommand(updates=[
+        BulkUpdateOrderItemCommand(order_id=order.id, status=status) for order in orders
+    ])
+    return BulkUpdateOrderUseCase(uow, None).execute(command)
+
+
+def test_statement_count_does_not_grow_with_the_orders(uow, orders):
+    with count_queries() as few:
+        _bulk_update(uow, orders[:2], OrderStatus.CANCELLED)
+    with count_queries() as many:
+        _bulk_update(uow, orders[2:30], OrderStatus.CANCELLED)
+
+    # Status lookup, then for the (PENDING, CANCELLED) group: UPDATE, summaries UPDATE,
+    # rollup read, two rollup upserts and two counter upserts
+    assert len(few) == len(many) == 8
+
+
+def test_valid_transitions_are_applied_and_invalid_ones_reported(db_session, uow, orders):
+    completed = orders[30:]
+    result = _bulk_update(uow, orders[:5] + completed, OrderStatus.COMPLETED)
+
+    assert result.total_successful == 10
+    assert {r.error_code for r in result.results if not r.success} == {"INVALID_STATUS_TRANSITION"}
+    rows = {row.id: row for row in db_session.query(OrderModel).all()}
+    assert all(rows[order.id].status == OrderStatus.PENDING for order in orders[:5])
+    assert all(rows[order.id].status == OrderStatus.COMPLETED for order in completed)
+    assert all(rows[order.id].completed_at is not None for order in completed)
+
+
+def test_rollup_and_counters_follow_the_bulk_update(db_session, uow, orders):
+    _bulk_update(uow, orders[:12], OrderStatus.CANCELLED)
+
+    counters = {row.status: row.order_count for row in db_session.query(OrderStatusCountModel).all()}
+    assert counters[OrderStatus.PENDING] == 18
+    assert counters[OrderStatus.CANCELLED] == 12
+
+    incremental = {
+        (row.day, row.status): (row.order_count, Decimal(row.revenue), row.item_count, row.unit_count)
+        for row in db_session.query(OrderDailyStatsModel).all() if row.order_count
+    }
+    OrderDailyStatsRepository(db_session).rebuild()
+    db_session.commit()
+    rebuilt = {
+        (row.day, row.status): (row.order_count, Decimal(row.revenue), row.item_count, row.unit_count)
+        for row in db_session.query(OrderDailyStatsModel).all() if row.order_count
+    }
+    assert incremental == rebuilt
+
+
+def test_status_change_events_are_published_after_commit(uow, event_bus, orders):
+    published = []
+    event_bus.subscribe(OrderStatusChangedEvent, published.append)
+
+    _bulk_update(uow, orders[:3], OrderStatus.PROCESSING)
+
+    assert sorted(event.id for event in published) == sorted(str(order.id) for order in orders[:3])
+    assert {(event.old_status, event.new_status) for event in published} == {("PENDING", "PROCESSING")}
@@ -0,0 +1,127 @@
+"""
+Integration tests for the incremental daily order rollup and the stats read from it.
+"""
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.order_service.domain.entities.order import OrderEntity
+from app.services.order_service.domain.entities.order_item import OrderItem
+from app.services.order_service.domain.value_objects.money import Money
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_daily_stats import OrderDailyStatsModel
+from app.services.order_service.infrastructure.persistence.repositories.order_daily_stats_repository import (
+    OrderDailyStatsRepository,
+    order_day
+)
+from app.services.order_service.infrastructure.persistence.repositories.order_repository import SQLAlchemyOrderRepository
+from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+
+
+def _rollup(db_session):
+    return {
+        (row.day, row.status): (row.order_count, Decimal(row.revenue), row.item_count, row.unit_count)
+        for row in db_session.query(OrderDailyStatsModel).all()
+        if row.order_count
+    }
+
+
+def _add_order(repository, *quantities):
+    items = [OrderItem(product_id=uuid4(), quantity=quantity, price=Money(Decimal("2.50"))) for quantity in quantities]
+    return repository.add(OrderEntity(
+        user_id=uuid4(),
+        items=items,
+        total_amount=sum((Decimal("2.50") * quantity for quantity in quantities), Decimal("0"))
+    ))
+
+
+@pytest.fixture
+def repository(app, db_session):
+    return SQLAlchemyOrderRepository(db_session)
+
+
+def test_new_orders_are_counted_per_day_and_status(db_session, repository):
+    first = _add_order(repository, 1, 3)
+    _add_order(repository, 2)
+    db_session.commit()
+
+    day = order_day(db_session.get(OrderModel, first.id).created_at)
+    assert _rollup(db_session) == {(day, OrderStatus.PENDING): (2, Decimal("15.00"), 3, 6)}
+
+
+def test_status_change_moves_the_order_between_rows(db_session, repository):
+    order = _add_order(repository, 4)
+    _add_order(repository, 1)
+    order.update_status(OrderStatus.PROCESSING)
+    repository.update(order)
+    db_session.commit()
+
+    day = order_day(db_session.get(OrderModel, order.id).created_at)
+    assert _rollup(db_session) == {
+        (day, OrderStatus.PENDING): (1, Decimal("2.50"), 1, 1),
+        (day, OrderStatus.PROCESSING): (1, Decimal("10.00"), 1, 4),
+    }
+
+
+def test_rebuild_matches_incremental_rollup(db_session, repository):
+    order = _add_order(repository, 2, 2)
+    _add_order(repository, 5)
+    order.update_status(OrderStatus.CANCELLED)
+    repository.update(order)
+    db_session.commit()
+    incremental = _rollup(db_session)
+
+    db_session.query(OrderDailyStatsModel).delete()
+    OrderDailyStatsRepository(db_session).rebuild()
+    db_session.commit()
+
+    assert _rollup(db_session) == incremental
+
+
+def test_rebuild_limited_to_a_day_range_keeps_other_days(db_session):
+    now = datetime.now(UTC)
+    for days_ago in (0, 3):
+        created_at = now - timedelta(days=days_ago)
+        db_session.add(OrderModel(
+            id=uuid4(), user_id=uuid4(), total_amount=Decimal("7.00"),
+            created_at=created_at, updated_at=created_at,
+            items=[OrderItemModel(id=uuid4(), product_id=uuid4(), quantity=1, price=Decimal("7.00"),
+                                  created_at=created_at, updated_at=created_at)]
+        ))
+    db_session.commit()
+
+    OrderDailyStatsRepository(db_session).rebuild(now.date(), now.date())
+    db_session.commit()
+    assert set(_rollup(db_session)) == {(now.date(), OrderStatus.PENDING)}
+
+    OrderDailyStatsRepository(db_session).rebuild()
+    db_session.commit()
+    assert set(_rollup(db_session)) == {
+        (now.date(), OrderStatus.PENDING),
+        ((now - timedelta(days=3)).date(), OrderStatus.PENDING),
+    }
+
+
+def test_daily_stats_are_read_from_the_rollup(db_session, repository):
+    order = _add_order(repository, 2)
+    _add_order(repository, 1, 1)
+    order.update_status(OrderStatus.PROCESSING)
+    repository.update(order)
+    db_session.commit()
+    day = order_day(db_session.get(OrderModel, order.id).created_at)
+    days = (datetime.now(UTC).date() - day).days + 1
+
+    query_service = OrderQueryService(db_session)
+    stats = query_service.get_daily_order_stats(days)
+    processing = query_service.get_daily_order_stats(days, OrderStatus.PROCESSING)
+
+    assert len(stats) == days + 1
+    assert stats[0] == {"date": (day - timedelta(days=1)).isoformat(), "order_count": 0,
+                        "total_revenue": 0.0, "item_count": 0, "unit_count": 0}
+    by_day = {entry["date"]: entry for entry in stats}
+    assert by_day[day.isoformat()] == {"date": day.isoformat(), "order_count": 2,
+                                       "total_revenue": 10.0, "item_count": 3, "unit_count": 4}
+    assert {entry["date"]: entry["order_count"] for entry in processing}[day.isoformat()] == 1
@@ -0,0 +1,139 @@
+"""
+Integration tests for the lean query of orders waiting for delivery and the delivery routes built on it.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.delivery_service.service import DeliveryService
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.services.order_service.service import OrderService
+from app.shared.domain.enums.enums import ServiceType
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def order_service(app, database, event_bus, acl, auth_service):
+    acl.register_service(ServiceType.AUTH, lambda: auth_service)
+    service = OrderService(database, event_bus, acl)
+    acl.register_service(ServiceType.ORDER, lambda: service)
+    return service
+
+
+@pytest.fixture
+def delivery_service(database, event_bus, acl, order_service):
+    return DeliveryService(database, event_bus, acl)
+
+
+@pytest.fixture
+def centers(add_center_users):
+    """Three health care centers with one user each, keyed by center index"""
+    return add_center_users(3, "Receiver")
+
+
+@pytest.fixture
+def add_orders(db_session, order_service):
+    """Add orders as (center index, status, minutes ago, items), newest last, and their summaries"""
+    def add(users, specs):
+        now = datetime.now(timezone.utc)
+        ids = []
+        for center, status, minutes_ago, items in specs:
+            created_at = now - timedelta(minutes=minutes_ago)
+            order = OrderModel(
+                id=uuid4(), user_id=users[center].id, status=status, total_amount=Decimal("10.00") * items,
+                created_at=created_at, updated_at=created_at,
+                items=[
+                    OrderItemModel(id=uuid4(), product_id=uuid4(), quantity=1, price=Decimal("10.00"),
+                                   created_at=created_at, updated_at=created_at)
+                    for _ in range(items)
+                ]
+            )
+            db_session.add(order)
+            ids.append(order.id)
+        db_session.commit()
+        order_service.backfill_order_summaries()
+        return ids
+    return add
+
+
+def test_shipped_orders_come_first_with_item_counts_and_centers(db_session, centers, add_orders):
+    shipped, processing = add_orders(centers, [
+        (0, OrderStatus.SHIPPED, 5, 3),
+        (1, OrderStatus.PROCESSING, 1, 2),
+    ])
+    query_service = OrderQueryService(db_session)
+
+    with count_queries() as statements:
+        orders, total = query_service.get_delivery_orders()
+
+    assert len(statements) == 1
+    assert total == 1
+    assert [order.order_id for order in orders] == [shipped]
+    assert orders[0].items_count == 3
+    assert orders[0].health_center_id == centers[0].health_care_center_id
+    assert orders[0].consumer_name == "Receiver 00"
+
+    processing_orders, _ = query_service.get_delivery_orders(status=OrderStatus.PROCESSING)
+    assert [order.order_id for order in processing_orders] == [processing]
+
+
+def test_processing_orders_when_none_is_shipped(db_session, centers, add_orders):
+    ids = add_orders(centers, [
+        (0, OrderStatus.PROCESSING, 3, 1),
+        (1, OrderStatus.PROCESSING, 1, 1),
+        (2, OrderStatus.PENDING, 0, 1),
+    ])
+
+    orders, total = OrderQueryService(db_session).get_delivery_orders()
+
+    assert total == 2
+    assert [order.order_id for order in orders] == [ids[1], ids[0]]
+
+
+def test_limit_is_applied_in_the_query(db_session, centers, add_orders):
+    ids = add_orders(centers, [(i % 3, OrderStatus.PROCESSING, 10 - i, 1) for i in range(6)])
+    query_service = OrderQueryService(db_session)
+
+    orders, total = query_service.get_delivery_orders(limit=2)
+    assert total == 6
+    assert [order.order_id for order in orders] == [ids[5], ids[4]]
+
+    # With by_center the limit counts centers, each with all its orders
+    orders, total = query_service.get_delivery_orders(limit=2, by_center=True)
+    assert total == 6
+    assert {order.health_center_id for order in orders} == {
+        centers[2].health_care_center_id, centers[1].health_care_center_id
+    }
+    assert len(orders) == 4
+
+
+def test_delivery_routes_look_centers_up_once(db_session, delivery_service, centers, add_orders):
+    add_orders(centers, [(i % 3, OrderStatus.SHIPPED, 10 - i, 2) for i in range(6)])
+
+    with count_queries() as statements:
+        result = delivery_service.get_delivery_routes(group_by_location=True)
+
+    # The orders, then one lookup of their centers
+    assert len(statements) == 2
+    assert result["summary"]["total_routes"] == 3
+    assert result["summary"]["total_estimated_deliveries"] == 6
+    route = result["routes"][0]
+    assert route["location"]["health_care_center_name"] == "Center 02"
+    assert route["location"]["latitude"] == 12.0
+    assert route["total_items_count"] == 4
+
+
+def test_delivery_route_limit_reaches_the_order_service(delivery_service, centers, add_orders):
+    add_orders(centers, [(i % 3, OrderStatus.SHIPPED, 10 - i, 1) for i in range(6)])
+
+    individual = delivery_service.get_delivery_routes(limit=2)
+    grouped = delivery_service.get_delivery_routes(group_by_location=True, limit=1)
+
+    assert individual["summary"]["total_routes"] == 2
+    assert individual["summary"]["processing_orders_count"] == 6
+    assert grouped["summary"]["total_routes"] == 1
+    assert grouped["summary"]["total_estimated_deliveries"] == 2
@@ -0,0 +1,84 @@
+"""
+Integration tests for the streamed order export.
+"""
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from app.services.order_service.application.dtos.order_dto import OrderFilterDTO
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.export import order_export
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def orders(seed_orders):
+    """Twelve orders of two items each, oldest first by index; every third one is cancelled"""
+    return seed_orders(
+        label="Exporter", status_of=lambda i: OrderStatus.CANCELLED if i % 3 == 0 else OrderStatus.PENDING
+    )
+
+
+def test_export_covers_every_matching_order_not_one_page(order_query_service, orders):
+    body = b"".join(order_query_service.export_orders(OrderFilterDTO(per_page=2))).decode("utf-8")
+
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert list(rows[0].keys()) == list(order_export.ORDER_FIELDS)
+    assert [row["id"] for row in rows] == [str(order.id) for order in orders]
+    assert rows[1]["consumer_name"] == "Exporter 01"
+    assert rows[1]["health_center_name"] == "Center 01"
+    assert rows[1]["items_count"] == "2"
+    assert rows[1]["unit_count"] == "3"
+
+
+def test_export_applies_the_filter(order_query_service, orders):
+    body = b"".join(order_query_service.export_orders(
+        OrderFilterDTO(status=OrderStatus.CANCELLED.value), fmt="ndjson"
+    )).decode("utf-8")
+
+    records = [json.loads(line) for line in body.splitlines()]
+    assert [record["id"] for record in records] == [str(order.id) for order in orders[::3]]
+    assert {record["status"] for record in records} == {"CANCELLED"}
+
+
+def test_ndjson_nests_line_items_and_csv_has_a_row_per_item(order_query_service, orders):
+    records = [
+        json.loads(line) for line in b"".join(order_query_service.export_orders(
+            OrderFilterDTO(), fmt="ndjson", include_items=True
+        )).decode("utf-8").splitlines()
+    ]
+    rows = list(csv.DictReader(io.StringIO(b"".join(order_query_service.export_orders(
+        OrderFilterDTO(), include_items=True
+    )).decode("utf-8"))))
+
+    assert sorted((item["product_name"], item["quantity"]) for item in records[4]["items"]) == [
+        ("Product 04-0", 1), ("Product 04-1", 2)
+    ]
+    assert len(rows) == 24
+    assert {row["product_name"] for row in rows if row["id"] == str(orders[4].id)} == {"Product 04-0", "Product 04-1"}
+
+
+def test_enrichment_runs_once_per_cursor_partition(order_query_service, orders):
+    """Nothing runs until the stream is consumed; then lookups grow with partitions, not orders"""
+    with count_queries() as statements:
+        blocks = order_query_service.export_orders(OrderFilterDTO(), include_items=True, yield_per=5)
+        assert statements == []
+        b"".join(blocks)
+    with count_queries() as single_partition:
+        b"".join(order_query_service.export_orders(OrderFilterDTO(), include_items=True, yield_per=12))
+
+    # The order cursor, then items, products, users and centers for each partition
+    assert len(single_partition) == 1 + 4
+    assert len(statements) == 1 + 3 * 4
+
+
+def test_gzip_export(order_query_service, orders):
+    compressed = b"".join(order_query_service.export_orders(
+        OrderFilterDTO(status=OrderStatus.PENDING.value), fmt="ndjson", compress=True
+    ))
+
+    lines = gzip.decompress(compressed).decode("utf-8").splitlines()
+    assert len(lines) == 8
@@ -0,0 +1,105 @@
+"""
+Integration tests for Idempotency-Key handling of the order write endpoints.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+import pytest
+from dependency_injector import providers
+from flask import make_response, request
+from flask_jwt_extended import create_access_token
+
+from app.apis.decorators.idempotency_decorator import REPLAYED_HEADER, idempotent
+from app.extensions import container
+from app.shared.infrastructure.idempotency import ClaimState, IdempotencyStore
+from app.shared.infrastructure.persistence.models.idempotency_key_model import IdempotencyKeyModel
+
+
+@pytest.fixture
+def store(app, database, db_session):
+    store = IdempotencyStore(database, ttl_seconds=3600)
+    with container.idempotency_store.override(providers.Object(store)):
+        yield store
+
+
+@pytest.fixture
+def create_order(app):
+    """A stand-in for an order endpoint, counting how often it really runs"""
+    calls = []
+
+    @idempotent("orders:create")
+    def endpoint():
+        calls.append(1)
+        status = HTTPStatus.CONFLICT if b"short" in request.get_data() else HTTPStatus.CREATED
+        return {"code": status, "data": {"order": len(calls)}}, status
+
+    def post(body, key=None, user="user-1"):
+        with app.app_context():
+            token = create_access_token(identity=user)
+        headers = {"Authorization": f"Bearer {token}"}
+        if key:
+            headers["Idempotency-Key"] = key
+        with app.test_request_context("/api/orders/order", method="POST", data=json.dumps(body), headers=headers):
+            return make_response(endpoint())
+
+    post.calls = calls
+    return post
+
+
+def test_retry_replays_the_stored_response(store, create_order):
+    first = create_order({"items": [1]}, key="k1")
+    retry = create_order({"items": [1]}, key="k1")
+
+    assert first.status_code == retry.status_code == HTTPStatus.CREATED
+    assert retry.get_json() == first.get_json()
+    assert retry.headers[REPLAYED_HEADER] == "true"
+    assert len(create_order.calls) == 1
+    assert store.hits == 1
+
+
+def test_other_workers_replay_from_the_table(database, store, create_order):
+    create_order({"items": [1]}, key="k1")
+    store.clear()
+
+    retry = create_order({"items": [1]}, key="k1")
+
+    assert retry.headers[REPLAYED_HEADER] == "true"
+    assert len(create_order.calls) == 1
+
+
+def test_keys_are_per_user_and_bound_to_the_request(store, create_order):
+    create_order({"items": [1]}, key="k1")
+
+    assert create_order({"items": [1]}, key="k1", user="user-2").status_code == HTTPStatus.CREATED
+    assert create_order({"items": [2]}, key="k1").status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert create_order({"items": [1]}).status_code == HTTPStatus.CREATED
+    assert len(create_order.calls) == 3
+
+
+def test_failures_are_not_stored(db_session, store, create_order):
+    assert create_order({"short": True}, key="k1").status_code == HTTPStatus.CONFLICT
+    assert db_session.query(IdempotencyKeyModel).count() == 0
+    assert create_order({"short": True}, key="k1").status_code == HTTPStatus.CONFLICT
+    assert len(create_order.calls) == 2
+
+
+def test_claims_block_concurrent_requests_until_their_lease_ends(db_session, store):
+    assert store.begin("orders:create:u", "k1", "f").state == ClaimState.NEW
+    assert store.begin("orders:create:u", "k1", "f").state == ClaimState.IN_PROGRESS
+
+    stale = datetime.now(timezone.utc) - timedelta(minutes=5)
+    db_session.query(IdempotencyKeyModel).update({"created_at": stale})
+    db_session.commit()
+    assert store.begin("orders:create:u", "k1", "f").state == ClaimState.NEW
+
+
+def test_expired_keys_are_purged(db_session, store, create_order):
+    create_order({"items": [1]}, key="k1")
+    db_session.query(IdempotencyKeyModel).update({"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)})
+    db_session.commit()
+    store.clear()
+
+    assert store.purge_expired() == 1
+    assert create_order({"items": [1]}, key="k1").headers.get(REPLAYED_HEADER) is None
+    assert len(create_order.calls) == 2
@@ -0,0 +1,98 @@
+"""
+Integration tests for single-transaction order placement with set-based stock reservation.
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.inventory_service.application.events.stock_reserved_event import StockReservedEvent
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.order_service.application.commands.create_order_command import CreateOrderCommand
+from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO
+from app.services.order_service.domain.exceptions.order_errors import OrderCreationError
+from app.services.order_service.infrastructure.cache.consumer_name_cache import ConsumerNameCache
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.service import OrderService
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.shared.domain.enums.enums import ServiceType
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def order_service(app, database, event_bus, acl, inventory_service, auth_service):
+    acl.register_service(ServiceType.INVENTORY, lambda: inventory_service)
+    acl.register_service(ServiceType.AUTH, lambda: auth_service)
+    return OrderService(database, event_bus, acl, name_cache=ConsumerNameCache())
+
+
+@pytest.fixture
+def stock(db_session):
+    """Five products with 10 units each, and one whose stock has expired"""
+    # The stock check reads expiry dates as whole days
+    today = datetime.combine(date.today(), time.min, timezone.utc)
+    product_ids = {}
+    for key in ("a", "b", "c", "d", "e", "expired"):
+        product_id = uuid4()
+        db_session.add(ProductModel(id=product_id, name=f"Product {key}", description="Test"))
+        db_session.add(InventoryModel(
+            id=uuid4(), product_id=product_id, quantity=10, price=5.0, max_stock=100, min_stock=1,
+            expiry_date=today + timedelta(days=-3 if key == "expired" else 365)
+        ))
+        product_ids[key] = product_id
+    db_session.commit()
+    return product_ids
+
+
+def _command(user_id, cart):
+    return CreateOrderCommand(user_id=user_id, items=[
+        CreateOrderItemDTO(product_id=product_id, quantity=quantity, price=Decimal("5.00"))
+        for product_id, quantity in cart
+    ])
+
+
+def _quantities(db_session, product_ids):
+    db_session.expire_all()
+    rows = db_session.query(InventoryModel.product_id, InventoryModel.quantity).filter(
+        InventoryModel.product_id.in_(product_ids)
+    ).all()
+    return dict(rows)
+
+
+def test_order_and_reservation_commit_together(db_session, order_service, event_bus, stock, test_user):
+    published = []
+    event_bus.subscribe(StockReservedEvent, published.append)
+
+    response = order_service.create_order(_command(test_user.id, [(stock["a"], 3), (stock["b"], 1), (stock["a"], 2)]))
+
+    assert _quantities(db_session, [stock["a"], stock["b"]]) == {stock["a"]: 5, stock["b"]: 9}
+    assert db_session.query(OrderModel).count() == 1
+    assert db_session.query(OrderItemModel).count() == 3
+    assert response.consumer_name == "Test User"
+    assert response.health_center_name == "Test Health Care Center"
+    assert [event.order_id for event in published] == [str(response.order_id)]
+
+
+def test_statements_do_not_grow_with_the_cart(db_session, order_service, stock, test_user):
+    order_service.create_order(_command(test_user.id, [(stock["a"], 1)]))
+
+    with count_queries() as small:
+        order_service.create_order(_command(test_user.id, [(stock["a"], 1)]))
+    with count_queries() as large:
+        order_service.create_order(_command(test_user.id, [(stock[key], 1) for key in "abcde"]))
+
+    assert len(small) == len(large)
+    assert not any("users" in statement for statement in small + large)
+
+
+@pytest.mark.parametrize("shortfall", [("b", 11), ("expired", 1)])
+def test_shortfall_rolls_back_the_whole_order(db_session, order_service, stock, test_user, shortfall):
+    key, quantity = shortfall
+
+    with pytest.raises(OrderCreationError) as error:
+        order_service.create_order(_command(test_user.id, [(stock["a"], 4), (stock[key], quantity)]))
+
+    assert error.value.errors["data"][0]["product_id"] == stock[key]
+    assert _quantities(db_session, [stock["a"], stock[key]]) == {stock["a"]: 10, stock[key]: 10}
+    assert db_session.query(OrderModel).count() == 0
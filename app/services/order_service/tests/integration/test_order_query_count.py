@@ -0,0 +1,73 @@
+"""
+Integration tests for the number of SQL statements issued by OrderQueryService list paths.
+
+List pages read the order_summaries read model, which holds the product, user and
+health center names, so a page is one statement whatever it holds.
+"""
+import pytest
+
+from app.services.order_service.application.dtos.order_dto import OrderFilterDTO
+from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+from app.services.order_service.infrastructure.projections.order_summary_projection import OrderSummaryProjection
+from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def orders(database, order_query_service, seed_orders):
+    """Orders for distinct users, centers and products, newest first by index, and their summaries"""
+    created = seed_orders(items_per_order=3, newest_first=True)
+    OrderSummaryProjection(database).backfill(order_query_service.get_display_names)
+    return created
+
+
+def _statements_for(callable_):
+    with count_queries() as statements:
+        result = callable_()
+    return result, len(statements)
+
+
+def test_filtered_order_page_issues_constant_queries(order_query_service, orders):
+    small, small_count = _statements_for(
+        lambda: order_query_service.get_orders_by_filter(OrderFilterDTO(per_page=2))
+    )
+    large, large_count = _statements_for(
+        lambda: order_query_service.get_orders_by_filter(OrderFilterDTO(per_page=10))
+    )
+
+    assert len(small.orders) == 2
+    assert len(large.orders) == 10
+    # The page and its total in one statement
+    assert small_count == large_count == 1
+
+
+def test_order_page_names_are_attached(order_query_service, orders):
+    result = order_query_service.get_orders_by_filter(OrderFilterDTO(per_page=5))
+
+    for index, summary in enumerate(result.orders):
+        assert summary.consumer_name == f"Orderer {index:02d}"
+        assert summary.health_center_name == f"Center {index:02d}"
+        assert {item['name'] for item in summary.items} == {f"Product {index:02d}-{j}" for j in range(3)}
+
+
+def test_user_order_lists_issue_constant_queries(order_query_service, orders):
+    user_id = orders[0].user_id
+    _, history_count = _statements_for(lambda: order_query_service.get_order_history(user_id, limit=1))
+    _, page_count = _statements_for(lambda: order_query_service.get_orders_by_user_id(user_id, 1, 10))
+    # One statement on the summaries, no name lookups
+    assert history_count == page_count == 1
+
+
+def test_missing_names_fall_back_to_defaults(db_session, database, orders):
+    # Summaries written while no other service answered
+    db_session.query(OrderSummaryModel).delete()
+    db_session.commit()
+    query_service = OrderQueryService(db_session)
+    OrderSummaryProjection(database).backfill(query_service.get_display_names)
+
+    result = query_service.get_orders_by_filter(OrderFilterDTO(per_page=1))
+
+    summary = result.orders[0]
+    assert summary.consumer_name == f"User {str(orders[0].user_id).split('-')[0]}"
+    assert summary.health_center_name is None
+    assert all(item['name'].startswith("Product ") for item in summary.items)
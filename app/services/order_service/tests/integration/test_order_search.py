@@ -0,0 +1,142 @@
+"""
+Integration tests for order search by short id prefix, user id prefix and notes, paged by cursor.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.repositories.order_repository import SQLAlchemyOrderRepository
+from app.services.order_service.infrastructure.search.order_search_backend import get_order_search_backend, id_prefix_range
+from app.services.order_service.service import OrderService
+from app.shared.utils.cursor_pagination import InvalidCursorError
+
+
+@pytest.fixture
+def order_service(app, database, event_bus, acl):
+    return OrderService(database, event_bus, acl)
+
+
+@pytest.fixture
+def orders(db_session, order_service):
+    """Orders with known ids and notes, newest first, and their summaries"""
+    now = datetime.now(timezone.utc)
+    specs = [
+        ("3f2a9c1e-0000-4000-8000-000000000001", "Deliver to the back door", OrderStatus.PENDING),
+        ("3f2a9c1e-0000-4000-8000-000000000002", None, OrderStatus.SHIPPED),
+        ("3f2b0000-0000-4000-8000-000000000003", "Fragile vials, keep cold", OrderStatus.PENDING),
+        ("a1000000-0000-4000-8000-000000000004", "Call before delivery", OrderStatus.COMPLETED),
+    ]
+    created = []
+    for index, (order_id, notes, status) in enumerate(specs):
+        created_at = now - timedelta(minutes=index)
+        order = OrderModel(
+            id=UUID(order_id), user_id=uuid4(), status=status, total_amount=Decimal("10.00"), notes=notes,
+            created_at=created_at, updated_at=created_at,
+            items=[OrderItemModel(id=uuid4(), product_id=uuid4(), quantity=1, price=Decimal("10.00"),
+                                  created_at=created_at, updated_at=created_at)]
+        )
+        db_session.add(order)
+        created.append(order)
+    db_session.commit()
+    order_service.backfill_order_summaries()
+    return created
+
+
+def _ids(result):
+    return [str(order.order_id) for order in result.orders]
+
+
+def test_id_prefix_range():
+    assert id_prefix_range("#3F2A-9c1e") == (
+        UUID("3f2a9c1e-0000-0000-0000-000000000000"), UUID("3f2a9c1e-ffff-ffff-ffff-ffffffffffff")
+    )
+    assert id_prefix_range("3f2") is None
+    assert id_prefix_range("back door") is None
+
+
+def test_short_id_prefix_finds_orders(order_service, orders):
+    assert _ids(order_service.search_orders("3f2a9c1e")) == [str(orders[0].id), str(orders[1].id)]
+    assert _ids(order_service.search_orders("#3F2B")) == [str(orders[2].id)]
+    assert _ids(order_service.search_orders("3f2a9c1e", status="SHIPPED")) == [str(orders[1].id)]
+
+
+def test_user_id_prefix_finds_orders(order_service, orders):
+    prefix = str(orders[3].user_id)[:8]
+
+    assert str(orders[3].id) in _ids(order_service.search_orders(prefix))
+
+
+def test_notes_match_every_word_as_prefix(order_service, orders):
+    assert _ids(order_service.search_orders("deliv")) == [str(orders[0].id), str(orders[3].id)]
+    assert _ids(order_service.search_orders("vials cold")) == [str(orders[2].id)]
+    assert _ids(order_service.search_orders("vials door")) == []
+
+
+def test_notes_index_follows_order_writes(db_session, order_service, orders):
+    db_session.query(OrderModel).filter(OrderModel.id == orders[1].id).update({'notes': "Leave at reception"})
+    db_session.query(OrderModel).filter(OrderModel.id == orders[0].id).update({'notes': None})
+    db_session.commit()
+
+    assert _ids(order_service.search_orders("reception")) == [str(orders[1].id)]
+    assert _ids(order_service.search_orders("door")) == []
+
+    db_session.query(OrderModel).filter(OrderModel.id == orders[2].id).delete()
+    db_session.commit()
+    assert _ids(order_service.search_orders("fragile")) == []
+
+
+
+def _archive(db_session, order_service, order):
+    """Age a completed order past the archival cutoff and archive it; returns its id"""
+    order_id = order.id
+    old = datetime.now(timezone.utc) - timedelta(days=200)
+    db_session.query(OrderModel).filter(OrderModel.id == order_id).update({'created_at': old, 'updated_at': old})
+    db_session.commit()
+    assert order_service.archive_orders(days=90) == 1
+    return str(order_id)
+
+
+def test_archived_orders_are_found_by_notes_and_id(db_session, order_service, orders):
+    newest = str(orders[0].id)
+    archived = _archive(db_session, order_service, orders[3])
+
+    assert _ids(order_service.search_orders("call before")) == [archived]
+    assert _ids(order_service.search_orders("a1000000")) == [archived]
+    assert _ids(order_service.search_orders("deliv")) == [newest, archived]
+
+def test_results_are_paged_by_cursor(order_service, orders):
+    first = order_service.search_orders("deliv", per_page=1)
+    second = order_service.search_orders("deliv", per_page=1, cursor=first.pagination.next_cursor)
+
+    assert _ids(first) == [str(orders[0].id)]
+    assert _ids(second) == [str(orders[3].id)]
+    assert second.pagination.next_cursor is None
+    assert first.pagination.total is None
+
+    with pytest.raises(InvalidCursorError):
+        order_service.search_orders("deliv", cursor="not-a-cursor")
+
+
+def test_repository_search_uses_the_same_matching(db_session, orders):
+    repository = SQLAlchemyOrderRepository(db_session)
+
+    assert {order.id for order in repository.search("3f2a9c1e")} == {orders[0].id, orders[1].id}
+    assert [order.id for order in repository.search("fragile")] == [orders[2].id]
+    assert repository.search("zz") == []
+
+
+def test_rebuild_reindexes_notes(db_session, order_service, orders):
+    backend = get_order_search_backend(db_session)
+
+    assert backend.rebuild(db_session) == 3
+    db_session.commit()
+    assert _ids(order_service.search_orders("fragile")) == [str(orders[2].id)]
+
+    archived = _archive(db_session, order_service, orders[3])
+    assert backend.rebuild(db_session) == 3
+    db_session.commit()
+    assert _ids(order_service.search_orders("call")) == [archived]
@@ -0,0 +1,90 @@
+"""
+Integration tests for the order status summary and the maintained status counters.
+"""
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.order_service.domain.entities.order import OrderEntity
+from app.services.order_service.domain.entities.order_item import OrderItem
+from app.services.order_service.domain.value_objects.money import Money
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order_status_count import OrderStatusCountModel
+from app.services.order_service.infrastructure.persistence.repositories.order_repository import SQLAlchemyOrderRepository
+from app.services.order_service.infrastructure.persistence.repositories.order_status_count_repository import (
+    OrderStatusCountRepository
+)
+from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+from app.shared.testing.query_count import count_queries
+
+
+def _counters(db_session):
+    return {row.status: row.order_count for row in db_session.query(OrderStatusCountModel).all() if row.order_count}
+
+
+def _add_order(repository):
+    return repository.add(OrderEntity(
+        user_id=uuid4(),
+        items=[OrderItem(product_id=uuid4(), quantity=1, price=Money(Decimal("4.00")))],
+        total_amount=Decimal("4.00")
+    ))
+
+
+@pytest.fixture
+def repository(app, db_session):
+    return SQLAlchemyOrderRepository(db_session, status_counters=True)
+
+
+@pytest.fixture
+def orders(db_session, repository):
+    """Two pending orders, one processing and one cancelled"""
+    created = [_add_order(repository) for _ in range(4)]
+    created[0].update_status(OrderStatus.PROCESSING)
+    repository.update(created[0])
+    created[1].update_status(OrderStatus.CANCELLED)
+    repository.update(created[1])
+    db_session.commit()
+    return created
+
+
+def test_counters_follow_order_writes(db_session, repository, orders):
+    assert _counters(db_session) == {
+        OrderStatus.PENDING: 2, OrderStatus.PROCESSING: 1, OrderStatus.CANCELLED: 1
+    }
+
+    repository.delete(orders[2].id)
+    db_session.commit()
+    assert _counters(db_session) == {
+        OrderStatus.PENDING: 1, OrderStatus.PROCESSING: 1, OrderStatus.CANCELLED: 1
+    }
+
+
+def test_counters_are_off_by_default(db_session, app):
+    _add_order(SQLAlchemyOrderRepository(db_session))
+    db_session.commit()
+
+    assert _counters(db_session) == {}
+
+
+def test_rebuild_matches_incremental_counters(db_session, orders):
+    incremental = _counters(db_session)
+
+    db_session.query(OrderStatusCountModel).delete()
+    OrderStatusCountRepository(db_session).rebuild()
+    db_session.commit()
+
+    assert _counters(db_session) == incremental
+
+
+def test_summary_is_one_query_with_or_without_counters(db_session, orders):
+    with count_queries() as grouped_statements:
+        grouped = OrderQueryService(db_session).get_order_status_summary()
+    with count_queries() as counter_statements:
+        counted = OrderQueryService(db_session, status_counters=True).get_order_status_summary()
+
+    assert grouped == counted == {
+        status.value: {OrderStatus.PENDING: 2, OrderStatus.PROCESSING: 1, OrderStatus.CANCELLED: 1}.get(status, 0)
+        for status in OrderStatus
+    }
+    assert len(grouped_statements) == len(counter_statements) == 1
@@ -0,0 +1,228 @@
+"""
+Integration tests for the order_summaries read model: writes on placement, status
+changes and archival, renames from other services' events, and the backfill.
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app import warm_up_read_models
+from app.extensions import container
+from app.services.auth_service.application.commands import AssignUserToCenterCommand, UserUpdateCommand
+from app.services.auth_service.application.commands.health_care_center.update_center_command import UpdateHealthCareCenterCommand
+from app.services.auth_service.infrastructure.persistence.models.health_care_center_model import HealthCareCenterModel
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.order_service.application.commands.create_order_command import CreateOrderCommand
+from app.services.order_service.application.commands.update_order_command import UpdateOrderCommand
+from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO, OrderFilterDTO
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.cache.consumer_name_cache import ConsumerNameCache
+from app.services.order_service.infrastructure.persistence.models.order import OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+from app.services.order_service.infrastructure.projections.order_summary_projection import OrderSummaryProjection
+from app.services.order_service.service import OrderService
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.shared.contracts.auth.auth_events import HealthCareCenterUpdatedEvent, UserUpdatedEvent
+from app.shared.contracts.product.product_events import ProductUpdatedEvent
+from app.shared.domain.enums.enums import ServiceType
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def projection(database):
+    return OrderSummaryProjection(database)
+
+
+@pytest.fixture
+def order_service(app, database, event_bus, acl, inventory_service, auth_service, product_service, projection):
+    acl.register_service(ServiceType.INVENTORY, lambda: inventory_service)
+    acl.register_service(ServiceType.AUTH, lambda: auth_service)
+    acl.register_service(ServiceType.PRODUCT, lambda: product_service)
+    return OrderService(database, event_bus, acl, name_cache=ConsumerNameCache(), summary_projection=projection)
+
+
+@pytest.fixture
+def stock(db_session):
+    """Two products with 10 units each"""
+    today = datetime.combine(date.today(), time.min, timezone.utc)
+    product_ids = []
+    for key in ("a", "b"):
+        product_id = uuid4()
+        db_session.add(ProductModel(id=product_id, name=f"Product {key}", description="Test"))
+        db_session.add(InventoryModel(
+            id=uuid4(), product_id=product_id, quantity=10, price=5.0, max_stock=100, min_stock=1,
+            expiry_date=today + timedelta(days=365)
+        ))
+        product_ids.append(product_id)
+    db_session.commit()
+    return product_ids
+
+
+def _place(order_service, user_id, product_ids):
+    return order_service.create_order(CreateOrderCommand(user_id=user_id, items=[
+        CreateOrderItemDTO(product_id=product_id, quantity=1, price=Decimal("5.00")) for product_id in product_ids
+    ]))
+
+
+def _summary(db_session, order_id):
+    db_session.expire_all()
+    return db_session.get(OrderSummaryModel, order_id)
+
+
+def _event_time():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def test_placement_writes_the_summary(db_session, order_service, stock, test_user):
+    response = _place(order_service, test_user.id, stock)
+
+    summary = _summary(db_session, response.order_id)
+    assert summary.user_id == test_user.id
+    assert summary.status == OrderStatus.PENDING
+    assert summary.total_amount == Decimal("10.00")
+    assert summary.items_count == 2
+    assert summary.archived is False
+    assert summary.consumer_name == "Test User"
+    assert summary.health_center_name == "Test Health Care Center"
+    assert summary.health_center_id == test_user.health_care_center_id
+    assert sorted(item['name'] for item in summary.items) == ["Product a", "Product b"]
+
+
+def test_listing_reads_summaries_in_one_statement(order_service, stock, test_user):
+    for _ in range(3):
+        _place(order_service, test_user.id, stock)
+
+    with count_queries() as statements:
+        result = order_service.get_orders(OrderFilterDTO(per_page=10))
+
+    assert len(statements) == 1
+    assert len(result.orders) == 3
+    assert all(order.consumer_name == "Test User" for order in result.orders)
+    assert all(order.items_count == 2 for order in result.orders)
+
+
+def test_status_changes_follow_into_the_summary(db_session, order_service, stock, test_user):
+    response = _place(order_service, test_user.id, stock)
+
+    order_service.update_order_status(UpdateOrderCommand(id=response.order_id, status=OrderStatus.PROCESSING))
+
+    assert _summary(db_session, response.order_id).status == OrderStatus.PROCESSING
+    listed = order_service.get_orders(OrderFilterDTO(status=OrderStatus.PROCESSING))
+    assert [order.order_id for order in listed.orders] == [response.order_id]
+
+
+def test_renames_rewrite_the_summaries(db_session, order_service, projection, stock, test_user):
+    response = _place(order_service, test_user.id, stock)
+    center_id = str(test_user.health_care_center_id)
+
+    projection.handle_user_updated(UserUpdatedEvent(
+        id=str(test_user.id), full_name="Renamed User", health_care_center_id=center_id,
+        health_care_center_name="Test Health Care Center", timestamp=_event_time()
+    ))
+    projection.handle_health_care_center_updated(HealthCareCenterUpdatedEvent(
+        id=center_id, name="Renamed Center", timestamp=_event_time()
+    ))
+    projection.handle_product_updated(ProductUpdatedEvent(
+        id=str(stock[0]), name="Renamed Product", status="active", timestamp=_event_time()
+    ))
+
+    summary = _summary(db_session, response.order_id)
+    assert summary.consumer_name == "Renamed User"
+    assert summary.health_center_name == "Renamed Center"
+    assert sorted(item['name'] for item in summary.items) == ["Product b", "Renamed Product"]
+
+
+
+def test_renames_leave_the_publishers_pending_work_alone(db_session, projection, stock, test_user):
+    pending = ProductModel(id=uuid4(), name="Not yet committed", description="Test")
+    db_session.add(pending)
+
+    projection.handle_health_care_center_updated(HealthCareCenterUpdatedEvent(
+        id=str(test_user.health_care_center_id), name="Renamed Center", timestamp=_event_time()
+    ))
+    db_session.rollback()
+
+    assert db_session.get(ProductModel, pending.id) is None
+
+def test_center_update_publishes_the_rename(db_session, auth_service, event_bus, projection, order_service,
+                                            stock, test_user):
+    response = _place(order_service, test_user.id, stock)
+    published = []
+    event_bus.subscribe(HealthCareCenterUpdatedEvent, published.append)
+
+    auth_service.update_health_care_center(UpdateHealthCareCenterCommand(
+        id=test_user.health_care_center_id, name="Moved Center"
+    ))
+    projection.handle_health_care_center_updated(published[-1])
+
+    assert _summary(db_session, response.order_id).health_center_name == "Moved Center"
+
+
+def test_user_update_publishes_the_rename(db_session, auth_service, event_bus, database, order_service,
+                                          stock, test_user):
+    OrderSummaryProjection(database, event_bus)
+    response = _place(order_service, test_user.id, stock)
+
+    auth_service.update_user(test_user.id, UserUpdateCommand(full_name="Renamed Through Auth"))
+
+    assert _summary(db_session, response.order_id).consumer_name == "Renamed Through Auth"
+
+
+def test_center_assignment_publishes_the_move(db_session, auth_service, event_bus, database, order_service,
+                                              stock, test_user):
+    OrderSummaryProjection(database, event_bus)
+    response = _place(order_service, test_user.id, stock)
+    center = HealthCareCenterModel(id=uuid4(), name="Other Center", address="1 Other Street",
+                                   phone="+1987654321", email="other@healthcare.com", latitude=40.0, longitude=-74.0,
+                                   is_active=True)
+    db_session.add(center)
+    db_session.commit()
+
+    auth_service.assign_user_to_center(AssignUserToCenterCommand(user_id=test_user.id, center_id=center.id))
+
+    summary = _summary(db_session, response.order_id)
+    assert summary.health_center_id == center.id
+    assert summary.health_center_name == "Other Center"
+
+
+def test_archival_flags_the_summary(db_session, order_service, stock, test_user):
+    response = _place(order_service, test_user.id, stock)
+    old = datetime.now(timezone.utc) - timedelta(days=200)
+    db_session.query(OrderModel).filter(OrderModel.id == response.order_id).update(
+        {'status': OrderStatus.COMPLETED, 'created_at': old, 'updated_at': old}
+    )
+    db_session.commit()
+
+    assert order_service.archive_orders(days=90) == 1
+
+    assert _summary(db_session, response.order_id).archived is True
+    assert order_service.get_orders(OrderFilterDTO()).orders == []
+    assert [order.order_id for order in order_service.get_orders(OrderFilterDTO(archived=True)).orders] == [response.order_id]
+
+
+def test_backfill_writes_missing_summaries_once(db_session, order_service, stock, test_user):
+    placed = [_place(order_service, test_user.id, stock).order_id for _ in range(3)]
+    db_session.query(OrderSummaryModel).delete()
+    db_session.commit()
+
+    assert order_service.backfill_order_summaries(batch_size=2) == 3
+    assert order_service.backfill_order_summaries(batch_size=2) == 0
+
+    for order_id in placed:
+        summary = _summary(db_session, order_id)
+        assert summary.consumer_name == "Test User"
+        assert sorted(item['name'] for item in summary.items) == ["Product a", "Product b"]
+
+
+def test_startup_backfills_missing_summaries(app, db_session, order_service, stock, test_user):
+    """Orders placed before the read model existed show in lists without a manual backfill"""
+    order_id = _place(order_service, test_user.id, stock).order_id
+    db_session.query(OrderSummaryModel).delete()
+    db_session.commit()
+
+    with container.order_service.override(order_service):
+        warm_up_read_models(app)
+
+    assert _summary(db_session, order_id).consumer_name == "Test User"
@@ -0,0 +1,83 @@
+"""
+Integration tests for per-insert order timestamps and the repair of rows written by the old defaults.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.order_service.domain.entities.order import OrderEntity
+from app.services.order_service.domain.entities.order_item import OrderItem
+from app.services.order_service.domain.value_objects.money import Money
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+from app.services.order_service.infrastructure.persistence.repositories.order_timestamp_repository import (
+    OrderTimestampRepository
+)
+from app.services.order_service.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+
+
+@pytest.fixture
+def stuck_orders(db_session):
+    """Three orders sharing an import-time created_at: two written again later, one never"""
+    stuck = datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc)
+    later = {"updated": stuck + timedelta(hours=3), "completed": stuck + timedelta(days=2)}
+    ids = {key: uuid4() for key in ("updated", "completed", "untouched")}
+    for key, order_id in ids.items():
+        db_session.add(OrderModel(
+            id=order_id, user_id=uuid4(), total_amount=Decimal("5.00"),
+            created_at=stuck,
+            updated_at=later["updated"] if key == "updated" else stuck + timedelta(microseconds=3),
+            completed_at=later["completed"] if key == "completed" else None,
+            items=[OrderItemModel(id=uuid4(), product_id=uuid4(), quantity=1, price=Decimal("5.00"),
+                                  created_at=stuck, updated_at=stuck)]
+        ))
+        db_session.add(OrderSummaryModel(id=order_id, user_id=uuid4(), status=OrderStatus.PENDING,
+                                         total_amount=Decimal("5.00"), items_count=1, created_at=stuck))
+    db_session.commit()
+    return ids, stuck, later
+
+
+def _created_at(db_session, model, **criteria):
+    value = db_session.query(model.created_at).filter_by(**criteria).scalar()
+    return value.replace(tzinfo=value.tzinfo or timezone.utc)
+
+
+def test_every_insert_gets_its_own_timestamps(app, db_session, event_bus):
+    uow = SQLAlchemyUnitOfWork(db_session, event_bus)
+    orders = []
+    for _ in range(2):
+        orders.append(uow.order_repository.add(OrderEntity(
+            user_id=uuid4(),
+            items=[OrderItem(product_id=uuid4(), quantity=1, price=Money(Decimal("5.00")))],
+            total_amount=Decimal("5.00")
+        )))
+    db_session.commit()
+
+    first, second = (_created_at(db_session, OrderModel, id=order.id) for order in orders)
+    assert first < second
+    assert datetime.now(timezone.utc) - second < timedelta(minutes=1)
+
+
+def test_shared_timestamps_are_capped_at_the_earliest_later_stamp(db_session, stuck_orders):
+    ids, stuck, later = stuck_orders
+
+    assert OrderTimestampRepository(db_session).repair() == (2, 1)
+    db_session.commit()
+
+    for key in ("updated", "completed"):
+        assert _created_at(db_session, OrderModel, id=ids[key]) == later[key]
+        assert _created_at(db_session, OrderItemModel, order_id=ids[key]) == later[key]
+        assert _created_at(db_session, OrderSummaryModel, id=ids[key]) == later[key]
+    assert _created_at(db_session, OrderModel, id=ids["untouched"]) == stuck
+    assert _created_at(db_session, OrderSummaryModel, id=ids["untouched"]) == stuck
+    assert OrderTimestampRepository(db_session).repair() == (0, 0)
+
+
+def test_dry_run_writes_nothing(db_session, stuck_orders):
+    ids, stuck, _ = stuck_orders
+
+    assert OrderTimestampRepository(db_session).repair(dry_run=True) == (2, 1)
+    assert {_created_at(db_session, OrderModel, id=order_id) for order_id in ids.values()} == {stuck}
@@ -1,7 +1,8 @@
 import pytest
 import uuid
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from app.services.order_service.application.commands.bulk_update_order_command import (
+    MAX_BULK_UPDATE,
     BulkUpdateOrderCommand,
     BulkUpdateOrderItemCommand
 )
@@ -10,16 +11,7 @@ from app.services.order_service.application.dtos.bulk_update_dto import (
     BulkUpdateOrderItemResult
 )
 from app.services.order_service.application.use_cases.bulk_update_order import BulkUpdateOrderUseCase
-from app.services.order_service.domain.entities.order import OrderEntity
-from app.services.order_service.domain.entities.order_item import OrderItem
 from app.services.order_service.domain.value_objects.order_status import OrderStatus
-from app.services.order_service.domain.value_objects.money import Money
-from app.services.order_service.domain.exceptions.order_errors import (
-    OrderNotFoundError,
-    InvalidOrderStatusTransition,
-    OrderValidationError
-)
-from decimal import Decimal
 
 class TestBulkUpdateOrderCommand:
     def test_create_bulk_update_command_success(self):
@@ -30,7 +22,7 @@ class TestBulkUpdateOrderCommand:
         updates = [
             BulkUpdateOrderItemCommand(
                 order_id=order_id1,
-                status=OrderStatus.CONFIRMED
+                status=OrderStatus.PROCESSING
             ),
             BulkUpdateOrderItemCommand(
                 order_id=order_id2,
@@ -45,7 +37,7 @@ class TestBulkUpdateOrderCommand:
         # Assert
         assert len(command.updates) == 2
         assert command.updates[0].order_id == order_id1
-        assert command.updates[0].status == OrderStatus.CONFIRMED
+        assert command.updates[0].status == OrderStatus.PROCESSING
         assert command.updates[1].order_id == order_id2
         assert command.updates[1].status == OrderStatus.COMPLETED
         assert command.updates[1].notes == "Completed successfully"
@@ -56,16 +48,16 @@ class TestBulkUpdateOrderCommand:
             BulkUpdateOrderCommand(updates=[])
     
     def test_create_bulk_update_command_too_many_updates_raises_error(self):
-        # Arrange - Create 101 updates (over the limit)
+        # Arrange - Create one update over the limit
         updates = [
             BulkUpdateOrderItemCommand(
                 order_id=uuid.uuid4(),
-                status=OrderStatus.CONFIRMED
-            ) for _ in range(101)
+                status=OrderStatus.PROCESSING
+            ) for _ in range(MAX_BULK_UPDATE + 1)
         ]
         
         # Act & Assert
-        with pytest.raises(ValueError, match="Maximum 100 orders can be updated"):
+        with pytest.raises(ValueError, match=f"Maximum {MAX_BULK_UPDATE} orders can be updated"):
             BulkUpdateOrderCommand(updates=updates)
 
 class TestBulkUpdateOrderUseCase:
@@ -73,45 +65,34 @@ class TestBulkUpdateOrderUseCase:
     def mock_uow(self):
         uow = Mock()
         uow.order_repository = Mock()
+        # Every order asked for is moved
+        uow.order_repository.update_statuses.side_effect = lambda order_ids, old, new: list(order_ids)
         return uow
     
     @pytest.fixture
     def mock_query_service(self):
         return Mock()
     
-    @pytest.fixture
-    def mock_update_use_case(self):
-        return Mock()
-    
     @pytest.fixture
     def bulk_update_use_case(self, mock_uow, mock_query_service):
         return BulkUpdateOrderUseCase(mock_uow, mock_query_service)
     
-    def test_bulk_update_all_successful(self, bulk_update_use_case, mock_uow, monkeypatch):
+    def test_bulk_update_all_successful(self, bulk_update_use_case, mock_uow):
         # Arrange
         order_id1 = uuid.uuid4()
         order_id2 = uuid.uuid4()
+        order_id3 = uuid.uuid4()
         
-        # Mock orders
-        order1 = self._create_mock_order(order_id1, OrderStatus.PENDING)
-        order2 = self._create_mock_order(order_id2, OrderStatus.PENDING)
-        
-        mock_uow.order_repository.get.side_effect = [order1, order2]
-        
-        # Mock successful update results
-        mock_update_result1 = Mock()
-        mock_update_result1.new_status = OrderStatus.CONFIRMED
-        mock_update_result2 = Mock()
-        mock_update_result2.new_status = OrderStatus.COMPLETED
-        
-        mock_update_use_case = Mock()
-        mock_update_use_case.execute.side_effect = [mock_update_result1, mock_update_result2]
-        
-        monkeypatch.setattr(bulk_update_use_case, '_update_order_use_case', mock_update_use_case)
+        mock_uow.order_repository.get_statuses.return_value = {
+            order_id1: OrderStatus.PENDING,
+            order_id2: OrderStatus.PENDING,
+            order_id3: OrderStatus.PROCESSING
+        }
         
         updates = [
-            BulkUpdateOrderItemCommand(order_id=order_id1, status=OrderStatus.CONFIRMED),
-            BulkUpdateOrderItemCommand(order_id=order_id2, status=OrderStatus.COMPLETED)
+            BulkUpdateOrderItemCommand(order_id=order_id1, status=OrderStatus.PROCESSING),
+            BulkUpdateOrderItemCommand(order_id=order_id2, status=OrderStatus.PROCESSING),
+            BulkUpdateOrderItemCommand(order_id=order_id3, status=OrderStatus.COMPLETED)
         ]
         command = BulkUpdateOrderCommand(updates=updates)
         
@@ -119,39 +100,38 @@ class TestBulkUpdateOrderUseCase:
         result = bulk_update_use_case.execute(command)
         
         # Assert
-        assert result.total_attempted == 2
-        assert result.total_successful == 2
+        assert result.total_attempted == 3
+        assert result.total_successful == 3
         assert result.total_failed == 0
         assert result.success_rate == 100.0
-        assert len(result.results) == 2
         assert all(r.success for r in result.results)
+        assert result.results[2].old_status == OrderStatus.PROCESSING
+        assert result.results[2].new_status == OrderStatus.COMPLETED
+        
+        # One status lookup, one UPDATE per (old, new) group and a single commit
+        mock_uow.order_repository.get_statuses.assert_called_once()
+        assert sorted(
+            (call.args[1].value, call.args[2].value, len(call.args[0]))
+            for call in mock_uow.order_repository.update_statuses.call_args_list
+        ) == [("PENDING", "PROCESSING", 2), ("PROCESSING", "COMPLETED", 1)]
+        mock_uow.commit.assert_called_once()
+        assert mock_uow.publish.call_count == 3
     
-    def test_bulk_update_partial_success(self, bulk_update_use_case, mock_uow, monkeypatch):
+    def test_bulk_update_partial_success(self, bulk_update_use_case, mock_uow):
         # Arrange
         order_id1 = uuid.uuid4()
         order_id2 = uuid.uuid4()
         order_id3 = uuid.uuid4()
         
-        # Mock orders - one doesn't exist
-        order1 = self._create_mock_order(order_id1, OrderStatus.PENDING)
-        order3 = self._create_mock_order(order_id3, OrderStatus.PENDING)
-        
-        mock_uow.order_repository.get.side_effect = [order1, None, order3]
-        
-        # Mock update results
-        mock_update_result1 = Mock()
-        mock_update_result1.new_status = OrderStatus.CONFIRMED
-        mock_update_result3 = Mock()
-        mock_update_result3.new_status = OrderStatus.COMPLETED
-        
-        mock_update_use_case = Mock()
-        mock_update_use_case.execute.side_effect = [mock_update_result1, mock_update_result3]
-        
-        monkeypatch.setattr(bulk_update_use_case, '_update_order_use_case', mock_update_use_case)
+        # One order doesn't exist
+        mock_uow.order_repository.get_statuses.return_value = {
+            order_id1: OrderStatus.PENDING,
+            order_id3: OrderStatus.PROCESSING
+        }
         
         updates = [
-            BulkUpdateOrderItemCommand(order_id=order_id1, status=OrderStatus.CONFIRMED),
-            BulkUpdateOrderItemCommand(order_id=order_id2, status=OrderStatus.CONFIRMED),
+            BulkUpdateOrderItemCommand(order_id=order_id1, status=OrderStatus.PROCESSING),
+            BulkUpdateOrderItemCommand(order_id=order_id2, status=OrderStatus.PROCESSING),
             BulkUpdateOrderItemCommand(order_id=order_id3, status=OrderStatus.COMPLETED)
         ]
         command = BulkUpdateOrderCommand(updates=updates)
@@ -174,13 +154,13 @@ class TestBulkUpdateOrderUseCase:
     
     def test_bulk_update_all_failed(self, bulk_update_use_case, mock_uow):
         # Arrange - No orders exist
-        mock_uow.order_repository.get.return_value = None
+        mock_uow.order_repository.get_statuses.return_value = {}
         
         order_id1 = uuid.uuid4()
         order_id2 = uuid.uuid4()
         
         updates = [
-            BulkUpdateOrderItemCommand(order_id=order_id1, status=OrderStatus.CONFIRMED),
+            BulkUpdateOrderItemCommand(order_id=order_id1, status=OrderStatus.PROCESSING),
             BulkUpdateOrderItemCommand(order_id=order_id2, status=OrderStatus.COMPLETED)
         ]
         command = BulkUpdateOrderCommand(updates=updates)
@@ -195,21 +175,12 @@ class TestBulkUpdateOrderUseCase:
         assert result.success_rate == 0.0
         assert all(not r.success for r in result.results)
         assert all(r.error_code == "ORDER_NOT_FOUND" for r in result.results)
+        mock_uow.order_repository.update_statuses.assert_not_called()
     
-    def test_bulk_update_invalid_status_transition(self, bulk_update_use_case, mock_uow, monkeypatch):
+    def test_bulk_update_invalid_status_transition(self, bulk_update_use_case, mock_uow):
         # Arrange
         order_id = uuid.uuid4()
-        order = self._create_mock_order(order_id, OrderStatus.COMPLETED)  # Already completed
-        
-        mock_uow.order_repository.get.return_value = order
-        
-        # Mock update use case to raise InvalidOrderStatusTransition
-        mock_update_use_case = Mock()
-        mock_update_use_case.execute.side_effect = InvalidOrderStatusTransition(
-            message="Cannot transition from COMPLETED to PENDING"
-        )
-        
-        monkeypatch.setattr(bulk_update_use_case, '_update_order_use_case', mock_update_use_case)
+        mock_uow.order_repository.get_statuses.return_value = {order_id: OrderStatus.COMPLETED}  # Already completed
         
         updates = [
             BulkUpdateOrderItemCommand(order_id=order_id, status=OrderStatus.PENDING)
@@ -225,22 +196,72 @@ class TestBulkUpdateOrderUseCase:
         assert result.total_failed == 1
         assert result.results[0].success is False
         assert result.results[0].error_code == "INVALID_STATUS_TRANSITION"
+        assert result.results[0].error_message == "Cannot transition from COMPLETED to PENDING"
     
-    def _create_mock_order(self, order_id: uuid.UUID, status: OrderStatus) -> OrderEntity:
-        """Helper method to create a mock order entity"""
-        order_item = OrderItem(
-            product_id=uuid.uuid4(),
-            quantity=1,
-            price=Money(Decimal("10.99"))
-        )
+    def test_repeated_order_moves_once_to_its_final_status(self, bulk_update_use_case, mock_uow):
+        # Arrange
+        order_id = uuid.uuid4()
+        mock_uow.order_repository.get_statuses.return_value = {order_id: OrderStatus.PENDING}
+        
+        updates = [
+            BulkUpdateOrderItemCommand(order_id=order_id, status=OrderStatus.PROCESSING),
+            BulkUpdateOrderItemCommand(order_id=order_id, status=OrderStatus.SHIPPED)
+        ]
+        command = BulkUpdateOrderCommand(updates=updates)
         
-        return OrderEntity(
-            id=order_id,
-            user_id=uuid.uuid4(),
-            items=[order_item],
-            status=status,
-            total_amount=Decimal("10.99")
+        # Act
+        result = bulk_update_use_case.execute(command)
+        
+        # Assert
+        assert result.total_successful == 2
+        mock_uow.order_repository.update_statuses.assert_called_once_with(
+            [order_id], OrderStatus.PENDING, OrderStatus.SHIPPED
         )
+    
+    def test_orders_changed_concurrently_are_reported(self, bulk_update_use_case, mock_uow):
+        # Arrange - The second order left PENDING after its status was read
+        order_id1 = uuid.uuid4()
+        order_id2 = uuid.uuid4()
+        mock_uow.order_repository.get_statuses.return_value = {
+            order_id1: OrderStatus.PENDING,
+            order_id2: OrderStatus.PENDING
+        }
+        mock_uow.order_repository.update_statuses.side_effect = lambda order_ids, old, new: [order_id1]
+        
+        updates = [
+            BulkUpdateOrderItemCommand(order_id=order_id1, status=OrderStatus.CANCELLED),
+            BulkUpdateOrderItemCommand(order_id=order_id2, status=OrderStatus.CANCELLED)
+        ]
+        command = BulkUpdateOrderCommand(updates=updates)
+        
+        # Act
+        result = bulk_update_use_case.execute(command)
+        
+        # Assert
+        assert result.results[0].success is True
+        assert result.results[1].success is False
+        assert result.results[1].error_code == "CONCURRENT_UPDATE"
+        assert mock_uow.publish.call_count == 1
+    
+    def test_failed_write_rolls_back_and_fails_every_update(self, bulk_update_use_case, mock_uow):
+        # Arrange
+        order_id = uuid.uuid4()
+        mock_uow.order_repository.get_statuses.return_value = {order_id: OrderStatus.PENDING}
+        mock_uow.order_repository.update_statuses.side_effect = RuntimeError("database is gone")
+        
+        command = BulkUpdateOrderCommand(updates=[
+            BulkUpdateOrderItemCommand(order_id=order_id, status=OrderStatus.PROCESSING)
+        ])
+        
+        # Act
+        result = bulk_update_use_case.execute(command)
+        
+        # Assert
+        assert result.total_failed == 1
+        assert result.results[0].error_code == "INTERNAL_ERROR"
+        mock_uow.rollback.assert_called_once()
+        mock_uow.commit.assert_not_called()
+        mock_uow.publish.assert_not_called()
 
 class TestBulkUpdateOrderResponse:
     def test_success_rate_calculation(self):
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.services.product_service.domain.enums.product_status import ProductStatus
+
 class GetProductsByFilterQuery(BaseModel):
     name: Optional[str] = None
     category_id: Optional[UUID] = None
@@ -11,7 +13,13 @@ class GetProductsByFilterQuery(BaseModel):
     is_active: bool = True
     min_stock: Optional[int] = None
     has_stock: Optional[bool] = None
+    status: Optional[ProductStatus] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    in_stock_only: bool = False
     sort_by: str = "name"
     sort_direction: str = "asc"
     page: int = 1
-    items_per_page: int = 20
\ No newline at end of file
+    items_per_page: int = 20
+    cursor: Optional[str] = None
+    count_mode: str = "exact"
\ No newline at end of file
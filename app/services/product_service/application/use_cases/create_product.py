@@ -11,6 +11,7 @@ from app.services.product_service.domain.interfaces.unit_of_work import UnitOfWo
 from app.shared.application.events.event_bus import EventBus
 from app.services.inventory_service.application.events.inventory_create_requested_event import InventoryCreateRequestedEvent
 from app.services.product_service.application.dtos.product_dto import ProductFieldsDto, InventoryFieldsDto
+from app.shared.contracts.product.product_events import ProductCreatedEvent
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -50,6 +51,9 @@ class CreateProductUseCase:
             
         # Commit the transaction
         self._uow.commit()
+        
+        # Notify read models once the product is persisted
+        self._publish_product_created_event(product_entity)
             
         # Prepare response
         response = self._create_product_response_dto(product_entity, inventory_data)
@@ -86,6 +90,18 @@ class CreateProductUseCase:
             logger.warning(f"Failed to publish inventory creation event: {str(event_error)}")
             raise
     
+    def _publish_product_created_event(self, product_entity: ProductEntity) -> None:
+        """Publish event announcing the new product."""
+        self._uow.publish(ProductCreatedEvent(
+            id=str(product_entity.id),
+            name=product_entity.name,
+            description=product_entity.description,
+            brand=product_entity.brand,
+            category_id=str(product_entity.category_id) if product_entity.category_id else None,
+            status=product_entity.status.value,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
+    
     def _create_product_response_dto(self, product_entity: ProductEntity, inventory_data: Dict[str, Any]) -> CreateProductResponseDTO:
         """Create a response DTO with product and inventory information."""
         return CreateProductResponseDTO(
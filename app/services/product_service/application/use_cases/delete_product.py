@@ -7,6 +7,7 @@ from pydantic import BaseModel
 from app.services.product_service.application.commands.delete_product_command import DeleteProductCommand
 from app.services.product_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.shared.application.events.event_bus import EventBus
+from app.shared.contracts.product.product_events import ProductDeletedEvent
 
 class DeleteProductResponseDTO(BaseModel):
     id: UUID
@@ -36,6 +37,13 @@ class DeleteProductUseCase:
         # Commit the transaction
         self._uow.commit()
         
+        # Notify read models that the product is gone
+        self._uow.publish(ProductDeletedEvent(
+            id=str(product.id),
+            name=product.name,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
+        
         # Create response
         response = self._create_response_dto(product.id, success)
         
@@ -16,6 +16,7 @@ class GetProductResponseDTO(BaseModel):
     id: UUID
     product_fields: ProductFieldsDto
     inventory_fields: Optional[InventoryFieldsDto] = None
+    category_name: Optional[str] = None
 
 class GetProductUseCase:
     """
@@ -10,6 +10,7 @@ from app.services.product_service.domain.interfaces.unit_of_work import UnitOfWo
 from app.shared.application.events.event_bus import EventBus
 from app.services.inventory_service.application.events.inventory_update_requested_event import InventoryUpdateRequestedEvent
 from app.services.product_service.application.dtos.product_dto import ProductFieldsDto, InventoryFieldsDto
+from app.shared.contracts.product.product_events import ProductUpdatedEvent
 
 class UpdateProductResponseDTO(BaseModel):
     id: UUID
@@ -33,10 +34,22 @@ class UpdateProductUseCase:
         inventory_fields_dict = self._update_inventory_dict(command, product_fields_entity)   
         self._publish_inventory_event(inventory_fields_dict)
         self._uow.commit()
+        self._publish_product_updated_event(product_fields_entity)
         response = self._create_product_response_dto(product_fields_entity, inventory_fields_dict)
         logger.info(f"Product updated successfully: {response.product_fields.id}")
         return response
 
+    def _publish_product_updated_event(self, product_fields_entity: ProductEntity) -> None:
+        self._uow.publish(ProductUpdatedEvent(
+            id=str(product_fields_entity.id),
+            name=product_fields_entity.name,
+            description=product_fields_entity.description,
+            brand=product_fields_entity.brand,
+            category_id=str(product_fields_entity.category_id) if product_fields_entity.category_id else None,
+            status=product_fields_entity.status.value,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
+
     def _create_product_response_dto(self, product_fields_entity: ProductEntity, inventory_fields_dict: dict) -> UpdateProductResponseDTO:
         return UpdateProductResponseDTO(
             id=product_fields_entity.id,
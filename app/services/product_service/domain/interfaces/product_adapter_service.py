@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
 
 from app.services.product_service.application.dtos.product_dto import InventoryFieldsDto
@@ -22,4 +22,17 @@ class ProductAdapterService(ABC):
         Returns:
             Dictionary with inventory information
         """
-        pass 
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_product_sales(self, limit: Optional[int] = None) -> List[Tuple[UUID, int]]:
+        """
+        Get the units ordered per product from the order service.
+        
+        Args:
+            limit: Keep only this many best selling products, all when None
+            
+        Returns:
+            (product id, units ordered) pairs, best sellers first
+        """
+        pass
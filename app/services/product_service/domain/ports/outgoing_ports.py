@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
 from app.services.product_service.domain.requests.get_inventory_by_id_request import GetInventoryByIdRequest
 
 
 class ProductServicePort(ABC):
     @abstractmethod
     def get_inventory_by_id(self, request: GetInventoryByIdRequest) -> Dict[str,Any]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_product_sales(self, limit: Optional[int] = None) -> List[Tuple[UUID, int]]:
+        pass
@@ -1,12 +1,18 @@
 
 
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
 from app.services.product_service.application.dtos.product_dto import InventoryFieldsDto
 from app.services.product_service.domain.ports.outgoing_ports import ProductServicePort
 from app.services.product_service.domain.requests.get_inventory_by_id_request import GetInventoryByIdRequest
 from app.shared.acl.unified_acl import ServiceContext, UnifiedACL
 from app.shared.domain.enums.enums import ServiceType
 
+# Configure logger
+logger = logging.getLogger(__name__)
+
 
 class ProductServiceAdapter(ProductServicePort):
     def __init__(self, acl: UnifiedACL):
@@ -24,4 +30,17 @@ class ProductServiceAdapter(ProductServicePort):
         
             
         return result.data
-   
\ No newline at end of file
+
+    def get_product_sales(self, limit: Optional[int] = None) -> List[Tuple[UUID, int]]:
+        """Units ordered per product, best sellers first; empty when the order service cannot answer"""
+        result = self._acl.execute_service_operation(
+            ServiceContext(
+                service_type=ServiceType.ORDER,
+                operation="GET_PRODUCT_SALES",
+                data={"limit": limit}
+            )
+        )
+        if not result.success:
+            logger.warning(f"Could not get product sales from order service: {result.error}")
+            return []
+        return [(UUID(entry['product_id']), entry['units']) for entry in result.data.get('products', [])]
@@ -0,0 +1,171 @@
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.services.inventory_service.application.events.inventory_create_requested_event import InventoryCreateRequestedEvent
+from app.services.inventory_service.application.events.inventory_update_requested_event import InventoryUpdateRequestedEvent
+from app.services.inventory_service.application.events.stock_release_requested_event import StockReleaseRequestedEvent
+from app.services.inventory_service.application.events.stock_reserved_event import StockReservedEvent
+from app.shared.application.events.event_bus import EventBus
+from app.shared.contracts.category.category_events import CategoryDeletedEvent, CategoryUpdatedEvent
+from app.shared.contracts.product.product_events import (
+    ProductCreatedEvent,
+    ProductDeletedEvent,
+    ProductStatusChangedEvent,
+    ProductUpdatedEvent
+)
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30.0
+
+
+class ProductDtoCache:
+    """
+    In-process LRU cache of fully built product DTOs (product, inventory, category name).
+
+    Entries are keyed by product id and version. Every write event for a product
+    bumps its version, so a DTO read from the database before the write can never
+    be stored afterwards: put() only accepts the version captured before loading.
+    Version counters are bounded too; a dropped counter falls back to the highest
+    version dropped so far, which only ever causes extra misses.
+
+    Events only reach the worker that handled the write, so entries also expire
+    after ttl_seconds, which bounds how long another worker serves a product,
+    price or stock level that changed elsewhere.
+    """
+
+    def __init__(self, event_bus: Optional[EventBus] = None, max_entries: int = 1024,
+                 ttl_seconds: Optional[float] = None):
+        self._entries: "OrderedDict[str, Tuple[int, Any, float]]" = OrderedDict()
+        self._versions: "OrderedDict[str, int]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_seconds = DEFAULT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._max_versions = max_entries * 4
+        self._sequence = 0
+        self._version_floor = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.expirations = 0
+        if event_bus:
+            self._register_event_handlers(event_bus)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _register_event_handlers(self, event_bus: EventBus) -> None:
+        """Evict products on their own writes, inventory writes and stock releases or reservations"""
+        for event_type in (ProductCreatedEvent, ProductUpdatedEvent, ProductDeletedEvent, ProductStatusChangedEvent):
+            event_bus.subscribe(event_type, lambda event: self._handle_event(event, [event.id]))
+        for event_type in (InventoryCreateRequestedEvent, InventoryUpdateRequestedEvent):
+            event_bus.subscribe(event_type, lambda event: self._handle_event(event, [event.product_id]))
+        for event_type in (StockReleaseRequestedEvent, StockReservedEvent):
+            event_bus.subscribe(event_type, lambda event: self._handle_event(
+                event, [item.get('product_id') for item in event.items if item.get('product_id')]
+            ))
+        # The DTO carries the category name
+        for event_type in (CategoryUpdatedEvent, CategoryDeletedEvent):
+            event_bus.subscribe(event_type, self._handle_category_changed)
+
+    def version(self, product_id: Any) -> int:
+        """Current version of a product; capture it before loading the DTO"""
+        with self._lock:
+            return self._versions.get(str(product_id), self._version_floor)
+
+    def get(self, product_id: Any) -> Optional[Any]:
+        """
+        Get a cached DTO.
+
+        Returns:
+            A copy of the DTO, or None if it is not cached at the current version or has expired
+        """
+        key = str(product_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != self._versions.get(key, self._version_floor):
+                self.misses += 1
+                return None
+            if entry[2] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            dto = entry[1]
+        return copy.deepcopy(dto)
+
+    def put(self, product_id: Any, version: int, dto: Any) -> bool:
+        """
+        Store a DTO loaded at the given version.
+
+        The DTO is kept as is, not copied; get() copies it on the way out, so
+        only the caller that loaded it must not mutate it.
+
+        Returns:
+            False if the product was written since the version was captured
+        """
+        key = str(product_id)
+        with self._lock:
+            if version != self._versions.get(key, self._version_floor):
+                return False
+            self._entries[key] = (version, dto, time.monotonic() + self._ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, product_ids: Iterable[Any]) -> None:
+        """Bump the version of the given products and drop their DTOs"""
+        with self._lock:
+            for product_id in product_ids:
+                key = str(product_id)
+                self._sequence += 1
+                self._versions[key] = self._sequence
+                self._versions.move_to_end(key)
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+            while len(self._versions) > self._max_versions:
+                _, dropped = self._versions.popitem(last=False)
+                self._version_floor = max(self._version_floor, dropped)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self._max_entries,
+                "ttl_seconds": self._ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "expirations": self.expirations,
+            }
+
+    def _handle_event(self, event: Any, product_ids: Iterable[Any]) -> None:
+        try:
+            self.invalidate(product_ids)
+        except Exception as e:
+            logger.error(f"Failed to evict cached products for {type(event).__name__}: {str(e)}")
+
+    def _handle_category_changed(self, event: Any) -> None:
+        try:
+            with self._lock:
+                affected = [
+                    key for key, (_, dto, _) in self._entries.items()
+                    if str(getattr(dto.product_fields, 'category_id', None)) == event.id
+                ]
+            self.invalidate(affected)
+        except Exception as e:
+            logger.error(f"Failed to evict cached products of category {event.id}: {str(e)}")
@@ -0,0 +1,288 @@
+"""
+Set-based import of supplier catalogs.
+
+Rows are read lazily from an NDJSON or CSV stream, validated a chunk at a time
+and written with one multi-row INSERT per table and chunk, all inside a single
+transaction. Memory stays flat whatever the size of the upload: only the
+current chunk and a bounded list of row errors are held.
+"""
+
+import codecs
+import csv
+import json
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from itertools import islice
+from typing import Any, Dict, IO, Iterable, Iterator, List, Tuple
+
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.services.category_service.infrastructure.persistence.models.category import Category
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.product_service.application.commands.create_product_command import CreateProductCommand
+from app.services.product_service.domain.enums.product_status import ProductStatus
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.services.product_service.infrastructure.search.product_search_backend import get_search_backend
+from app.shared.domain.exceptions.common_errors import BaseAPIException, ValidationError
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("ndjson", "csv")
+IMPORT_MODES = ("partial", "atomic")
+
+PRODUCT_COLUMNS = ("name", "description", "brand", "category_id", "dosage_form", "strength", "package", "image_url", "status")
+INVENTORY_COLUMNS = ("price", "quantity", "max_stock", "min_stock", "expiry_date", "supplier_id")
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+
+@dataclass
+class ImportReport:
+    """Outcome of a catalog import"""
+    mode: str
+    total_rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    committed: bool = False
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    errors_truncated: bool = False
+
+    def add_error(self, row: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": message})
+        else:
+            self.errors_truncated = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "total_rows": self.total_rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            "committed": self.committed,
+            "errors": self.errors,
+            "errors_truncated": self.errors_truncated,
+        }
+
+
+def read_records(stream: IO[bytes], fmt: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Lazily decode an uploaded catalog.
+
+    Args:
+        stream: Binary stream of the upload
+        fmt: "ndjson" (one JSON object per line) or "csv" (header row, flat columns)
+
+    Yields:
+        Tuples of the 1-based row number and the decoded record (or the decoding error)
+    """
+    text_stream = codecs.getreader("utf-8")(stream, errors="replace")
+    if fmt == "csv":
+        reader = csv.DictReader(text_stream)
+        for row_number, row in enumerate(reader, start=1):
+            yield row_number, {key: (value if value != "" else None) for key, value in row.items() if key}
+        return
+    row_number = 0
+    for line in text_stream:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            yield row_number, json.loads(line)
+        except ValueError as e:
+            yield row_number, ValidationError(f"Invalid JSON: {str(e)}")
+
+
+def _to_command_data(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Accept both the nested API shape and flat CSV-style records"""
+    if "product_fields" in record or "inventory_fields" in record:
+        return record
+    return {
+        "product_fields": {key: record.get(key) for key in PRODUCT_COLUMNS if record.get(key) is not None},
+        "inventory_fields": {key: record.get(key) for key in INVENTORY_COLUMNS if record.get(key) is not None},
+    }
+
+
+def _validation_message(error: Exception) -> str:
+    if isinstance(error, PydanticValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+        )
+    if isinstance(error, BaseAPIException):
+        return error.message
+    return str(error)
+
+
+def _as_datetime(value: Any) -> Any:
+    """Inventory expiry dates are stored in a DateTime column"""
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+    return value
+
+
+class CatalogImporter:
+    """
+    Import products with their inventory using set-based inserts.
+
+    In "partial" mode valid rows are committed and invalid rows reported. In
+    "atomic" mode the whole upload is validated and nothing is committed unless
+    every row is valid.
+    """
+
+    def __init__(self, session: Session, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._session = session
+        self._chunk_size = chunk_size
+        self._search_backend = get_search_backend(session)
+
+    def run(self, records: Iterable[Tuple[int, Any]], mode: str = "partial") -> ImportReport:
+        """
+        Validate and insert all records in one transaction.
+
+        Args:
+            records: (row number, record) tuples, e.g. from read_records
+            mode: "partial" or "atomic"
+
+        Returns:
+            The import report; committed tells whether anything was written
+        """
+        report = ImportReport(mode=mode)
+        iterator = iter(records)
+        try:
+            while True:
+                chunk = list(islice(iterator, self._chunk_size))
+                if not chunk:
+                    break
+                report.total_rows += len(chunk)
+                valid = self._validate_chunk(chunk, report)
+                # In atomic mode the first error stops writing, but validation goes on to report every row
+                if mode == "atomic" and report.failed:
+                    continue
+                report.imported += self._insert_chunk(valid, report, mode)
+
+            if report.imported and not (mode == "atomic" and report.failed):
+                self._session.commit()
+                report.committed = True
+            else:
+                self._session.rollback()
+                report.imported = 0
+        except Exception:
+            self._session.rollback()
+            raise
+
+        logger.info(
+            f"Catalog import finished: {report.total_rows} rows, {report.imported} imported, "
+            f"{report.failed} failed, committed={report.committed}"
+        )
+        return report
+
+    def _validate_chunk(self, chunk: List[Tuple[int, Any]], report: ImportReport) -> List[Tuple[int, CreateProductCommand]]:
+        """Validate a chunk, checking referenced categories with one query"""
+        commands: List[Tuple[int, CreateProductCommand]] = []
+        first_error = len(report.errors)
+        for row_number, record in chunk:
+            if isinstance(record, Exception):
+                report.add_error(row_number, _validation_message(record))
+                continue
+            if not isinstance(record, dict):
+                report.add_error(row_number, "Record must be an object")
+                continue
+            try:
+                commands.append((row_number, CreateProductCommand(**_to_command_data(record))))
+            except (PydanticValidationError, BaseAPIException, TypeError, ValueError) as e:
+                report.add_error(row_number, _validation_message(e))
+
+        category_ids = {command.product_fields.category_id for _, command in commands if command.product_fields.category_id}
+        if category_ids:
+            known = {
+                row[0] for row in self._session.query(Category.id).filter(Category.id.in_(category_ids)).all()
+            }
+            checked = []
+            for row_number, command in commands:
+                category_id = command.product_fields.category_id
+                if category_id and category_id not in known:
+                    report.add_error(row_number, f"Category not found: {category_id}")
+                else:
+                    checked.append((row_number, command))
+            commands = checked
+            report.errors[first_error:] = sorted(report.errors[first_error:], key=lambda error: error["row"])
+        return commands
+
+    def _insert_chunk(self, commands: List[Tuple[int, CreateProductCommand]], report: ImportReport, mode: str) -> int:
+        """
+        Insert a validated chunk with one multi-row INSERT per table.
+
+        In partial mode a chunk rejected by the database is retried row by row
+        inside savepoints so only the offending rows are reported. In atomic
+        mode the rejection ends the import.
+        """
+        if not commands:
+            return 0
+        if mode == "atomic":
+            try:
+                self._write(commands)
+                return len(commands)
+            except SQLAlchemyError as e:
+                self._session.rollback()
+                for row_number, _ in commands:
+                    report.add_error(row_number, str(getattr(e, "orig", e)))
+                return 0
+        try:
+            with self._session.begin_nested():
+                self._write(commands)
+            return len(commands)
+        except SQLAlchemyError as e:
+            logger.warning(f"Chunk insert failed, retrying row by row: {str(e)}")
+        inserted = 0
+        for row_number, command in commands:
+            try:
+                with self._session.begin_nested():
+                    self._write([(row_number, command)])
+                inserted += 1
+            except SQLAlchemyError as e:
+                report.add_error(row_number, str(getattr(e, "orig", e)))
+        return inserted
+
+    def _write(self, commands: List[Tuple[int, CreateProductCommand]]) -> None:
+        now = datetime.now(timezone.utc)
+        product_rows = []
+        inventory_rows = []
+        for _, command in commands:
+            product_id = uuid.uuid4()
+            product_fields = command.product_fields
+            product_rows.append({
+                "id": product_id,
+                "category_id": product_fields.category_id,
+                "name": product_fields.name,
+                "description": product_fields.description,
+                "brand": product_fields.brand,
+                "dosage_form": product_fields.dosage_form,
+                "strength": product_fields.strength,
+                "package": product_fields.package,
+                "image_url": product_fields.image_url,
+                "status": product_fields.status or ProductStatus.ACTIVE,
+                "created_at": now,
+                "updated_at": now,
+            })
+            inventory_fields = command.inventory_fields
+            inventory_rows.append({
+                "id": uuid.uuid4(),
+                "product_id": product_id,
+                "quantity": inventory_fields.quantity,
+                "price": inventory_fields.price,
+                "max_stock": inventory_fields.max_stock,
+                "min_stock": inventory_fields.min_stock,
+                "expiry_date": _as_datetime(inventory_fields.expiry_date),
+                "supplier_id": inventory_fields.supplier_id,
+                "last_updated_at": now,
+            })
+        self._session.execute(insert(ProductModel.__table__), product_rows)
+        self._session.execute(insert(InventoryModel.__table__), inventory_rows)
+        self._search_backend.index(self._session, [row["id"] for row in product_rows])
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, Enum, ForeignKey, String, DateTime
+from sqlalchemy import Column, Enum, ForeignKey, Index, String, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 from app.shared.database_types import UUID
@@ -9,6 +9,14 @@ from app.services.product_service.domain.enums.product_status import ProductStat
 
 class ProductModel(db.Model):
     __tablename__ = 'products'
+    __table_args__ = (
+        # Backs the (name, id) keyset pagination of product lists
+        Index('ix_products_name_id', 'name', 'id'),
+        # Backs sort_by=created_at (newest first reads it backwards)
+        Index('ix_products_created_at_id', 'created_at', 'id'),
+        # max(updated_at) of the product list marker
+        Index('ix_products_updated_at', 'updated_at'),
+    )
     id = Column(UUID(as_uuid=True), default=uuid.uuid4, primary_key=True)
     category_id = Column(UUID(as_uuid=True), ForeignKey('categories.id'), nullable=True)
     name = Column(String(255), nullable=False)
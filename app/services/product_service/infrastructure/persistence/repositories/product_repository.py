@@ -8,6 +8,7 @@ import logging
 from app.services.product_service.domain.entities.product_entity import ProductEntity
 from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
 from app.services.product_service.domain.interfaces.repository import ProductRepository as ProductRepositoryInterface
+from app.services.product_service.infrastructure.search.product_search_backend import ProductSearchBackend, get_search_backend
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -15,6 +16,14 @@ logger = logging.getLogger(__name__)
 class ProductRepository(ProductRepositoryInterface):
     def __init__(self, session: Session):
         self._session = session
+        self._search_backend = None
+
+    @property
+    def search_backend(self) -> ProductSearchBackend:
+        """Full-text search backend kept in sync with product writes"""
+        if not self._search_backend:
+            self._search_backend = get_search_backend(self._session)
+        return self._search_backend
 
     def add(self, entity: ProductEntity) -> ProductEntity:
         """Add a new product to the database"""
@@ -32,6 +41,7 @@ class ProductRepository(ProductRepositoryInterface):
         )
         self._session.add(model)
         self._session.flush()
+        self.search_backend.index(self._session, [model.id])
         logger.info(f"Product added with ID: {model.id}")
         return self._to_domain(model)
 
@@ -88,6 +98,7 @@ class ProductRepository(ProductRepositoryInterface):
         model.updated_at = datetime.utcnow()
         
         self._session.flush()
+        self.search_backend.index(self._session, [model.id])
         logger.info(f"Product updated successfully: {model.id}")
         return self._to_domain(model)
 
@@ -101,6 +112,7 @@ class ProductRepository(ProductRepositoryInterface):
             return False
         
         # Hard delete approach
+        self.search_backend.remove(self._session, [model.id])
         self._session.delete(model)
         self._session.flush()
         logger.info(f"Product deleted successfully: {product_id}")
@@ -1,100 +1,198 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func, text
+from sqlalchemy.orm import Session, contains_eager, joinedload
+from sqlalchemy import or_, and_, func, select, text
 from math import ceil
 import logging
 from datetime import datetime, timedelta, timezone
 
+from app.services.category_service.infrastructure.persistence.models.category import Category
 from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
 from app.services.product_service.application.queries.get_product_by_id import GetProductByIdQuery
 from app.services.product_service.application.queries.get_products_by_filter import GetProductsByFilterQuery
-from app.services.product_service.application.use_cases.get_product import GetProductResponseDTO, GetProductUseCase
+from app.services.product_service.application.use_cases.get_product import GetProductResponseDTO
 from app.services.product_service.domain.interfaces.unit_of_work import UnitOfWork
 from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
 from app.services.product_service.application.dtos.product_dto import ProductFieldsDto, InventoryFieldsDto
+from app.services.product_service.infrastructure.search.product_search_backend import ProductSearchBackend, get_search_backend
+from app.services.product_service.infrastructure.search.product_facets import PRODUCT_FACET_NAMESPACE, facet_counts
+from app.services.inventory_service.application.events.inventory_create_requested_event import InventoryCreateRequestedEvent
+from app.services.inventory_service.application.events.inventory_update_requested_event import InventoryUpdateRequestedEvent
+from app.services.inventory_service.application.events.stock_release_requested_event import StockReleaseRequestedEvent
+from app.services.inventory_service.application.events.stock_reserved_event import StockReservedEvent
+from app.shared.contracts.product.product_events import (
+    ProductCreatedEvent,
+    ProductDeletedEvent,
+    ProductStatusChangedEvent,
+    ProductUpdatedEvent,
+    ProductsImportedEvent
+)
+from app.shared.infrastructure.persistence.list_counts import CountMode, ListCountCache, fetch_page, filter_signature
+from app.shared.utils.cursor_pagination import InvalidCursorError, decode_cursor, encode_cursor, keyset_condition
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Cursor kind for product listings ordered by (name, id)
+PRODUCT_CURSOR = "products:name"
+
+# Keyset columns of each product ordering (tie-breaker last) and how to read them from a row.
+# Each leads an index: ix_products_name_id, ix_products_created_at_id,
+# ix_inventory_price_product_id and ix_inventory_quantity_product_id.
+PRODUCT_SORTS = {
+    "name": ((ProductModel.name, ProductModel.id), lambda product: (product.name, product.id)),
+    "created_at": ((ProductModel.created_at, ProductModel.id), lambda product: (product.created_at, product.id)),
+    "price": (
+        (InventoryModel.price, InventoryModel.product_id),
+        lambda product: (product.inventory.price, product.id)
+    ),
+    "stock": (
+        (InventoryModel.quantity, InventoryModel.product_id),
+        lambda product: (product.inventory.quantity, product.id)
+    ),
+}
+# Orderings on inventory columns only cover products that have a value for them
+INVENTORY_SORTS = ("price", "stock")
+
+# Count cache namespace of product listings and the writes that change their totals
+PRODUCT_LIST_NAMESPACE = "products"
+PRODUCT_LIST_WRITE_EVENTS = (
+    ProductCreatedEvent,
+    ProductUpdatedEvent,
+    ProductDeletedEvent,
+    ProductStatusChangedEvent,
+    ProductsImportedEvent,
+    InventoryCreateRequestedEvent,
+    InventoryUpdateRequestedEvent,
+    StockReleaseRequestedEvent,
+    StockReservedEvent,
+)
+
+# Query fields that do not change which products are counted
+PAGING_FIELDS = ("page", "items_per_page", "cursor", "count_mode", "sort_by", "sort_direction")
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive database timestamps as UTC"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
 class ProductQueryService:
     """
     Query service for optimized product read operations with advanced filtering and analytics.
     """
     
-    def __init__(self, session: Session, uow: UnitOfWork):
+    def __init__(self, session: Session, uow: UnitOfWork, count_cache: Optional[ListCountCache] = None):
         """
         Initialize the query service with a database session.
         
         Args:
             session: SQLAlchemy database session
             uow: Unit of Work for transaction management
+            count_cache: Shared cache of list totals for the "cached" count mode
         """
         self._session = session
         self._uow = uow
-        self._get_product_use_case = GetProductUseCase(self._uow)
+        self._count_cache = count_cache
+        self._search_backend = None
+
+    @property
+    def search_backend(self) -> ProductSearchBackend:
+        """Full-text search backend for the current database"""
+        if not self._search_backend:
+            self._search_backend = get_search_backend(self._session)
+        return self._search_backend
     
-    def get_by_id(self, query: GetProductByIdQuery) -> GetProductResponseDTO:
-        """Get a single product by ID with inventory data"""
-        product_fields = self._get_product_use_case.execute(query)
-        # Get inventory information if available
-        product_model = self._session.query(ProductModel).filter(ProductModel.id == product_fields.id).first()
-        inventory_data = self._get_inventory_data(product_model)
-        # Create response DTO
-        response = GetProductResponseDTO(
-                id=product_fields.id,
-                product_fields=product_fields,
-                inventory_fields=inventory_data
-            )
-        return response
+    def get_by_id(self, query: GetProductByIdQuery) -> Optional[GetProductResponseDTO]:
+        """Get a single product by ID with inventory data in one query"""
+        product_model = self._base_query().filter(ProductModel.id == query.id).first()
+        if not product_model:
+            return None
+        return self._to_response_dto(product_model)
+    
+    def get_many_by_ids(self, product_ids: List[UUID]) -> List[GetProductResponseDTO]:
+        """Get several products by ID with inventory and category in one query"""
+        if not product_ids:
+            return []
+        products = self._base_query().filter(ProductModel.id.in_(product_ids)).all()
+        return [self._to_response_dto(product) for product in products]
+
+    def get_names_by_ids(self, product_ids: List[UUID]) -> Dict[UUID, str]:
+        """Get the names of several products in one query, without loading inventory"""
+        if not product_ids:
+            return {}
+        rows = self._session.query(ProductModel.id, ProductModel.name).filter(
+            ProductModel.id.in_(set(product_ids))
+        ).all()
+        return {product_id: name for product_id, name in rows}
+    
+    def get_recent_product_ids(self, limit: int, exclude: Optional[List[UUID]] = None) -> List[UUID]:
+        """IDs of the most recently updated products, leaving out the excluded ones"""
+        if limit <= 0:
+            return []
+        query = self._session.query(ProductModel.id)
+        if exclude:
+            query = query.filter(~ProductModel.id.in_(exclude))
+        return [row[0] for row in query.order_by(ProductModel.updated_at.desc()).limit(limit).all()]
+    
+    def get_updated_at(self, product_id: UUID) -> Optional[datetime]:
+        """
+        Latest write time of a product, its inventory and its category, for conditional GET validators.
+
+        Stock and category writes made by another worker do not touch the product's
+        own updated_at, so their timestamps are read along with it.
+        """
+        row = self._session.query(
+            ProductModel.updated_at, InventoryModel.last_updated_at, Category.updated_at
+        ).outerjoin(ProductModel.inventory).outerjoin(ProductModel.category).filter(
+            ProductModel.id == product_id
+        ).first()
+        if not row:
+            return None
+        return max(_as_utc(stamp) for stamp in row if stamp is not None)
+    
+    def get_list_marker(self) -> tuple:
+        """
+        Row counts and newest write times behind product listings, in one round trip.
+
+        Folded into the list ETag so a write made on another worker changes it too.
+        """
+        return tuple(self._session.execute(select(
+            select(func.count()).select_from(ProductModel).scalar_subquery(),
+            select(func.max(ProductModel.updated_at)).scalar_subquery(),
+            select(func.max(InventoryModel.last_updated_at)).scalar_subquery(),
+            select(func.count()).select_from(Category).scalar_subquery(),
+            select(func.max(Category.updated_at)).scalar_subquery()
+        )).one())
     
     def list(self, filters: GetProductsByFilterQuery) -> Dict[str, Any]:
         """List products with advanced filtering and pagination"""
         logger.info(f"Query service listing products with filters")
         # Build the query with filters
-        query = self._session.query(ProductModel)
+        query = self._base_query()
         
         query = self._apply_filters(query, filters)
         
-        # Get total count for pagination
-        total_count = query.count()
-        
-        # Apply pagination
-        offset = (filters.page - 1) * filters.items_per_page
-        products = query.order_by(ProductModel.name).offset(offset).limit(filters.items_per_page).all()
-        
-        # Calculate pagination metadata
-        total_pages = ceil(total_count / filters.items_per_page) if total_count > 0 else 1
+        # Read the page and its total with the requested count strategy
+        products, page, next_cursor, total_count, estimated = self._page_sorted(
+            query, filters, kind="list", unfiltered=not self._has_filters(filters)
+        )
         
         # Convert to DTOs
-        items = [{           
-            "id": str(product.id),
-            "name": product.name,
-            "description": product.description,
-            "price": self._get_inventory_data(product).price if self._get_inventory_data(product) else 0.0,
-            "imageUrl": product.image_url,
-            "inStock": self._get_inventory_data(product).quantity > 0 if self._get_inventory_data(product) else False,
-            "stockQuantity": self._get_inventory_data(product).quantity if self._get_inventory_data(product) else 0,
-            "category": product.category.name,
-            "manufacturer": product.brand,
-            "metadata": {
-              "prescription": False,
-              "dosage": product.strength,
-              "form": product.dosage_form,
-            },
-            }     
-                 for product in products]
+        items = [self._to_list_item(product) for product in products]
         
         # Build response
         result = {
             "items": items,
             "total_items": total_count,
-            "page": filters.page,
+            "total_estimated": estimated,
+            "page": page,
             "page_size": filters.items_per_page,
-            "total_pages": total_pages
+            "total_pages": self._total_pages(total_count, filters.items_per_page),
+            "next_cursor": next_cursor
         }
         
-        logger.info(f"Query service found {total_count} products (page {filters.page} of {total_pages})")
+        logger.info(f"Query service listed {len(items)} products (total: {total_count})")
         return result
     
     def search(self, query: GetProductsByFilterQuery) -> Dict[str, Any]:
@@ -110,18 +208,24 @@ class ProductQueryService:
         logger.info(f"Query service searching products with advanced criteria")
         
         # Build the query with search filters
-        sql_query = self._session.query(ProductModel)
-        sql_query = self._apply_search_filters(sql_query, query)
-        
-        # Get total count for pagination
-        total_count = sql_query.count()
-        
-        # Apply pagination
-        offset = (query.page - 1) * query.items_per_page
-        products = sql_query.order_by(ProductModel.name).offset(offset).limit(query.items_per_page).all()
-        
-        # Calculate pagination metadata
-        total_pages = ceil(total_count / query.items_per_page) if total_count > 0 else 1
+        sql_query = self._base_query()
+        sql_query, relevance_order = self._apply_search_filters(sql_query, query)
+        
+        # Apply pagination, best matches first when searching by text unless another order is asked for
+        if relevance_order is not None and query.sort_by not in PRODUCT_SORTS:
+            if query.cursor:
+                raise InvalidCursorError("Cursor pagination is not available for relevance ranked searches, use page numbers")
+            ordered = sql_query.order_by(relevance_order, ProductModel.name, ProductModel.id) \
+                .offset((query.page - 1) * query.items_per_page)
+            products, total_count, estimated = fetch_page(
+                sql_query, ordered, query.items_per_page,
+                **self._count_options(query, kind="search", unfiltered=False)
+            )
+            page, next_cursor = query.page, None
+        else:
+            products, page, next_cursor, total_count, estimated = self._page_sorted(
+                sql_query, query, kind="search", unfiltered=not self._has_filters(query)
+            )
         
         # Convert to DTOs
         items = [self._to_dto(product) for product in products]
@@ -130,14 +234,43 @@ class ProductQueryService:
         result = {
             "items": items,
             "total_items": total_count,
-            "page": query.page,
+            "total_estimated": estimated,
+            "page": page,
             "page_size": query.items_per_page,
-            "total_pages": total_pages
+            "total_pages": self._total_pages(total_count, query.items_per_page),
+            "next_cursor": next_cursor
         }
         
-        logger.info(f"Search found {total_count} products (page {query.page} of {total_pages})")
+        logger.info(f"Search found {total_count} products")
         return result
 
+    def facets(self, query: GetProductsByFilterQuery) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Facet counts (category, brand, dosage form, in stock) of a search's filtered set.
+        
+        Computed with one grouped aggregate query and kept in the count cache per
+        filter signature until a product, inventory or category write arrives.
+        
+        Args:
+            query: Search query with filters; paging and sorting are ignored
+            
+        Returns:
+            Facet name to a list of {value, count}, largest first
+        """
+        signature = filter_signature(query.model_dump(), ignore=PAGING_FIELDS)
+        if self._count_cache is not None:
+            cached = self._count_cache.get(PRODUCT_FACET_NAMESPACE, signature)
+            if cached is not None:
+                return cached
+        
+        filtered, _ = self._apply_search_filters(
+            self._session.query(ProductModel).outerjoin(ProductModel.inventory), query
+        )
+        facets = facet_counts(self._session, filtered)
+        if self._count_cache is not None:
+            self._count_cache.set(PRODUCT_FACET_NAMESPACE, signature, facets)
+        return facets
+
     def get_low_stock_products(self, threshold_percentage: float = 100, page: int = 1, page_size: int = 20):
         """
         Get products with stock levels below the specified threshold.
@@ -154,8 +287,7 @@ class ProductQueryService:
         
         # Query products with their inventory
         query = (
-            self._session.query(ProductModel)
-            .join(InventoryModel, ProductModel.id == InventoryModel.product_id)
+            self._base_query(inventory_required=True)
             .filter(
                 InventoryModel.quantity <= InventoryModel.min_stock * threshold_percentage / 100
             )
@@ -165,12 +297,10 @@ class ProductQueryService:
             )
         )
         
-        # Get total count
-        total_count = query.count()
-        
-        # Apply pagination
-        offset = (page - 1) * page_size
-        products = query.offset(offset).limit(page_size).all()
+        # Read the page and the total in one round trip
+        products, total_count, _ = fetch_page(
+            query, query.offset((page - 1) * page_size), page_size
+        )
         
         # Calculate pagination metadata
         total_pages = ceil(total_count / page_size) if total_count > 0 else 1
@@ -219,8 +349,7 @@ class ProductQueryService:
         
         # Query products with their inventory that are expiring
         query = (
-            self._session.query(ProductModel)
-            .join(InventoryModel, ProductModel.id == InventoryModel.product_id)
+            self._base_query(inventory_required=True)
             .filter(
                 InventoryModel.expiry_date.isnot(None),
                 InventoryModel.expiry_date <= expiry_cutoff,
@@ -230,12 +359,10 @@ class ProductQueryService:
             .order_by(InventoryModel.expiry_date)  # Earliest expiring first
         )
         
-        # Get total count
-        total_count = query.count()
-        
-        # Apply pagination
-        offset = (page - 1) * page_size
-        products = query.offset(offset).limit(page_size).all()
+        # Read the page and the total in one round trip
+        products, total_count, _ = fetch_page(
+            query, query.offset((page - 1) * page_size), page_size
+        )
         
         # Calculate pagination metadata
         total_pages = ceil(total_count / page_size) if total_count > 0 else 1
@@ -459,21 +586,18 @@ class ProductQueryService:
         return query
 
     def _apply_search_filters(self, query, search_query: GetProductsByFilterQuery):
-        """Apply advanced search filters to a query"""
+        """
+        Apply advanced search filters to a query.
+        
+        Returns:
+            Tuple of the filtered query and the relevance ORDER BY clause (None without a text search)
+        """
         filter_conditions = []
+        relevance_order = None
         
-        # Text search across multiple fields
+        # Full-text search across name, brand, dosage form, strength and description
         if search_query.name:
-            search_term = f"%{search_query.name}%"
-            filter_conditions.append(
-                or_(
-                    ProductModel.name.ilike(search_term),
-                    ProductModel.description.ilike(search_term),
-                    ProductModel.brand.ilike(search_term),
-                    ProductModel.dosage_form.ilike(search_term),
-                    ProductModel.strength.ilike(search_term)
-                )
-            )
+            query, relevance_order = self.search_backend.apply(query, search_query.name)
         
         # Category filter
         if search_query.category_id:
@@ -487,33 +611,120 @@ class ProductQueryService:
         if hasattr(search_query, 'status') and search_query.status:
             filter_conditions.append(ProductModel.status == search_query.status)
         
-        # Price filters (requires joining with inventory)
-        if hasattr(search_query, 'min_price') or hasattr(search_query, 'max_price'):
-            query = query.join(InventoryModel, ProductModel.id == InventoryModel.product_id)
-            
-            if hasattr(search_query, 'min_price') and search_query.min_price:
-                filter_conditions.append(InventoryModel.price >= search_query.min_price)
-            
-            if hasattr(search_query, 'max_price') and search_query.max_price:
-                filter_conditions.append(InventoryModel.price <= search_query.max_price)
+        # Price filters (inventory is already joined by the base query)
+        if getattr(search_query, 'min_price', None):
+            filter_conditions.append(InventoryModel.price >= search_query.min_price)
+        
+        if getattr(search_query, 'max_price', None):
+            filter_conditions.append(InventoryModel.price <= search_query.max_price)
         
         # In stock only filter
-        if hasattr(search_query, 'in_stock_only') and search_query.in_stock_only:
-            # Check if we already joined inventory table
-            joined_tables = [mapper.class_ for mapper in query.column_descriptions if hasattr(mapper, 'class_')]
-            if InventoryModel not in joined_tables:
-                query = query.join(InventoryModel, ProductModel.id == InventoryModel.product_id)
+        if getattr(search_query, 'in_stock_only', False):
             filter_conditions.append(InventoryModel.quantity > 0)
         
         # Apply all filters
         if filter_conditions:
             query = query.filter(and_(*filter_conditions))
         
-        return query
+        return query, relevance_order
     
-    def _to_dto(self, product_model) -> Dict[str, Any]:
-        """Convert a product model to a DTO"""
-        product_fields = ProductFieldsDto(
+    def _page_sorted(self, query, filters: GetProductsByFilterQuery, kind: str, unfiltered: bool = False):
+        """
+        Order a product query by the requested sort key and read one page of it with its total.
+        
+        Without a cursor the page is read by number (OFFSET). With a cursor the
+        query seeks past the sort key it carries, which stays cheap however deep
+        the client pages. Unknown sort fields fall back to name. Price and stock
+        orderings leave out products without inventory or without that value.
+        
+        Args:
+            query: Filtered product query
+            filters: Listing query holding sort_by, sort_direction, page, items_per_page, cursor and count_mode
+            kind: Listing name used in the count cache signature ("list" or "search")
+            unfiltered: Whether the listing covers every product (allows estimated totals)
+            
+        Returns:
+            Tuple of the products, the page number (None in cursor mode), the next page's
+            cursor, the total (None when not requested) and whether the total is an estimate
+        """
+        sort_by = filters.sort_by if filters.sort_by in PRODUCT_SORTS else "name"
+        descending = filters.sort_direction == "desc"
+        columns, sort_key = PRODUCT_SORTS[sort_by]
+        if sort_by in INVENTORY_SORTS:
+            query = query.filter(columns[0].isnot(None))
+            kind, unfiltered = f"{kind}:{sort_by}", False
+        cursor_kind = PRODUCT_CURSOR if sort_by == "name" and not descending else \
+            f"products:{sort_by}:{'desc' if descending else 'asc'}"
+        
+        ordered = query.order_by(*[column.desc() if descending else column.asc() for column in columns])
+        if filters.cursor:
+            ordered = ordered.filter(
+                keyset_condition(columns, decode_cursor(filters.cursor, cursor_kind), descending=descending)
+            )
+            page = None
+        else:
+            page = filters.page
+            ordered = ordered.offset((filters.page - 1) * filters.items_per_page)
+        
+        # Read one extra row to know whether another page follows
+        products, total, estimated = fetch_page(
+            query, ordered, filters.items_per_page + 1,
+            first_page=not filters.cursor,
+            **self._count_options(filters, kind, unfiltered)
+        )
+        has_more = len(products) > filters.items_per_page
+        products = products[:filters.items_per_page]
+        next_cursor = encode_cursor(cursor_kind, sort_key(products[-1])) if has_more else None
+        return products, page, next_cursor, total, estimated
+
+    def _count_options(self, filters: GetProductsByFilterQuery, kind: str, unfiltered: bool) -> Dict[str, Any]:
+        """Count strategy arguments for fetch_page"""
+        return {
+            "mode": CountMode.parse(filters.count_mode),
+            "cache": self._count_cache,
+            "namespace": PRODUCT_LIST_NAMESPACE,
+            "signature": filter_signature({"kind": kind, **filters.model_dump()}, ignore=PAGING_FIELDS),
+            "table_name": ProductModel.__tablename__,
+            "unfiltered": unfiltered,
+        }
+
+    @staticmethod
+    def _has_filters(filters: GetProductsByFilterQuery) -> bool:
+        """Whether any filter narrows the listing"""
+        return any(
+            getattr(filters, field, None)
+            for field in ("name", "brand", "category_id", "status", "min_price", "max_price", "in_stock_only")
+        )
+
+    @staticmethod
+    def _total_pages(total: Optional[int], page_size: int) -> Optional[int]:
+        if total is None:
+            return None
+        return ceil(total / page_size) if total > 0 else 1
+
+    def _base_query(self, inventory_required: bool = False):
+        """
+        Build a product query that loads inventory and category with the same statement.
+        
+        Args:
+            inventory_required: Use an inner join so products without inventory are excluded
+            
+        Returns:
+            SQLAlchemy query over ProductModel with eager-loaded relationships
+        """
+        query = self._session.query(ProductModel)
+        if inventory_required:
+            query = query.join(ProductModel.inventory)
+        else:
+            query = query.outerjoin(ProductModel.inventory)
+        return query.options(
+            contains_eager(ProductModel.inventory),
+            joinedload(ProductModel.category)
+        )
+
+    def _to_product_fields(self, product_model: ProductModel) -> ProductFieldsDto:
+        """Convert a product model to its fields DTO"""
+        return ProductFieldsDto(
             id=product_model.id,
             name=product_model.name,
             description=product_model.description,
@@ -525,6 +736,39 @@ class ProductQueryService:
             image_url=product_model.image_url,
             status=product_model.status
         )
+
+    def _to_response_dto(self, product_model: ProductModel) -> GetProductResponseDTO:
+        """Convert a product model with its inventory and category to the detail DTO"""
+        return GetProductResponseDTO(
+            id=product_model.id,
+            product_fields=self._to_product_fields(product_model),
+            inventory_fields=self._get_inventory_data(product_model),
+            category_name=product_model.category.name if product_model.category else None
+        )
+
+    def _to_list_item(self, product: ProductModel) -> Dict[str, Any]:
+        """Convert a product model to a flattened list item"""
+        inventory_data = self._get_inventory_data(product)
+        return {
+            "id": str(product.id),
+            "name": product.name,
+            "description": product.description,
+            "price": inventory_data.price if inventory_data else 0.0,
+            "imageUrl": product.image_url,
+            "inStock": inventory_data.quantity > 0 if inventory_data else False,
+            "stockQuantity": inventory_data.quantity if inventory_data else 0,
+            "category": product.category.name if product.category else None,
+            "manufacturer": product.brand,
+            "metadata": {
+              "prescription": False,
+              "dosage": product.strength,
+              "form": product.dosage_form,
+            },
+        }
+
+    def _to_dto(self, product_model) -> Dict[str, Any]:
+        """Convert a product model to a DTO"""
+        product_fields = self._to_product_fields(product_model)
         
         # Get inventory data if available
         inventory_fields = self._get_inventory_data(product_model)
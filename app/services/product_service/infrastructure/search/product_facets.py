@@ -0,0 +1,121 @@
+"""
+Facet counts for product search results.
+
+All facets are computed from the filtered product set in one grouped aggregate
+statement: GROUPING SETS on PostgreSQL, a UNION ALL of grouped selects on other
+databases. Each facet row carries the facet it belongs to, so both forms are
+read the same way.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from sqlalchemy import case, func, literal, null, select, type_coerce, union_all
+from sqlalchemy.orm import Session
+
+from app.services.category_service.infrastructure.persistence.models.category import Category
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Facet names, in the order they are returned
+FACETS = ("category", "brand", "dosage_form", "in_stock")
+
+# Count cache namespace of facet counts
+PRODUCT_FACET_NAMESPACE = "product_facets"
+
+
+def _facet_source(filtered_query):
+    """Reduce a filtered product query to the columns facets are grouped by"""
+    return (
+        filtered_query
+        .outerjoin(Category, Category.id == ProductModel.category_id)
+        .with_entities(
+            ProductModel.category_id.label("category_id"),
+            Category.name.label("category_name"),
+            ProductModel.brand.label("brand"),
+            ProductModel.dosage_form.label("dosage_form"),
+            (func.coalesce(InventoryModel.quantity, 0) > 0).label("in_stock"),
+        )
+        .order_by(None)
+        .subquery("facet_source")
+    )
+
+
+def _grouping_sets_statement(source):
+    """One pass with GROUPING SETS; grouping() tells which set produced a row"""
+    facet = case(
+        (func.grouping(source.c.category_id) == 0, literal("category")),
+        (func.grouping(source.c.brand) == 0, literal("brand")),
+        (func.grouping(source.c.dosage_form) == 0, literal("dosage_form")),
+        else_=literal("in_stock"),
+    )
+    return (
+        select(
+            facet.label("facet"),
+            source.c.category_id,
+            func.max(source.c.category_name).label("category_name"),
+            source.c.brand,
+            source.c.dosage_form,
+            source.c.in_stock,
+            func.count().label("count"),
+        )
+        .group_by(func.grouping_sets(source.c.category_id, source.c.brand, source.c.dosage_form, source.c.in_stock))
+    )
+
+
+def _union_statement(source):
+    """UNION ALL of one grouped select per facet, shaped like the GROUPING SETS result"""
+    def empty(column):
+        return type_coerce(null(), column.type).label(column.name)
+
+    def grouped(facet: str, *columns):
+        selected = [
+            column if column.name in {c.name for c in columns} else empty(column)
+            for column in (source.c.category_id, source.c.category_name, source.c.brand,
+                           source.c.dosage_form, source.c.in_stock)
+        ]
+        return (
+            select(literal(facet).label("facet"), *selected, func.count().label("count"))
+            .group_by(*columns)
+        )
+
+    return union_all(
+        grouped("category", source.c.category_id, source.c.category_name),
+        grouped("brand", source.c.brand),
+        grouped("dosage_form", source.c.dosage_form),
+        grouped("in_stock", source.c.in_stock),
+    )
+
+
+def facet_counts(session: Session, filtered_query) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Count the filtered products per category, brand, dosage form and stock state.
+
+    Args:
+        session: Database session
+        filtered_query: ORM query over ProductModel (inventory outer-joined) with the
+            search filters applied and no ordering or paging
+
+    Returns:
+        Facet name to a list of {value, count} (plus label for categories), largest first
+    """
+    source = _facet_source(filtered_query)
+    if session.get_bind().dialect.name == "postgresql":
+        statement = _grouping_sets_statement(source)
+    else:
+        statement = _union_statement(source)
+
+    facets: Dict[str, List[Dict[str, Any]]] = {name: [] for name in FACETS}
+    for row in session.execute(statement):
+        if row.facet == "category":
+            facets["category"].append({"value": row.category_id, "label": row.category_name, "count": row.count})
+        elif row.facet == "in_stock":
+            facets["in_stock"].append({"value": bool(row.in_stock), "count": row.count})
+        else:
+            facets[row.facet].append({"value": getattr(row, row.facet), "count": row.count})
+    for values in facets.values():
+        values.sort(key=lambda value: (-value["count"], str(value["value"])))
+    return facets
@@ -0,0 +1,243 @@
+import logging
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from heapq import nlargest
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.services.inventory_service.application.events.stock_release_requested_event import StockReleaseRequestedEvent
+from app.services.inventory_service.application.events.stock_reserved_event import StockReservedEvent
+from app.services.product_service.domain.enums.product_status import ProductStatus
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.shared.application.events.event_bus import EventBus
+from app.shared.contracts.product.product_events import ProductCreatedEvent, ProductDeletedEvent, ProductUpdatedEvent
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_text(value: Optional[str]) -> str:
+    """Lowercase, strip accents and collapse punctuation to single spaces"""
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", value)
+    ascii_text = "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+    return _NON_ALNUM.sub(" ", ascii_text).strip()
+
+
+@dataclass
+class AutocompleteEntry:
+    """Product data held by the prefix index"""
+    id: str
+    name: str
+    brand: Optional[str]
+    popularity: float = 0.0
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {"id": self.id, "name": self.name, "brand": self.brand}
+
+
+class ProductPrefixIndex:
+    """
+    In-process prefix index over normalized product names and brands.
+
+    Keys are kept in a sorted list and looked up with bisect, so a query never
+    touches the database. Every word suffix of a name or brand is indexed, which
+    lets "500" find "Paracetamol 500mg". Results are ranked by popularity (units
+    ordered) and memoized per prefix until the next write.
+    """
+
+    def __init__(self, event_bus: Optional[EventBus] = None, max_cached_prefixes: int = 4096):
+        self._keys: List[Tuple[str, str]] = []
+        self._entries: Dict[str, AutocompleteEntry] = {}
+        self._entry_keys: Dict[str, List[Tuple[str, str]]] = {}
+        self._results_cache: "OrderedDict[Tuple[str, int], List[Dict]]" = OrderedDict()
+        self._max_cached_prefixes = max_cached_prefixes
+        self._lock = threading.RLock()
+        self._built = False
+        if event_bus:
+            self._register_event_handlers(event_bus)
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _register_event_handlers(self, event_bus: EventBus) -> None:
+        """Keep the index in sync with product writes and orders (imports rebuild it, see ProductService)"""
+        event_bus.subscribe(ProductCreatedEvent, self.handle_product_changed)
+        event_bus.subscribe(ProductUpdatedEvent, self.handle_product_changed)
+        event_bus.subscribe(ProductDeletedEvent, self.handle_product_deleted)
+        event_bus.subscribe(StockReleaseRequestedEvent, self.handle_stock_release_requested)
+        event_bus.subscribe(StockReservedEvent, self.handle_stock_release_requested)
+
+    def build(self, session: Session, popularity: Optional[Mapping[UUID, float]] = None) -> int:
+        """
+        (Re)build the index from the products table.
+
+        Args:
+            session: Database session
+            popularity: Units ordered per product id, as reported by the order
+                service; products left out rank by name only
+
+        Returns:
+            Number of indexed products
+        """
+        rows = (
+            session.query(ProductModel.id, ProductModel.name, ProductModel.brand)
+            .filter(ProductModel.status == ProductStatus.ACTIVE)
+            .all()
+        )
+        popularity = popularity or {}
+
+        keys: List[Tuple[str, str]] = []
+        entries: Dict[str, AutocompleteEntry] = {}
+        entry_keys: Dict[str, List[Tuple[str, str]]] = {}
+        for product_id, name, brand in rows:
+            entry = AutocompleteEntry(
+                id=str(product_id),
+                name=name,
+                brand=brand,
+                popularity=float(popularity.get(product_id) or 0)
+            )
+            entries[entry.id] = entry
+            entry_keys[entry.id] = self._keys_for(entry)
+            keys.extend(entry_keys[entry.id])
+        keys.sort()
+
+        with self._lock:
+            self._keys = keys
+            self._entries = entries
+            self._entry_keys = entry_keys
+            self._results_cache.clear()
+            self._built = True
+
+        logger.info(f"Product prefix index built with {len(entries)} products and {len(keys)} keys")
+        return len(entries)
+
+    def upsert(self, product_id: str, name: str, brand: Optional[str], active: bool = True) -> None:
+        """Add or refresh a product, keeping its popularity"""
+        product_id = str(product_id)
+        with self._lock:
+            existing = self._entries.get(product_id)
+            self._remove_keys(product_id)
+            if not active:
+                self._entries.pop(product_id, None)
+            else:
+                entry = AutocompleteEntry(
+                    id=product_id,
+                    name=name,
+                    brand=brand,
+                    popularity=existing.popularity if existing else 0.0
+                )
+                self._entries[product_id] = entry
+                self._entry_keys[product_id] = self._keys_for(entry)
+                for key in self._entry_keys[product_id]:
+                    insort(self._keys, key)
+            self._results_cache.clear()
+
+    def remove(self, product_id: str) -> None:
+        """Drop a product from the index"""
+        product_id = str(product_id)
+        with self._lock:
+            self._remove_keys(product_id)
+            self._entries.pop(product_id, None)
+            self._results_cache.clear()
+
+    def add_popularity(self, product_id: str, amount: float) -> None:
+        """Increase a product's popularity score"""
+        with self._lock:
+            entry = self._entries.get(str(product_id))
+            if entry:
+                entry.popularity += amount
+                self._results_cache.clear()
+
+    def search(self, prefix: str, limit: int = 10) -> List[Dict[str, Optional[str]]]:
+        """
+        Get the most popular products with a name or brand word starting with prefix.
+
+        Args:
+            prefix: Text typed by the user
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of {id, name, brand} dictionaries, most popular first
+        """
+        normalized = normalize_text(prefix)
+        if not normalized or limit <= 0:
+            return []
+        cache_key = (normalized, limit)
+        with self._lock:
+            cached = self._results_cache.get(cache_key)
+            if cached is not None:
+                self._results_cache.move_to_end(cache_key)
+                return cached
+
+            start = bisect_left(self._keys, (normalized, ""))
+            end = bisect_left(self._keys, (normalized + "\uffff", ""))
+            candidates = {self._keys[i][1] for i in range(start, end)}
+            best = nlargest(
+                limit,
+                (self._entries[product_id] for product_id in candidates),
+                key=lambda entry: (entry.popularity, _reverse_name_key(entry.name))
+            )
+            results = [entry.to_dict() for entry in best]
+
+            self._results_cache[cache_key] = results
+            if len(self._results_cache) > self._max_cached_prefixes:
+                self._results_cache.popitem(last=False)
+            return results
+
+    def handle_product_changed(self, event) -> None:
+        """Handle ProductCreatedEvent and ProductUpdatedEvent"""
+        try:
+            self.upsert(event.id, event.name, event.brand, active=event.status == ProductStatus.ACTIVE.value)
+        except Exception as e:
+            logger.error(f"Failed to update prefix index for product {event.id}: {str(e)}")
+
+    def handle_product_deleted(self, event: ProductDeletedEvent) -> None:
+        """Handle ProductDeletedEvent"""
+        try:
+            self.remove(event.id)
+        except Exception as e:
+            logger.error(f"Failed to remove product {event.id} from prefix index: {str(e)}")
+
+    def handle_stock_release_requested(self, event: Union[StockReleaseRequestedEvent, StockReservedEvent]) -> None:
+        """Count ordered units towards product popularity"""
+        try:
+            for item in event.items:
+                self.add_popularity(item['product_id'], item.get('quantity', 1))
+        except Exception as e:
+            logger.error(f"Failed to update product popularity for order {event.order_id}: {str(e)}")
+
+    def _keys_for(self, entry: AutocompleteEntry) -> List[Tuple[str, str]]:
+        """Index every word suffix of the normalized name and brand"""
+        keys = set()
+        for text_value in (entry.name, entry.brand):
+            words = normalize_text(text_value).split(" ")
+            for i in range(len(words)):
+                suffix = " ".join(words[i:])
+                if suffix:
+                    keys.add((suffix, entry.id))
+        return sorted(keys)
+
+    def _remove_keys(self, product_id: str) -> None:
+        for key in self._entry_keys.pop(product_id, []):
+            position = bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+
+
+def _reverse_name_key(name: str) -> Tuple[int, ...]:
+    """Sort key that makes nlargest break popularity ties alphabetically"""
+    return tuple(-ord(ch) for ch in (name or "").lower()) + (1,)
@@ -0,0 +1,234 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Column, MetaData, String, Table, bindparam, event, func, literal_column, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.shared.infrastructure.search.search_backends import SearchBackendRegistry, tokenize_search_term
+
+# Columns covered by full-text search, most relevant first
+SEARCH_COLUMNS = ("name", "brand", "dosage_form", "strength", "description")
+
+
+class ProductSearchBackend(ABC):
+    """
+    Full-text search strategy for the product catalog.
+
+    A backend owns the search structures of one database dialect, applies search
+    terms to product queries and keeps its index in sync with product writes.
+    """
+    name = "base"
+
+    @abstractmethod
+    def install(self, connection) -> None:
+        """
+        Create the search structures if they do not exist yet.
+
+        Args:
+            connection: SQLAlchemy connection used to issue DDL
+        """
+        pass
+
+    @abstractmethod
+    def apply(self, query, term: str) -> Tuple[Any, Optional[Any]]:
+        """
+        Restrict a product query to rows matching the search term.
+
+        Args:
+            query: SQLAlchemy query over ProductModel
+            term: Raw search term
+
+        Returns:
+            Tuple of the filtered query and an ORDER BY clause ranking by relevance (or None)
+        """
+        pass
+
+    def index(self, session: Session, product_ids: Iterable[UUID]) -> None:
+        """
+        (Re)index the given products after they were inserted or updated.
+
+        Args:
+            session: Session holding the pending product rows
+            product_ids: IDs of the products to index
+        """
+        pass
+
+    def remove(self, session: Session, product_ids: Iterable[UUID]) -> None:
+        """
+        Remove the given products from the index before they are deleted.
+
+        Args:
+            session: Session holding the pending delete
+            product_ids: IDs of the products to remove
+        """
+        pass
+
+    def rebuild(self, session: Session) -> int:
+        """
+        Rebuild the whole index from the products table.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Number of indexed products
+        """
+        self.install(session.connection())
+        return session.query(func.count(ProductModel.id)).scalar()
+
+
+class LikeSearchBackend(ProductSearchBackend):
+    """Fallback backend using ILIKE over the searchable columns (no index, no ranking)"""
+    name = "like"
+
+    def install(self, connection) -> None:
+        pass
+
+    def apply(self, query, term: str) -> Tuple[Any, Optional[Any]]:
+        if not term:
+            return query, None
+        search_term = f"%{term}%"
+        return query.filter(
+            or_(*[getattr(ProductModel, column).ilike(search_term) for column in SEARCH_COLUMNS])
+        ), None
+
+
+class PostgresSearchBackend(ProductSearchBackend):
+    """
+    PostgreSQL backend using a generated tsvector column, a GIN index and ts_rank ordering.
+
+    The column is maintained by PostgreSQL itself, so index/remove are no-ops.
+    """
+    name = "postgresql"
+    config = "simple"
+    vector_column = "search_vector"
+    index_name = "ix_products_search_vector"
+
+    def install(self, connection) -> None:
+        connection.execute(text(
+            f"ALTER TABLE products ADD COLUMN IF NOT EXISTS {self.vector_column} tsvector "
+            f"GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('{self.config}', coalesce(name, '')), 'A') || "
+            f"setweight(to_tsvector('{self.config}', coalesce(brand, '')), 'B') || "
+            f"setweight(to_tsvector('{self.config}', coalesce(dosage_form, '') || ' ' || coalesce(strength, '')), 'C') || "
+            f"setweight(to_tsvector('{self.config}', coalesce(description, '')), 'D')"
+            f") STORED"
+        ))
+        connection.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {self.index_name} ON products USING GIN ({self.vector_column})"
+        ))
+
+    def apply(self, query, term: str) -> Tuple[Any, Optional[Any]]:
+        tokens = tokenize_search_term(term)
+        if not tokens:
+            return query, None
+        # Prefix match every token so partial words keep working as they did with ILIKE
+        ts_query = func.to_tsquery(self.config, " & ".join(f"{token}:*" for token in tokens))
+        vector = literal_column(f"products.{self.vector_column}")
+        query = query.filter(vector.op("@@")(ts_query))
+        return query, func.ts_rank(vector, ts_query).desc()
+
+
+class SqliteFtsSearchBackend(ProductSearchBackend):
+    """
+    SQLite backend using an FTS5 virtual table kept in sync by the product repository.
+    """
+    name = "sqlite_fts5"
+    table_name = "products_fts"
+
+    # Declared on its own metadata so db.create_all() does not try to create it
+    fts_table = Table(
+        table_name,
+        MetaData(),
+        Column("product_id", String(36)),
+        *[Column(column, String) for column in SEARCH_COLUMNS],
+        Column("rank", String),
+    )
+
+    def install(self, connection) -> None:
+        columns = ", ".join(SEARCH_COLUMNS)
+        connection.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table_name} "
+            f"USING fts5(product_id UNINDEXED, {columns}, tokenize='unicode61')"
+        ))
+
+    def apply(self, query, term: str) -> Tuple[Any, Optional[Any]]:
+        tokens = tokenize_search_term(term)
+        if not tokens:
+            return query, None
+        # Every token must match, as a prefix
+        match_expression = " ".join(f'"{token}"*' for token in tokens)
+        fts = self.fts_table
+        matches = (
+            select(fts.c.product_id, fts.c.rank)
+            .where(literal_column(self.table_name).op("MATCH")(match_expression))
+            .subquery("search_matches")
+        )
+        query = query.join(matches, matches.c.product_id == ProductModel.id)
+        # FTS5 rank is bm25 where lower is better
+        return query, matches.c.rank.asc()
+
+    def index(self, session: Session, product_ids: Iterable[UUID]) -> None:
+        ids = [str(product_id) for product_id in product_ids]
+        if not ids:
+            return
+        self.remove(session, ids)
+        columns = ", ".join(SEARCH_COLUMNS)
+        session.execute(
+            text(
+                f"INSERT INTO {self.table_name} (product_id, {columns}) "
+                f"SELECT id, {columns} FROM products WHERE id IN :ids"
+            ).bindparams(bindparam("ids", expanding=True)),
+            {"ids": ids}
+        )
+
+    def remove(self, session: Session, product_ids: Iterable[UUID]) -> None:
+        ids = [str(product_id) for product_id in product_ids]
+        if not ids:
+            return
+        session.execute(
+            text(f"DELETE FROM {self.table_name} WHERE product_id IN :ids").bindparams(bindparam("ids", expanding=True)),
+            {"ids": ids}
+        )
+
+    def rebuild(self, session: Session) -> int:
+        self.install(session.connection())
+        columns = ", ".join(SEARCH_COLUMNS)
+        session.execute(text(f"DELETE FROM {self.table_name}"))
+        session.execute(text(
+            f"INSERT INTO {self.table_name} (product_id, {columns}) SELECT id, {columns} FROM products"
+        ))
+        return session.query(func.count(ProductModel.id)).scalar()
+
+
+_backends: SearchBackendRegistry[ProductSearchBackend] = SearchBackendRegistry(
+    "product", postgresql=PostgresSearchBackend, sqlite_fts5=SqliteFtsSearchBackend, fallback=LikeSearchBackend
+)
+
+
+def get_search_backend(bind) -> ProductSearchBackend:
+    """
+    Get the search backend for the database behind a session, engine or connection.
+
+    Args:
+        bind: SQLAlchemy session, engine or connection
+
+    Returns:
+        The search backend for the bind's dialect (cached per dialect)
+    """
+    return _backends.get(bind)
+
+
+@event.listens_for(ProductModel.__table__, "after_create")
+def _install_search_structures(target, connection, **kw):
+    """Create the search structures whenever the products table is created"""
+    get_search_backend(connection).install(connection)
+
+
+@event.listens_for(ProductModel.__table__, "before_drop")
+def _drop_search_structures(target, connection, **kw):
+    """Drop the SQLite FTS table together with the products table"""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {SqliteFtsSearchBackend.table_name}"))
@@ -1,8 +1,8 @@
-from typing import List, Dict, Any, Optional
+from typing import IO, Iterator, List, Dict, Any, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import or_, and_, func
 
 from app.dataBase import Database
@@ -19,8 +19,21 @@ from app.services.product_service.application.use_cases.list_products import Lis
 from app.services.product_service.infrastructure.persistence.unit_of_work.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 from app.services.product_service.infrastructure.query_services.product_query_service import ProductQueryService
 from app.services.product_service.infrastructure.adapters.product_event_adapter import ProductEventAdapter
+from app.services.product_service.infrastructure.search.product_prefix_index import ProductPrefixIndex
+from app.services.product_service.infrastructure.cache.product_dto_cache import ProductDtoCache
+from app.services.product_service.infrastructure.catalog.catalog_import import (
+    DEFAULT_CHUNK_SIZE,
+    IMPORT_FORMATS,
+    IMPORT_MODES,
+    CatalogImporter,
+    read_records
+)
+from app.services.product_service.infrastructure.catalog.catalog_export import DEFAULT_YIELD_PER, EXPORT_FORMATS, export_catalog
 from app.shared.acl.unified_acl import UnifiedACL
+from app.shared.infrastructure.persistence.list_counts import ListCountCache
 from app.shared.application.events.event_bus import EventBus
+from app.shared.contracts.product.product_events import ProductsImportedEvent
+from app.shared.domain.exceptions.common_errors import ValidationError
 from app.dataBase import db
 from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
 from app.services.product_service.domain.enums.product_status import ProductStatus
@@ -33,10 +46,16 @@ class ProductService:
     Service for managing products in the pharmacy system.
     """
     
-    def __init__(self, db: Database, event_bus: EventBus, acl: UnifiedACL):
+    def __init__(self, db: Database, event_bus: EventBus, acl: UnifiedACL,
+                 prefix_index: Optional[ProductPrefixIndex] = None,
+                 count_cache: Optional[ListCountCache] = None,
+                 dto_cache: Optional[ProductDtoCache] = None):
         self._db_session = db.get_session()
         self._acl = acl
         self._event_bus = event_bus
+        self._prefix_index = prefix_index
+        self._count_cache = count_cache
+        self._dto_cache = dto_cache
         self._init_resources()
         logger.info("Product service initialized")
         
@@ -48,7 +67,7 @@ class ProductService:
             self._event_bus, 
             self._acl
         )
-        self._query_service = ProductQueryService(self._db_session,self._uow)
+        self._query_service = ProductQueryService(self._db_session,self._uow, self._count_cache)
         self._create_product_use_case = CreateProductUseCase(self._uow)
         self._update_product_use_case = UpdateProductUseCase(self._uow)
         self._delete_product_use_case = DeleteProductUseCase(self._uow)        
@@ -70,6 +89,7 @@ class ProductService:
         logger.info(f"Creating product with name: {command.product_fields.name}")
         try:
             result = self._create_product_use_case.execute(command)
+            self._evict_cached_products([result.id])
             logger.info(f"Product created successfully with ID: {result.id}")
             return result
         except Exception as e:
@@ -82,6 +102,7 @@ class ProductService:
         logger.info(f"Updating product with ID: {command.id}")
         try:
             result = self._update_product_use_case.execute(command)
+            self._evict_cached_products([command.id])
             logger.info(f"Product updated successfully: {result.id}")
             return result
         except Exception as e:
@@ -93,6 +114,7 @@ class ProductService:
         logger.info(f"Deleting product with ID: {command.id}")
         try:
             result = self._delete_product_use_case.execute(command)
+            self._evict_cached_products([command.id])
             logger.info(f"Product deleted successfully: {command.id}")
             return result
         except Exception as e:
@@ -105,7 +127,17 @@ class ProductService:
         
         logger.info(f"Getting product with ID: {product_id}")
         try:
-            result = self._query_service.get_by_id(query)
+            if self._dto_cache is None:
+                result = self._query_service.get_by_id(query)
+            else:
+                result = self._dto_cache.get(product_id)
+                if result is None:
+                    # Capture the version first so a concurrent write wins over this read
+                    version = self._dto_cache.version(product_id)
+                    result = self._query_service.get_by_id(query)
+                    if result:
+                        # Stored as is: hits are handed out as copies, and this DTO is only serialized
+                        self._dto_cache.put(product_id, version, result)
             if result:
                 logger.info(f"Product found: {product_id}")
             else:
@@ -114,6 +146,63 @@ class ProductService:
         except Exception as e:
             logger.error(f"Error getting product: {str(e)}")
             raise
+
+    def get_product_names(self, product_ids: List[UUID]) -> Dict[UUID, str]:
+        """
+        Get the names of several products with one query.
+        This method is called by other services via ACL.
+
+        Args:
+            product_ids: IDs of the products
+
+        Returns:
+            Product ID to name, for the products that exist
+        """
+        return self._query_service.get_names_by_ids(product_ids)
+
+    def warm_up_product_cache(self, limit: int) -> int:
+        """
+        Load the most ordered products into the DTO cache.
+        
+        Args:
+            limit: Number of products to load
+            
+        Returns:
+            Number of products cached
+        """
+        if self._dto_cache is None or limit <= 0:
+            return 0
+        product_ids = self._top_product_ids(limit)
+        versions = {str(product_id): self._dto_cache.version(product_id) for product_id in product_ids}
+        cached = 0
+        for dto in self._query_service.get_many_by_ids(product_ids):
+            cached += self._dto_cache.put(dto.id, versions[str(dto.id)], dto)
+        logger.info(f"Product DTO cache warmed up with {cached} products")
+        return cached
+    
+    def _top_product_ids(self, limit: int) -> List[UUID]:
+        """IDs of the best selling products per the order service, topped up with the most recently updated ones"""
+        product_ids = [product_id for product_id, _ in self._uow.product_adapter_service.get_product_sales(limit)]
+        if len(product_ids) < limit:
+            product_ids.extend(self._query_service.get_recent_product_ids(limit - len(product_ids), exclude=product_ids))
+        return product_ids
+    
+    def get_product_cache_stats(self) -> Dict[str, Any]:
+        """Hit, miss and eviction counters of the product DTO cache"""
+        return self._dto_cache.stats() if self._dto_cache is not None else {}
+    
+    def _evict_cached_products(self, product_ids: List[UUID]) -> None:
+        # Also done by the write events; evicting here does not depend on the other event handlers
+        if self._dto_cache is not None:
+            self._dto_cache.invalidate(product_ids)
+    
+    def get_product_updated_at(self, product_id: UUID) -> Optional[datetime]:
+        """Last update time of a product without loading it, None if it does not exist"""
+        return self._query_service.get_updated_at(product_id)
+    
+    def get_list_marker(self) -> tuple:
+        """Row counts and newest write times behind product listings, for conditional GET validators"""
+        return self._query_service.get_list_marker()
     
     def list_products(self, query: GetProductsByFilterQuery):
         """List products with filtering and pagination"""        
@@ -133,7 +222,7 @@ class ProductService:
             search_term: The search term to look for
             page: Page number (1-indexed)
             page_size: Number of items per page
-            filters: Additional filters to apply
+            filters: Additional filters to apply; facets=True adds facet counts of the filtered set
             
         Returns:
             Product list DTO with pagination information
@@ -154,17 +243,57 @@ class ProductService:
                 in_stock_only=search_filters.get('in_stock_only', False),
                 page=page,
                 items_per_page=page_size,
-                sort_by=search_filters.get('sort_by', 'name'),
-                sort_direction=search_filters.get('sort_direction', 'asc')
+                # Text searches rank by relevance unless a sort field is given
+                sort_by=search_filters.get('sort_by') or ('relevance' if search_term else 'name'),
+                sort_direction=search_filters.get('sort_direction', 'asc'),
+                cursor=search_filters.get('cursor'),
+                count_mode=search_filters.get('count_mode', 'exact')
             )
             
             result = self._query_service.search(query)
+            if search_filters.get('facets'):
+                result["facets"] = self._query_service.facets(query)
             logger.info(f"Found products matching '{search_term}'")
             return result
         except Exception as e:
             logger.error(f"Error searching products: {str(e)}")
             raise
 
+    def autocomplete_products(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Suggest products whose name or brand starts with the given prefix.
+        
+        Answers from the in-memory prefix index, which is built at worker start
+        and kept current by product events.
+        
+        Args:
+            prefix: Text typed by the user
+            limit: Maximum number of suggestions
+            
+        Returns:
+            List of {id, name, brand} suggestions, most popular first
+        """
+        if self._prefix_index is None:
+            raise RuntimeError("Product prefix index is not configured")
+        if not self._prefix_index.is_built:
+            # Only reached when worker start-up could not build the index
+            logger.warning("Product prefix index not built yet, building on demand")
+            self.rebuild_prefix_index()
+        return self._prefix_index.search(prefix, limit)
+
+    def rebuild_prefix_index(self) -> int:
+        """
+        (Re)build the autocomplete index, ranked by the units ordered per
+        product as reported by the order service through the ACL.
+        
+        Returns:
+            Number of indexed products
+        """
+        if self._prefix_index is None:
+            raise RuntimeError("Product prefix index is not configured")
+        sales = self._uow.product_adapter_service.get_product_sales()
+        return self._prefix_index.build(self._db_session, popularity=dict(sales))
+
     def create_bulk_products(self, products_data: List[Dict[str, Any]]):
         """
         Create multiple products in a single operation.
@@ -216,6 +345,63 @@ class ProductService:
             logger.error(f"Bulk product creation failed: {str(e)}")
             raise
 
+    def import_products(self, stream: IO[bytes], fmt: str = "ndjson", mode: str = "partial",
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        Import a catalog upload with set-based inserts in a single transaction.
+        
+        Args:
+            stream: Binary NDJSON or CSV stream, read lazily
+            fmt: "ndjson" or "csv"
+            mode: "partial" commits valid rows, "atomic" commits only a fully valid upload
+            chunk_size: Rows validated and inserted per statement
+            
+        Returns:
+            Import report with per-row errors
+        """
+        if fmt not in IMPORT_FORMATS:
+            raise ValidationError(f"Unsupported import format: {fmt}")
+        if mode not in IMPORT_MODES:
+            raise ValidationError(f"Unsupported import mode: {mode}")
+        logger.info(f"Importing products from {fmt} upload in {mode} mode")
+        report = CatalogImporter(self._db_session, chunk_size=chunk_size).run(read_records(stream, fmt), mode=mode)
+        if report.committed:
+            # The import carries no per-product events, so the autocomplete index is
+            # rebuilt on this request; a failure leaves the previous index serving
+            if self._prefix_index is not None:
+                try:
+                    self.rebuild_prefix_index()
+                except Exception as e:
+                    logger.error(f"Failed to rebuild product prefix index after import: {str(e)}")
+            # One event for the whole batch instead of one per product
+            self._event_bus.publish(ProductsImportedEvent(
+                count=report.imported,
+                timestamp=datetime.now(timezone.utc).isoformat()
+            ))
+        return report.to_dict()
+
+    def export_products(self, fmt: str = "csv", compress: bool = False, status: Optional[ProductStatus] = None,
+                        yield_per: int = DEFAULT_YIELD_PER) -> Iterator[bytes]:
+        """
+        Stream the catalog (product, inventory and category name per row).
+        
+        Rows come from one joined query on a server-side cursor and are encoded
+        as they arrive, so the session must stay open until the stream is consumed.
+        
+        Args:
+            fmt: "csv" or "ndjson"
+            compress: Gzip the stream
+            status: Only export products with this status
+            yield_per: Rows fetched from the cursor at a time
+            
+        Returns:
+            Iterator of encoded blocks
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValidationError(f"Unsupported export format: {fmt}")
+        logger.info(f"Exporting products as {fmt}{' (gzip)' if compress else ''}")
+        return export_catalog(self._db_session, fmt=fmt, compress=compress, status=status, yield_per=yield_per)
+
     def get_low_stock_products(self, threshold_percentage: float = 100, page: int = 1, page_size: int = 20):
         """
         Get products with stock levels below the specified threshold.
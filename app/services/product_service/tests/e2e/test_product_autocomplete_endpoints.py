@@ -0,0 +1,35 @@
+import json
+
+from app.extensions import container
+
+
+class TestProductAutocompleteEndpoints:
+    """Test the product autocomplete endpoint"""
+
+    def test_autocomplete_returns_created_product(self, client, db_session, admin_headers, valid_product_data):
+        """New products are suggested without rebuilding the index"""
+        container.product_prefix_index().build(db_session)
+        product_data = valid_product_data.copy()
+        product_data['product_fields']['name'] = "Autocomplete Aspirin"
+
+        create_response = client.post("/api/products/",
+                                       data=json.dumps(product_data),
+                                       content_type='application/json',
+                                       headers=admin_headers)
+        assert create_response.status_code == 201
+
+        response = client.get("/api/products/autocomplete", query_string={"q": "autocomp", "limit": 5})
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['message'] == "Product suggestions retrieved successfully"
+        assert [item['name'] for item in data['data']] == ["Autocomplete Aspirin"]
+
+    def test_autocomplete_requires_prefix(self, client):
+        """The q parameter is mandatory"""
+        response = client.get("/api/products/autocomplete")
+        assert response.status_code == 422
+
+    def test_autocomplete_limit_is_bounded(self, client):
+        """Limits above the fixed maximum are rejected"""
+        response = client.get("/api/products/autocomplete", query_string={"q": "a", "limit": 500})
+        assert response.status_code == 422
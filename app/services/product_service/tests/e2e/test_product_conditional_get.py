@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+from werkzeug.http import http_date
+
+from app.extensions import container
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.services.product_service.service import ProductService
+from app.shared.contracts.category.category_events import CategoryUpdatedEvent
+from app.shared.contracts.product.product_events import ProductUpdatedEvent
+from app.shared.infrastructure.resource_versions import ResourceVersions
+
+
+class TestProductConditionalGet:
+    """ETag / Last-Modified handling of product reads"""
+
+    def test_product_not_modified(self, client, test_products):
+        """A matching If-None-Match is answered with 304 and no body"""
+        product_id = test_products['regular_id']
+        first = client.get(f"/api/products/{product_id}")
+        etag = first.headers['ETag']
+        assert first.status_code == 200
+        assert first.headers['Last-Modified']
+
+        second = client.get(f"/api/products/{product_id}", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers['ETag'] == etag
+
+    def test_product_etag_changes_on_write_event(self, client, event_bus, test_products):
+        """A write event for the product invalidates its ETag"""
+        product_id = test_products['regular_id']
+        etag = client.get(f"/api/products/{product_id}").headers['ETag']
+
+        event_bus.publish(ProductUpdatedEvent(
+            id=str(product_id),
+            name="Regular Medicine",
+            status="ACTIVE",
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
+
+        response = client.get(f"/api/products/{product_id}", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_product_if_modified_since(self, client, test_products):
+        """If-Modified-Since is honoured when no If-None-Match is sent"""
+        product_id = test_products['regular_id']
+        last_modified = client.get(f"/api/products/{product_id}").headers['Last-Modified']
+
+        assert client.get(f"/api/products/{product_id}",
+                          headers={"If-Modified-Since": last_modified}).status_code == 304
+        assert client.get(f"/api/products/{product_id}",
+                          headers={"If-Modified-Since": http_date(datetime(2000, 1, 1, tzinfo=timezone.utc))}
+                          ).status_code == 200
+
+    def test_missing_product_has_no_validators(self, client):
+        """Unknown products skip the conditional handling"""
+        response = client.get("/api/products/00000000-0000-0000-0000-000000000000", headers={"If-None-Match": "*"})
+        assert response.status_code != 304
+        assert 'ETag' not in response.headers
+
+    def test_list_not_modified_without_query(self, client, test_products):
+        """The list 304 is decided from the collection version alone"""
+        first = client.get("/api/products/list?items_per_page=2")
+        etag = first.headers['ETag']
+
+        with patch.object(ProductService, 'list_products') as list_products:
+            second = client.get("/api/products/list?items_per_page=2", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        list_products.assert_not_called()
+
+        other_page = client.get("/api/products/list?items_per_page=3", headers={"If-None-Match": etag})
+        assert other_page.status_code == 200
+
+    def test_list_etag_changes_after_category_write(self, client, event_bus, test_products):
+        """List items carry category names, so category writes bump the product collection"""
+        etag = client.get("/api/products/list").headers['ETag']
+
+        event_bus.publish(CategoryUpdatedEvent(
+            id=str(uuid4()),
+            name="Renamed",
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
+
+        response = client.get("/api/products/list", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_validators_are_process_bound(self):
+        """ETags issued by another process (different boot id) never match"""
+        other_process = ResourceVersions()
+
+        assert container.resource_versions().collection_validators("products", "{}")[0] != \
+            other_process.collection_validators("products", "{}")[0]
+
+    def test_list_etag_changes_after_write_on_another_worker(self, client, db_session, test_products):
+        """A write that published no event in this process still changes the list ETag"""
+        etag = client.get("/api/products/list").headers['ETag']
+
+        db_session.query(ProductModel).filter(ProductModel.id == test_products['regular_id']).update(
+            {"name": "Renamed Elsewhere"}
+        )
+        db_session.commit()
+
+        response = client.get("/api/products/list", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+
+    def test_stock_write_on_another_worker_changes_validators(self, client, db_session, test_products):
+        """Stock changes touch only the inventory row, which both the list and the detail validators read"""
+        product_id = test_products['regular_id']
+        db_session.add(InventoryModel(id=uuid4(), product_id=product_id, quantity=100, price=10.0))
+        db_session.commit()
+        list_etag = client.get("/api/products/list").headers['ETag']
+        detail_etag = client.get(f"/api/products/{product_id}").headers['ETag']
+
+        db_session.query(InventoryModel).filter(InventoryModel.product_id == product_id).update({"quantity": 1})
+        db_session.commit()
+
+        assert client.get("/api/products/list", headers={"If-None-Match": list_etag}).status_code == 200
+        assert client.get(f"/api/products/{product_id}", headers={"If-None-Match": detail_etag}).status_code == 200
+
+    def test_list_if_modified_since_sees_delete_on_another_worker(self, client, db_session, test_products):
+        """A delete leaves no timestamp behind; the changed row count moves Last-Modified forward"""
+        last_modified = client.get("/api/products/list").headers['Last-Modified']
+
+        db_session.query(ProductModel).filter(ProductModel.id == test_products['inactive_id']).delete()
+        db_session.commit()
+
+        later = datetime.now(timezone.utc) + timedelta(seconds=5)
+        with patch("app.shared.infrastructure.resource_versions.datetime") as clock:
+            clock.now.return_value = later
+            response = client.get("/api/products/list", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 200
+        assert response.headers['Last-Modified'] == http_date(later)
@@ -0,0 +1,86 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from marshmallow import Schema
+
+from app.apis.product.product_shemas import ProductPaginatedResponseSchema
+from app.apis.schema_projection import project
+from app.services.product_service.domain.enums.product_status import ProductStatus
+from app.shared.utils import json_provider
+from app.shared.utils.json_provider import FastJSONProvider
+
+
+@pytest.fixture
+def fast_json(app):
+    """Install the fast JSON provider for one test"""
+    default = app.json
+    app.json = FastJSONProvider(app)
+    yield app
+    app.json = default
+    app.config['TRUSTED_RESPONSES'] = True
+
+
+def _both_paths(app, client, url):
+    app.config['TRUSTED_RESPONSES'] = False
+    dumped = client.get(url)
+    app.config['TRUSTED_RESPONSES'] = True
+    with patch.object(Schema, 'dump', side_effect=AssertionError("marshmallow dump on the trusted path")):
+        trusted = client.get(url)
+    return dumped, trusted
+
+
+class TestFastSerialization:
+    """The trusted path must produce the same payloads as the marshmallow path"""
+
+    @pytest.mark.parametrize("url", [
+        "/api/products/{regular_id}",
+        "/api/products/list?items_per_page=5",
+        "/api/products/search?search=medicine&page_size=5",
+    ])
+    def test_trusted_responses_match_schema_dump(self, fast_json, client, test_products, url):
+        dumped, trusted = _both_paths(fast_json, client, url.format(**test_products))
+
+        assert dumped.status_code == trusted.status_code == 200
+        assert trusted.get_json() == dumped.get_json()
+
+    def test_trusted_path_needs_fast_provider(self, app, client, test_products):
+        """With the default provider the route falls back to marshmallow"""
+        response = client.get("/api/products/list?items_per_page=2")
+
+        assert response.status_code == 200
+        assert "total" in response.get_json()['data']
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_provider_encodes_dto_values(self, app, monkeypatch, use_orjson):
+        """UUID, Decimal, datetime, date and enums need no hand conversion"""
+        if not use_orjson:
+            monkeypatch.setattr(json_provider, "orjson", None)
+        product_id = uuid4()
+        payload = {
+            "id": product_id,
+            "price": Decimal("12.50"),
+            "created_at": datetime(2024, 5, 1, 8, 30, tzinfo=timezone.utc),
+            "expiry_date": date(2030, 1, 1),
+            "status": ProductStatus.ACTIVE,
+        }
+
+        decoded = FastJSONProvider(app).loads(FastJSONProvider(app).dumps(payload))
+
+        assert decoded == {
+            "id": str(product_id),
+            "price": 12.5,
+            "created_at": "2024-05-01T08:30:00+00:00",
+            "expiry_date": "2030-01-01",
+            "status": ProductStatus.ACTIVE.value,
+        }
+
+    def test_projection_follows_schema_shape(self):
+        """Undeclared keys are dropped and attribute renames applied"""
+        page = {"items": [{"id": "1", "name": "A", "internal": True}], "total_items": 1, "debug": "x"}
+
+        projected = project(ProductPaginatedResponseSchema, {"code": 200, "message": "ok", "data": page})
+
+        assert projected == {"code": 200, "message": "ok", "data": {"items": [{"id": "1", "name": "A"}], "total": 1}}
@@ -0,0 +1,80 @@
+"""
+Integration tests for keyset (cursor) pagination of product lists.
+"""
+from uuid import uuid4
+
+import pytest
+
+from app.services.product_service.application.queries.get_products_by_filter import GetProductsByFilterQuery
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.shared.utils.cursor_pagination import InvalidCursorError, encode_cursor
+
+
+@pytest.fixture
+def named_products(app, db_session):
+    """Create products where several share the same name"""
+    names = ["Amoxicillin", "Ibuprofen", "Ibuprofen", "Ibuprofen", "Ibuprofen", "Paracetamol", "Zinc"]
+    for name in names:
+        db_session.add(ProductModel(id=uuid4(), name=name, brand="Brand"))
+    db_session.commit()
+    return names
+
+
+class TestProductCursorPagination:
+    """Cursor pages must cover every product exactly once in (name, id) order"""
+
+    def _walk(self, product_service, page_size):
+        pages = []
+        result = product_service.list_products(GetProductsByFilterQuery(items_per_page=page_size))
+        pages.append(result)
+        while result['next_cursor']:
+            result = product_service.list_products(
+                GetProductsByFilterQuery(items_per_page=page_size, cursor=result['next_cursor'])
+            )
+            pages.append(result)
+        return pages
+
+    def test_cursor_walk_returns_every_product_once(self, product_service, named_products):
+        """Products sharing a name are split across pages without gaps or duplicates"""
+        pages = self._walk(product_service, page_size=2)
+
+        ids = [item['id'] for page in pages for item in page['items']]
+        names = [item['name'] for page in pages for item in page['items']]
+        assert len(pages) == 4
+        assert len(ids) == len(set(ids)) == len(named_products)
+        assert names == sorted(named_products)
+        assert pages[-1]['next_cursor'] is None
+
+    def test_cursor_pages_match_numbered_pages(self, product_service, named_products):
+        """Following next_cursor yields the same pages as page numbers"""
+        cursor_pages = self._walk(product_service, page_size=3)
+
+        for number, cursor_page in enumerate(cursor_pages, start=1):
+            numbered = product_service.list_products(GetProductsByFilterQuery(items_per_page=3, page=number))
+            assert [item['id'] for item in numbered['items']] == [item['id'] for item in cursor_page['items']]
+
+        assert cursor_pages[0]['page'] == 1
+        assert cursor_pages[1]['page'] is None
+        assert cursor_pages[0]['total_items'] == len(named_products)
+        # The exact total comes with the first page only
+        assert cursor_pages[1]['total_items'] is None
+
+    def test_invalid_cursor_rejected(self, product_service, named_products):
+        """Garbage and cursors from other listings raise InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            product_service.list_products(GetProductsByFilterQuery(cursor="not-a-cursor"))
+        with pytest.raises(InvalidCursorError):
+            product_service.list_products(
+                GetProductsByFilterQuery(cursor=encode_cursor("categories:name", ["Zinc", str(uuid4())]))
+            )
+
+    def test_cursor_endpoint(self, client, named_products):
+        """The list endpoint exposes next_cursor and rejects bad cursors with 400"""
+        first = client.get("/api/products/list?items_per_page=4").get_json()['data']
+        assert first['next_cursor']
+
+        second = client.get(f"/api/products/list?items_per_page=4&cursor={first['next_cursor']}").get_json()['data']
+        assert len(first['items']) + len(second['items']) == len(named_products)
+        assert second['next_cursor'] is None
+
+        assert client.get("/api/products/list?cursor=garbage").status_code == 400
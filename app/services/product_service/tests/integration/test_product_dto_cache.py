@@ -0,0 +1,91 @@
+"""
+Integration tests for ProductService reads served from the product DTO cache.
+"""
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.services.order_service.domain.value_objects.order_status import OrderStatus
+from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+from app.services.order_service.service import OrderService
+from app.services.product_service.application.commands.delete_product_command import DeleteProductCommand
+from app.services.product_service.application.queries.get_product_by_id import GetProductByIdQuery
+from app.services.product_service.infrastructure.cache.product_dto_cache import ProductDtoCache
+from app.services.product_service.infrastructure.search.product_prefix_index import ProductPrefixIndex
+from app.services.product_service.service import ProductService
+from app.services.product_service.tests.integration.test_product_query_count import catalog
+from app.shared.domain.enums.enums import ServiceType
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def dto_cache(event_bus):
+    return ProductDtoCache(event_bus=event_bus)
+
+
+@pytest.fixture
+def cached_product_service(database, event_bus, acl, dto_cache):
+    acl.register_service(ServiceType.ORDER, lambda: OrderService(database, event_bus, acl))
+    return ProductService(database, event_bus, acl, dto_cache=dto_cache, prefix_index=ProductPrefixIndex())
+
+
+@pytest.fixture
+def best_seller(db_session, catalog):
+    """An order of 7 units of the last catalog product"""
+    now = datetime.now(timezone.utc)
+    db_session.add(OrderModel(
+        id=uuid4(), user_id=uuid4(), status=OrderStatus.COMPLETED, total_amount=Decimal("70.00"),
+        created_at=now, updated_at=now,
+        items=[OrderItemModel(id=uuid4(), product_id=catalog[-1], quantity=7, price=Decimal("10.00"),
+                              created_at=now, updated_at=now)]
+    ))
+    db_session.commit()
+    return catalog[-1]
+
+
+class TestProductDtoCacheIntegration:
+    """Repeated reads skip the database until the product is written"""
+
+    def test_second_read_runs_no_query(self, cached_product_service, dto_cache, catalog):
+        """The first read fills the cache, the second is a hit"""
+        product_id = catalog[0]
+        first = cached_product_service.get_product(GetProductByIdQuery(id=product_id))
+        with count_queries() as statements:
+            second = cached_product_service.get_product(GetProductByIdQuery(id=product_id))
+
+        assert statements == []
+        assert second.model_dump() == first.model_dump()
+        # The miss stored the loaded DTO itself; the hit hands out a copy of it
+        assert second is not first
+        assert second.category_name == "Analgesics"
+        assert dto_cache.stats()['hits'] == 1
+
+    def test_delete_evicts(self, cached_product_service, dto_cache, catalog):
+        """Deleting a product through the service drops its cached DTO"""
+        product_id = catalog[0]
+        cached_product_service.get_product(GetProductByIdQuery(id=product_id))
+
+        cached_product_service.delete_product(DeleteProductCommand(id=product_id))
+
+        assert dto_cache.get(product_id) is None
+        assert cached_product_service.get_product(GetProductByIdQuery(id=product_id)) is None
+
+    def test_warm_up_loads_products_in_one_query(self, cached_product_service, dto_cache, catalog):
+        """Warm-up caches the requested number of products"""
+        with count_queries() as statements:
+            cached = cached_product_service.warm_up_product_cache(limit=5)
+
+        assert cached == 5
+        assert len(dto_cache) == 5
+        # product sales from the order service, recent products to top them up and one load query
+        assert len(statements) == 3
+
+    def test_best_sellers_come_from_the_order_service(self, cached_product_service, dto_cache, best_seller):
+        """Warm-up and the autocomplete index rank by the units the order service reports"""
+        cached_product_service.warm_up_product_cache(limit=1)
+        cached_product_service.rebuild_prefix_index()
+
+        assert dto_cache.get(best_seller) is not None
+        assert cached_product_service.autocomplete_products("product", limit=1)[0]['id'] == str(best_seller)
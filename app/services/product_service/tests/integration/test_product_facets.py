@@ -0,0 +1,111 @@
+"""
+Integration tests for faceted search counts.
+"""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.category_service.infrastructure.persistence.models.category import Category
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.product_service.application.queries.get_products_by_filter import GetProductsByFilterQuery
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.services.product_service.infrastructure.query_services.product_query_service import ProductQueryService
+from app.services.product_service.infrastructure.search import product_facets
+from app.services.product_service.infrastructure.search.product_search_backend import get_search_backend
+from app.shared.contracts.product.product_events import ProductUpdatedEvent
+from app.shared.infrastructure.persistence.list_counts import ListCountCache
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def faceted_catalog(app, db_session):
+    tablets = Category(id=uuid4(), name="Tablets")
+    syrups = Category(id=uuid4(), name="Syrups")
+    db_session.add_all([tablets, syrups])
+    specs = [
+        ("Aspirin 100", "Acme", "tablet", tablets, 10),
+        ("Aspirin 500", "Acme", "tablet", tablets, 0),
+        ("Ibuprofen", "Medico", "tablet", tablets, 4),
+        ("Cough Syrup", "Medico", "syrup", syrups, 7),
+        ("Loose Gauze", None, None, None, 0),
+    ]
+    product_ids = []
+    for name, brand, dosage_form, category, quantity in specs:
+        product = ProductModel(id=uuid4(), name=name, description=name, brand=brand, dosage_form=dosage_form,
+                               category_id=category.id if category else None)
+        db_session.add(product)
+        db_session.add(InventoryModel(id=uuid4(), product_id=product.id, quantity=quantity, price=1.0,
+                                      max_stock=100, min_stock=1,
+                                      expiry_date=datetime(2030, 1, 1, tzinfo=timezone.utc)))
+        product_ids.append(product.id)
+    db_session.flush()
+    get_search_backend(db_session).index(db_session, product_ids)
+    db_session.commit()
+    return {"tablets": tablets, "syrups": syrups}
+
+
+def _counts(values):
+    return {value["value"]: value["count"] for value in values}
+
+
+class TestProductFacets:
+    """Facets come from one grouped query and are cached per filter signature"""
+
+    def test_facets_in_one_statement(self, db_session, faceted_catalog):
+        """Every facet is counted by a single aggregate statement"""
+        query_service = ProductQueryService(db_session, uow=None)
+        with count_queries() as statements:
+            facets = query_service.facets(GetProductsByFilterQuery())
+
+        assert len(statements) == 1
+        assert _counts(facets["brand"]) == {"Acme": 2, "Medico": 2, None: 1}
+        assert _counts(facets["dosage_form"]) == {"tablet": 3, "syrup": 1, None: 1}
+        assert _counts(facets["in_stock"]) == {True: 3, False: 2}
+        categories = {value["label"]: value["count"] for value in facets["category"]}
+        assert categories == {"Tablets": 3, "Syrups": 1, None: 1}
+        assert facets["category"][0]["value"] == faceted_catalog["tablets"].id
+
+    def test_facets_follow_filters(self, db_session, faceted_catalog):
+        """Counts describe the filtered set, including text search and stock filters"""
+        query_service = ProductQueryService(db_session, uow=None)
+
+        facets = query_service.facets(GetProductsByFilterQuery(name="aspirin", in_stock_only=True))
+
+        assert _counts(facets["brand"]) == {"Acme": 1}
+        assert _counts(facets["in_stock"]) == {True: 1}
+
+    def test_facets_cached_until_write_event(self, db_session, event_bus, faceted_catalog):
+        """A cached signature costs no query until a product write invalidates it"""
+        cache = ListCountCache(event_bus, {product_facets.PRODUCT_FACET_NAMESPACE: (ProductUpdatedEvent,)})
+        query_service = ProductQueryService(db_session, uow=None, count_cache=cache)
+        query_service.facets(GetProductsByFilterQuery(brand="Acme"))
+
+        with count_queries() as statements:
+            query_service.facets(GetProductsByFilterQuery(brand="Acme", page=3))
+        assert statements == []
+
+        event_bus.publish(ProductUpdatedEvent(id=str(uuid4()), name="x", status="ACTIVE",
+                                              timestamp=datetime.now(timezone.utc).isoformat()))
+        with count_queries() as statements:
+            query_service.facets(GetProductsByFilterQuery(brand="Acme"))
+        assert len(statements) == 1
+
+    def test_postgresql_uses_grouping_sets(self, db_session):
+        """On PostgreSQL the facets are one GROUPING SETS query"""
+        source = product_facets._facet_source(db_session.query(ProductModel).outerjoin(ProductModel.inventory))
+        sql = str(product_facets._grouping_sets_statement(source).compile(dialect=postgresql.dialect()))
+
+        assert "GROUP BY GROUPING SETS" in sql
+        assert "UNION" not in sql
+
+    def test_search_endpoint_returns_facets(self, client, faceted_catalog):
+        """facets=true adds the counts next to the page"""
+        response = client.get("/api/products/search?search=aspirin&facets=true")
+
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        assert len(data["items"]) == 2
+        assert data["facets"]["brand"] == [{"value": "Acme", "count": 2}]
+        assert "facets" not in client.get("/api/products/search?search=aspirin").get_json()["data"]
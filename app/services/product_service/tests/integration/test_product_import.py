@@ -0,0 +1,122 @@
+"""
+Integration tests for the set-based catalog import.
+"""
+import io
+import json
+from uuid import uuid4
+
+import pytest
+
+from app.services.category_service.infrastructure.persistence.models.category import Category
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.services.product_service.infrastructure.search.product_prefix_index import ProductPrefixIndex
+from app.services.product_service.service import ProductService
+from app.shared.testing.query_count import count_queries
+
+CSV_HEADER = "name,description,brand,category_id,status,price,quantity,max_stock,min_stock,expiry_date\n"
+
+
+def _ndjson(rows):
+    return io.BytesIO("\n".join(json.dumps(row) for row in rows).encode("utf-8"))
+
+
+def _row(i, **overrides):
+    row = {
+        "name": f"Imported {i:03d}",
+        "description": f"Imported product {i}",
+        "brand": "Supplier",
+        "price": 9.5,
+        "quantity": 10,
+        "max_stock": 100,
+        "min_stock": 5,
+        "expiry_date": "2030-01-01",
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def category(app, db_session):
+    category = Category(id=uuid4(), name="Imported")
+    db_session.add(category)
+    db_session.commit()
+    return category
+
+
+class TestProductImport:
+    """Uploads are validated up front and written with multi-row inserts"""
+
+    def test_ndjson_import_uses_one_insert_per_table_and_chunk(self, product_service, db_session, category):
+        """25 rows in chunks of 10 cost a handful of statements, not one per row"""
+        rows = [_row(i, category_id=str(category.id)) for i in range(25)]
+        with count_queries() as statements:
+            report = product_service.import_products(_ndjson(rows), fmt="ndjson", chunk_size=10)
+
+        assert report['imported'] == 25
+        assert report['committed'] is True
+        assert report['errors'] == []
+        assert db_session.query(ProductModel).filter(ProductModel.brand == "Supplier").count() == 25
+        assert db_session.query(InventoryModel).count() == 25
+        inserts = [statement for statement in statements if statement.lstrip().startswith("INSERT INTO products (")]
+        assert len(inserts) == 3
+
+    def test_partial_mode_reports_row_errors(self, product_service, db_session):
+        """Invalid rows are reported by row number, valid rows are committed"""
+        rows = [_row(0), _row(1, price=-1), _row(2, category_id=str(uuid4())), _row(3, description=None)]
+        upload = io.BytesIO(b"\n".join([json.dumps(row).encode() for row in rows] + [b"{not json"]))
+
+        report = product_service.import_products(upload, fmt="ndjson")
+
+        assert report['total_rows'] == 5
+        assert report['imported'] == 1
+        assert [error['row'] for error in report['errors']] == [2, 3, 4, 5]
+        assert "Category not found" in report['errors'][1]['error']
+        assert db_session.query(ProductModel).count() == 1
+
+    def test_atomic_mode_commits_nothing_on_error(self, product_service, db_session):
+        """A single invalid row rolls back the whole upload"""
+        rows = [_row(i) for i in range(5)] + [_row(5, quantity="many")]
+
+        report = product_service.import_products(_ndjson(rows), fmt="ndjson", mode="atomic", chunk_size=2)
+
+        assert report['committed'] is False
+        assert report['imported'] == 0
+        assert [error['row'] for error in report['errors']] == [6]
+        assert db_session.query(ProductModel).count() == 0
+
+    def test_csv_import(self, product_service, db_session, category):
+        """Flat CSV columns map onto product and inventory fields"""
+        body = CSV_HEADER + f"Csv Aspirin,Pain relief,Acme,{category.id},ACTIVE,3.5,40,100,10,2031-06-30\n" \
+                            "Csv Zinc,Supplement,Acme,,,1.25,0,50,5,2031-06-30\n"
+
+        report = product_service.import_products(io.BytesIO(body.encode("utf-8")), fmt="csv")
+
+        assert report['imported'] == 2
+        zinc = db_session.query(ProductModel).filter(ProductModel.name == "Csv Zinc").one()
+        assert zinc.category_id is None
+        assert zinc.inventory.price == 1.25
+
+    def test_import_rebuilds_the_prefix_index(self, database, event_bus, acl, db_session):
+        """Imported products are suggested without autocomplete touching the database"""
+        prefix_index = ProductPrefixIndex(event_bus)
+        service = ProductService(database, event_bus, acl, prefix_index=prefix_index)
+        prefix_index.build(db_session)
+
+        service.import_products(_ndjson([_row(0, name="Zolmitriptan 2.5mg")]), fmt="ndjson")
+
+        with count_queries() as statements:
+            suggestions = service.autocomplete_products("zolmi")
+        assert statements == []
+        assert [suggestion['name'] for suggestion in suggestions] == ["Zolmitriptan 2.5mg"]
+
+    def test_import_endpoint(self, client, admin_headers):
+        """The endpoint streams the request body and picks the format from Content-Type"""
+        body = CSV_HEADER + "Endpoint Product,From CSV,Acme,,,2.0,5,10,1,2031-01-01\n"
+        response = client.post("/api/products/import", data=body.encode("utf-8"),
+                               content_type="text/csv", headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['imported'] == 1
+        assert data['committed'] is True
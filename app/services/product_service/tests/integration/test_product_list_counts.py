@@ -0,0 +1,121 @@
+"""
+Integration tests for the count strategies of product listings.
+"""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.services.product_service.application.queries.get_products_by_filter import GetProductsByFilterQuery
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.services.product_service.infrastructure.query_services.product_query_service import (
+    PRODUCT_LIST_NAMESPACE,
+    PRODUCT_LIST_WRITE_EVENTS
+)
+from app.services.product_service.service import ProductService
+from app.shared.contracts.product.product_events import ProductCreatedEvent
+from app.shared.infrastructure.persistence.list_counts import ListCountCache
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def products(app, db_session):
+    """Create a handful of products"""
+    for i in range(7):
+        db_session.add(ProductModel(id=uuid4(), name=f"Count {i}", brand="Brand A" if i < 3 else "Brand B"))
+    db_session.commit()
+
+
+@pytest.fixture
+def count_cache(event_bus):
+    return ListCountCache(event_bus=event_bus, invalidation={PRODUCT_LIST_NAMESPACE: PRODUCT_LIST_WRITE_EVENTS})
+
+
+@pytest.fixture
+def cached_product_service(database, event_bus, acl, count_cache):
+    return ProductService(database, event_bus, acl, count_cache=count_cache)
+
+
+class TestProductListCounts:
+    """Totals come with the page, from the cache, or not at all"""
+
+    def test_exact_count_in_same_query(self, product_service, products):
+        """The default mode returns page and total from a single statement"""
+        with count_queries() as statements:
+            result = product_service.list_products(GetProductsByFilterQuery(items_per_page=3))
+
+        assert len(statements) == 1
+        assert result['total_items'] == 7
+        assert result['total_pages'] == 3
+        assert result['total_estimated'] is False
+
+    def test_exact_count_past_last_page(self, product_service, products):
+        """An empty page still reports the total"""
+        result = product_service.list_products(GetProductsByFilterQuery(items_per_page=5, page=4))
+
+        assert result['items'] == []
+        assert result['total_items'] == 7
+
+    def test_cursor_pages_skip_exact_count(self, product_service, products):
+        """Pages after the first carry no exact total and run no COUNT(*)"""
+        first = product_service.list_products(GetProductsByFilterQuery(items_per_page=3))
+        with count_queries() as statements:
+            second = product_service.list_products(
+                GetProductsByFilterQuery(items_per_page=3, cursor=first['next_cursor'])
+            )
+
+        assert first['total_items'] == 7
+        assert len(second['items']) == 3
+        assert second['total_items'] is None
+        assert len(statements) == 1
+        assert "count(" not in statements[0].lower()
+
+    def test_no_total(self, product_service, products):
+        """count_mode=none skips counting"""
+        result = product_service.list_products(GetProductsByFilterQuery(items_per_page=3, count_mode="none"))
+
+        assert len(result['items']) == 3
+        assert result['total_items'] is None
+        assert result['total_pages'] is None
+        assert result['next_cursor']
+
+    def test_cached_count_reused_per_filter(self, cached_product_service, count_cache, products):
+        """A cached total is reused by later pages with the same filters only"""
+        first = cached_product_service.list_products(GetProductsByFilterQuery(items_per_page=2, count_mode="cached"))
+        with count_queries() as statements:
+            second = cached_product_service.list_products(
+                GetProductsByFilterQuery(items_per_page=2, page=2, count_mode="cached")
+            )
+        filtered = cached_product_service.list_products(
+            GetProductsByFilterQuery(brand="Brand A", count_mode="cached")
+        )
+
+        assert first['total_items'] == second['total_items'] == 7
+        assert len(statements) == 1
+        assert filtered['total_items'] == 3
+        assert count_cache.hits == 1
+
+    def test_cached_count_invalidated_by_write_event(self, cached_product_service, event_bus, db_session, products):
+        """Publishing a product write drops the cached totals"""
+        query = GetProductsByFilterQuery(count_mode="cached")
+        assert cached_product_service.list_products(query)['total_items'] == 7
+
+        product = ProductModel(id=uuid4(), name="Count new")
+        db_session.add(product)
+        db_session.commit()
+        assert cached_product_service.list_products(query)['total_items'] == 7
+
+        event_bus.publish(ProductCreatedEvent(
+            id=str(product.id),
+            name=product.name,
+            status="ACTIVE",
+            timestamp=datetime.now(timezone.utc).isoformat()
+        ))
+        assert cached_product_service.list_products(query)['total_items'] == 8
+
+    def test_estimate_falls_back_without_statistics(self, cached_product_service, products):
+        """Without planner statistics (SQLite) estimate mode returns an exact total"""
+        result = cached_product_service.list_products(GetProductsByFilterQuery(count_mode="estimate"))
+
+        assert result['total_items'] == 7
+        assert result['total_estimated'] is False
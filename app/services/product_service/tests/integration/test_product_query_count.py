@@ -0,0 +1,111 @@
+"""
+Integration tests for the number of SQL statements issued by ProductQueryService read paths.
+"""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.services.category_service.infrastructure.persistence.models.category import Category
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.product_service.application.queries.get_product_by_id import GetProductByIdQuery
+from app.services.product_service.application.queries.get_products_by_filter import GetProductsByFilterQuery
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.services.product_service.infrastructure.search.product_search_backend import get_search_backend
+from app.shared.testing.query_count import count_queries
+
+
+@pytest.fixture
+def catalog(app, db_session):
+    """Create products, each with inventory and a category"""
+    category = Category(id=uuid4(), name="Analgesics")
+    db_session.add(category)
+    product_ids = []
+    for i in range(12):
+        product_id = uuid4()
+        db_session.add(ProductModel(
+            id=product_id,
+            category_id=category.id,
+            name=f"Product {i:02d}",
+            description=f"Description {i}",
+            brand="Brand"
+        ))
+        db_session.add(InventoryModel(
+            id=uuid4(),
+            product_id=product_id,
+            quantity=5,
+            price=10.0 + i,
+            max_stock=100,
+            min_stock=10,
+            expiry_date=datetime(2030, 1, 1, tzinfo=timezone.utc)
+        ))
+        product_ids.append(product_id)
+    db_session.flush()
+    get_search_backend(db_session).rebuild(db_session)
+    db_session.commit()
+    db_session.expunge_all()
+    return product_ids
+
+
+class TestProductQueryCount:
+    """Read paths must not issue per-row queries"""
+
+    def _statements_for(self, db_session, func):
+        db_session.expunge_all()
+        with count_queries() as statements:
+            result = func()
+        return result, len(statements)
+
+    def test_list_query_count_constant_across_page_sizes(self, product_service, db_session, catalog):
+        """Listing 2 or 10 products costs the same number of queries"""
+        small, small_count = self._statements_for(
+            db_session, lambda: product_service.list_products(GetProductsByFilterQuery(items_per_page=2))
+        )
+        large, large_count = self._statements_for(
+            db_session, lambda: product_service.list_products(GetProductsByFilterQuery(items_per_page=10))
+        )
+
+        assert len(small['items']) == 2
+        assert len(large['items']) == 10
+        assert large['items'][0]['category'] == "Analgesics"
+        assert large['items'][0]['stockQuantity'] == 5
+        assert small_count == large_count
+
+    def test_search_query_count_constant_across_page_sizes(self, product_service, db_session, catalog):
+        """Searching with 2 or 10 results per page costs the same number of queries"""
+        small, small_count = self._statements_for(
+            db_session, lambda: product_service.search_products("Product", page_size=2)
+        )
+        large, large_count = self._statements_for(
+            db_session, lambda: product_service.search_products("Product", page_size=10)
+        )
+
+        assert len(small['items']) == 2
+        assert len(large['items']) == 10
+        assert small_count == large_count
+
+    def test_low_stock_query_count_constant_across_page_sizes(self, product_service, db_session, catalog):
+        """Low stock pages of 2 or 10 items cost the same number of queries"""
+        small, small_count = self._statements_for(
+            db_session, lambda: product_service.get_low_stock_products(page_size=2)
+        )
+        large, large_count = self._statements_for(
+            db_session, lambda: product_service.get_low_stock_products(page_size=10)
+        )
+
+        assert len(small['items']) == 2
+        assert len(large['items']) == 10
+        assert small_count == large_count
+
+    def test_get_by_id_single_query(self, product_service, db_session, catalog):
+        """Product detail loads product, inventory and category in one query"""
+        result, count = self._statements_for(
+            db_session, lambda: product_service.get_product(GetProductByIdQuery(id=catalog[0]))
+        )
+
+        assert result.id == catalog[0]
+        assert count == 1
+
+    def test_get_by_id_missing_product(self, product_service, db_session, catalog):
+        """Unknown product IDs return None"""
+        assert product_service.get_product(GetProductByIdQuery(id=uuid4())) is None
@@ -0,0 +1,120 @@
+"""
+Integration tests for the product full-text search backends.
+"""
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.dataBase import db
+from app.services.product_service.application.commands.create_product_command import CreateProductCommand
+from app.services.product_service.application.commands.delete_product_command import DeleteProductCommand
+from app.services.product_service.application.commands.update_product_command import UpdateProductCommand
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.services.product_service.infrastructure.search.product_search_backend import (
+    PostgresSearchBackend,
+    SqliteFtsSearchBackend,
+    get_search_backend,
+)
+
+
+def _product_data(name, description="A product", brand="Generic"):
+    return {
+        "product_fields": {
+            "name": name,
+            "description": description,
+            "brand": brand,
+            "dosage_form": "Tablet",
+            "strength": "500mg",
+            "status": "ACTIVE"
+        },
+        "inventory_fields": {
+            "price": 10.0,
+            "quantity": 10,
+            "max_stock": 100,
+            "min_stock": 5,
+            "expiry_date": "2030-01-01"
+        }
+    }
+
+
+def _names(result):
+    return [item['product_fields']['name'] for item in result['items']]
+
+
+class TestSqliteFtsSearch:
+    """FTS5 backend used for SQLite databases"""
+
+    def test_sqlite_uses_fts5_backend(self, app, db_session):
+        """SQLite databases with FTS5 get the FTS backend"""
+        assert isinstance(get_search_backend(db_session), SqliteFtsSearchBackend)
+
+    def test_search_follows_create_update_delete(self, product_service, db_session):
+        """The index is kept in sync with product writes"""
+        created = product_service.create_product(CreateProductCommand(**_product_data("Paracetamol")))
+        assert _names(product_service.search_products("parac")) == ["Paracetamol"]
+
+        update_data = _product_data("Ibuprofen")
+        update_data['id'] = created.id
+        product_service.update_product(UpdateProductCommand(**update_data))
+        assert _names(product_service.search_products("paracetamol")) == []
+        assert _names(product_service.search_products("ibupro")) == ["Ibuprofen"]
+
+        product_service.delete_product(DeleteProductCommand(id=created.id))
+        assert _names(product_service.search_products("ibuprofen")) == []
+
+    def test_search_ranks_name_matches_first(self, product_service, db_session):
+        """Products matching on several columns outrank description-only matches"""
+        product_service.create_product(CreateProductCommand(**_product_data(
+            "Zinc Syrup", description="Contains aspirin traces"
+        )))
+        product_service.create_product(CreateProductCommand(**_product_data(
+            "Aspirin", description="Aspirin tablets", brand="Aspirin Labs"
+        )))
+
+        assert _names(product_service.search_products("aspirin")) == ["Aspirin", "Zinc Syrup"]
+
+    def test_search_requires_all_terms(self, product_service, db_session):
+        """Multi-word searches match products containing every term"""
+        product_service.create_product(CreateProductCommand(**_product_data("Vitamin C", brand="Health Plus")))
+        product_service.create_product(CreateProductCommand(**_product_data("Vitamin D", brand="Sun Labs")))
+
+        assert _names(product_service.search_products("vitamin health")) == ["Vitamin C"]
+
+    def test_search_term_is_not_interpreted_as_fts_syntax(self, product_service, db_session):
+        """Quotes and FTS operators in the term are treated as plain text"""
+        product_service.create_product(CreateProductCommand(**_product_data("Cough Drops")))
+
+        assert _names(product_service.search_products('"cough" OR NEAR(*')) == []
+        assert _names(product_service.search_products('cough"')) == ["Cough Drops"]
+
+    def test_rebuild_indexes_rows_written_outside_the_repository(self, app, db_session):
+        """Rebuilding picks up products inserted directly into the table"""
+        db_session.add(ProductModel(id=uuid4(), name="Loratadine", description="Allergy relief"))
+        db_session.commit()
+        backend = get_search_backend(db_session)
+        query = db_session.query(ProductModel)
+
+        assert backend.apply(query, "lorat")[0].count() == 0
+        backend.rebuild(db_session)
+        assert backend.apply(query, "lorat")[0].count() == 1
+
+
+class TestPostgresSearchSql:
+    """SQL produced by the PostgreSQL backend"""
+
+    def test_query_uses_tsvector_match_and_rank(self, app):
+        """Searches go through the generated tsvector column and are ranked with ts_rank"""
+        backend = PostgresSearchBackend()
+        query, relevance_order = backend.apply(db.session.query(ProductModel.id), "para 500")
+        sql = str(query.order_by(relevance_order).statement.compile(dialect=postgresql.dialect()))
+
+        assert "products.search_vector @@ to_tsquery" in sql
+        assert "ts_rank(products.search_vector" in sql
+
+    def test_term_without_words_does_not_filter(self, app):
+        """Searches without any word characters leave the query untouched"""
+        backend = PostgresSearchBackend()
+        query, relevance_order = backend.apply(db.session.query(ProductModel.id), "%%")
+
+        assert relevance_order is None
+        assert "@@" not in str(query.statement.compile(dialect=postgresql.dialect()))
@@ -0,0 +1,120 @@
+"""
+Integration tests for sorted product listings and searches.
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+from app.services.product_service.application.queries.get_products_by_filter import GetProductsByFilterQuery
+from app.services.product_service.infrastructure.persistence.models.product_model import ProductModel
+from app.services.product_service.infrastructure.search.product_search_backend import get_search_backend
+from app.shared.utils.cursor_pagination import InvalidCursorError
+
+# name, price, quantity; prices and quantities repeat to exercise the id tie-breaker
+CATALOG = [
+    ("Vitamin C", 4.0, 0),
+    ("Vitamin D", 2.5, 12),
+    ("Aspirin", 2.5, 3),
+    ("Zinc", 9.0, 12),
+    ("Ibuprofen", 1.0, 7),
+    ("Vitamin B12", 4.0, 5),
+    ("Omega 3", 15.0, 0),
+]
+
+
+@pytest.fixture
+def priced_products(app, db_session):
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    ids = []
+    for offset, (name, price, quantity) in enumerate(CATALOG):
+        product = ProductModel(id=uuid4(), name=name, brand="Brand", description=name,
+                               created_at=created + timedelta(days=offset))
+        db_session.add(product)
+        db_session.add(InventoryModel(id=uuid4(), product_id=product.id, price=price, quantity=quantity,
+                                      max_stock=100, min_stock=1, expiry_date=datetime(2030, 1, 1, tzinfo=timezone.utc)))
+        ids.append(product.id)
+    # No inventory: left out of price and stock orderings
+    db_session.add(ProductModel(id=uuid4(), name="Unpriced", brand="Brand", description="Unpriced"))
+    db_session.flush()
+    get_search_backend(db_session).index(db_session, ids)
+    db_session.commit()
+
+
+def _walk(product_service, **filters):
+    result = product_service.list_products(GetProductsByFilterQuery(items_per_page=2, **filters))
+    items = list(result['items'])
+    while result['next_cursor']:
+        result = product_service.list_products(
+            GetProductsByFilterQuery(items_per_page=2, cursor=result['next_cursor'], **filters)
+        )
+        items.extend(result['items'])
+    return items
+
+
+class TestProductSorting:
+    """Every sort field orders pages in SQL and pages by keyset cursor"""
+
+    @pytest.mark.parametrize("sort_by, sort_direction, key", [
+        ("price", "asc", lambda item: (item['price'],)),
+        ("price", "desc", lambda item: (-item['price'],)),
+        ("stock", "desc", lambda item: (-item['stockQuantity'],)),
+    ])
+    def test_inventory_sorts(self, product_service, priced_products, sort_by, sort_direction, key):
+        """Cursor walks come back fully sorted and skip products without inventory"""
+        items = _walk(product_service, sort_by=sort_by, sort_direction=sort_direction)
+
+        assert len(items) == len(CATALOG)
+        assert len({item['id'] for item in items}) == len(CATALOG)
+        assert [key(item) for item in items] == sorted(key(item) for item in items)
+
+    def test_cursor_pages_match_numbered_pages(self, product_service, priced_products):
+        """Seeking and OFFSET agree on every page, including tied prices"""
+        walked = _walk(product_service, sort_by="price", sort_direction="desc")
+        numbered = []
+        for page in range(1, 5):
+            numbered.extend(product_service.list_products(GetProductsByFilterQuery(
+                items_per_page=2, page=page, sort_by="price", sort_direction="desc"
+            ))['items'])
+
+        assert [item['id'] for item in walked] == [item['id'] for item in numbered]
+
+    def test_created_at_newest_first(self, product_service, priced_products):
+        """Recency sorting reads creation time backwards"""
+        items = _walk(product_service, sort_by="created_at", sort_direction="desc")
+
+        # "Unpriced" was created last, without an explicit timestamp
+        assert [item['name'] for item in items] == ["Unpriced"] + [name for name, _, _ in reversed(CATALOG)]
+
+    def test_brand_sorts_by_name(self, product_service, priced_products):
+        """brand has no keyset ordering of its own and falls back to name"""
+        by_brand = _walk(product_service, sort_by="brand")
+        by_name = _walk(product_service, sort_by="name")
+
+        assert [item['id'] for item in by_brand] == [item['id'] for item in by_name]
+
+    def test_cursor_bound_to_sort(self, product_service, priced_products):
+        """A cursor issued for one ordering is rejected by another"""
+        cursor = product_service.list_products(
+            GetProductsByFilterQuery(items_per_page=2, sort_by="price")
+        )['next_cursor']
+
+        with pytest.raises(InvalidCursorError):
+            product_service.list_products(GetProductsByFilterQuery(items_per_page=2, sort_by="stock", cursor=cursor))
+
+    def test_search_sorted_and_filtered(self, product_service, priced_products):
+        """Text searches honour sort_by and the price and stock filters"""
+        result = product_service.search_products("vitamin", filters={
+            "sort_by": "price", "sort_direction": "asc", "in_stock_only": True, "max_price": 4.0
+        })
+
+        assert [item['product_fields']['name'] for item in result['items']] == ["Vitamin D", "Vitamin B12"]
+        assert result['total_items'] == 2
+
+    def test_search_defaults_to_relevance(self, product_service, priced_products):
+        """Without sort_by a text search stays relevance ranked on page numbers"""
+        result = product_service.search_products("vitamin")
+
+        assert len(result['items']) == 3
+        assert result['next_cursor'] is None
@@ -0,0 +1,105 @@
+"""
+Unit tests for the versioned product DTO cache.
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.services.inventory_service.application.events.stock_release_requested_event import StockReleaseRequestedEvent
+from app.services.product_service.infrastructure.cache.product_dto_cache import ProductDtoCache
+from app.shared.application.events.event_bus import EventBus
+from app.shared.contracts.category.category_events import CategoryUpdatedEvent
+from app.shared.contracts.product.product_events import ProductUpdatedEvent
+
+
+def _dto(category_id=None):
+    return SimpleNamespace(product_fields=SimpleNamespace(category_id=category_id), name="Paracetamol")
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+class TestProductDtoCache:
+    """Lookups, versioning, LRU bounds and event driven eviction"""
+
+    def test_hit_returns_copy(self):
+        """A cached DTO is returned as a copy and counted as a hit"""
+        cache = ProductDtoCache()
+        product_id = uuid4()
+        assert cache.get(product_id) is None
+
+        dto = _dto()
+        assert cache.put(product_id, cache.version(product_id), dto)
+        cached = cache.get(product_id)
+
+        assert cached is not dto
+        assert cached.name == "Paracetamol"
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_stale_version_rejected(self):
+        """A DTO loaded before a write is not stored after it"""
+        cache = ProductDtoCache()
+        product_id = uuid4()
+        version = cache.version(product_id)
+
+        cache.invalidate([product_id])
+
+        assert cache.put(product_id, version, _dto()) is False
+        assert cache.get(product_id) is None
+
+    def test_entries_expire_after_ttl(self):
+        """Writes seen only by another worker are picked up once the entry expires"""
+        cache = ProductDtoCache(ttl_seconds=0)
+        product_id = uuid4()
+        cache.put(product_id, cache.version(product_id), _dto())
+
+        assert cache.get(product_id) is None
+        assert len(cache) == 0
+        assert cache.stats()['expirations'] == 1
+
+    def test_lru_bound(self):
+        """The least recently used entry is evicted past max_entries"""
+        cache = ProductDtoCache(max_entries=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        for product_id in (first, second):
+            cache.put(product_id, cache.version(product_id), _dto())
+        cache.get(first)
+        cache.put(third, cache.version(third), _dto())
+
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.stats()['evictions'] == 1
+
+    def test_bounded_versions_never_resurrect_stale_entries(self):
+        """Dropping version counters only causes misses"""
+        cache = ProductDtoCache(max_entries=1)
+        product_id = uuid4()
+        version = cache.version(product_id)
+        cache.invalidate([product_id])
+        cache.invalidate([uuid4() for _ in range(10)])
+
+        assert cache.put(product_id, version, _dto()) is False
+
+    def test_events_evict(self):
+        """Product, stock release and category events evict the affected entries"""
+        event_bus = EventBus()
+        cache = ProductDtoCache(event_bus=event_bus)
+        category_id = uuid4()
+        updated, released, categorized, untouched = uuid4(), uuid4(), uuid4(), uuid4()
+        for product_id in (updated, released, untouched):
+            cache.put(product_id, cache.version(product_id), _dto())
+        cache.put(categorized, cache.version(categorized), _dto(category_id))
+
+        event_bus.publish(ProductUpdatedEvent(id=str(updated), name="X", status="ACTIVE", timestamp=_now()))
+        event_bus.publish(StockReleaseRequestedEvent(
+            order_id=str(uuid4()), items=[{'product_id': str(released), 'quantity': 1}]
+        ))
+        event_bus.publish(CategoryUpdatedEvent(id=str(category_id), name="Renamed", timestamp=_now()))
+
+        assert cache.get(updated) is None
+        assert cache.get(released) is None
+        assert cache.get(categorized) is None
+        assert cache.get(untouched) is not None
+        assert cache.stats()['invalidations'] == 3
@@ -0,0 +1,79 @@
+"""
+Unit tests for the in-memory product prefix index.
+"""
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.services.inventory_service.application.events.stock_release_requested_event import StockReleaseRequestedEvent
+from app.services.product_service.infrastructure.search.product_prefix_index import ProductPrefixIndex, normalize_text
+from app.shared.contracts.product.product_events import ProductCreatedEvent, ProductDeletedEvent, ProductUpdatedEvent
+
+
+def _names(results):
+    return [result['name'] for result in results]
+
+
+class TestProductPrefixIndex:
+    """Prefix lookups, ranking and incremental updates"""
+
+    def test_normalize_text(self):
+        """Accents, case and punctuation are folded"""
+        assert normalize_text("  Ibuprofène-Forte 400mg ") == "ibuprofene forte 400mg"
+
+    def test_matches_name_brand_and_inner_words(self):
+        """Prefixes match the start of any word of the name or brand"""
+        index = ProductPrefixIndex()
+        index.upsert("1", "Paracetamol 500mg", "Acme Pharma")
+        index.upsert("2", "Amoxicillin", "Beta Medical")
+
+        assert _names(index.search("para")) == ["Paracetamol 500mg"]
+        assert _names(index.search("500")) == ["Paracetamol 500mg"]
+        assert _names(index.search("beta med")) == ["Amoxicillin"]
+        assert index.search("xyz") == []
+        assert index.search("  ") == []
+
+    def test_ranks_by_popularity_then_name(self):
+        """More popular products come first, ties are alphabetical"""
+        index = ProductPrefixIndex()
+        index.upsert("1", "Vitamin A", None)
+        index.upsert("2", "Vitamin B", None)
+        index.upsert("3", "Vitamin C", None)
+        index.add_popularity("3", 5)
+
+        assert _names(index.search("vit")) == ["Vitamin C", "Vitamin A", "Vitamin B"]
+        assert _names(index.search("vit", limit=2)) == ["Vitamin C", "Vitamin A"]
+
+    def test_update_and_remove(self):
+        """Renamed products move to their new keys, removed ones disappear"""
+        index = ProductPrefixIndex()
+        index.upsert("1", "Aspirin", None)
+        assert _names(index.search("asp")) == ["Aspirin"]
+
+        index.upsert("1", "Ibuprofen", None)
+        assert index.search("asp") == []
+        assert _names(index.search("ibu")) == ["Ibuprofen"]
+
+        index.upsert("1", "Ibuprofen", None, active=False)
+        assert index.search("ibu") == []
+
+        index.upsert("1", "Ibuprofen", None)
+        index.remove("1")
+        assert index.search("ibu") == []
+        assert len(index) == 0
+
+    def test_follows_product_and_order_events(self):
+        """The index listens to product writes and order stock releases"""
+        event_bus = SimpleNamespace(handlers={})
+        event_bus.subscribe = lambda event_type, handler: event_bus.handlers.setdefault(event_type, []).append(handler)
+        event_bus.publish = lambda event: [handler(event) for handler in event_bus.handlers.get(type(event), [])]
+        index = ProductPrefixIndex(event_bus=event_bus)
+        first, second = str(uuid4()), str(uuid4())
+
+        for product_id, name in ((first, "Zinc Tablets"), (second, "Zinc Syrup")):
+            event_bus.publish(ProductCreatedEvent(id=product_id, name=name, status="ACTIVE", timestamp="now"))
+        event_bus.publish(StockReleaseRequestedEvent(order_id="o1", items=[{'product_id': second, 'quantity': 3}]))
+        assert _names(index.search("zinc")) == ["Zinc Syrup", "Zinc Tablets"]
+
+        event_bus.publish(ProductUpdatedEvent(id=first, name="Zinc Tablets", status="INACTIVE", timestamp="now"))
+        event_bus.publish(ProductDeletedEvent(id=second, name="Zinc Syrup", timestamp="now"))
+        assert index.search("zinc") == []
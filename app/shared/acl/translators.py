@@ -74,6 +74,19 @@ class GetProductTranslator():
         return response
 
 
+class GetProductNamesTranslator():
+    def to_service_format(self, data: Dict[str, Any]) -> List[UUID]:
+        """Convert external data to the list of product IDs to look up"""
+        return [
+            product_id if isinstance(product_id, UUID) else UUID(str(product_id))
+            for product_id in data.get('product_ids', [])
+        ]
+
+    def to_response_format(self, response: Dict[UUID, str]) -> Dict[str, str]:
+        """Key the product names by string ID"""
+        return {str(product_id): name for product_id, name in response.items()}
+
+
 class GetProductsTranslator():
     def to_service_format(self, data: Dict[str, Any]) -> GetProductsRequestContract:
         """Convert external data to product listing request"""
@@ -122,7 +135,9 @@ class TranslatorFactory:
     def __init__(self):
         self.translators = {
             "STOCK_CHECK": StockCheckTranslator(),
+            "RESERVE_STOCK": StockCheckTranslator(),
             "GET_PRODUCT": GetProductTranslator(),
+            "GET_PRODUCT_NAMES": GetProductNamesTranslator(),
             "GET_PRODUCTS": GetProductsTranslator(),
             "SEARCH_PRODUCTS": SearchProductsTranslator(),
             "CATEGORY_PRODUCTS": CategoryProductsTranslator(),
@@ -243,6 +258,7 @@ class OrderTranslator:
         self._translators = {
             "GET_PROCESSING_ORDERS": self._handle_get_processing_orders,
             "GET_PRIORITIZED_ORDERS_FOR_DELIVERY": self._handle_get_prioritized_orders_for_delivery,
+            "GET_PRODUCT_SALES": self._handle_get_product_sales,
         }
 
     def to_service_format(self, query_type: str, data: Dict[str, Any]) -> Any:
@@ -256,11 +272,14 @@ class OrderTranslator:
             return domain_data
         if query_type == "GET_PRIORITIZED_ORDERS_FOR_DELIVERY":
             return domain_data
+        if query_type == "GET_PRODUCT_SALES":
+            return domain_data
 
     def _handle_get_processing_orders(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle GET_PROCESSING_ORDERS operation"""
         return {
             "status": "PROCESSING",
+            "limit": self._field(data, "limit"),
             "include_details": True
         }
 
@@ -268,9 +287,25 @@ class OrderTranslator:
         """Handle GET_PRIORITIZED_ORDERS_FOR_DELIVERY operation"""
         return {
             "priority_logic": "SHIPPED_FIRST_THEN_PROCESSING",
+            "limit": self._field(data, "limit"),
+            "group_by_location": bool(self._field(data, "group_by_location")),
+            "health_care_center_id": self._field(data, "health_care_center_id"),
             "include_details": True
         }
 
+    def _handle_get_product_sales(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle GET_PRODUCT_SALES operation"""
+        return {"limit": self._field(data, "limit")}
+
+    @staticmethod
+    def _field(data: Any, name: str) -> Any:
+        """A field of a request object or dictionary, None when absent"""
+        if data is None:
+            return None
+        if isinstance(data, dict):
+            return data.get(name)
+        return getattr(data, name, None)
+
 
 class AuthTranslator:
     def __init__(self):
@@ -278,6 +313,8 @@ class AuthTranslator:
             "GET_USER_HEALTH_CARE_CENTER": self._handle_get_user_health_care_center,
             "GET_HEALTH_CARE_CENTER_BY_ID": self._handle_get_health_care_center_by_id,
             "GET_USER_BY_ID": self._handle_get_user_by_id,
+            "GET_USERS_BY_IDS": self._handle_get_users_by_ids,
+            "GET_HEALTH_CARE_CENTERS_BY_IDS": self._handle_get_health_care_centers_by_ids,
         }
 
     def to_service_format(self, query_type: str, data: Dict[str, Any]) -> Any:
@@ -287,7 +324,8 @@ class AuthTranslator:
         return translator(data)
 
     def to_response_format(self, query_type: str, domain_data) -> Dict[str, Any]:
-        if query_type in ["GET_USER_HEALTH_CARE_CENTER", "GET_HEALTH_CARE_CENTER_BY_ID", "GET_USER_BY_ID"]:
+        if query_type in ["GET_USER_HEALTH_CARE_CENTER", "GET_HEALTH_CARE_CENTER_BY_ID", "GET_USER_BY_ID",
+                          "GET_USERS_BY_IDS", "GET_HEALTH_CARE_CENTERS_BY_IDS"]:
             return domain_data
 
     def _handle_get_user_health_care_center(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -308,6 +346,14 @@ class AuthTranslator:
             return {"user_id": data.user_id}
         return {"user_id": data.get("user_id")}
 
+    def _handle_get_users_by_ids(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle GET_USERS_BY_IDS operation"""
+        return {"user_ids": list(data.get("user_ids") or [])}
+
+    def _handle_get_health_care_centers_by_ids(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle GET_HEALTH_CARE_CENTERS_BY_IDS operation"""
+        return {"center_ids": list(data.get("center_ids") or [])}
+
 
 class DeliveryTranslator:
     def __init__(self):
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class UserUpdatedEvent(BaseModel):
+    """
+    Event contract for a committed change of a user's name or health care center.
+    """
+    id: str
+    full_name: str
+    health_care_center_id: Optional[str] = None
+    health_care_center_name: Optional[str] = None
+    timestamp: str
+
+
+class HealthCareCenterUpdatedEvent(BaseModel):
+    """
+    Event contract for a committed health care center update.
+    """
+    id: str
+    name: str
+    timestamp: str
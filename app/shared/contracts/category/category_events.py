@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+
+class CategoryCreatedEvent(BaseModel):
+    """
+    Event contract for a committed category creation.
+    """
+    id: str
+    name: str
+    timestamp: str
+
+
+class CategoryUpdatedEvent(BaseModel):
+    """
+    Event contract for a committed category update.
+    """
+    id: str
+    name: str
+    timestamp: str
+
+
+class CategoryDeletedEvent(BaseModel):
+    """
+    Event contract for a committed category deletion.
+    """
+    id: str
+    timestamp: str
@@ -76,5 +76,13 @@ class StockCheckResponseContract(BaseModel):
 
     def is_legit(self):
         return self.summary.available_items == self.summary.total_items
-    
-    
\ No newline at end of file
+
+
+class StockReservationResponseContract(BaseModel):
+    """Contract for a stock reservation response"""
+    success: bool
+    reserved_product_ids: List[UUID] = []
+    # Quantity still reservable of each product that could not be reserved
+    available_quantities: Dict[UUID, int] = {}
+    # Stock check of the products that could not be reserved
+    stock_check: Optional[StockCheckResponseContract] = None
@@ -0,0 +1,33 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class OrderPlacedEvent(BaseModel):
+    """
+    Event contract for a committed order creation.
+    """
+    id: str
+    user_id: Optional[str] = None
+    status: str
+    total_amount: str
+    created_at: Optional[str] = None
+    timestamp: str
+
+
+class OrderStatusChangedEvent(BaseModel):
+    """
+    Event contract for a committed order status change.
+    """
+    id: str
+    old_status: str
+    new_status: str
+    timestamp: str
+
+
+class OrdersArchivedEvent(BaseModel):
+    """
+    Event contract for a committed batch of orders moved to the archive tables.
+    """
+    count: int
+    cutoff: str
+    timestamp: str
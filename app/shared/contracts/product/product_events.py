@@ -47,4 +47,11 @@ class ProductStatusChangedEvent(BaseModel):
     name: str
     old_status: str
     new_status: str
-    timestamp: str 
\ No newline at end of file
+    timestamp: str 
+
+class ProductsImportedEvent(BaseModel):
+    """
+    Event contract for a committed bulk catalog import.
+    """
+    count: int
+    timestamp: str
@@ -0,0 +1,221 @@
+"""
+Idempotency-Key support for retried writes.
+
+Clients that retry a POST after a timeout send the same Idempotency-Key header.
+The first request claims the key, runs, and stores its response; every retry
+gets that response back without running the request again.
+
+Completed responses are kept in a per-process LRU, so a retry landing on the
+same worker is answered from memory. The idempotency_keys table is shared by
+all workers and is the source of truth: claiming a key is an INSERT on its
+primary key, so only one of several concurrent requests runs.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.dataBase import Database
+from app.shared.infrastructure.persistence.models.idempotency_key_model import IdempotencyKeyModel
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+# A claim not completed within this time is taken to belong to a request that died
+DEFAULT_LEASE_SECONDS = 60
+
+
+class ClaimState(str, Enum):
+    """Outcome of claiming an idempotency key"""
+    NEW = "new"                  # Claimed: run the request, then complete() or release()
+    REPLAY = "replay"            # Already completed: return the stored response
+    MISMATCH = "mismatch"        # Key used before for a different request
+    IN_PROGRESS = "in_progress"  # Another request with this key is still running
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    status_code: int
+    body: str
+
+
+@dataclass(frozen=True)
+class Claim:
+    state: ClaimState
+    response: Optional[StoredResponse] = None
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite hands timestamps back naive; they are stored as UTC"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+class IdempotencyStore:
+    """
+    Two-level store of idempotent responses: an in-process LRU over the shared table.
+
+    Keys are namespaced by a scope naming the endpoint and the caller, so two
+    users can pick the same key. Claims and completions commit on the request's
+    session; the request's own writes commit before complete() is called.
+    """
+
+    def __init__(self, db: Database, ttl_seconds: Optional[float] = None, max_entries: int = 10000,
+                 lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        """
+        Args:
+            db: Database whose session holds the idempotency_keys table
+            ttl_seconds: How long a completed response is replayed (24 hours by default)
+            max_entries: Maximum number of responses kept in memory
+            lease_seconds: Age after which an unfinished claim may be taken over
+        """
+        self._db = db
+        self._ttl = timedelta(seconds=ttl_seconds or DEFAULT_TTL_SECONDS)
+        self._lease = timedelta(seconds=lease_seconds)
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, StoredResponse, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def begin(self, scope: str, key: str, fingerprint: str) -> Claim:
+        """
+        Claim a key for a request, or find out what happened to it before.
+
+        Args:
+            scope: Endpoint and caller the key belongs to
+            key: Client supplied Idempotency-Key
+            fingerprint: Hash of the request, to detect a key reused for another request
+        """
+        cached = self._cached(scope, key)
+        if cached is not None:
+            return self._from_row(fingerprint, *cached)
+
+        session = self._db.get_session()
+        now = datetime.now(timezone.utc)
+        try:
+            session.execute(insert(IdempotencyKeyModel).values(
+                scope=scope, key=key, fingerprint=fingerprint, created_at=now, expires_at=now + self._ttl
+            ))
+            session.commit()
+            return Claim(ClaimState.NEW)
+        except IntegrityError:
+            session.rollback()
+
+        row = session.execute(
+            select(IdempotencyKeyModel.fingerprint, IdempotencyKeyModel.status_code, IdempotencyKeyModel.body,
+                   IdempotencyKeyModel.created_at, IdempotencyKeyModel.expires_at)
+            .where(IdempotencyKeyModel.scope == scope, IdempotencyKeyModel.key == key)
+        ).first()
+        if row is None:
+            # Purged in the meantime
+            return self.begin(scope, key, fingerprint)
+        stored_fingerprint, status_code, body, created_at, expires_at = row
+        expires_at = _as_utc(expires_at)
+
+        if expires_at <= now or (status_code is None and _as_utc(created_at) + self._lease <= now):
+            return self._take_over(scope, key, fingerprint, created_at, now)
+        if status_code is None:
+            return Claim(ClaimState.MISMATCH if stored_fingerprint != fingerprint else ClaimState.IN_PROGRESS)
+
+        response = StoredResponse(status_code, body)
+        self._remember(scope, key, stored_fingerprint, response, expires_at)
+        return self._from_row(fingerprint, stored_fingerprint, response)
+
+    def complete(self, scope: str, key: str, status_code: int, body: str) -> None:
+        """Store the response of a claimed key for its retries"""
+        session = self._db.get_session()
+        expires_at = datetime.now(timezone.utc) + self._ttl
+        fingerprint = session.execute(
+            update(IdempotencyKeyModel)
+            .where(IdempotencyKeyModel.scope == scope, IdempotencyKeyModel.key == key)
+            .values(status_code=status_code, body=body, expires_at=expires_at)
+            .returning(IdempotencyKeyModel.fingerprint)
+        ).scalar()
+        session.commit()
+        if fingerprint is not None:
+            self._remember(scope, key, fingerprint, StoredResponse(status_code, body), expires_at)
+
+    def release(self, scope: str, key: str) -> None:
+        """Give up an unfinished claim, so the request can be retried"""
+        session = self._db.get_session()
+        session.rollback()
+        session.execute(
+            delete(IdempotencyKeyModel)
+            .where(IdempotencyKeyModel.scope == scope, IdempotencyKeyModel.key == key,
+                   IdempotencyKeyModel.status_code.is_(None))
+        )
+        session.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete the expired keys from the table and from memory.
+
+        Returns:
+            Number of rows deleted
+        """
+        now = time.monotonic()
+        with self._lock:
+            for cache_key in [cache_key for cache_key, entry in self._entries.items() if entry[2] <= now]:
+                del self._entries[cache_key]
+        session = self._db.get_session()
+        deleted = session.execute(
+            delete(IdempotencyKeyModel).where(IdempotencyKeyModel.expires_at <= datetime.now(timezone.utc))
+        ).rowcount
+        session.commit()
+        return deleted
+
+    def clear(self) -> None:
+        """Forget the responses kept in memory"""
+        with self._lock:
+            self._entries.clear()
+
+    def _take_over(self, scope: str, key: str, fingerprint: str, created_at: datetime, now: datetime) -> Claim:
+        """Reclaim an expired key or an abandoned claim, unless another request got there first"""
+        session = self._db.get_session()
+        claimed = session.execute(
+            update(IdempotencyKeyModel)
+            .where(IdempotencyKeyModel.scope == scope, IdempotencyKeyModel.key == key,
+                   IdempotencyKeyModel.created_at == created_at)
+            .values(fingerprint=fingerprint, status_code=None, body=None,
+                    created_at=now, expires_at=now + self._ttl)
+        ).rowcount
+        session.commit()
+        return Claim(ClaimState.NEW) if claimed else self.begin(scope, key, fingerprint)
+
+    @staticmethod
+    def _from_row(fingerprint: str, stored_fingerprint: str, response: StoredResponse) -> Claim:
+        if stored_fingerprint != fingerprint:
+            return Claim(ClaimState.MISMATCH)
+        return Claim(ClaimState.REPLAY, response)
+
+    def _cached(self, scope: str, key: str) -> Optional[Tuple[str, StoredResponse]]:
+        with self._lock:
+            entry = self._entries.get((scope, key))
+            if entry is None:
+                return None
+            if entry[2] <= time.monotonic():
+                del self._entries[(scope, key)]
+                return None
+            self._entries.move_to_end((scope, key))
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def _remember(self, scope: str, key: str, fingerprint: str, response: StoredResponse,
+                  expires_at: datetime) -> None:
+        remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        with self._lock:
+            self._entries[(scope, key)] = (fingerprint, response, time.monotonic() + remaining)
+            self._entries.move_to_end((scope, key))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,224 @@
+"""
+Count strategies for paginated list queries.
+
+A separate COUNT(*) over the filtered set costs about as much as reading the
+page itself. Listings pick one of these strategies instead:
+
+- exact:    COUNT(*) OVER () on the page query, so rows and total come back in one round trip
+- cached:   exact count memoized per filter signature, dropped when a write event arrives
+- estimate: planner statistics for unfiltered lists (PostgreSQL), exact elsewhere
+- none:     no total at all, for clients that only follow next links
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from app.shared.application.events.event_bus import EventBus
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+class CountMode(str, Enum):
+    """How a listing computes its total"""
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> "CountMode":
+        """Parse a client supplied mode, defaulting to exact"""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(value) if value else cls.EXACT
+        except ValueError:
+            return cls.EXACT
+
+
+COUNT_MODES = [mode.value for mode in CountMode]
+
+
+def filter_signature(filters: Dict[str, Any], ignore: Iterable[str] = ()) -> str:
+    """
+    Build a stable cache key from the filters of a listing.
+
+    Args:
+        filters: Filter values of the listing query
+        ignore: Keys that do not change the filtered set (paging, sorting, ...)
+
+    Returns:
+        Canonical JSON string of the non-empty filters
+    """
+    ignored = set(ignore)
+    relevant = {key: value for key, value in filters.items() if key not in ignored and value is not None}
+    return json.dumps(relevant, sort_keys=True, default=str)
+
+
+class ListCountCache:
+    """
+    Process-wide cache of exact list totals keyed by (namespace, filter signature).
+
+    Other aggregates of a filtered set (e.g. facet counts) can be kept under their
+    own namespace; cached values are shared and must not be mutated. Each
+    namespace is cleared by the write events it is registered for. Entries also
+    expire after ttl_seconds, which bounds staleness for writes that bypass the
+    event bus.
+    """
+
+    def __init__(self, event_bus: Optional[EventBus] = None, invalidation: Optional[Dict[str, Iterable[Type]]] = None,
+                 max_entries: int = 2048, ttl_seconds: float = 300.0):
+        """
+        Args:
+            event_bus: Event bus delivering write events
+            invalidation: Write event classes per namespace, e.g. {"orders": (OrderPlacedEvent,)}
+            max_entries: Maximum number of cached totals
+            ttl_seconds: Lifetime of a cached total
+        """
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, float]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._event_bus = event_bus
+        self.hits = 0
+        self.misses = 0
+        for namespace, event_types in (invalidation or {}).items():
+            self.invalidate_on(namespace, event_types)
+
+    def invalidate_on(self, namespace: str, event_types: Iterable[Type]) -> None:
+        """
+        Clear a namespace whenever one of the given events is published.
+
+        Args:
+            namespace: Listing namespace (e.g. "products")
+            event_types: Event classes signalling a write to that listing
+        """
+        if not self._event_bus:
+            return
+        handler = lambda event: self._handle_write_event(namespace, event)
+        for event_type in event_types:
+            self._event_bus.subscribe(event_type, handler)
+
+    def get(self, namespace: str, signature: str) -> Optional[Any]:
+        key = (namespace, signature)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, namespace: str, signature: str, total: Any) -> None:
+        with self._lock:
+            self._entries[(namespace, signature)] = (total, time.monotonic() + self._ttl_seconds)
+            self._entries.move_to_end((namespace, signature))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop the totals of one namespace, or all of them"""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == namespace]:
+                    del self._entries[key]
+
+    def _handle_write_event(self, namespace: str, event: Any) -> None:
+        try:
+            self.invalidate(namespace)
+        except Exception as e:
+            logger.error(f"Failed to invalidate cached '{namespace}' counts: {str(e)}")
+
+
+def estimate_row_count(session: Session, table_name: str) -> Optional[int]:
+    """
+    Read the planner's row estimate for a table.
+
+    Args:
+        session: Database session
+        table_name: Table to estimate
+
+    Returns:
+        Estimated row count, or None when the database keeps no usable statistics
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name}
+    ).scalar()
+    # reltuples is -1 (or 0 on old versions) until the table has been analyzed
+    if estimate is None or estimate <= 0:
+        return None
+    return int(estimate)
+
+
+def fetch_page(
+    filtered_query,
+    page_query,
+    limit: int,
+    mode: CountMode = CountMode.EXACT,
+    *,
+    cache: Optional[ListCountCache] = None,
+    namespace: Optional[str] = None,
+    signature: Optional[str] = None,
+    table_name: Optional[str] = None,
+    unfiltered: bool = False,
+    first_page: bool = True,
+) -> Tuple[List[Any], Optional[int], bool]:
+    """
+    Read one page of a listing and its total using the requested count strategy.
+
+    Args:
+        filtered_query: The filtered query without ordering or paging, used for standalone counts
+        page_query: Ordered query positioned at the page (offset or keyset applied), without LIMIT
+        limit: Number of rows to read
+        mode: Count strategy
+        cache: Cache for the "cached" strategy
+        namespace: Cache namespace of the listing
+        signature: Cache key of the listing's filters
+        table_name: Table estimated by the "estimate" strategy
+        unfiltered: Whether the listing has no filters (required for estimates)
+        first_page: False when page_query seeks past a cursor. The window would only see the
+            remaining rows there, and the client has the exact total from the first page, so
+            the exact strategy reports none instead of running a standalone COUNT(*) per page
+
+    Returns:
+        Tuple of the page rows, the total (None for "none") and whether the total is an estimate
+    """
+    if mode == CountMode.NONE:
+        return page_query.limit(limit).all(), None, False
+
+    if mode == CountMode.ESTIMATE and unfiltered and table_name:
+        estimate = estimate_row_count(filtered_query.session, table_name)
+        if estimate is not None:
+            return page_query.limit(limit).all(), estimate, True
+
+    if mode in (CountMode.CACHED, CountMode.ESTIMATE) and cache is not None and namespace:
+        total = cache.get(namespace, signature or "")
+        if total is None:
+            total = filtered_query.order_by(None).count()
+            cache.set(namespace, signature or "", total)
+        return page_query.limit(limit).all(), total, False
+
+    if not first_page:
+        return page_query.limit(limit).all(), None, False
+
+    rows = page_query.add_columns(func.count().over().label("total_count")).limit(limit).all()
+    if rows:
+        return [row[0] for row in rows], rows[0][-1], False
+    # Past the last page the window has nothing to report on
+    return [], filtered_query.order_by(None).count(), False
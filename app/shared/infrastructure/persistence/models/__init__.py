@@ -4,5 +4,6 @@ from app.services.auth_service.infrastructure.persistence.models.access_code_mod
 from app.services.auth_service.infrastructure.persistence.models.health_care_center_model import HealthCareCenterModel
 from app.services.auth_service.infrastructure.persistence.models.user_model import UserModel
 from app.services.category_service.infrastructure.persistence.models.category import Category
+from app.shared.infrastructure.persistence.models.idempotency_key_model import IdempotencyKeyModel
 
-__all__ = ['InventoryModel', 'ProductModel', 'AccessCodeModel', 'HealthCareCenterModel', 'UserModel', 'Category']
\ No newline at end of file
+__all__ = ['InventoryModel', 'ProductModel', 'AccessCodeModel', 'HealthCareCenterModel', 'UserModel', 'Category', 'IdempotencyKeyModel']
\ No newline at end of file
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+
+from app.dataBase import db
+
+
+class IdempotencyKeyModel(db.Model):
+    """
+    Responses of requests sent with an Idempotency-Key, shared by all workers.
+
+    A row is claimed (no status_code yet) before the request runs and completed
+    with its response afterwards. Rows are dropped once expires_at has passed.
+    """
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        Index('ix_idempotency_keys_expires_at', 'expires_at'),
+    )
+
+    # Endpoint and caller the key belongs to, e.g. "orders:create:<user id>"
+    scope = Column(String(200), primary_key=True)
+    key = Column(String(255), primary_key=True)
+    # SHA-256 of the request, so a key reused for another request is refused
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer)
+    body = Column(Text)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,181 @@
+"""
+Version counters backing conditional GET (ETag / Last-Modified) responses.
+
+Every write event bumps the version of the collection it belongs to and of the
+resource it names. A poll can then be answered with 304 Not Modified from these
+counters and a cheap database marker, without running the list query or
+serializing anything.
+
+Versions are per process, like the other event driven read models: each ETag
+embeds a random boot id so validators issued by another worker or a previous
+process never match here and simply lead to a full response. Writes handled by
+another worker publish no event here, so listings also pass a marker read from
+the database (row counts and newest write times); a marker this process has not
+seen yet bumps the collection like a write event would.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from uuid import uuid4
+
+from app.shared.application.events.event_bus import EventBus
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+def _event_resource_ids(event: Any) -> List[str]:
+    """Ids of the resources a write event touches (product_id wins over the event's own id)"""
+    product_id = getattr(event, "product_id", None)
+    if product_id:
+        return [str(product_id)]
+    items = getattr(event, "items", None)
+    if isinstance(items, list):
+        return [str(item["product_id"]) for item in items if isinstance(item, dict) and item.get("product_id")]
+    resource_id = getattr(event, "id", None)
+    return [str(resource_id)] if resource_id else []
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive database timestamps as UTC"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+class ResourceVersions:
+    """
+    Process-wide version registry keyed by namespace ("products", "orders", ...).
+
+    Versions come from one monotonic sequence. Per-resource entries are kept in a
+    bounded LRU; an evicted resource falls back to the highest sequence evicted so
+    far, which is never older than its real last change.
+    """
+
+    def __init__(self, event_bus: Optional[EventBus] = None, tracking: Optional[Dict[str, Iterable[Type]]] = None,
+                 max_resources: int = 10000):
+        """
+        Args:
+            event_bus: Event bus delivering write events
+            tracking: Write event classes per namespace, e.g. {"orders": (OrderPlacedEvent,)}
+            max_resources: Maximum number of per-resource versions kept
+        """
+        self.boot_id = uuid4().hex
+        self._started_at = datetime.now(timezone.utc)
+        self._sequence = 0
+        self._collections: Dict[str, Tuple[int, datetime]] = {}
+        self._markers: Dict[str, Tuple[Any, ...]] = {}
+        self._resources: "OrderedDict[Tuple[str, str], Tuple[int, datetime]]" = OrderedDict()
+        self._evicted_floor: Tuple[int, datetime] = (0, self._started_at)
+        self._max_resources = max_resources
+        self._lock = threading.Lock()
+        self._event_bus = event_bus
+        for namespace, event_types in (tracking or {}).items():
+            self.track(namespace, event_types)
+
+    def track(self, namespace: str, event_types: Iterable[Type]) -> None:
+        """
+        Bump a namespace whenever one of the given events is published.
+
+        Args:
+            namespace: Resource namespace (e.g. "products")
+            event_types: Event classes signalling a write to that namespace
+        """
+        if not self._event_bus:
+            return
+        handler = lambda event: self._handle_write_event(namespace, event)
+        for event_type in event_types:
+            self._event_bus.subscribe(event_type, handler)
+
+    def bump(self, namespace: str, resource_ids: Iterable[str] = ()) -> int:
+        """
+        Record a write to a namespace and, optionally, to some of its resources.
+
+        Returns:
+            The new collection version
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            self._sequence += 1
+            version = (self._sequence, now)
+            self._collections[namespace] = version
+            for resource_id in resource_ids:
+                key = (namespace, str(resource_id))
+                self._resources[key] = version
+                self._resources.move_to_end(key)
+            while len(self._resources) > self._max_resources:
+                _, evicted = self._resources.popitem(last=False)
+                self._evicted_floor = max(self._evicted_floor, evicted)
+            return self._sequence
+
+    def collection(self, namespace: str) -> Tuple[int, datetime]:
+        """Version and last write time of a collection"""
+        with self._lock:
+            return self._collections.get(namespace, (0, self._started_at))
+
+    def resource(self, namespace: str, resource_id: Any) -> Tuple[int, datetime]:
+        """Version and last write time of a single resource"""
+        with self._lock:
+            return self._resources.get((namespace, str(resource_id)), self._evicted_floor)
+
+    def observe(self, namespace: str, marker: Tuple[Any, ...]) -> None:
+        """
+        Bump a collection when its database marker differs from the last one seen here.
+
+        The first marker seen also bumps, so Last-Modified never predates a write
+        made by another worker before this process looked (deletes included, which
+        leave no timestamp behind).
+        """
+        marker = tuple(marker)
+        with self._lock:
+            if self._markers.get(namespace) == marker:
+                return
+            self._markers[namespace] = marker
+        self.bump(namespace)
+
+    def collection_validators(self, namespace: str, *parts: Any,
+                              marker: Optional[Tuple[Any, ...]] = None) -> Tuple[str, datetime]:
+        """
+        ETag and Last-Modified of a listing.
+
+        Args:
+            namespace: Collection namespace
+            parts: Whatever else selects the representation (filters, paging)
+            marker: Row counts and newest write times of the tables behind the listing
+
+        Returns:
+            Tuple of the unquoted strong ETag and the last write time
+        """
+        if marker is not None:
+            self.observe(namespace, marker)
+        version, modified_at = self.collection(namespace)
+        return self._etag(namespace, version, *(marker or ()), *parts), modified_at
+
+    def resource_validators(self, namespace: str, resource_id: Any,
+                            updated_at: Optional[datetime] = None) -> Tuple[str, datetime]:
+        """
+        ETag and Last-Modified of a single resource.
+
+        The row's updated_at catches writes made elsewhere; the event version
+        catches writes that do not touch updated_at (stock, related rows).
+
+        Returns:
+            Tuple of the unquoted strong ETag and the later of both timestamps
+        """
+        version, modified_at = self.resource(namespace, resource_id)
+        if updated_at is not None:
+            modified_at = max(modified_at, _as_utc(updated_at))
+        stamp = _as_utc(updated_at).isoformat() if updated_at is not None else ""
+        return self._etag(namespace, resource_id, stamp, version), modified_at
+
+    def _etag(self, *parts: Any) -> str:
+        raw = "|".join([self.boot_id] + [str(part) for part in parts])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _handle_write_event(self, namespace: str, event: Any) -> None:
+        try:
+            self.bump(namespace, _event_resource_ids(event))
+        except Exception as e:
+            logger.error(f"Failed to bump '{namespace}' version: {str(e)}")
@@ -0,0 +1,87 @@
+"""
+Dialect plumbing shared by the full-text search backends of the services.
+
+Each service keeps the SQL of its own tables (the tsvector columns, FTS5
+tables and LIKE fallback); this module holds what does not depend on them:
+splitting a term into words, probing SQLite for FTS5 and picking a backend
+per database dialect.
+"""
+
+import logging
+import re
+import sqlite3
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+Backend = TypeVar("Backend")
+
+
+def tokenize_search_term(term: Optional[str]) -> List[str]:
+    """Split a user supplied search term into lowercase word tokens"""
+    if not term:
+        return []
+    return [token.lower() for token in _TOKEN_PATTERN.findall(term)]
+
+
+def sqlite_supports_fts5() -> bool:
+    """Check whether the linked SQLite library was compiled with FTS5"""
+    connection = sqlite3.connect(":memory:")
+    try:
+        connection.execute("CREATE VIRTUAL TABLE fts5_probe USING fts5(content)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        connection.close()
+
+
+class SearchBackendRegistry(Generic[Backend]):
+    """
+    Picks and caches one search backend per database dialect.
+
+    PostgreSQL gets the tsvector backend, SQLite the FTS5 backend when its
+    library has FTS5, and every other database the LIKE fallback.
+    """
+
+    def __init__(self, label: str, postgresql: Callable[[], Backend],
+                 sqlite_fts5: Callable[[], Backend], fallback: Callable[[], Backend]):
+        """
+        Args:
+            label: What is searched, used in the log line naming the chosen backend
+            postgresql: Factory of the PostgreSQL backend
+            sqlite_fts5: Factory of the SQLite FTS5 backend
+            fallback: Factory of the backend used by any other database
+        """
+        self._label = label
+        self._postgresql = postgresql
+        self._sqlite_fts5 = sqlite_fts5
+        self._fallback = fallback
+        self._backends: Dict[str, Backend] = {}
+
+    def get(self, bind) -> Backend:
+        """
+        Get the backend for the database behind a session, engine or connection.
+
+        Args:
+            bind: SQLAlchemy session, engine or connection
+
+        Returns:
+            The search backend for the bind's dialect (cached per dialect)
+        """
+        if hasattr(bind, "get_bind"):
+            bind = bind.get_bind()
+        dialect_name = bind.dialect.name
+        if dialect_name not in self._backends:
+            if dialect_name == "postgresql":
+                backend = self._postgresql()
+            elif dialect_name == "sqlite" and sqlite_supports_fts5():
+                backend = self._sqlite_fts5()
+            else:
+                backend = self._fallback()
+            logger.info(f"Using '{backend.name}' {self._label} search backend for {dialect_name}")
+            self._backends[dialect_name] = backend
+        return self._backends[dialect_name]
@@ -0,0 +1,74 @@
+"""
+Encoders shared by the streamed exports.
+
+Rows are encoded as they arrive and handed to the response in blocks of about
+block_size characters, so an export holds at most one block of encoded output at a time.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+from uuid import UUID
+
+# Encoded rows are handed to the response in blocks of about this size
+BLOCK_SIZE = 64 * 1024
+
+
+def plain(value: Any) -> Any:
+    """Convert a column value (or a nested dict / list of them) to a JSON and CSV friendly one"""
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Mapping):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    return value
+
+
+def csv_blocks(header: Sequence[str], rows: Iterable[Sequence[Any]], block_size: int = BLOCK_SIZE) -> Iterator[str]:
+    """Encode rows as CSV lines, header first"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow(["" if value is None else plain(value) for value in row])
+        if buffer.tell() >= block_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def ndjson_blocks(records: Iterable[Mapping[str, Any]], block_size: int = BLOCK_SIZE) -> Iterator[str]:
+    """Encode records as one JSON object per line"""
+    block = []
+    size = 0
+    for record in records:
+        line = json.dumps(plain(record), separators=(",", ":"))
+        block.append(line)
+        size += len(line) + 1
+        if size >= block_size:
+            yield "\n".join(block) + "\n"
+            block = []
+            size = 0
+    if block:
+        yield "\n".join(block) + "\n"
+
+
+def gzip_blocks(blocks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a stream of byte blocks into a single gzip member"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for block in blocks:
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
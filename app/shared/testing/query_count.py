@@ -0,0 +1,24 @@
+"""
+Statement counting for tests asserting how many queries a read or write path issues.
+"""
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.dataBase import db
+
+
+@contextmanager
+def count_queries():
+    """Count the statements sent to the database inside the block"""
+    statements = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
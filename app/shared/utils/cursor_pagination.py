@@ -0,0 +1,118 @@
+"""
+Opaque cursors for keyset (seek) pagination.
+
+A cursor carries the sort key of the last row of a page. The next page is read
+with a WHERE clause that seeks past that key instead of an OFFSET, so every page
+costs the same no matter how deep the client scrolls.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+
+from app.shared.domain.exceptions.common_errors import ValidationError
+
+
+class InvalidCursorError(ValidationError):
+    """Raised when a pagination cursor cannot be decoded or belongs to another listing"""
+    error_code: str = "INVALID_CURSOR"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    if hasattr(value, "value"):  # Enum members
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and len(value) == 1:
+        (tag, raw), = value.items()
+        if tag == "u":
+            return UUID(raw)
+        if tag == "dt":
+            return datetime.fromisoformat(raw)
+        if tag == "d":
+            return date.fromisoformat(raw)
+        if tag == "n":
+            return Decimal(raw)
+    return value
+
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of a row into an opaque, URL safe cursor.
+
+    Args:
+        kind: Name of the listing and ordering the cursor belongs to (e.g. "products:name")
+        values: Sort key values of the last row, tie-breaker column last
+
+    Returns:
+        Base64url encoded cursor
+    """
+    payload = json.dumps({"k": kind, "v": [_encode_value(value) for value in values]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor sent by the client
+        kind: Listing the cursor is expected to belong to
+
+    Returns:
+        The sort key values stored in the cursor
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for another listing
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = [_decode_value(value) for value in payload["v"]]
+        cursor_kind = payload["k"]
+    except (binascii.Error, ValueError, TypeError, KeyError, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {str(e)}")
+    if cursor_kind != kind:
+        raise InvalidCursorError("Pagination cursor does not belong to this listing")
+    return values
+
+
+def keyset_condition(columns: Sequence[Any], values: Sequence[Any], descending: bool = False):
+    """
+    Build the WHERE clause selecting rows strictly after a sort key.
+
+    Expands (a, b) > (x, y) into a > x OR (a = x AND b > y), which every
+    dialect understands and which can use a composite index on (a, b).
+
+    Args:
+        columns: Sort columns, tie-breaker last
+        values: Sort key of the last row already returned
+        descending: Whether the listing is sorted in descending order
+
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    if len(columns) != len(values):
+        raise InvalidCursorError("Pagination cursor does not match the sort order")
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        equal_prefix = [columns[j] == values[j] for j in range(i)]
+        after = column < value if descending else column > value
+        clauses.append(and_(*equal_prefix, after))
+    return or_(*clauses)
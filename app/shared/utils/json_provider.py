@@ -0,0 +1,80 @@
+"""
+Flask JSON provider that serializes API payloads without hand conversion.
+
+UUIDs, Decimals, datetimes, dates and enums are encoded natively, so query
+services and routes can hand over DTO values as they are. orjson is used when
+it is installed; otherwise the stdlib encoder runs with the same conversions.
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+def _default(value: Any) -> Any:
+    """Conversions shared by both encoders for types they do not handle themselves"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "model_dump"):  # pydantic models
+        return value.model_dump()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider handling UUID, Decimal, datetime, date and Enum values natively.
+
+    Select it with JSON_PROVIDER = "fast" (the default). Output matches the
+    default provider except that datetimes are ISO 8601 instead of HTTP dates.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is not None and not kwargs:
+            return self._orjson_dumps(obj).decode("utf-8")
+        kwargs.setdefault("default", _default)
+        kwargs.setdefault("ensure_ascii", self.ensure_ascii)
+        kwargs.setdefault("sort_keys", self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if orjson is not None and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        # Hand the encoded bytes to the response as they are
+        return self._app.response_class(self._orjson_dumps(obj) + b"\n", mimetype=self.mimetype)
+
+    def _orjson_dumps(self, obj: Any) -> bytes:
+        options = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=options)
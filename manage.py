@@ -178,6 +178,468 @@ def seed_data():
             logger.error(f"Failed to seed data: {e}")
             raise
 
+def rebuild_search_index():
+    """Create the product full-text search structures and reindex all products."""
+    from app.services.product_service.infrastructure.search.product_search_backend import get_search_backend
+    
+    logger.info("Rebuilding product search index...")
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        try:
+            backend = get_search_backend(db.session)
+            indexed = backend.rebuild(db.session)
+            db.session.commit()
+            logger.info(f"Search index '{backend.name}' rebuilt for {indexed} products")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to rebuild search index: {e}")
+            raise
+
+def rebuild_order_search_index():
+    """Create the order notes full-text search structures and reindex all live and archived orders."""
+    from app.services.order_service.infrastructure.search.order_search_backend import get_order_search_backend
+    
+    logger.info("Rebuilding order search index...")
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        try:
+            backend = get_order_search_backend(db.session)
+            indexed = backend.rebuild(db.session)
+            db.session.commit()
+            logger.info(f"Order search index '{backend.name}' rebuilt for {indexed} orders with notes")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to rebuild order search index: {e}")
+            raise
+
+def backfill_order_stats(start_day=None, end_day=None):
+    """Rebuild the order status counters and the daily order rollup (all days or a YYYY-MM-DD day range)."""
+    from datetime import date
+    from app.services.order_service.infrastructure.persistence.repositories.order_daily_stats_repository import OrderDailyStatsRepository
+    from app.services.order_service.infrastructure.persistence.repositories.order_status_count_repository import OrderStatusCountRepository
+    
+    logger.info("Rebuilding order stats...")
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        try:
+            counters = OrderStatusCountRepository(db.session).rebuild()
+            rows = OrderDailyStatsRepository(db.session).rebuild(
+                date.fromisoformat(start_day) if start_day else None,
+                date.fromisoformat(end_day) if end_day else None
+            )
+            db.session.commit()
+            logger.info(f"Order stats rebuilt: {counters} status counters, {rows} daily rows")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to rebuild daily order stats: {e}")
+            raise
+
+def backfill_order_timestamps(dry_run=False):
+    """Repair order timestamps written by the old import-time defaults, then rebuild the daily rollup."""
+    from app.services.order_service.infrastructure.persistence.repositories.order_daily_stats_repository import OrderDailyStatsRepository
+    from app.services.order_service.infrastructure.persistence.repositories.order_timestamp_repository import OrderTimestampRepository
+    
+    logger.info("Repairing order timestamps...")
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        try:
+            repaired, unresolved = OrderTimestampRepository(db.session).repair(dry_run=dry_run)
+            if dry_run:
+                db.session.rollback()
+                logger.info(f"Dry run: {repaired} orders would be repaired, {unresolved} have no later write to use")
+                return
+            # Orders may move to another day of the rollup
+            OrderDailyStatsRepository(db.session).rebuild()
+            db.session.commit()
+            logger.info(f"Repaired {repaired} orders, {unresolved} left unchanged (no later write to use)")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to repair order timestamps: {e}")
+            raise
+
+def archive_orders(days=90, batch_size=1000):
+    """Move finished orders older than the given number of days to the archive tables, in batches."""
+    from app.extensions import container
+    
+    logger.info(f"Archiving finished orders older than {days} days...")
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        archived = container.order_service().archive_orders(days=days, batch_size=batch_size)
+        logger.info(f"Archived {archived} orders")
+
+def backfill_order_summaries(batch_size=1000):
+    """Write the order summaries missing for existing orders, so order lists show them."""
+    from app.extensions import container
+    
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        # create_all() only adds indexes together with new tables
+        from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel
+        from app.services.order_service.infrastructure.persistence.models.order_archive import ArchivedOrderItemModel
+        db.create_all()
+        for table in (OrderItemModel.__table__, ArchivedOrderItemModel.__table__):
+            for index in table.indexes:
+                index.create(db.session.get_bind(), checkfirst=True)
+        written = container.order_service().backfill_order_summaries(batch_size=batch_size)
+        logger.info(f"Wrote {written} order summaries")
+
+def purge_idempotency_keys():
+    """Delete expired Idempotency-Key responses."""
+    from app.extensions import container
+    
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        deleted = container.idempotency_store().purge_expired()
+        logger.info(f"Deleted {deleted} expired idempotency keys")
+
+def benchmark_product_sorting(rows=200000):
+    """Time sorted and filtered product pages on a synthetic catalog of the given size."""
+    import random
+    import statistics
+    import time
+    import uuid
+    from datetime import datetime, timedelta, timezone
+    from sqlalchemy import insert, text
+    from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+    from app.services.product_service.application.queries.get_products_by_filter import GetProductsByFilterQuery
+    from app.services.product_service.infrastructure.query_services.product_query_service import ProductQueryService
+    
+    marker = "__sort_benchmark__"
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        session = db.session
+        bind = session.get_bind()
+        # create_all() only adds indexes together with new tables
+        db.create_all()
+        for table in (ProductModel.__table__, InventoryModel.__table__):
+            for index in table.indexes:
+                index.create(bind, checkfirst=True)
+        
+        logger.info(f"Seeding {rows} benchmark products...")
+        rng = random.Random(42)
+        now = datetime.now(timezone.utc)
+        try:
+            for start in range(0, rows, 5000):
+                products, inventory = [], []
+                for i in range(start, min(start + 5000, rows)):
+                    product_id = uuid.uuid4()
+                    products.append({
+                        "id": product_id, "name": f"Bench product {rng.randrange(rows):07d}", "description": "Benchmark", "brand": marker,
+                        "status": "ACTIVE", "created_at": now - timedelta(minutes=i), "updated_at": now,
+                    })
+                    inventory.append({
+                        "id": uuid.uuid4(), "product_id": product_id, "price": round(rng.uniform(0.5, 200), 2),
+                        "quantity": rng.choice([0, 0, rng.randrange(1, 500)]), "max_stock": 500, "min_stock": 10,
+                        "expiry_date": now + timedelta(days=365),
+                    })
+                session.execute(insert(ProductModel.__table__), products)
+                session.execute(insert(InventoryModel.__table__), inventory)
+            session.commit()
+            session.execute(text("ANALYZE"))
+            
+            query_service = ProductQueryService(session, uow=None)
+            scenarios = [
+                ("no filter", {}),
+                ("in_stock_only", {"in_stock_only": True}),
+                ("price 10-50", {"min_price": 10, "max_price": 50}),
+                ("in stock, price 10-50", {"in_stock_only": True, "min_price": 10, "max_price": 50}),
+            ]
+            
+            def timed(query):
+                samples = []
+                for _ in range(5):
+                    started = time.perf_counter()
+                    result = query_service.search(query)
+                    samples.append((time.perf_counter() - started) * 1000)
+                return statistics.median(samples), result
+            
+            print(f"{'sort':<18}{'filters':<24}{'page 1 ms':>11}{'page 500 ms':>13}{'cursor ms':>11}")
+            for sort_by in ("name", "price", "stock", "created_at"):
+                for sort_direction in ("asc", "desc"):
+                    for label, filters in scenarios:
+                        base = dict(filters, sort_by=sort_by, sort_direction=sort_direction,
+                                    items_per_page=20, count_mode="none")
+                        first, _ = timed(GetProductsByFilterQuery(page=1, **base))
+                        deep, result = timed(GetProductsByFilterQuery(page=500, **base))
+                        cursor = result["next_cursor"]
+                        seek = timed(GetProductsByFilterQuery(cursor=cursor, **base))[0] if cursor else float("nan")
+                        print(f"{sort_by + ' ' + sort_direction:<18}{label:<24}{first:>11.2f}{deep:>13.2f}{seek:>11.2f}")
+        finally:
+            session.rollback()
+            select_ids = session.query(ProductModel.id).filter(ProductModel.brand == marker)
+            session.query(InventoryModel).filter(InventoryModel.product_id.in_(select_ids)).delete(synchronize_session=False)
+            session.query(ProductModel).filter(ProductModel.brand == marker).delete(synchronize_session=False)
+            session.commit()
+            logger.info("Benchmark products removed")
+
+def benchmark_order_listing(rows=5000000):
+    """Time filtered order list pages on a synthetic order table of the given size."""
+    import random
+    import statistics
+    import time
+    import uuid
+    from datetime import datetime, timedelta, timezone
+    from sqlalchemy import insert, text
+    from app.services.order_service.application.dtos.order_dto import OrderFilterDTO
+    from app.services.order_service.domain.value_objects.order_status import OrderStatus
+    from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+    from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+    from app.services.order_service.infrastructure.query_services.order_query_service import OrderQueryService
+    
+    marker = "__order_benchmark__"
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        session = db.session
+        bind = session.get_bind()
+        # create_all() only adds indexes together with new tables
+        db.create_all()
+        for table in (OrderModel.__table__, OrderItemModel.__table__, OrderSummaryModel.__table__):
+            for index in table.indexes:
+                index.create(bind, checkfirst=True)
+        
+        logger.info(f"Seeding {rows} benchmark orders...")
+        rng = random.Random(42)
+        now = datetime.now(timezone.utc)
+        users = [uuid.uuid4() for _ in range(max(rows // 50, 1))]
+        statuses = list(OrderStatus)
+        try:
+            for start in range(0, rows, 10000):
+                orders, items, summaries = [], [], []
+                for i in range(start, min(start + 10000, rows)):
+                    order_id = uuid.uuid4()
+                    created_at = now - timedelta(seconds=i * 5)
+                    orders.append({
+                        "id": order_id, "user_id": rng.choice(users), "status": rng.choice(statuses),
+                        "total_amount": 10, "notes": marker, "created_at": created_at, "updated_at": created_at,
+                    })
+                    items.append({
+                        "id": uuid.uuid4(), "order_id": order_id, "product_id": uuid.uuid4(), "quantity": 2,
+                        "price": 5, "created_at": created_at, "updated_at": created_at,
+                    })
+                    summaries.append({
+                        "id": order_id, "user_id": orders[-1]["user_id"], "status": orders[-1]["status"],
+                        "total_amount": 10, "items_count": 1, "created_at": created_at, "archived": False,
+                        "consumer_name": "Benchmark User", "items": [{
+                            "id": str(items[-1]["id"]), "product_id": str(items[-1]["product_id"]),
+                            "name": "Benchmark Product", "quantity": 2, "price": "5"
+                        }],
+                    })
+                session.execute(insert(OrderModel.__table__), orders)
+                session.execute(insert(OrderItemModel.__table__), items)
+                session.execute(insert(OrderSummaryModel), summaries)
+                session.commit()
+            session.execute(text("ANALYZE"))
+            
+            query_service = OrderQueryService(session)
+            week_ago = now - timedelta(days=7)
+            scenarios = [
+                ("no filter", {}),
+                ("user", {"user_id": users[0]}),
+                ("status", {"status": OrderStatus.SHIPPED.value}),
+                ("status, last 7 days", {"status": OrderStatus.SHIPPED.value, "start_date": week_ago}),
+                ("user, last 7 days", {"user_id": users[0], "start_date": week_ago}),
+            ]
+            
+            def timed(filter_dto):
+                samples = []
+                for _ in range(5):
+                    started = time.perf_counter()
+                    result = query_service.get_orders_by_filter(filter_dto)
+                    samples.append((time.perf_counter() - started) * 1000)
+                return statistics.median(samples), result
+            
+            print(f"{'filters':<24}{'page 1 ms':>11}{'cursor ms':>11}{'history ms':>12}")
+            for label, filters in scenarios:
+                first, result = timed(OrderFilterDTO(per_page=20, count_mode="none", **filters))
+                cursor = result.pagination.next_cursor
+                seek = (timed(OrderFilterDTO(per_page=20, count_mode="none", cursor=cursor, **filters))[0]
+                        if cursor else float("nan"))
+                history = float("nan")
+                if "user_id" in filters and "start_date" not in filters:
+                    samples = []
+                    for _ in range(5):
+                        started = time.perf_counter()
+                        query_service.get_orders_by_user_id(filters["user_id"], per_page=20)
+                        samples.append((time.perf_counter() - started) * 1000)
+                    history = statistics.median(samples)
+                print(f"{label:<24}{first:>11.2f}{seek:>11.2f}{history:>12.2f}")
+        finally:
+            session.rollback()
+            select_ids = session.query(OrderModel.id).filter(OrderModel.notes == marker)
+            session.query(OrderSummaryModel).filter(OrderSummaryModel.id.in_(select_ids)).delete(synchronize_session=False)
+            session.query(OrderItemModel).filter(OrderItemModel.order_id.in_(select_ids)).delete(synchronize_session=False)
+            session.query(OrderModel).filter(OrderModel.notes == marker).delete(synchronize_session=False)
+            session.commit()
+            logger.info("Benchmark orders removed")
+
+def benchmark_order_placement(iterations=200):
+    """Time order placement (p50 / p99 latency and statements per order) for several cart sizes."""
+    import statistics
+    import time
+    import uuid
+    from datetime import date, datetime, timedelta, timezone
+    from decimal import Decimal
+    from sqlalchemy import event, insert
+    from app.extensions import container
+    from app.services.auth_service.infrastructure.persistence.models.health_care_center_model import HealthCareCenterModel
+    from app.services.auth_service.infrastructure.persistence.models.user_model import UserModel
+    from app.services.inventory_service.infrastructure.persistence.models.inventory_model import InventoryModel
+    from app.services.order_service.application.commands.create_order_command import CreateOrderCommand
+    from app.services.order_service.application.dtos.order_dto import CreateOrderItemDTO
+    from app.services.order_service.infrastructure.persistence.models.order import OrderItemModel, OrderModel
+    from app.services.order_service.infrastructure.persistence.models.order_summary import OrderSummaryModel
+    from app.services.order_service.infrastructure.persistence.repositories.order_daily_stats_repository import OrderDailyStatsRepository
+    from app.services.order_service.infrastructure.persistence.repositories.order_status_count_repository import OrderStatusCountRepository
+    
+    marker = "__placement_benchmark__"
+    cart_sizes = (1, 5, 20, 50)
+    app, _ = create_migration_app()
+    
+    with app.app_context():
+        session = db.session
+        db.create_all()
+        center_id, user_id = uuid.uuid4(), uuid.uuid4()
+        product_ids = [uuid.uuid4() for _ in range(max(cart_sizes))]
+        # Expiry dates are whole days for the stock check
+        expiry = datetime.combine(date.today() + timedelta(days=365), datetime.min.time(), timezone.utc)
+        
+        logger.info(f"Seeding {len(product_ids)} benchmark products and a consumer...")
+        try:
+            session.add(HealthCareCenterModel(id=center_id, name="Benchmark center", address="Benchmark", phone="0",
+                                              email=f"{center_id}@benchmark.invalid", latitude=0, longitude=0))
+            session.add(UserModel(id=user_id, username=str(user_id)[:50], email=f"{str(user_id)[:30]}@bench.invalid",
+                                  password="-", full_name="Benchmark consumer", phone="0", health_care_center_id=center_id))
+            session.execute(insert(ProductModel.__table__), [
+                {"id": product_id, "name": f"Placement product {i}", "description": "Benchmark", "brand": marker,
+                 "status": "ACTIVE"} for i, product_id in enumerate(product_ids)
+            ])
+            session.execute(insert(InventoryModel.__table__), [
+                {"id": uuid.uuid4(), "product_id": product_id, "quantity": 10 ** 9, "price": 5.0, "max_stock": 10 ** 9,
+                 "min_stock": 0, "expiry_date": expiry} for product_id in product_ids
+            ])
+            session.commit()
+            
+            order_service = container.order_service()
+            statements = []
+            listener = lambda *args: statements.append(1)
+            event.listen(db.engine, "before_cursor_execute", listener)
+            print(f"{'cart size':<11}{'p50 ms':>9}{'p99 ms':>9}{'statements':>12}")
+            try:
+                for size in cart_sizes:
+                    command = CreateOrderCommand(user_id=user_id, items=[
+                        CreateOrderItemDTO(product_id=product_id, quantity=1, price=Decimal("5.00"))
+                        for product_id in product_ids[:size]
+                    ])
+                    samples = []
+                    statements.clear()
+                    for _ in range(iterations):
+                        started = time.perf_counter()
+                        order_service.create_order(command)
+                        samples.append((time.perf_counter() - started) * 1000)
+                    samples.sort()
+                    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+                    print(f"{size:<11}{statistics.median(samples):>9.2f}{p99:>9.2f}{len(statements) / iterations:>12.1f}")
+            finally:
+                event.remove(db.engine, "before_cursor_execute", listener)
+        finally:
+            session.rollback()
+            order_ids = session.query(OrderModel.id).filter(OrderModel.user_id == user_id)
+            session.query(OrderItemModel).filter(OrderItemModel.order_id.in_(order_ids)).delete(synchronize_session=False)
+            session.query(OrderModel).filter(OrderModel.user_id == user_id).delete(synchronize_session=False)
+            session.query(OrderSummaryModel).filter(OrderSummaryModel.user_id == user_id).delete(synchronize_session=False)
+            session.query(InventoryModel).filter(InventoryModel.product_id.in_(product_ids)).delete(synchronize_session=False)
+            session.query(ProductModel).filter(ProductModel.brand == marker).delete(synchronize_session=False)
+            session.query(UserModel).filter(UserModel.id == user_id).delete(synchronize_session=False)
+            session.query(HealthCareCenterModel).filter(HealthCareCenterModel.id == center_id).delete(synchronize_session=False)
+            # The placed orders were counted in today's rollup and the status counters
+            today = datetime.now(timezone.utc).date()
+            OrderDailyStatsRepository(session).rebuild(today, today)
+            OrderStatusCountRepository(session).rebuild()
+            session.commit()
+            logger.info("Benchmark orders, products and consumer removed")
+
+def benchmark_serialization(iterations=200):
+    """Compare serialization CPU of 100-item product and order pages: marshmallow + stdlib vs trusted + fast provider."""
+    import time
+    import uuid
+    from datetime import date, datetime, timezone
+    from decimal import Decimal
+    from flask.json.provider import DefaultJSONProvider
+    from app.apis.order.schemas import OrderListResponseSchema
+    from app.apis.product.product_shemas import ProductPaginatedResponseSchema, ProductResponseSchema
+    from app.apis.schema_projection import project
+    from app.services.order_service.application.dtos.order_dto import (
+        OrderFilterPaginationDTO, OrderFilterResponseDTO, OrderSummaryDTO
+    )
+    from app.services.order_service.domain.value_objects.order_status import OrderStatus
+    from app.services.product_service.application.dtos.product_dto import InventoryFieldsDto, ProductFieldsDto
+    from app.services.product_service.application.use_cases.get_product import GetProductResponseDTO
+    from app.services.product_service.domain.enums.product_status import ProductStatus
+    from app.shared.utils.json_provider import ORJSON_AVAILABLE, FastJSONProvider
+    
+    now = datetime.now(timezone.utc)
+    product_page = {
+        "items": [{
+            "id": str(uuid.uuid4()), "name": f"Product {i}", "description": "Benchmark product", "price": 9.99 + i,
+            "imageUrl": None, "inStock": True, "stockQuantity": i, "category": "Tablets", "manufacturer": "Acme",
+            "metadata": {"prescription": False, "dosage": "500mg", "form": "tablet"},
+        } for i in range(100)],
+        "total_items": 1000, "total_estimated": False, "page": 1, "page_size": 100, "total_pages": 10, "next_cursor": None,
+    }
+    product = GetProductResponseDTO(
+        id=uuid.uuid4(),
+        product_fields=ProductFieldsDto(id=uuid.uuid4(), name="Product", description="Benchmark product", brand="Acme",
+                                        category_id=uuid.uuid4(), dosage_form="tablet", strength="500mg",
+                                        package="Box", image_url=None, status=ProductStatus.ACTIVE),
+        inventory_fields=InventoryFieldsDto(quantity=10, price=9.99, max_stock=100, min_stock=5,
+                                            expiry_date=date(2030, 1, 1)),
+        category_name="Tablets",
+    )
+    order_page = OrderFilterResponseDTO(
+        orders=[OrderSummaryDTO(
+            order_id=uuid.uuid4(), consumer_id=uuid.uuid4(), status=OrderStatus.PENDING,
+            total_amount=Decimal("59.90"), items_count=3, created_at=now,
+            items=[{"id": str(uuid.uuid4()), "product_id": uuid.uuid4(), "name": f"Item {j}", "quantity": 2,
+                    "price": Decimal("9.95"), "total_price": Decimal("19.90")} for j in range(3)],
+            consumer_name="Consumer", health_center_name="Center",
+        ) for _ in range(100)],
+        pagination=OrderFilterPaginationDTO(page=1, per_page=100, pages=10, total=1000),
+    )
+    cases = [
+        ("product page (100 items)", ProductPaginatedResponseSchema, product_page),
+        ("product detail", ProductResponseSchema, product),
+        ("order page (100 orders)", OrderListResponseSchema, order_page),
+    ]
+    
+    app = Flask(__name__)
+    default_provider = DefaultJSONProvider(app)
+    fast_provider = FastJSONProvider(app)
+    
+    def cpu_ms(fn):
+        fn()
+        started = time.process_time()
+        for _ in range(iterations):
+            fn()
+        return (time.process_time() - started) * 1000 / iterations
+    
+    print(f"orjson installed: {ORJSON_AVAILABLE}")
+    print(f"{'payload':<28}{'marshmallow + stdlib':>22}{'trusted + fast':>16}{'speed-up':>10}")
+    for label, schema_class, data in cases:
+        schema = schema_class()
+        envelope = {"code": 200, "message": "ok", "data": data}
+        baseline = cpu_ms(lambda: default_provider.dumps(schema.dump(envelope)))
+        fast = cpu_ms(lambda: fast_provider.dumps(project(schema_class, envelope)))
+        print(f"{label:<28}{baseline:>19.3f} ms{fast:>13.3f} ms{baseline / fast:>9.1f}x")
+
 def main():
     """Main CLI interface."""
     if len(sys.argv) < 2:
@@ -191,6 +653,17 @@ def main():
         print("  downgrade [revision] - Downgrade to revision")
         print("  migrate <message> - Create new migration")
         print("  seed-data    - Add sample data")
+        print("  rebuild-search-index - Create and fill the product full-text index")
+        print("  rebuild-order-search-index - Create and fill the order notes full-text index")
+        print("  backfill-order-stats [start] [end] - Rebuild order status counters and the daily rollup (days as YYYY-MM-DD)")
+        print("  backfill-order-timestamps [--dry-run] - Repair order timestamps written by the old import-time defaults")
+        print("  archive-orders [days] [batch_size] - Move finished orders older than days (default 90) to the archive tables")
+        print("  backfill-order-summaries [batch_size] - Write the order list summaries missing for existing orders")
+        print("  purge-idempotency-keys - Delete expired Idempotency-Key responses")
+        print("  benchmark-product-sorting [rows] - Time sorted product pages on a synthetic catalog (default 200000)")
+        print("  benchmark-order-listing [rows] - Time filtered order pages on a synthetic order table (default 5000000)")
+        print("  benchmark-order-placement [iterations] - Time order placement p50/p99 per cart size (default 200 orders each)")
+        print("  benchmark-serialization [iterations] - Compare response serialization CPU per page")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -217,6 +690,35 @@ def main():
             create_migration(message)
         elif command == 'seed-data':
             seed_data()
+        elif command == 'rebuild-search-index':
+            rebuild_search_index()
+        elif command == 'rebuild-order-search-index':
+            rebuild_order_search_index()
+        elif command == 'backfill-order-stats':
+            backfill_order_stats(*sys.argv[2:4])
+        elif command == 'backfill-order-timestamps':
+            backfill_order_timestamps(dry_run='--dry-run' in sys.argv[2:])
+        elif command == 'archive-orders':
+            days = int(sys.argv[2]) if len(sys.argv) > 2 else 90
+            batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+            archive_orders(days, batch_size)
+        elif command == 'backfill-order-summaries':
+            batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+            backfill_order_summaries(batch_size)
+        elif command == 'purge-idempotency-keys':
+            purge_idempotency_keys()
+        elif command == 'benchmark-product-sorting':
+            rows = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+            benchmark_product_sorting(rows)
+        elif command == 'benchmark-order-listing':
+            rows = int(sys.argv[2]) if len(sys.argv) > 2 else 5000000
+            benchmark_order_listing(rows)
+        elif command == 'benchmark-order-placement':
+            iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+            benchmark_order_placement(iterations)
+        elif command == 'benchmark-serialization':
+            iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+            benchmark_serialization(iterations)
         else:
             print(f"Unknown command: {command}")
             sys.exit(1)